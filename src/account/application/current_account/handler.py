@@ -3,7 +3,7 @@ from typing import Final
 
 from account.application.current_account.port import CurrentAccountUseCase
 from account.domain.account.entity import Account
-from account.domain.account.ports import AccessRevoker
+from account.domain.account.ports import AccessRevoker, RevokedAccessRegistry
 from account.domain.account.repository import AccountRepository
 from shared.domain.errors import AuthorizationError
 from shared.domain.ports.identity_provider import IdentityProvider
@@ -22,13 +22,18 @@ class CurrentAccountHandler(CurrentAccountUseCase):
         identity_provider: IdentityProvider,
         account_repository: AccountRepository,
         access_revoker: AccessRevoker,
+        revoked_access: RevokedAccessRegistry,
     ) -> None:
         self._identity_provider = identity_provider
         self._account_repository = account_repository
         self._access_revoker = access_revoker
+        self._revoked_access = revoked_access
 
     async def get_current_account(self, for_update: bool = False) -> Account:
         current_account_id = await self._identity_provider.get_current_account_id()
+        if self._revoked_access.is_access_revoked(current_account_id):
+            raise AuthorizationError(AUTHZ_NOT_AUTHORIZED)
+
         account: Account | None = await self._account_repository.get_by_id(
             current_account_id,
             for_update=for_update,
@@ -7,7 +7,6 @@ from account.application.shared.account_unit_of_work import AccountUnitOfWork
 from account.domain.account.entity import Account
 from account.domain.account.enums import AccountRole
 from account.domain.account.errors import AccountNotFoundByIdError
-from account.domain.account.ports import AccessRevoker
 from account.domain.account.repository import AccountRepository
 from account.domain.account.services import (
     AccountManagementContext,
@@ -28,13 +27,11 @@ class DeactivateAccountHandler(DeactivateAccountUseCase):
         current_account_handler: CurrentAccountUseCase,
         account_repository: AccountRepository,
         account_unit_of_work: AccountUnitOfWork,
-        access_revoker: AccessRevoker,
         event_dispatcher: EventDispatcher,
     ) -> None:
         self._current_account_handler = current_account_handler
         self._account_repository = account_repository
         self._account_unit_of_work = account_unit_of_work
-        self._access_revoker = access_revoker
         self._event_dispatcher = event_dispatcher
 
     async def execute(self, command: DeactivateAccountCommand) -> None:
@@ -76,7 +73,6 @@ class DeactivateAccountHandler(DeactivateAccountUseCase):
 
         await self._account_repository.save(account)
         await self._event_dispatcher.dispatch(account.collect_events())
-        await self._access_revoker.remove_all_account_access(account.id_)
         await self._account_unit_of_work.commit()
 
         log.info(
@@ -0,0 +1,17 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from account.domain.account.enums import AccountRole
+from shared.domain.account_id import AccountId
+
+
+class AccessClaimsPublisher(Protocol):
+    @abstractmethod
+    async def publish_access_claims(
+        self,
+        account_id: AccountId,
+        role: AccountRole,
+        is_active: bool,
+    ) -> None:
+        """Stores role and status where the auth provider signs them into
+        the account's next access tokens."""
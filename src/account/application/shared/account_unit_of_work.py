@@ -4,7 +4,10 @@ from typing import Protocol
 
 class AccountUnitOfWork(Protocol):
     @abstractmethod
-    async def commit(self) -> None: ...
+    async def commit(self, *, await_handlers: bool = False) -> None:
+        """``await_handlers`` waits, for a bounded time, for the handlers of
+        the committed events, for callers that read their effects right after.
+        """
 
     @abstractmethod
     async def rollback(self) -> None: ...
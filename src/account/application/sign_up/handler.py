@@ -63,7 +63,8 @@ class SignUpHandler(SignUpUseCase):
         await self._event_dispatcher.dispatch(account.collect_events())
 
         try:
-            await self._account_unit_of_work.commit()
+            # The new account's profile is read right after sign-up.
+            await self._account_unit_of_work.commit(await_handlers=True)
         except EmailAlreadyExistsError:
             raise
 
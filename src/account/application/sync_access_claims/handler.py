@@ -0,0 +1,42 @@
+import logging
+
+from account.application.shared.access_claims_publisher import AccessClaimsPublisher
+from account.application.sync_access_claims.command import SyncAccessClaimsCommand
+from account.application.sync_access_claims.port import SyncAccessClaimsUseCase
+from account.domain.account.repository import AccountRepository
+from shared.domain.account_id import AccountId
+
+log = logging.getLogger(__name__)
+
+
+class SyncAccessClaimsHandler(SyncAccessClaimsUseCase):
+    """Publishes the stored state rather than an event's delta, so retried or
+    reordered deliveries converge on the latest role and status."""
+
+    def __init__(
+        self,
+        account_repository: AccountRepository,
+        access_claims_publisher: AccessClaimsPublisher,
+    ) -> None:
+        self._account_repository = account_repository
+        self._access_claims_publisher = access_claims_publisher
+
+    async def execute(self, command: SyncAccessClaimsCommand) -> None:
+        log.info("Sync access claims: started. Account ID: '%s'.", command.account_id)
+
+        account_id = AccountId(command.account_id)
+        account = await self._account_repository.get_by_id(account_id)
+        if account is None:
+            log.info(
+                "Sync access claims: account '%s' no longer exists; skipped.",
+                command.account_id,
+            )
+            return
+
+        await self._access_claims_publisher.publish_access_claims(
+            account_id,
+            role=account.role,
+            is_active=account.is_active,
+        )
+
+        log.info("Sync access claims: done. Account ID: '%s'.", command.account_id)
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from account.application.sync_access_claims.command import SyncAccessClaimsCommand
+
+
+class SyncAccessClaimsUseCase(ABC):
+    """Copies an account's current role and status into its token claims."""
+
+    @abstractmethod
+    async def execute(self, command: SyncAccessClaimsCommand) -> None: ...
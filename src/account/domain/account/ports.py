@@ -8,3 +8,10 @@ class AccessRevoker(Protocol):
     @abstractmethod
     async def remove_all_account_access(self, account_id: AccountId) -> None:
         """:raises DataMapperError:"""
+
+
+class RevokedAccessRegistry(Protocol):
+    @abstractmethod
+    def is_access_revoked(self, account_id: AccountId) -> bool:
+        """Whether the account's access was revoked moments ago, or is being
+        revoked; a cheap answer that needs no I/O."""
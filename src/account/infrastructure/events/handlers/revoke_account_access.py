@@ -0,0 +1,19 @@
+from account.domain.account.events import AccountDeactivated
+from account.infrastructure.security.access_revocation import (
+    AccessRevocationCoordinator,
+)
+from shared.domain.account_id import AccountId
+from shared.infrastructure.events.registry import handles
+
+
+@handles(AccountDeactivated)
+class RevokeAccessOnAccountDeactivated:
+    """Signs a deactivated account out once its deactivation is committed,
+    outside the transaction that locked it; failures are retried by the relay.
+    """
+
+    def __init__(self, coordinator: AccessRevocationCoordinator) -> None:
+        self._coordinator = coordinator
+
+    async def handle(self, event: AccountDeactivated) -> None:
+        await self._coordinator.revoke(AccountId(event.account_id))
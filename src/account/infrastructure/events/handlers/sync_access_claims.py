@@ -0,0 +1,25 @@
+from account.application.sync_access_claims.command import SyncAccessClaimsCommand
+from account.application.sync_access_claims.port import SyncAccessClaimsUseCase
+from account.domain.account.events import (
+    AccountActivated,
+    AccountCreated,
+    AccountDeactivated,
+    AccountRoleChanged,
+)
+from shared.infrastructure.events.registry import handles
+
+
+@handles(AccountCreated, AccountActivated, AccountDeactivated, AccountRoleChanged)
+class SyncAccessClaimsOnAccountChanged:
+    def __init__(self, sync_access_claims: SyncAccessClaimsUseCase) -> None:
+        self._sync_access_claims = sync_access_claims
+
+    async def handle(
+        self,
+        event: AccountCreated
+        | AccountActivated
+        | AccountDeactivated
+        | AccountRoleChanged,
+    ) -> None:
+        command = SyncAccessClaimsCommand(account_id=event.account_id)
+        await self._sync_access_claims.execute(command)
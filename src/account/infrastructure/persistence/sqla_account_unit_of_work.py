@@ -3,6 +3,7 @@ import logging
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from account.application.shared.account_unit_of_work import AccountUnitOfWork
+from shared.infrastructure.events.fast_path import PostCommitDelivery
 from shared.infrastructure.persistence.constants import (
     DB_COMMIT_DONE,
     DB_COMMIT_FAILED,
@@ -16,10 +17,15 @@ log = logging.getLogger(__name__)
 
 
 class SqlaAccountUnitOfWork(AccountUnitOfWork):
-    def __init__(self, session: MainAsyncSession) -> None:
+    def __init__(
+        self,
+        session: MainAsyncSession,
+        post_commit: PostCommitDelivery,
+    ) -> None:
         self._session = session
+        self._post_commit = post_commit
 
-    async def commit(self) -> None:
+    async def commit(self, *, await_handlers: bool = False) -> None:
         """:raises DataMapperError:"""
         try:
             await self._session.flush()
@@ -36,5 +42,9 @@ class SqlaAccountUnitOfWork(AccountUnitOfWork):
         except SQLAlchemyError as err:
             raise DataMapperError(f"{DB_QUERY_FAILED} {DB_COMMIT_FAILED}") from err
 
+        # Outbox entries are only claimable once committed.
+        await self._post_commit.committed(wait=await_handlers)
+
     async def rollback(self) -> None:
+        self._post_commit.discard()
         await self._session.rollback()
@@ -0,0 +1,86 @@
+import logging
+from typing import Final
+from uuid import UUID
+
+from sqlalchemy import func, select
+
+from account.domain.account.events import (
+    AccountActivated,
+    AccountDeactivated,
+    AccountRoleChanged,
+)
+from account.infrastructure.security.access_revocation import (
+    AccessRevocationCoordinator,
+)
+from account.infrastructure.security.account_access_cache import AccountAccessCache
+from shared.application.event_dispatcher import EventDispatcher
+from shared.domain.account_id import AccountId
+from shared.domain.domain_event import DomainEvent
+from shared.infrastructure.persistence.types_ import MainAsyncSession
+
+log = logging.getLogger(__name__)
+
+ACCOUNT_ACCESS_NOTIFY_CHANNEL: Final[str] = "account_access"
+_ACCESS_EVENTS: Final = (AccountActivated, AccountDeactivated, AccountRoleChanged)
+
+
+class AccountAccessBroadcaster(EventDispatcher):
+    """Dispatches events through ``dispatcher`` and announces access changes
+    to every process.
+
+    The caches they invalidate are local to each process, so unlike outbox
+    handlers, which run once in whichever process claims the entry, the
+    announcement goes out as a ``pg_notify`` on
+    ``ACCOUNT_ACCESS_NOTIFY_CHANNEL``. It is issued inside the writing
+    transaction, so Postgres only delivers it once the change is committed.
+    """
+
+    def __init__(
+        self,
+        dispatcher: EventDispatcher,
+        session: MainAsyncSession,
+    ) -> None:
+        self._dispatcher = dispatcher
+        self._session = session
+
+    async def dispatch(self, events: list[DomainEvent]) -> None:
+        await self._dispatcher.dispatch(events)
+        for event in events:
+            if isinstance(event, _ACCESS_EVENTS):
+                payload = f"{event.event_type}:{event.account_id}"
+                await self._session.execute(
+                    select(func.pg_notify(ACCOUNT_ACCESS_NOTIFY_CHANNEL, payload))
+                )
+
+
+class AccountAccessSubscriber:
+    """Applies access changes announced by ``AccountAccessBroadcaster`` to
+    this process.
+
+    Every change drops the account's cached access; a reactivation also lets
+    the account's new tokens in before the revocation TTL. ``None``, passed
+    after the listener reconnects, drops all cached access, since changes
+    may have been missed.
+    """
+
+    def __init__(
+        self,
+        access_cache: AccountAccessCache,
+        coordinator: AccessRevocationCoordinator,
+    ) -> None:
+        self._access_cache = access_cache
+        self._coordinator = coordinator
+
+    def apply(self, payload: str | None) -> None:
+        if payload is None:
+            self._access_cache.clear()
+            return
+        event_type, _, raw_id = payload.partition(":")
+        try:
+            account_id = AccountId(UUID(raw_id))
+        except ValueError:
+            log.warning("Ignoring malformed account access change '%s'.", payload)
+            return
+        self._access_cache.invalidate(account_id)
+        if event_type == AccountActivated.__name__:
+            self._coordinator.forget(account_id)
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Final
+from uuid import UUID
+
+from account.domain.account.ports import AccessRevoker, RevokedAccessRegistry
+from shared.domain.account_id import AccountId
+from shared.infrastructure.security.metrics import SecurityMetrics
+
+log = logging.getLogger(__name__)
+
+DEFAULT_REVOCATION_TTL_SECONDS: Final[float] = 60.0
+DEFAULT_REVOCATION_CACHE_SIZE: Final[int] = 10_000
+
+
+class AccessRevocationCoordinator(AccessRevoker, RevokedAccessRegistry):
+    """Runs account revocations in the background, at most once per ``ttl``.
+
+    ``remove_all_account_access`` returns at once: it schedules a call to
+    ``revoker`` unless one is already running for the account, or succeeded
+    less than ``ttl`` seconds ago. Meanwhile ``is_access_revoked`` lets
+    callers turn away the account's stale tokens without a lookup. A failed
+    call is not remembered, so the next request retries it. ``forget``
+    clears an account once it may sign in again, e.g. after reactivation.
+
+    ``revoke`` calls ``revoker`` in the caller's task instead and raises its
+    errors, for callers that retry on their own, like the outbox relay.
+
+    Local to the process, like its memory of revocations, which keeps at
+    most ``max_size`` accounts.
+    """
+
+    def __init__(
+        self,
+        revoker: AccessRevoker,
+        ttl: float = DEFAULT_REVOCATION_TTL_SECONDS,
+        max_size: int = DEFAULT_REVOCATION_CACHE_SIZE,
+        metrics: SecurityMetrics | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._revoker = revoker
+        self._ttl = ttl
+        self._max_size = max_size
+        self._metrics = metrics
+        self._clock = clock
+        self._in_flight: dict[UUID, asyncio.Task[None]] = {}
+        self._revoked: OrderedDict[UUID, float] = OrderedDict()
+
+    async def remove_all_account_access(self, account_id: AccountId) -> None:
+        key = account_id.value
+        if key in self._in_flight:
+            self._observe("coalesced")
+            return
+        if self._recently_revoked(key):
+            self._observe("suppressed")
+            return
+        self._observe("started")
+        self._in_flight[key] = asyncio.create_task(
+            self._revoke(account_id),
+            name=f"revoke-access-{key}",
+        )
+
+    async def revoke(self, account_id: AccountId) -> None:
+        """Raises whatever ``revoker`` raises, for the caller to retry."""
+        self._observe("started")
+        try:
+            await self._revoker.remove_all_account_access(account_id)
+        except Exception:
+            self._observe("failed")
+            raise
+        self._remember(account_id.value)
+
+    def is_access_revoked(self, account_id: AccountId) -> bool:
+        key = account_id.value
+        return key in self._in_flight or self._recently_revoked(key)
+
+    def forget(self, account_id: AccountId) -> None:
+        self._revoked.pop(account_id.value, None)
+
+    async def close(self) -> None:
+        """Waits for in-flight revocations; each is bounded by its HTTP timeout."""
+        await asyncio.gather(*self._in_flight.values(), return_exceptions=True)
+
+    async def _revoke(self, account_id: AccountId) -> None:
+        key = account_id.value
+        try:
+            await self._revoker.remove_all_account_access(account_id)
+        except Exception:
+            # Best effort: the next stale-token request starts another one.
+            log.warning(
+                "Failed to revoke sessions for account '%s'. "
+                "Sessions may have already expired.",
+                key,
+                exc_info=True,
+            )
+            self._observe("failed")
+        else:
+            self._remember(key)
+        finally:
+            del self._in_flight[key]
+
+    def _remember(self, key: UUID) -> None:
+        self._revoked[key] = self._clock() + self._ttl
+        self._revoked.move_to_end(key)
+        while len(self._revoked) > self._max_size:
+            self._revoked.popitem(last=False)
+
+    def _recently_revoked(self, key: UUID) -> bool:
+        expires_at = self._revoked.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= self._clock():
+            del self._revoked[key]
+            return False
+        return True
+
+    def _observe(self, outcome: str) -> None:
+        if self._metrics is not None:
+            self._metrics.revocation(outcome)
@@ -1,31 +1,64 @@
 import logging
+from dataclasses import dataclass
 
 import jwt
 
+from account.domain.account.enums import AccountRole
+from account.infrastructure.security.jwks_key_store import JwksKeyStore
+
 log = logging.getLogger(__name__)
 
 ACCESS_TOKEN_INVALID_OR_EXPIRED = "Invalid or expired JWT."  # noqa: S105
 ACCESS_TOKEN_PAYLOAD_MISSING = "JWT payload missing claim."  # noqa: S105
+ACCESS_TOKEN_UNKNOWN_KEY = "JWT signed with an unknown key."  # noqa: S105
+
+_ACCOUNT_ROLES: frozenset[str] = frozenset(AccountRole)
+
+
+@dataclass(frozen=True, slots=True)
+class AccessTokenClaims:
+    account_id: str
+    expires_at: float | None = None
+    """``exp`` as a Unix timestamp; ``None`` if the token does not expire."""
+    role: AccountRole | None = None
+    """``app_metadata.role``, as last synced to the auth provider."""
+    is_active: bool | None = None
+    """``app_metadata.is_active``, as last synced to the auth provider."""
 
 
 class AccessTokenDecoder:
+    """Verifies access tokens without I/O.
+
+    Asymmetric tokens are checked against ``key_store``, whose keys are
+    fetched and refreshed outside the request path; otherwise ``secret``
+    is the HMAC key.
+    """
+
     def __init__(
         self,
         secret: str,
         algorithm: str,
-        jwks_url: str | None = None,
+        key_store: JwksKeyStore | None = None,
     ) -> None:
         self._secret = secret
         self._algorithm = algorithm
-        self._jwk_client = jwt.PyJWKClient(jwks_url) if jwks_url else None
+        self._key_store = key_store
 
     def decode_account_id(self, token: str) -> str | None:
+        claims = self.decode(token)
+        return None if claims is None else claims.account_id
+
+    def decode(self, token: str) -> AccessTokenClaims | None:
+        """Verifies ``token``; ``None`` if it is invalid or expired."""
         try:
-            if self._jwk_client:
-                signing_key = self._jwk_client.get_signing_key_from_jwt(token)
-                key = signing_key.key
-            else:
-                key = self._secret
+            key: jwt.PyJWK | str = self._secret
+            if self._key_store is not None:
+                kid = jwt.get_unverified_header(token).get("kid")
+                signing_key = self._key_store.get(kid) if kid else None
+                if signing_key is None:
+                    log.debug("%s kid=%r", ACCESS_TOKEN_UNKNOWN_KEY, kid)
+                    return None
+                key = signing_key
 
             payload = jwt.decode(
                 token,
@@ -42,4 +75,23 @@ class AccessTokenDecoder:
             log.debug("%s 'sub'", ACCESS_TOKEN_PAYLOAD_MISSING)
             return None
 
-        return sub
+        exp = payload.get("exp")
+        role, is_active = _access_claims(payload.get("app_metadata"))
+        return AccessTokenClaims(
+            account_id=sub,
+            expires_at=None if exp is None else float(exp),
+            role=role,
+            is_active=is_active,
+        )
+
+
+def _access_claims(app_metadata: object) -> tuple[AccountRole | None, bool | None]:
+    """Role and active status from ``app_metadata``; ``None`` where unusable."""
+    if not isinstance(app_metadata, dict):
+        return None, None
+    role = app_metadata.get("role")
+    is_active = app_metadata.get("is_active")
+    return (
+        AccountRole(role) if role in _ACCOUNT_ROLES else None,
+        is_active if isinstance(is_active, bool) else None,
+    )
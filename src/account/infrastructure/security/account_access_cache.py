@@ -0,0 +1,105 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Final
+from uuid import UUID
+
+from account.domain.account.enums import AccountRole
+from shared.domain.account_id import AccountId
+from shared.infrastructure.security.metrics import SecurityMetrics
+
+DEFAULT_ACCESS_CACHE_SIZE: Final[int] = 10_000
+DEFAULT_ACCESS_CACHE_TTL_SECONDS: Final[float] = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class AccountAccess:
+    role: AccountRole
+    is_active: bool
+
+
+class AccountAccessCache:
+    """Role and active status per account, for authorization checks.
+
+    Local to the process: ``AccountAccessSubscriber`` drops an account's entry
+    when every process is notified of its ``AccountActivated``,
+    ``AccountDeactivated`` or ``AccountRoleChanged`` event, and ``ttl`` bounds
+    how long a missed notification may go on serving the old value. Entries
+    beyond ``max_size`` are evicted least recently used first; ``max_size`` 0
+    disables caching.
+
+    A reader that misses takes ``generation`` before querying the database
+    and passes it to ``put``; an invalidation in between makes ``put`` a
+    no-op, so a read that raced a change cannot cache the old value.
+    """
+
+    __slots__ = (
+        "_clock",
+        "_entries",
+        "_generation",
+        "_max_size",
+        "_metrics",
+        "_ttl",
+    )
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_ACCESS_CACHE_SIZE,
+        ttl: float = DEFAULT_ACCESS_CACHE_TTL_SECONDS,
+        metrics: SecurityMetrics | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._metrics = metrics
+        self._clock = clock
+        self._entries: OrderedDict[UUID, tuple[float, AccountAccess]] = OrderedDict()
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, account_id: AccountId) -> AccountAccess | None:
+        access = self._lookup(account_id.value)
+        if self._metrics is not None:
+            self._metrics.access_cache_lookup(hit=access is not None)
+        return access
+
+    def put(
+        self,
+        account_id: AccountId,
+        access: AccountAccess,
+        generation: int,
+    ) -> None:
+        if self._max_size <= 0 or generation != self._generation:
+            return
+        self._entries[account_id.value] = (self._clock() + self._ttl, access)
+        self._entries.move_to_end(account_id.value)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, account_id: AccountId) -> None:
+        self._generation += 1
+        self._entries.pop(account_id.value, None)
+        if self._metrics is not None:
+            self._metrics.access_cache_invalidated()
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def _lookup(self, key: UUID) -> AccountAccess | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, access = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return access
@@ -1,22 +1,74 @@
+from dataclasses import dataclass
+
 from account.domain.account.enums import AccountRole
 from account.domain.account.repository import AccountRepository
+from account.infrastructure.security.account_access_cache import (
+    AccountAccess,
+    AccountAccessCache,
+)
 from shared.domain.errors import AuthorizationError
 from shared.domain.ports.identity_provider import IdentityProvider
+from shared.infrastructure.security.identity_provider import (
+    AccessTokenClaimsProvider,
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthorizationPolicy:
+    """Where the guard reads the current account's role and status from.
+
+    With ``trust_token_claims``, from the access token's signed claims when
+    it carries them; they can lag behind a change by one token lifetime.
+    With ``strict``, checks ``for_update`` always read the database.
+    """
+
+    trust_token_claims: bool = False
+    strict: bool = True
 
 
 class AccountAuthorizationGuard:
+    """Checks the current account's role and status.
+
+    By ``policy``, from the token's claims, else from ``access_cache``, which
+    only queries the account on a miss. Strict checks ``for_update`` bypass
+    both and read the account row.
+    """
+
     def __init__(
         self,
         identity_provider: IdentityProvider,
+        claims_provider: AccessTokenClaimsProvider,
         account_repository: AccountRepository,
+        access_cache: AccountAccessCache,
+        policy: AuthorizationPolicy,
     ) -> None:
         self._identity_provider = identity_provider
+        self._claims_provider = claims_provider
         self._account_repository = account_repository
+        self._access_cache = access_cache
+        self._policy = policy
 
-    async def require_admin(self) -> None:
-        account_id = await self._identity_provider.get_current_account_id()
-        account = await self._account_repository.get_by_id(account_id)
-        if account is None or not account.is_active:
+    async def require_admin(self, for_update: bool = False) -> None:
+        access = await self._current_access(for_update)
+        if access is None or not access.is_active:
             raise AuthorizationError("Insufficient permissions.")
-        if account.role not in {AccountRole.SUPER_ADMIN, AccountRole.ADMIN}:
+        if access.role not in {AccountRole.SUPER_ADMIN, AccountRole.ADMIN}:
             raise AuthorizationError("Insufficient permissions.")
+
+    async def _current_access(self, for_update: bool) -> AccountAccess | None:
+        fresh = for_update and self._policy.strict
+        if self._policy.trust_token_claims and not fresh:
+            claims = await self._claims_provider.get_current_claims()
+            if claims.role is not None and claims.is_active is not None:
+                return AccountAccess(role=claims.role, is_active=claims.is_active)
+
+        account_id = await self._identity_provider.get_current_account_id()
+        if not fresh and (access := self._access_cache.get(account_id)) is not None:
+            return access
+        generation = self._access_cache.generation
+        account = await self._account_repository.get_by_id(account_id)
+        if account is None:
+            return None
+        access = AccountAccess(role=account.role, is_active=account.is_active)
+        self._access_cache.put(account_id, access, generation)
+        return access
@@ -0,0 +1,114 @@
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+from typing import Final
+
+import httpx
+import jwt
+
+log = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_INTERVAL_SECONDS: Final[float] = 300.0
+DEFAULT_MIN_REFRESH_INTERVAL_SECONDS: Final[float] = 10.0
+
+
+class JwksKeyStore:
+    """Signing keys of a JWKS endpoint, kept in memory for the app's lifetime.
+
+    ``start`` fetches the key set once, then a background task refetches it
+    every ``refresh_interval`` seconds. ``get`` never does I/O: a ``kid`` it
+    does not know wakes the background task for an early refetch, at most
+    once per ``min_refresh_interval`` seconds, so a stream of forged ``kid``
+    values cannot hammer the endpoint. A failed fetch keeps the current keys.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        http_client: httpx.AsyncClient,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+        min_refresh_interval: float = DEFAULT_MIN_REFRESH_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._url = url
+        self._http_client = http_client
+        self._refresh_interval = refresh_interval
+        self._min_refresh_interval = min_refresh_interval
+        self._clock = clock
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._fetched_at: float | None = None
+        self._refresh_requested = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def kids(self) -> frozenset[str]:
+        return frozenset(self._keys)
+
+    def get(self, kid: str) -> jwt.PyJWK | None:
+        key = self._keys.get(kid)
+        if key is None:
+            log.debug("Unknown JWKS kid %r; requesting a refresh.", kid)
+            self._refresh_requested.set()
+        return key
+
+    async def start(self) -> None:
+        """Prefetches the keys, then refreshes them in the background."""
+        if self._task is not None:
+            return
+        await self.refresh()
+        self._task = asyncio.create_task(self._run(), name="jwks-refresh")
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def refresh(self) -> bool:
+        """Refetches the key set; keeps the current keys on failure."""
+        self._fetched_at = self._clock()
+        try:
+            response = await self._http_client.get(self._url)
+            response.raise_for_status()
+            jwk_set = jwt.PyJWKSet.from_dict(response.json())
+        except (httpx.HTTPError, ValueError, jwt.PyJWTError) as err:
+            log.warning(
+                "Failed to fetch JWKS from %s (%s); keeping %d cached key(s).",
+                self._url,
+                err,
+                len(self._keys),
+            )
+            return False
+        self._keys = {key.key_id: key for key in jwk_set.keys if key.key_id}
+        log.debug("Loaded %d JWKS key(s) from %s.", len(self._keys), self._url)
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._refresh_requested.wait(),
+                    timeout=self._next_refresh_in(),
+                )
+            if self._refresh_requested.is_set():
+                await asyncio.sleep(self._throttle())
+            self._refresh_requested.clear()
+            await self.refresh()
+
+    def _next_refresh_in(self) -> float:
+        # Without keys every token fails, so a failed fetch is retried sooner.
+        interval = self._refresh_interval if self._keys else self._min_refresh_interval
+        return self._remaining(interval)
+
+    def _throttle(self) -> float:
+        return self._remaining(self._min_refresh_interval)
+
+    def _remaining(self, interval: float) -> float:
+        """Seconds until ``interval`` has passed since the last fetch."""
+        if self._fetched_at is None:
+            return 0.0
+        return max(self._fetched_at + interval - self._clock(), 0.0)
@@ -0,0 +1,98 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Final
+
+from account.application.shared.token_pair_refresher import TokenPairRefresher
+from shared.infrastructure.security.metrics import SecurityMetrics
+
+DEFAULT_REFRESH_GRACE_SECONDS: Final[float] = 10.0
+DEFAULT_REFRESH_CACHE_SIZE: Final[int] = 10_000
+
+
+class SingleFlightTokenPairRefresher(TokenPairRefresher):
+    """Refreshes each refresh token once, however many callers race on it.
+
+    Callers presenting a token whose refresh is in flight wait for it and
+    share its token pair; for ``grace`` seconds after it succeeds they are
+    handed the same pair, rather than have ``refresher`` reject the token it
+    just rotated. A failure reaches every waiting caller and is not kept.
+    The shared refresh runs in its own task, so a caller that disconnects
+    does not cancel it for the others.
+
+    Keyed by the SHA-256 digest of the token, local to the process, and
+    keeping at most ``max_size`` recent pairs; ``grace`` 0 disables reuse.
+    """
+
+    def __init__(
+        self,
+        refresher: TokenPairRefresher,
+        grace: float = DEFAULT_REFRESH_GRACE_SECONDS,
+        max_size: int = DEFAULT_REFRESH_CACHE_SIZE,
+        metrics: SecurityMetrics | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._refresher = refresher
+        self._grace = grace
+        self._max_size = max_size
+        self._metrics = metrics
+        self._clock = clock
+        self._in_flight: dict[bytes, asyncio.Task[tuple[str, str]]] = {}
+        self._recent: OrderedDict[bytes, tuple[float, tuple[str, str]]] = OrderedDict()
+
+    @property
+    def access_token_expiry_seconds(self) -> int:
+        return self._refresher.access_token_expiry_seconds
+
+    async def refresh(self, refresh_token_id: str) -> tuple[str, str]:
+        """:raises RefreshTokenNotFoundError, RefreshTokenExpiredError:"""
+        key = hashlib.sha256(refresh_token_id.encode()).digest()
+        if (pair := self._lookup(key)) is not None:
+            self._observe("reused")
+            return pair
+        task = self._in_flight.get(key)
+        if task is None:
+            self._observe("started")
+            task = asyncio.create_task(self._refresh(key, refresh_token_id))
+            # Its callers may all have gone by the time it fails.
+            task.add_done_callback(_retrieve_exception)
+            self._in_flight[key] = task
+        else:
+            self._observe("coalesced")
+        return await asyncio.shield(task)
+
+    async def _refresh(self, key: bytes, refresh_token_id: str) -> tuple[str, str]:
+        try:
+            pair = await self._refresher.refresh(refresh_token_id)
+        except Exception:
+            self._observe("failed")
+            raise
+        finally:
+            del self._in_flight[key]
+        if self._grace > 0 and self._max_size > 0:
+            self._recent[key] = (self._clock() + self._grace, pair)
+            self._recent.move_to_end(key)
+            while len(self._recent) > self._max_size:
+                self._recent.popitem(last=False)
+        return pair
+
+    def _lookup(self, key: bytes) -> tuple[str, str] | None:
+        entry = self._recent.get(key)
+        if entry is None:
+            return None
+        expires_at, pair = entry
+        if expires_at <= self._clock():
+            del self._recent[key]
+            return None
+        return pair
+
+    def _observe(self, outcome: str) -> None:
+        if self._metrics is not None:
+            self._metrics.token_refresh(outcome)
+
+
+def _retrieve_exception(task: asyncio.Task[tuple[str, str]]) -> None:
+    if not task.cancelled():
+        task.exception()
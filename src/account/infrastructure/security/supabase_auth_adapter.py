@@ -1,13 +1,21 @@
 import logging
+from collections.abc import Mapping
+from typing import Final
 from uuid import UUID
 
+import httpx
+from gotrue.constants import API_VERSION_HEADER_NAME
 from gotrue.errors import AuthApiError
+from gotrue.helpers import handle_exception, parse_auth_response
+from gotrue.types import Session
 
 from account.application.log_in.handler import AuthenticationError
+from account.application.shared.access_claims_publisher import AccessClaimsPublisher
 from account.application.shared.account_provisioner import AccountProvisioner
 from account.application.shared.password_resetter import PasswordResetter
 from account.application.shared.token_pair_issuer import TokenPairIssuer
 from account.application.shared.token_pair_refresher import TokenPairRefresher
+from account.domain.account.enums import AccountRole
 from account.domain.account.errors import EmailAlreadyExistsError
 from account.domain.account.ports import AccessRevoker
 from account.domain.account.value_objects import Email, RawPassword
@@ -16,19 +24,22 @@ from account.infrastructure.security.errors import (
     RefreshTokenNotFoundError,
 )
 from shared.domain.account_id import AccountId
-from supabase import Client as SupabaseClient
+from supabase import ASupabaseAuthClient as SupabaseAuthClient
 
 log = logging.getLogger(__name__)
 
+# Sent on every call by the client library, which pins this version too.
+AUTH_API_VERSION: Final[str] = "2024-01-01"
+
 
 class SupabaseAccountProvisioner(AccountProvisioner):
-    def __init__(self, client: SupabaseClient) -> None:
+    def __init__(self, client: SupabaseAuthClient) -> None:
         self._client = client
 
     async def register(self, email: Email, password: RawPassword) -> AccountId:
         """:raises EmailAlreadyExistsError:"""
         try:
-            response = self._client.auth.admin.create_user({
+            response = await self._client.admin.create_user({
                 "email": email.value,
                 "password": password.value.decode(),
                 "email_confirm": True,
@@ -47,13 +58,51 @@ class SupabaseAccountProvisioner(AccountProvisioner):
         return AccountId(user_id)
 
 
+class SupabaseTokenEndpoint:
+    """Supabase Auth's ``/token`` endpoint, called without client state.
+
+    ``ASupabaseAuthClient`` keeps every session it signs in or refreshes on
+    itself, so one shared by all requests would hold the last user's session.
+    Grants go straight to the endpoint instead, over the shared connection
+    pool, parsed and failing like the client's own calls.
+    """
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        url: str,
+        headers: Mapping[str, str],
+    ) -> None:
+        self._http_client = http_client
+        self._url = f"{url}/token"
+        self._headers = {API_VERSION_HEADER_NAME: AUTH_API_VERSION, **headers}
+
+    async def grant(
+        self,
+        grant_type: str,
+        body: Mapping[str, str],
+    ) -> Session | None:
+        """:raises AuthError:"""
+        try:
+            response = await self._http_client.post(
+                self._url,
+                params={"grant_type": grant_type},
+                json=dict(body),
+                headers=self._headers,
+            )
+            response.raise_for_status()
+            return parse_auth_response(response.json()).session
+        except Exception as err:
+            raise handle_exception(err) from err
+
+
 class SupabaseTokenPairIssuer(TokenPairIssuer):
     def __init__(
         self,
-        client: SupabaseClient,
+        tokens: SupabaseTokenEndpoint,
         access_token_expiry_s: int,
     ) -> None:
-        self._client = client
+        self._tokens = tokens
         self._access_token_expiry_s = access_token_expiry_s
 
     @property
@@ -65,14 +114,13 @@ class SupabaseTokenPairIssuer(TokenPairIssuer):
     ) -> tuple[str, str]:
         """:raises AuthenticationError:"""
         try:
-            response = self._client.auth.sign_in_with_password({
-                "email": email.value,
-                "password": password.value.decode(),
-            })
+            session = await self._tokens.grant(
+                "password",
+                {"email": email.value, "password": password.value.decode()},
+            )
         except AuthApiError as err:
             raise AuthenticationError(str(err)) from err
 
-        session = response.session
         if session is None:
             raise AuthenticationError("No session returned from auth provider.")
 
@@ -82,10 +130,10 @@ class SupabaseTokenPairIssuer(TokenPairIssuer):
 class SupabaseTokenPairRefresher(TokenPairRefresher):
     def __init__(
         self,
-        client: SupabaseClient,
+        tokens: SupabaseTokenEndpoint,
         access_token_expiry_s: int,
     ) -> None:
-        self._client = client
+        self._tokens = tokens
         self._access_token_expiry_s = access_token_expiry_s
 
     @property
@@ -95,7 +143,10 @@ class SupabaseTokenPairRefresher(TokenPairRefresher):
     async def refresh(self, refresh_token_id: str) -> tuple[str, str]:
         """:raises RefreshTokenNotFoundError, RefreshTokenExpiredError:"""
         try:
-            response = self._client.auth.refresh_session(refresh_token_id)
+            session = await self._tokens.grant(
+                "refresh_token",
+                {"refresh_token": refresh_token_id},
+            )
         except AuthApiError as err:
             err_msg = str(err).lower()
             if "expired" in err_msg:
@@ -104,7 +155,6 @@ class SupabaseTokenPairRefresher(TokenPairRefresher):
                 "Refresh token not found or invalid."
             ) from err
 
-        session = response.session
         if session is None:
             raise RefreshTokenNotFoundError("No session returned from auth provider.")
 
@@ -112,28 +162,22 @@ class SupabaseTokenPairRefresher(TokenPairRefresher):
 
 
 class SupabaseAccessRevoker(AccessRevoker):
-    def __init__(self, client: SupabaseClient) -> None:
+    def __init__(self, client: SupabaseAuthClient) -> None:
         self._client = client
 
     async def remove_all_account_access(self, account_id: AccountId) -> None:
-        try:
-            self._client.auth.admin.sign_out(str(account_id.value), scope="global")
-        except AuthApiError:
-            log.warning(
-                "Failed to revoke sessions for account '%s'. "
-                "Sessions may have already expired.",
-                account_id.value,
-            )
+        """:raises AuthApiError:"""
+        await self._client.admin.sign_out(str(account_id.value), scope="global")
 
 
 class SupabasePasswordResetter(PasswordResetter):
-    def __init__(self, client: SupabaseClient) -> None:
+    def __init__(self, client: SupabaseAuthClient) -> None:
         self._client = client
 
     async def reset_password(
         self, account_id: AccountId, new_password: RawPassword
     ) -> None:
-        self._client.auth.admin.update_user_by_id(
+        await self._client.admin.update_user_by_id(
             str(account_id.value),
             {"password": new_password.value.decode()},
         )
@@ -141,3 +185,28 @@ class SupabasePasswordResetter(PasswordResetter):
             "Password reset for account '%s' via Supabase admin API.",
             account_id.value,
         )
+
+
+class SupabaseAccessClaimsPublisher(AccessClaimsPublisher):
+    """Writes role and status to the user's ``app_metadata``, which Supabase
+    Auth embeds in every access token it issues afterwards."""
+
+    def __init__(self, client: SupabaseAuthClient) -> None:
+        self._client = client
+
+    async def publish_access_claims(
+        self,
+        account_id: AccountId,
+        role: AccountRole,
+        is_active: bool,
+    ) -> None:
+        await self._client.admin.update_user_by_id(
+            str(account_id.value),
+            {"app_metadata": {"role": role.value, "is_active": is_active}},
+        )
+        log.info(
+            "Access claims published for account '%s': role=%s, is_active=%s.",
+            account_id.value,
+            role,
+            is_active,
+        )
@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CreateProfilesCommand:
+    account_ids: tuple[UUID, ...]
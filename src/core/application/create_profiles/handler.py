@@ -0,0 +1,38 @@
+import logging
+
+from core.application.create_profiles.command import CreateProfilesCommand
+from core.application.create_profiles.port import CreateProfilesUseCase
+from core.application.shared.core_unit_of_work import CoreUnitOfWork
+from core.domain.profile.entity import Profile
+from core.domain.profile.ports import ProfileIdGenerator
+from core.domain.profile.repository import ProfileRepository
+from shared.domain.account_id import AccountId
+
+log = logging.getLogger(__name__)
+
+
+class CreateProfilesHandler(CreateProfilesUseCase):
+    def __init__(
+        self,
+        profile_id_generator: ProfileIdGenerator,
+        profile_repository: ProfileRepository,
+        core_unit_of_work: CoreUnitOfWork,
+    ) -> None:
+        self._profile_id_generator = profile_id_generator
+        self._profile_repository = profile_repository
+        self._core_unit_of_work = core_unit_of_work
+
+    async def execute(self, command: CreateProfilesCommand) -> None:
+        log.info("Creating profiles for %d accounts.", len(command.account_ids))
+
+        profiles = [
+            Profile.create(
+                id_=self._profile_id_generator.generate(),
+                account_id=AccountId(account_id),
+            )
+            for account_id in command.account_ids
+        ]
+        await self._profile_repository.save_many(profiles)
+        await self._core_unit_of_work.commit()
+
+        log.info("Profiles created for %d accounts.", len(profiles))
@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+from core.application.create_profiles.command import CreateProfilesCommand
+
+
+class CreateProfilesUseCase(ABC):
+    @abstractmethod
+    async def execute(self, command: CreateProfilesCommand) -> None: ...
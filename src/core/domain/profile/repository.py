@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Protocol, TypedDict
 from uuid import UUID
 
@@ -23,6 +24,13 @@ class ProfileRepository(Protocol):
     async def save(self, profile: "Profile") -> None:
         """:raises DataMapperError:"""
 
+    @abstractmethod
+    async def save_many(self, profiles: Sequence["Profile"]) -> None:
+        """Inserts new profiles at once, skipping accounts that already have one.
+
+        :raises DataMapperError:
+        """
+
     @abstractmethod
     async def get_by_id(
         self,
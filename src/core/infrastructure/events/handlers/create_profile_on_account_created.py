@@ -1,14 +1,29 @@
+from collections.abc import Sequence
+
 from account.domain.account.events import AccountCreated
 from core.application.create_profile.command import CreateProfileCommand
 from core.application.create_profile.port import CreateProfileUseCase
+from core.application.create_profiles.command import CreateProfilesCommand
+from core.application.create_profiles.port import CreateProfilesUseCase
 from shared.infrastructure.events.registry import handles
 
 
 @handles(AccountCreated)
 class CreateProfileOnAccountCreated:
-    def __init__(self, create_profile: CreateProfileUseCase) -> None:
+    def __init__(
+        self,
+        create_profile: CreateProfileUseCase,
+        create_profiles: CreateProfilesUseCase,
+    ) -> None:
         self._create_profile = create_profile
+        self._create_profiles = create_profiles
 
     async def handle(self, event: AccountCreated) -> None:
         command = CreateProfileCommand(account_id=event.account_id)
         await self._create_profile.execute(command)
+
+    async def handle_batch(self, events: Sequence[AccountCreated]) -> None:
+        command = CreateProfilesCommand(
+            account_ids=tuple(event.account_id for event in events)
+        )
+        await self._create_profiles.execute(command)
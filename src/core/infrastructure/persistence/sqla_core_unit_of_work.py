@@ -6,6 +6,7 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from core.application.shared.core_unit_of_work import CoreUnitOfWork
 from core.domain.profile.errors import UsernameAlreadyExistsError
+from shared.infrastructure.events.fast_path import PostCommitDelivery
 from shared.infrastructure.persistence.constants import (
     DB_COMMIT_DONE,
     DB_COMMIT_FAILED,
@@ -19,8 +20,13 @@ log = logging.getLogger(__name__)
 
 
 class SqlaCoreUnitOfWork(CoreUnitOfWork):
-    def __init__(self, session: MainAsyncSession) -> None:
+    def __init__(
+        self,
+        session: MainAsyncSession,
+        post_commit: PostCommitDelivery,
+    ) -> None:
         self._session = session
+        self._post_commit = post_commit
 
     async def commit(self) -> None:
         """
@@ -47,5 +53,9 @@ class SqlaCoreUnitOfWork(CoreUnitOfWork):
         except SQLAlchemyError as err:
             raise DataMapperError(f"{DB_QUERY_FAILED} {DB_COMMIT_FAILED}") from err
 
+        # Outbox entries are only claimable once committed.
+        await self._post_commit.committed()
+
     async def rollback(self) -> None:
+        self._post_commit.discard()
         await self._session.rollback()
@@ -1,4 +1,8 @@
+import dataclasses
+from collections.abc import Sequence
+
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 
 from core.domain.profile.entity import Profile
@@ -39,6 +43,24 @@ class SqlaProfileRepository(ProfileRepository):
         except SQLAlchemyError as err:
             raise DataMapperError(DB_QUERY_FAILED) from err
 
+    async def save_many(self, profiles: Sequence[Profile]) -> None:
+        """:raises DataMapperError:"""
+        if not profiles:
+            return
+        stmt = (
+            pg_insert(profiles_table)
+            .values([
+                dataclasses.asdict(ProfileConverter.to_record(profile))
+                for profile in profiles
+            ])
+            # Redelivered events must not fail the whole batch.
+            .on_conflict_do_nothing(index_elements=[profiles_table.c.account_id])
+        )
+        try:
+            await self._session.execute(stmt)
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+
     async def get_by_id(
         self,
         profile_id: ProfileId,
@@ -0,0 +1,31 @@
+import uvloop
+from dishka import Provider
+
+from shared.infrastructure.config.settings.app_settings import (
+    AppSettings,
+    load_settings,
+)
+from shared.infrastructure.config.settings.logs import configure_logging
+from shared.infrastructure.config.worker_factory import (
+    create_worker_container,
+    run_outbox_worker,
+)
+
+
+def run_worker(
+    *di_providers: Provider,
+    settings: AppSettings | None = None,
+) -> None:
+    """Delivers outbox events outside the web app. Start as many as needed."""
+    if settings is None:
+        configure_logging()
+        settings = load_settings()
+
+    configure_logging(level=settings.logs.level)
+
+    container = create_worker_container(settings, *di_providers)
+    uvloop.run(run_outbox_worker(container))
+
+
+if __name__ == "__main__":
+    run_worker()
@@ -0,0 +1,12 @@
+from abc import abstractmethod
+from typing import Protocol
+
+
+class DeadLetterQueue(Protocol):
+    @abstractmethod
+    async def replay(self, event_type: str | None, limit: int) -> int:
+        """Requeues up to ``limit`` dead-lettered events, oldest first.
+
+        :returns: the number of events put back for delivery.
+        :raises DataMapperError:
+        """
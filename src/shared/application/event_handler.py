@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Protocol, runtime_checkable
 
 from shared.domain.domain_event import DomainEvent
@@ -6,3 +7,14 @@ from shared.domain.domain_event import DomainEvent
 @runtime_checkable
 class EventHandler[E: DomainEvent](Protocol):
     async def handle(self, event: E) -> None: ...
+
+
+@runtime_checkable
+class BatchEventHandler[E: DomainEvent](EventHandler[E], Protocol):
+    """Handler that can apply many events at once.
+
+    ``handle_batch`` receives the events in ``occurred_at`` order. When it
+    fails, the events are retried one by one through ``handle``.
+    """
+
+    async def handle_batch(self, events: Sequence[E]) -> None: ...
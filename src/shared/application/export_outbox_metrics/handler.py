@@ -0,0 +1,27 @@
+import logging
+
+from shared.application.export_outbox_metrics.port import ExportOutboxMetricsUseCase
+from shared.application.outbox_metrics_reader import OutboxMetricsReader
+from shared.domain.ports.authorization_guard import AuthorizationGuard
+
+log = logging.getLogger(__name__)
+
+
+class ExportOutboxMetricsHandler(ExportOutboxMetricsUseCase):
+    def __init__(
+        self,
+        authorization_guard: AuthorizationGuard,
+        metrics_reader: OutboxMetricsReader,
+    ) -> None:
+        self._authorization_guard = authorization_guard
+        self._metrics_reader = metrics_reader
+
+    async def execute(self) -> str:
+        log.info("Export outbox metrics: started.")
+
+        await self._authorization_guard.require_admin()
+
+        text = await self._metrics_reader.render_text()
+
+        log.info("Export outbox metrics: done.")
+        return text
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+
+class ExportOutboxMetricsUseCase(ABC):
+    """Outbox relay metrics of this process in the Prometheus text format, for
+    scraping. Admin only."""
+
+    @abstractmethod
+    async def execute(self) -> str: ...
@@ -0,0 +1,27 @@
+import logging
+
+from shared.application.get_outbox_lanes.port import GetOutboxLanesUseCase
+from shared.application.outbox_lane_monitor import LaneBacklog, OutboxLaneMonitor
+from shared.domain.ports.authorization_guard import AuthorizationGuard
+
+log = logging.getLogger(__name__)
+
+
+class GetOutboxLanesHandler(GetOutboxLanesUseCase):
+    def __init__(
+        self,
+        authorization_guard: AuthorizationGuard,
+        lane_monitor: OutboxLaneMonitor,
+    ) -> None:
+        self._authorization_guard = authorization_guard
+        self._lane_monitor = lane_monitor
+
+    async def execute(self) -> list[LaneBacklog]:
+        log.info("Get outbox lanes: started.")
+
+        await self._authorization_guard.require_admin()
+
+        backlogs = await self._lane_monitor.backlogs()
+
+        log.info("Get outbox lanes: done. Lanes: %d.", len(backlogs))
+        return backlogs
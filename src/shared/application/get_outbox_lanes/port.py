@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from shared.application.outbox_lane_monitor import LaneBacklog
+
+
+class GetOutboxLanesUseCase(ABC):
+    """Backlog and lag of each outbox delivery lane. Admin only."""
+
+    @abstractmethod
+    async def execute(self) -> list[LaneBacklog]: ...
@@ -0,0 +1,30 @@
+import logging
+
+from shared.application.get_outbox_metrics.port import GetOutboxMetricsUseCase
+from shared.application.outbox_metrics_reader import (
+    OutboxMetricsReader,
+    OutboxMetricsReport,
+)
+from shared.domain.ports.authorization_guard import AuthorizationGuard
+
+log = logging.getLogger(__name__)
+
+
+class GetOutboxMetricsHandler(GetOutboxMetricsUseCase):
+    def __init__(
+        self,
+        authorization_guard: AuthorizationGuard,
+        metrics_reader: OutboxMetricsReader,
+    ) -> None:
+        self._authorization_guard = authorization_guard
+        self._metrics_reader = metrics_reader
+
+    async def execute(self) -> OutboxMetricsReport:
+        log.info("Get outbox metrics: started.")
+
+        await self._authorization_guard.require_admin()
+
+        report = await self._metrics_reader.read()
+
+        log.info("Get outbox metrics: done.")
+        return report
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from shared.application.outbox_metrics_reader import OutboxMetricsReport
+
+
+class GetOutboxMetricsUseCase(ABC):
+    """Outbox relay metrics: lane backlog and lag, delivery rates, handler
+    latency, retries, dead letters and poll/batch durations. Admin only."""
+
+    @abstractmethod
+    async def execute(self) -> OutboxMetricsReport: ...
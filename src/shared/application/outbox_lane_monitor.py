@@ -0,0 +1,21 @@
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LaneBacklog:
+    lane: str
+    # Undelivered entries, including those backing off after a failure.
+    backlog: int
+    # Age in seconds of the oldest undelivered entry, 0 when the lane is empty.
+    lag_s: float
+
+
+class OutboxLaneMonitor(Protocol):
+    @abstractmethod
+    async def backlogs(self) -> list[LaneBacklog]:
+        """Reports every configured delivery lane, the default one first.
+
+        :raises DataMapperError:
+        """
@@ -0,0 +1,27 @@
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from shared.application.outbox_lane_monitor import LaneBacklog
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OutboxMetricsReport:
+    lanes: list[LaneBacklog]
+    # Deliveries per second and event type, over the recent window.
+    delivered_per_s: dict[str, float]
+    # Every relay metric of this process, by name.
+    metrics: dict[str, Any]
+
+
+class OutboxMetricsReader(Protocol):
+    @abstractmethod
+    async def read(self) -> OutboxMetricsReport:
+        """:raises DataMapperError:"""
+
+    @abstractmethod
+    async def render_text(self) -> str:
+        """The same metrics in the Prometheus text format.
+
+        :raises DataMapperError:
+        """
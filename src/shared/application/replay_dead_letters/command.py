@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ReplayDeadLettersCommand:
+    event_type: str | None
+    limit: int
@@ -0,0 +1,35 @@
+import logging
+
+from shared.application.dead_letter_queue import DeadLetterQueue
+from shared.application.replay_dead_letters.command import ReplayDeadLettersCommand
+from shared.application.replay_dead_letters.port import ReplayDeadLettersUseCase
+from shared.domain.ports.authorization_guard import AuthorizationGuard
+
+log = logging.getLogger(__name__)
+
+
+class ReplayDeadLettersHandler(ReplayDeadLettersUseCase):
+    def __init__(
+        self,
+        authorization_guard: AuthorizationGuard,
+        dead_letter_queue: DeadLetterQueue,
+    ) -> None:
+        self._authorization_guard = authorization_guard
+        self._dead_letter_queue = dead_letter_queue
+
+    async def execute(self, command: ReplayDeadLettersCommand) -> int:
+        log.info(
+            "Replay dead letters: started. Event type: '%s', limit: %d.",
+            command.event_type,
+            command.limit,
+        )
+
+        await self._authorization_guard.require_admin(for_update=True)
+
+        replayed = await self._dead_letter_queue.replay(
+            event_type=command.event_type,
+            limit=command.limit,
+        )
+
+        log.info("Replay dead letters: done. Replayed: %d.", replayed)
+        return replayed
@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+from shared.application.replay_dead_letters.command import ReplayDeadLettersCommand
+
+
+class ReplayDeadLettersUseCase(ABC):
+    @abstractmethod
+    async def execute(self, command: ReplayDeadLettersCommand) -> int: ...
@@ -1,3 +1,4 @@
+from dataclasses import astuple, replace
 from typing import Any, Self
 
 from shared.domain.domain_event import DomainEvent
@@ -17,7 +18,15 @@ class AggregateRoot[T: ValueObject](Entity[T]):
         super().__init__(id_=id_)
         self._events = []
 
+    @property
+    def aggregate_key(self) -> str:
+        """Stable identity across aggregate types, e.g. ``Account:<uuid>``."""
+        identity = ":".join(str(part) for part in astuple(self.id_))
+        return f"{type(self).__name__}:{identity}"
+
     def _register_event(self, event: DomainEvent) -> None:
+        if event.aggregate_id is None:
+            event = replace(event, aggregate_id=self.aggregate_key)
         try:
             self._events.append(event)
         except AttributeError:
@@ -7,6 +7,8 @@ from uuid import uuid4
 class DomainEvent:
     event_id: str = field(default_factory=lambda: str(uuid4()))
     occurred_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    # Stamped by the emitting aggregate; events sharing it are delivered in order.
+    aggregate_id: str | None = None
 
     @property
     def event_type(self) -> str:
@@ -4,5 +4,9 @@ from typing import Protocol
 
 class AuthorizationGuard(Protocol):
     @abstractmethod
-    async def require_admin(self) -> None:
-        """:raises AuthorizationError:"""
+    async def require_admin(self, for_update: bool = False) -> None:
+        """``for_update`` marks checks guarding a mutation, which may demand
+        fresher data than read-only ones.
+
+        :raises AuthorizationError:
+        """
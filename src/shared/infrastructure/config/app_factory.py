@@ -6,33 +6,38 @@ from contextlib import asynccontextmanager
 from dishka import AsyncContainer, Provider, make_async_container
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from account.infrastructure.security.access_broadcast import (
+    ACCOUNT_ACCESS_NOTIFY_CHANNEL,
+    AccountAccessSubscriber,
+)
+from account.infrastructure.security.access_revocation import (
+    AccessRevocationCoordinator,
+)
+from account.infrastructure.security.access_token_processor_jwt import (
+    AccessTokenDecoder,
+)
+from account.infrastructure.security.account_access_cache import AccountAccessCache
+from shared.infrastructure.config.bootstrap import map_tables, prepare_event_delivery
 from shared.infrastructure.config.di.provider_registry import get_providers
 from shared.infrastructure.config.settings.app_settings import AppSettings
-from shared.infrastructure.events.registry import auto_discover_handlers
-from shared.infrastructure.events.relay import OutboxRelay
+from shared.infrastructure.config.settings.outbox import OutboxSettings
+from shared.infrastructure.config.worker_factory import (
+    create_outbox_relay,
+    start_outbox_tasks,
+    stop_outbox_tasks,
+)
+from shared.infrastructure.events.fast_path import OutboxFastPath
+from shared.infrastructure.events.notifications import (
+    NotificationListener,
+    conninfo_from_engine,
+)
 from shared.infrastructure.http.routers.root_router import create_root_router
 
 log = logging.getLogger(__name__)
 
 
-def _map_tables() -> None:
-    from account.infrastructure.persistence.mappers.account import (  # noqa: PLC0415
-        map_account_metadata_table,
-    )
-    from core.infrastructure.persistence.mappers.profile import (  # noqa: PLC0415
-        map_profiles_table,
-    )
-    from shared.infrastructure.persistence.mappers.outbox import (  # noqa: PLC0415
-        map_outbox_table,
-    )
-
-    map_account_metadata_table()
-    map_profiles_table()
-    map_outbox_table()
-
-
 def create_ioc_container(
     settings: AppSettings,
     *di_providers: Provider,
@@ -53,24 +58,47 @@ def create_web_app() -> FastAPI:
     return app
 
 
+async def start_access_change_listener(
+    container: AsyncContainer,
+) -> asyncio.Task[None]:
+    """Applies account access changes, announced by whichever process made
+    them, to this process's caches."""
+    engine = await container.get(AsyncEngine)
+    subscriber = AccountAccessSubscriber(
+        access_cache=await container.get(AccountAccessCache),
+        coordinator=await container.get(AccessRevocationCoordinator),
+    )
+    listener = NotificationListener(
+        conninfo_from_engine(engine),
+        ACCOUNT_ACCESS_NOTIFY_CHANNEL,
+    )
+    return asyncio.create_task(listener.run(subscriber.apply))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    _map_tables()
-    auto_discover_handlers()
+    map_tables()
+    prepare_event_delivery()
 
     container: AsyncContainer = app.state.dishka_container
-    session_factory = await container.get(async_sessionmaker[AsyncSession])
-
-    relay = OutboxRelay(container=container, session_factory=session_factory)
-    relay_task = asyncio.create_task(relay.run())
+    # Loads the JWKS signing keys before the first request needs them.
+    await container.get(AccessTokenDecoder)
+    outbox = await container.get(OutboxSettings)
+
+    relay = await create_outbox_relay(container)
+    if outbox.fast_path:
+        fast_path = await container.get(OutboxFastPath)
+        fast_path.attach(relay)
+    background_tasks: list[asyncio.Task[None]] = []
+    if outbox.embedded_relay:
+        background_tasks = await start_outbox_tasks(container, relay)
+    else:
+        log.info("Embedded outbox relay disabled; run the outbox worker instead.")
+    background_tasks.append(await start_access_change_listener(container))
 
     yield
 
-    relay_task.cancel()
-    try:
-        await relay_task
-    except asyncio.CancelledError:
-        log.debug("Outbox relay task cancelled.")
+    await stop_outbox_tasks(background_tasks)
 
     # https://dishka.readthedocs.io/en/stable/integrations/fastapi.html
     await container.close()
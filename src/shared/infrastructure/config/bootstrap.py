@@ -0,0 +1,24 @@
+from shared.infrastructure.events.registry import auto_discover_handlers
+from shared.infrastructure.events.serialization import compile_event_codecs
+
+
+def map_tables() -> None:
+    from account.infrastructure.persistence.mappers.account import (  # noqa: PLC0415
+        map_account_metadata_table,
+    )
+    from core.infrastructure.persistence.mappers.profile import (  # noqa: PLC0415
+        map_profiles_table,
+    )
+    from shared.infrastructure.persistence.mappers.outbox import (  # noqa: PLC0415
+        map_outbox_table,
+    )
+
+    map_account_metadata_table()
+    map_profiles_table()
+    map_outbox_table()
+
+
+def prepare_event_delivery() -> None:
+    """Registers event handlers and builds event codecs before any delivery."""
+    auto_discover_handlers()
+    compile_event_codecs()
@@ -1,4 +1,4 @@
-from dishka import Provider, Scope, provide
+from dishka import AnyOf, Provider, Scope, provide
 
 from account.application.activate_account.handler import ActivateAccountHandler
 from account.application.activate_account.port import ActivateAccountUseCase
@@ -25,6 +25,8 @@ from account.application.set_account_password.port import SetAccountPasswordUseC
 from account.application.shared.account_unit_of_work import AccountUnitOfWork
 from account.application.sign_up.handler import SignUpHandler
 from account.application.sign_up.port import SignUpUseCase
+from account.application.sync_access_claims.handler import SyncAccessClaimsHandler
+from account.application.sync_access_claims.port import SyncAccessClaimsUseCase
 from account.domain.account.repository import AccountRepository
 from account.infrastructure.persistence.sqla_account_repository import (
     SqlaAccountRepository,
@@ -32,11 +34,14 @@ from account.infrastructure.persistence.sqla_account_repository import (
 from account.infrastructure.persistence.sqla_account_unit_of_work import (
     SqlaAccountUnitOfWork,
 )
+from account.infrastructure.security.access_broadcast import AccountAccessBroadcaster
 from account.infrastructure.security.authorization_guard import (
     AccountAuthorizationGuard,
 )
 from core.application.create_profile.handler import CreateProfileHandler
 from core.application.create_profile.port import CreateProfileUseCase
+from core.application.create_profiles.handler import CreateProfilesHandler
+from core.application.create_profiles.port import CreateProfilesUseCase
 from core.application.get_my_profile.handler import GetMyProfileHandler
 from core.application.get_my_profile.port import GetMyProfileUseCase
 from core.application.list_profiles.handler import ListProfilesHandler
@@ -51,12 +56,32 @@ from core.infrastructure.persistence.sqla_core_unit_of_work import SqlaCoreUnitO
 from core.infrastructure.persistence.sqla_profile_repository import (
     SqlaProfileRepository,
 )
+from shared.application.dead_letter_queue import DeadLetterQueue
 from shared.application.event_dispatcher import EventDispatcher
+from shared.application.export_outbox_metrics.handler import (
+    ExportOutboxMetricsHandler,
+)
+from shared.application.export_outbox_metrics.port import ExportOutboxMetricsUseCase
+from shared.application.get_outbox_lanes.handler import GetOutboxLanesHandler
+from shared.application.get_outbox_lanes.port import GetOutboxLanesUseCase
+from shared.application.get_outbox_metrics.handler import GetOutboxMetricsHandler
+from shared.application.get_outbox_metrics.port import GetOutboxMetricsUseCase
+from shared.application.outbox_lane_monitor import OutboxLaneMonitor
+from shared.application.outbox_metrics_reader import OutboxMetricsReader
+from shared.application.replay_dead_letters.handler import ReplayDeadLettersHandler
+from shared.application.replay_dead_letters.port import ReplayDeadLettersUseCase
 from shared.domain.ports.authorization_guard import AuthorizationGuard
 from shared.domain.ports.identity_provider import IdentityProvider
+from shared.infrastructure.events.dead_letter_queue import SqlaDeadLetterQueue
 from shared.infrastructure.events.dispatcher import OutboxEventDispatcher
+from shared.infrastructure.events.fast_path import PostCommitDelivery
+from shared.infrastructure.events.lane_monitor import SqlaOutboxLaneMonitor
+from shared.infrastructure.events.metrics import OutboxMetricsCollector
 from shared.infrastructure.persistence.types_ import MainAsyncSession
-from shared.infrastructure.security.identity_provider import JwtBearerIdentityProvider
+from shared.infrastructure.security.identity_provider import (
+    AccessTokenClaimsProvider,
+    JwtBearerIdentityProvider,
+)
 
 
 class AccountApplicationProvider(Provider):
@@ -67,14 +92,24 @@ class AccountApplicationProvider(Provider):
     account_repository = provide(SqlaAccountRepository, provides=AccountRepository)
 
     # Ports Auth
-    identity_provider = provide(JwtBearerIdentityProvider, provides=IdentityProvider)
+    identity_provider = provide(
+        JwtBearerIdentityProvider,
+        provides=AnyOf[IdentityProvider, AccessTokenClaimsProvider],
+    )
     authorization_guard = provide(
         AccountAuthorizationGuard, provides=AuthorizationGuard
     )
 
     @provide
-    def event_dispatcher(self, session: MainAsyncSession) -> EventDispatcher:
-        return OutboxEventDispatcher(session)
+    def event_dispatcher(
+        self,
+        session: MainAsyncSession,
+        post_commit: PostCommitDelivery,
+    ) -> EventDispatcher:
+        return AccountAccessBroadcaster(
+            OutboxEventDispatcher(session, post_commit),
+            session,
+        )
 
     # Account Use Cases
     activate_account_use_case = provide(
@@ -101,6 +136,9 @@ class AccountApplicationProvider(Provider):
     change_password_use_case = provide(
         ChangePasswordHandler, provides=ChangePasswordUseCase
     )
+    sync_access_claims_use_case = provide(
+        SyncAccessClaimsHandler, provides=SyncAccessClaimsUseCase
+    )
 
 
 class CoreApplicationProvider(Provider):
@@ -114,9 +152,38 @@ class CoreApplicationProvider(Provider):
     create_profile_use_case = provide(
         CreateProfileHandler, provides=CreateProfileUseCase
     )
+    create_profiles_use_case = provide(
+        CreateProfilesHandler, provides=CreateProfilesUseCase
+    )
     get_my_profile_use_case = provide(GetMyProfileHandler, provides=GetMyProfileUseCase)
     update_profile_use_case = provide(
         UpdateProfileHandler, provides=UpdateProfileUseCase
     )
     patch_profile_use_case = provide(PatchProfileHandler, provides=PatchProfileUseCase)
     list_profiles_use_case = provide(ListProfilesHandler, provides=ListProfilesUseCase)
+
+
+class OutboxApplicationProvider(Provider):
+    scope = Scope.REQUEST
+
+    # Ports Persistence
+    dead_letter_queue = provide(SqlaDeadLetterQueue, provides=DeadLetterQueue)
+    lane_monitor = provide(SqlaOutboxLaneMonitor, provides=OutboxLaneMonitor)
+    metrics_reader = provide(
+        OutboxMetricsCollector,
+        provides=AnyOf[OutboxMetricsReader, OutboxMetricsCollector],
+    )
+
+    # Outbox Use Cases
+    replay_dead_letters_use_case = provide(
+        ReplayDeadLettersHandler, provides=ReplayDeadLettersUseCase
+    )
+    get_outbox_lanes_use_case = provide(
+        GetOutboxLanesHandler, provides=GetOutboxLanesUseCase
+    )
+    get_outbox_metrics_use_case = provide(
+        GetOutboxMetricsHandler, provides=GetOutboxMetricsUseCase
+    )
+    export_outbox_metrics_use_case = provide(
+        ExportOutboxMetricsHandler, provides=ExportOutboxMetricsUseCase
+    )
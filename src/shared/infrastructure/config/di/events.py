@@ -1,6 +1,12 @@
 from dishka import Provider, Scope, provide_all
 
 from account.infrastructure.events.handlers.log_account_created import LogAccountCreated
+from account.infrastructure.events.handlers.revoke_account_access import (
+    RevokeAccessOnAccountDeactivated,
+)
+from account.infrastructure.events.handlers.sync_access_claims import (
+    SyncAccessClaimsOnAccountChanged,
+)
 from core.infrastructure.events.handlers.create_profile_on_account_created import (
     CreateProfileOnAccountCreated,
 )
@@ -11,3 +17,7 @@ class EventHandlerProvider(Provider):
 
     log_account_created = provide_all(LogAccountCreated)
     create_profile_on_account_created = provide_all(CreateProfileOnAccountCreated)
+    revoke_access_on_account_deactivated = provide_all(RevokeAccessOnAccountDeactivated)
+    sync_access_claims_on_account_changed = provide_all(
+        SyncAccessClaimsOnAccountChanged
+    )
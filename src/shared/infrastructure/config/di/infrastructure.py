@@ -2,7 +2,10 @@ import logging
 from collections.abc import AsyncIterator
 from typing import NewType, cast
 
-from dishka import Provider, Scope, from_context, provide
+import httpx
+import orjson
+from dishka import AnyOf, Provider, Scope, from_context, provide
+from gotrue.constants import DEFAULT_HEADERS
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -11,18 +14,30 @@ from sqlalchemy.ext.asyncio import (
 )
 from starlette.requests import Request
 
+from account.application.shared.access_claims_publisher import AccessClaimsPublisher
 from account.application.shared.account_provisioner import AccountProvisioner
 from account.application.shared.password_resetter import PasswordResetter
 from account.application.shared.token_pair_issuer import TokenPairIssuer
 from account.application.shared.token_pair_refresher import TokenPairRefresher
-from account.domain.account.ports import AccessRevoker
+from account.domain.account.ports import AccessRevoker, RevokedAccessRegistry
+from account.infrastructure.security.access_revocation import (
+    AccessRevocationCoordinator,
+)
 from account.infrastructure.security.access_token_processor_jwt import (
     AccessTokenDecoder,
 )
+from account.infrastructure.security.account_access_cache import AccountAccessCache
+from account.infrastructure.security.authorization_guard import AuthorizationPolicy
+from account.infrastructure.security.jwks_key_store import JwksKeyStore
+from account.infrastructure.security.single_flight_refresher import (
+    SingleFlightTokenPairRefresher,
+)
 from account.infrastructure.security.supabase_auth_adapter import (
+    SupabaseAccessClaimsPublisher,
     SupabaseAccessRevoker,
     SupabaseAccountProvisioner,
     SupabasePasswordResetter,
+    SupabaseTokenEndpoint,
     SupabaseTokenPairIssuer,
     SupabaseTokenPairRefresher,
 )
@@ -30,15 +45,19 @@ from shared.infrastructure.config.settings.database import (
     PostgresSettings,
     SqlaEngineSettings,
 )
+from shared.infrastructure.config.settings.outbox import OutboxSettings
 from shared.infrastructure.config.settings.security import SecuritySettings
+from shared.infrastructure.events.fast_path import OutboxFastPath, PostCommitDelivery
+from shared.infrastructure.events.handler_policy import HandlerPolicies, HandlerPolicy
+from shared.infrastructure.events.lanes import DEFAULT_LANE, OutboxLane, OutboxLanes
+from shared.infrastructure.events.metrics import RelayMetrics
+from shared.infrastructure.observability.metrics import MetricsRegistry
 from shared.infrastructure.persistence.types_ import MainAsyncSession
-from supabase import (
-    Client as SupabaseClient,
-    create_client,
-)
+from shared.infrastructure.security.metrics import SecurityMetrics
+from shared.infrastructure.security.verified_token_cache import VerifiedTokenCache
+from supabase import ASupabaseAuthClient as SupabaseAuthClient
 
-AdminSupabaseClient = NewType("AdminSupabaseClient", SupabaseClient)
-AuthSupabaseClient = NewType("AuthSupabaseClient", SupabaseClient)
+SupabaseHttpClient = NewType("SupabaseHttpClient", httpx.AsyncClient)
 
 log = logging.getLogger(__name__)
 
@@ -58,6 +77,8 @@ class PersistenceSqlaProvider(Provider):
             max_overflow=sqla_engine.max_overflow,
             connect_args={"connect_timeout": 5},
             pool_pre_ping=True,
+            json_serializer=orjson.dumps,
+            json_deserializer=orjson.loads,
         )
         log.debug("Async engine created with DSN: %s", postgres.dsn)
         yield async_engine
@@ -93,104 +114,285 @@ class PersistenceSqlaProvider(Provider):
         log.debug("Main async session closed.")
 
 
+class MetricsProvider(Provider):
+    @provide(scope=Scope.APP)
+    def provide_metrics_registry(self) -> MetricsRegistry:
+        return MetricsRegistry()
+
+
+class OutboxProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def provide_outbox_fast_path(
+        self,
+        outbox: OutboxSettings,
+    ) -> AsyncIterator[OutboxFastPath]:
+        fast_path = OutboxFastPath(wait=outbox.fast_path_wait_s)
+        yield fast_path
+        await fast_path.close()
+
+    post_commit_delivery = provide(PostCommitDelivery, scope=Scope.REQUEST)
+
+    @provide(scope=Scope.APP)
+    def provide_relay_metrics(self, registry: MetricsRegistry) -> RelayMetrics:
+        return RelayMetrics(registry)
+
+    @provide(scope=Scope.APP)
+    def provide_outbox_lanes(self, outbox: OutboxSettings) -> OutboxLanes:
+        return OutboxLanes(
+            OutboxLane(
+                name=DEFAULT_LANE,
+                batch_size=outbox.batch_size,
+                concurrency=outbox.concurrency,
+                workers=outbox.workers,
+            ),
+            [
+                OutboxLane(
+                    name=name,
+                    event_types=frozenset(lane.event_types),
+                    batch_size=lane.batch_size,
+                    concurrency=lane.concurrency,
+                    workers=lane.workers,
+                )
+                for name, lane in outbox.lanes.items()
+            ],
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_handler_policies(self, outbox: OutboxSettings) -> HandlerPolicies:
+        default = HandlerPolicy(
+            timeout=outbox.handler_timeout_s or None,
+            breaker_failures=outbox.breaker_failures,
+            breaker_cool_off=outbox.breaker_cool_off_s,
+        )
+        overrides: dict[str, HandlerPolicy] = {}
+        for name, handler in outbox.handlers.items():
+            timeout = default.timeout
+            if handler.timeout_s is not None:
+                timeout = handler.timeout_s or None
+            overrides[name] = HandlerPolicy(
+                timeout=timeout,
+                breaker_failures=(
+                    default.breaker_failures
+                    if handler.breaker_failures is None
+                    else handler.breaker_failures
+                ),
+                breaker_cool_off=(
+                    default.breaker_cool_off
+                    if handler.breaker_cool_off_s is None
+                    else handler.breaker_cool_off_s
+                ),
+            )
+        return HandlerPolicies(default, overrides)
+
+
 class EntrypointProvider(Provider):
     scope = Scope.REQUEST
 
     request = from_context(provides=Request)
 
-    @provide
-    def provide_access_token_decoder(
+    @provide(scope=Scope.APP)
+    async def provide_access_token_decoder(
         self,
         security: SecuritySettings,
-    ) -> AccessTokenDecoder:
-        jwks_url: str | None = None
+        http_client: SupabaseHttpClient,
+    ) -> AsyncIterator[AccessTokenDecoder]:
+        """Shared by all requests; asymmetric keys come from an in-memory JWKS."""
+        key_store: JwksKeyStore | None = None
         if security.auth.jwt_algorithm.startswith("ES"):
-            jwks_url = f"{security.supabase.url}/auth/v1/.well-known/jwks.json"
-        return AccessTokenDecoder(
+            key_store = JwksKeyStore(
+                url=f"{security.supabase.url}/auth/v1/.well-known/jwks.json",
+                http_client=http_client,
+                refresh_interval=security.auth.jwks_refresh_interval_s,
+                min_refresh_interval=security.auth.jwks_min_refresh_interval_s,
+            )
+            await key_store.start()
+        yield AccessTokenDecoder(
             secret=security.auth.jwt_secret,
             algorithm=security.auth.jwt_algorithm,
-            jwks_url=jwks_url,
+            key_store=key_store,
         )
+        if key_store is not None:
+            log.debug("Stopping JWKS refresh...")
+            await key_store.close()
+
+    @provide(scope=Scope.APP)
+    def provide_security_metrics(self, registry: MetricsRegistry) -> SecurityMetrics:
+        return SecurityMetrics(registry)
+
+    @provide(scope=Scope.APP)
+    def provide_verified_token_cache(
+        self,
+        security: SecuritySettings,
+        metrics: SecurityMetrics,
+    ) -> VerifiedTokenCache:
+        return VerifiedTokenCache(
+            max_size=security.auth.token_cache_size,
+            max_ttl=security.auth.token_cache_max_ttl_s,
+            metrics=metrics,
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_account_access_cache(
+        self,
+        security: SecuritySettings,
+        metrics: SecurityMetrics,
+    ) -> AccountAccessCache:
+        return AccountAccessCache(
+            max_size=security.auth.access_cache_size,
+            ttl=security.auth.access_cache_ttl_s,
+            metrics=metrics,
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_authorization_policy(
+        self,
+        security: SecuritySettings,
+    ) -> AuthorizationPolicy:
+        return AuthorizationPolicy(
+            trust_token_claims=security.auth.token_claims_authz,
+            strict=security.auth.strict_authz,
+        )
+
+
+def _supabase_auth_url(security: SecuritySettings) -> str:
+    return f"{security.supabase.url}/auth/v1"
+
+
+def _supabase_auth_headers(security: SecuritySettings) -> dict[str, str]:
+    key = security.supabase.service_role_key
+    return {**DEFAULT_HEADERS, "apikey": key, "Authorization": f"Bearer {key}"}
 
 
 class SupabaseProvider(Provider):
     @provide(scope=Scope.APP)
-    def provide_admin_supabase_client(
+    async def provide_supabase_http_client(
         self,
         security: SecuritySettings,
-    ) -> AdminSupabaseClient:
-        """Dedicated client for admin operations (create_user, etc.).
+    ) -> AsyncIterator[SupabaseHttpClient]:
+        """One keep-alive connection pool shared by every Supabase Auth call."""
+        client = SupabaseHttpClient(
+            httpx.AsyncClient(
+                timeout=security.supabase.http_timeout_s,
+                limits=httpx.Limits(
+                    max_connections=security.supabase.http_max_connections,
+                    max_keepalive_connections=security.supabase.http_max_connections,
+                ),
+                follow_redirects=True,
+            )
+        )
+        yield client
+        log.debug("Closing Supabase HTTP client...")
+        await client.aclose()
 
-        Isolated from user auth state changes that would overwrite the
-        service-role Authorization header.
+    @provide(scope=Scope.APP)
+    def provide_supabase_auth_client(
+        self,
+        security: SecuritySettings,
+        http_client: SupabaseHttpClient,
+    ) -> SupabaseAuthClient:
+        """Auth client with the service-role key, for admin calls.
+
+        Shared by all requests, so it must not sign users in or refresh their
+        sessions: it would keep them. ``SupabaseTokenEndpoint`` does that.
         """
-        return AdminSupabaseClient(
-            create_client(
-                security.supabase.url,
-                security.supabase.service_role_key,
-            )
+        return SupabaseAuthClient(
+            url=_supabase_auth_url(security),
+            headers=_supabase_auth_headers(security),
+            http_client=http_client,
+            auto_refresh_token=False,
+            persist_session=False,
         )
 
     @provide(scope=Scope.APP)
-    def provide_auth_supabase_client(
+    def provide_supabase_token_endpoint(
         self,
         security: SecuritySettings,
-    ) -> AuthSupabaseClient:
-        """Dedicated client for user-facing auth (sign_in, refresh)."""
-        return AuthSupabaseClient(
-            create_client(
-                security.supabase.url,
-                security.supabase.service_role_key,
-            )
+        http_client: SupabaseHttpClient,
+    ) -> SupabaseTokenEndpoint:
+        return SupabaseTokenEndpoint(
+            http_client,
+            url=_supabase_auth_url(security),
+            headers=_supabase_auth_headers(security),
         )
 
     @provide(scope=Scope.APP)
     def provide_account_provisioner(
         self,
-        client: AdminSupabaseClient,
+        client: SupabaseAuthClient,
     ) -> AccountProvisioner:
         return SupabaseAccountProvisioner(client)
 
+    @provide(scope=Scope.APP)
+    def provide_access_claims_publisher(
+        self,
+        client: SupabaseAuthClient,
+    ) -> AccessClaimsPublisher:
+        return SupabaseAccessClaimsPublisher(client)
+
     @provide(scope=Scope.APP)
     def provide_password_resetter(
         self,
-        client: AdminSupabaseClient,
+        client: SupabaseAuthClient,
     ) -> PasswordResetter:
         return SupabasePasswordResetter(client)
 
     @provide(scope=Scope.APP)
     def provide_token_pair_issuer(
         self,
-        client: AuthSupabaseClient,
+        tokens: SupabaseTokenEndpoint,
         security: SecuritySettings,
     ) -> TokenPairIssuer:
         return SupabaseTokenPairIssuer(
-            client=client,
+            tokens=tokens,
             access_token_expiry_s=security.auth.access_token_expiry_min * 60,
         )
 
     @provide(scope=Scope.APP)
     def provide_token_pair_refresher(
         self,
-        client: AuthSupabaseClient,
+        tokens: SupabaseTokenEndpoint,
         security: SecuritySettings,
+        metrics: SecurityMetrics,
     ) -> TokenPairRefresher:
-        return SupabaseTokenPairRefresher(
-            client=client,
-            access_token_expiry_s=security.auth.access_token_expiry_min * 60,
+        return SingleFlightTokenPairRefresher(
+            SupabaseTokenPairRefresher(
+                tokens=tokens,
+                access_token_expiry_s=security.auth.access_token_expiry_min * 60,
+            ),
+            grace=security.auth.refresh_grace_s,
+            metrics=metrics,
         )
 
-    @provide(scope=Scope.APP)
-    def provide_access_revoker(
+    @provide(
+        scope=Scope.APP,
+        provides=AnyOf[
+            AccessRevoker,
+            RevokedAccessRegistry,
+            AccessRevocationCoordinator,
+        ],
+    )
+    async def provide_access_revoker(
         self,
-        client: AdminSupabaseClient,
-    ) -> AccessRevoker:
-        return SupabaseAccessRevoker(client)
+        client: SupabaseAuthClient,
+        security: SecuritySettings,
+        metrics: SecurityMetrics,
+    ) -> AsyncIterator[AccessRevocationCoordinator]:
+        """Revocations go through one coordinator, off the request path."""
+        coordinator = AccessRevocationCoordinator(
+            SupabaseAccessRevoker(client),
+            ttl=security.auth.revocation_ttl_s,
+            metrics=metrics,
+        )
+        yield coordinator
+        log.debug("Waiting for in-flight access revocations...")
+        await coordinator.close()
 
 
 def infrastructure_providers() -> tuple[Provider, ...]:
     return (
         PersistenceSqlaProvider(),
+        MetricsProvider(),
+        OutboxProvider(),
         EntrypointProvider(),
         SupabaseProvider(),
     )
@@ -5,6 +5,7 @@ from dishka import Provider
 from shared.infrastructure.config.di.application import (
     AccountApplicationProvider,
     CoreApplicationProvider,
+    OutboxApplicationProvider,
 )
 from shared.infrastructure.config.di.domain import CoreDomainProvider
 from shared.infrastructure.config.di.events import EventHandlerProvider
@@ -17,6 +18,7 @@ def get_providers() -> Iterable[Provider]:
         CoreDomainProvider(),
         AccountApplicationProvider(),
         CoreApplicationProvider(),
+        OutboxApplicationProvider(),
         EventHandlerProvider(),
         *infrastructure_providers(),
         SettingsProvider(),
@@ -6,6 +6,7 @@ from shared.infrastructure.config.settings.database import (
     SqlaEngineSettings,
 )
 from shared.infrastructure.config.settings.logs import LoggingSettings
+from shared.infrastructure.config.settings.outbox import OutboxSettings
 from shared.infrastructure.config.settings.security import SecuritySettings
 
 
@@ -29,3 +30,7 @@ class SettingsProvider(Provider):
     @provide
     def logs(self, settings: AppSettings) -> LoggingSettings:
         return settings.logs
+
+    @provide
+    def outbox(self, settings: AppSettings) -> OutboxSettings:
+        return settings.outbox
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from shared.infrastructure.config.settings.database import (
     PostgresSettings,
@@ -10,6 +10,7 @@ from shared.infrastructure.config.settings.loader import (
     load_full_config,
 )
 from shared.infrastructure.config.settings.logs import LoggingSettings
+from shared.infrastructure.config.settings.outbox import OutboxSettings
 from shared.infrastructure.config.settings.security import SecuritySettings
 
 
@@ -18,6 +19,7 @@ class AppSettings(BaseModel):
     sqla: SqlaEngineSettings
     security: SecuritySettings
     logs: LoggingSettings
+    outbox: OutboxSettings = Field(default_factory=OutboxSettings)
 
 
 def load_settings(env: ValidEnvs | None = None) -> AppSettings:
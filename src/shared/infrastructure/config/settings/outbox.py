@@ -0,0 +1,52 @@
+from pydantic import BaseModel, Field
+
+
+class OutboxRetentionSettings(BaseModel):
+    enabled: bool = Field(alias="ENABLED", default=True)
+    archive: bool = Field(alias="ARCHIVE", default=True)
+    min_age_s: float = Field(alias="MIN_AGE_S", default=3600.0, ge=0)
+    days: int = Field(alias="DAYS", default=30, ge=1)
+    batch_size: int = Field(alias="BATCH_SIZE", default=1000, ge=1)
+    interval_s: float = Field(alias="INTERVAL_S", default=60.0, gt=0)
+
+
+class OutboxLaneSettings(BaseModel):
+    event_types: list[str] = Field(alias="EVENT_TYPES", min_length=1)
+    batch_size: int = Field(alias="BATCH_SIZE", default=100, ge=1)
+    concurrency: int = Field(alias="CONCURRENCY", default=10, ge=1)
+    workers: int = Field(alias="WORKERS", default=1, ge=1)
+
+
+class OutboxHandlerSettings(BaseModel):
+    timeout_s: float | None = Field(alias="TIMEOUT_S", default=None, ge=0)
+    breaker_failures: int | None = Field(alias="BREAKER_FAILURES", default=None, ge=0)
+    breaker_cool_off_s: float | None = Field(
+        alias="BREAKER_COOL_OFF_S", default=None, gt=0
+    )
+
+
+class OutboxSettings(BaseModel):
+    embedded_relay: bool = Field(alias="EMBEDDED_RELAY", default=True)
+    poll_interval_s: float = Field(alias="POLL_INTERVAL_S", default=30.0, gt=0)
+    min_poll_interval_s: float = Field(alias="MIN_POLL_INTERVAL_S", default=0.5, gt=0)
+    listen: bool = Field(alias="LISTEN", default=True)
+    max_retries: int = Field(alias="MAX_RETRIES", default=5, ge=1)
+    batch_size: int = Field(alias="BATCH_SIZE", default=100, ge=1)
+    lease_s: float = Field(alias="LEASE_S", default=60.0, gt=0)
+    workers: int = Field(alias="WORKERS", default=1, ge=1)
+    concurrency: int = Field(alias="CONCURRENCY", default=10, ge=1)
+    backoff_base_s: float = Field(alias="BACKOFF_BASE_S", default=1.0, gt=0)
+    backoff_max_s: float = Field(alias="BACKOFF_MAX_S", default=300.0, gt=0)
+    batch_scope: bool = Field(alias="BATCH_SCOPE", default=False)
+    fast_path: bool = Field(alias="FAST_PATH", default=True)
+    fast_path_wait_s: float = Field(alias="FAST_PATH_WAIT_S", default=2.0, ge=0)
+    worker_metrics_host: str = Field(alias="WORKER_METRICS_HOST", default="127.0.0.1")
+    worker_metrics_port: int = Field(
+        alias="WORKER_METRICS_PORT", default=0, ge=0, le=65535
+    )
+    handler_timeout_s: float = Field(alias="HANDLER_TIMEOUT_S", default=30.0, ge=0)
+    breaker_failures: int = Field(alias="BREAKER_FAILURES", default=5, ge=0)
+    breaker_cool_off_s: float = Field(alias="BREAKER_COOL_OFF_S", default=30.0, gt=0)
+    lanes: dict[str, OutboxLaneSettings] = Field(default_factory=dict)
+    handlers: dict[str, OutboxHandlerSettings] = Field(default_factory=dict)
+    retention: OutboxRetentionSettings = Field(default_factory=OutboxRetentionSettings)
@@ -15,11 +15,29 @@ class AuthSettings(BaseModel):
         "ES256",
     ] = Field(alias="JWT_ALGORITHM")
     access_token_expiry_min: int = Field(alias="ACCESS_TOKEN_EXPIRY_MIN", ge=1)
+    jwks_refresh_interval_s: float = Field(
+        alias="JWKS_REFRESH_INTERVAL_S", default=300.0, gt=0
+    )
+    jwks_min_refresh_interval_s: float = Field(
+        alias="JWKS_MIN_REFRESH_INTERVAL_S", default=10.0, gt=0
+    )
+    token_cache_size: int = Field(alias="TOKEN_CACHE_SIZE", default=10_000, ge=0)
+    token_cache_max_ttl_s: float = Field(
+        alias="TOKEN_CACHE_MAX_TTL_S", default=300.0, gt=0
+    )
+    access_cache_size: int = Field(alias="ACCESS_CACHE_SIZE", default=10_000, ge=0)
+    access_cache_ttl_s: float = Field(alias="ACCESS_CACHE_TTL_S", default=30.0, gt=0)
+    token_claims_authz: bool = Field(alias="TOKEN_CLAIMS_AUTHZ", default=False)
+    strict_authz: bool = Field(alias="STRICT_AUTHZ", default=True)
+    revocation_ttl_s: float = Field(alias="REVOCATION_TTL_S", default=60.0, gt=0)
+    refresh_grace_s: float = Field(alias="REFRESH_GRACE_S", default=10.0, ge=0)
 
 
 class SupabaseSettings(BaseModel):
     url: str = Field(alias="SUPABASE_URL")
     service_role_key: str = Field(alias="SERVICE_ROLE_KEY", min_length=32)
+    http_timeout_s: float = Field(alias="HTTP_TIMEOUT_S", default=10.0, gt=0)
+    http_max_connections: int = Field(alias="HTTP_MAX_CONNECTIONS", default=100, ge=1)
 
 
 class SecuritySettings(BaseModel):
@@ -0,0 +1,151 @@
+import asyncio
+import logging
+import signal
+
+from dishka import AsyncContainer, Provider, make_async_container
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from shared.infrastructure.config.bootstrap import map_tables, prepare_event_delivery
+from shared.infrastructure.config.di.provider_registry import get_providers
+from shared.infrastructure.config.settings.app_settings import AppSettings
+from shared.infrastructure.config.settings.outbox import OutboxSettings
+from shared.infrastructure.events.handler_policy import HandlerPolicies
+from shared.infrastructure.events.lanes import OutboxLanes
+from shared.infrastructure.events.metrics import OutboxMetricsCollector, RelayMetrics
+from shared.infrastructure.events.notifications import (
+    OutboxNotificationListener,
+    conninfo_from_engine,
+)
+from shared.infrastructure.events.relay import OutboxRelay
+from shared.infrastructure.events.retention import OutboxPruner
+from shared.infrastructure.observability.scrape_server import MetricsScrapeServer
+
+log = logging.getLogger(__name__)
+
+
+async def create_outbox_relay(container: AsyncContainer) -> OutboxRelay:
+    session_factory = await container.get(async_sessionmaker[AsyncSession])
+    outbox = await container.get(OutboxSettings)
+
+    listener: OutboxNotificationListener | None = None
+    if outbox.listen:
+        engine = await container.get(AsyncEngine)
+        listener = OutboxNotificationListener(conninfo_from_engine(engine))
+
+    return OutboxRelay(
+        container=container,
+        session_factory=session_factory,
+        poll_interval=outbox.poll_interval_s,
+        max_retries=outbox.max_retries,
+        lease_duration=outbox.lease_s,
+        min_poll_interval=outbox.min_poll_interval_s,
+        listener=listener,
+        backoff_base=outbox.backoff_base_s,
+        backoff_max=outbox.backoff_max_s,
+        batch_scope=outbox.batch_scope,
+        lanes=await container.get(OutboxLanes),
+        metrics=await container.get(RelayMetrics),
+        handler_policies=await container.get(HandlerPolicies),
+    )
+
+
+async def start_outbox_tasks(
+    container: AsyncContainer,
+    relay: OutboxRelay,
+) -> list[asyncio.Task[None]]:
+    """Starts the relay and, if enabled, the outbox pruner."""
+    session_factory = await container.get(async_sessionmaker[AsyncSession])
+    outbox = await container.get(OutboxSettings)
+
+    tasks = [asyncio.create_task(relay.run())]
+    if outbox.retention.enabled:
+        pruner = OutboxPruner(
+            session_factory=session_factory,
+            archive=outbox.retention.archive,
+            min_age=outbox.retention.min_age_s,
+            retention_days=outbox.retention.days,
+            batch_size=outbox.retention.batch_size,
+            interval=outbox.retention.interval_s,
+        )
+        tasks.append(asyncio.create_task(pruner.run()))
+    return tasks
+
+
+async def stop_outbox_tasks(tasks: list[asyncio.Task[None]]) -> None:
+    """Cancels the tasks and waits for them; re-raises the error of a crashed one."""
+    for task in tasks:
+        task.cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    log.debug("Outbox background tasks stopped.")
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+
+
+def create_worker_container(
+    settings: AppSettings,
+    *di_providers: Provider,
+) -> AsyncContainer:
+    """Same graph as the web app's; Dishka only builds what the relay resolves."""
+    return make_async_container(
+        *get_providers(),
+        *di_providers,
+        context={AppSettings: settings},
+    )
+
+
+async def create_metrics_server(
+    container: AsyncContainer,
+) -> MetricsScrapeServer | None:
+    """The worker's scrape endpoint, if ``WORKER_METRICS_PORT`` is set."""
+    outbox = await container.get(OutboxSettings)
+    if not outbox.worker_metrics_port:
+        return None
+
+    async def render() -> str:
+        async with container() as scope:
+            collector = await scope.get(OutboxMetricsCollector)
+            return await collector.render_text()
+
+    return MetricsScrapeServer(
+        render,
+        host=outbox.worker_metrics_host,
+        port=outbox.worker_metrics_port,
+    )
+
+
+async def run_outbox_worker(container: AsyncContainer) -> None:
+    """Runs the outbox relay and pruner until SIGINT or SIGTERM.
+
+    No web app, routers or OpenAPI schema are built. Any number of worker
+    processes can run side by side: relay claims never overlap.
+    """
+    map_tables()
+    prepare_event_delivery()
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stopping.set)
+
+    tasks = await start_outbox_tasks(container, await create_outbox_relay(container))
+    metrics_server = await create_metrics_server(container)
+    log.info("Outbox worker started.")
+    try:
+        if metrics_server is not None:
+            await metrics_server.start()
+        stop = asyncio.create_task(stopping.wait())
+        # Background tasks only return early when they crash.
+        await asyncio.wait([stop, *tasks], return_when=asyncio.FIRST_COMPLETED)
+        stop.cancel()
+    finally:
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(signum)
+        if metrics_server is not None:
+            await metrics_server.close()
+        try:
+            # A crashed task fails the process, for its supervisor to restart.
+            await stop_outbox_tasks(tasks)
+        finally:
+            await container.close()
+            log.info("Outbox worker stopped.")
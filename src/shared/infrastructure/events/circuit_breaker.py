@@ -0,0 +1,134 @@
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+
+from shared.infrastructure.events.handler_policy import HandlerPolicies
+
+log = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+@dataclass(slots=True)
+class _Circuit:
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    trial_in_flight: bool = False
+
+
+class HandlerCircuitBreakers:
+    """One circuit breaker per event handler class, local to the process.
+
+    A closed circuit lets every call through. ``breaker_failures``
+    consecutive failures open it: the handler gets no calls for
+    ``breaker_cool_off`` seconds, while other handlers keep flowing. Then the
+    circuit is half-open and lets a single trial call through, whose outcome
+    closes it again or reopens it for another cool-off.
+    """
+
+    __slots__ = ("_circuits", "_clock", "_on_transition", "_policies")
+
+    def __init__(
+        self,
+        policies: HandlerPolicies,
+        on_transition: Callable[[type, CircuitState], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._policies = policies
+        self._on_transition = on_transition
+        self._clock = clock
+        self._circuits: dict[type, _Circuit] = {}
+
+    def state(self, handler_type: type) -> CircuitState:
+        circuit = self._circuits.get(handler_type)
+        if circuit is None:
+            return CircuitState.CLOSED
+        self._cool_down(handler_type, circuit)
+        return circuit.state
+
+    def allow(self, handler_type: type) -> bool:
+        """Whether ``handler_type`` may be called now.
+
+        A half-open circuit admits one caller, which must report back through
+        ``record_success`` or ``record_failure``, or else ``release_trial``.
+        """
+        circuit = self._circuits.get(handler_type)
+        if circuit is None:
+            return True
+        self._cool_down(handler_type, circuit)
+        if circuit.state is CircuitState.CLOSED:
+            return True
+        if circuit.state is CircuitState.HALF_OPEN and not circuit.trial_in_flight:
+            circuit.trial_in_flight = True
+            return True
+        return False
+
+    def retry_after(self, handler_type: type) -> float:
+        """Seconds until ``handler_type``'s circuit lets calls through again."""
+        circuit = self._circuits.get(handler_type)
+        if circuit is None or circuit.state is not CircuitState.OPEN:
+            return 0.0
+        cool_off = self._policies.for_handler(handler_type).breaker_cool_off
+        return max(circuit.opened_at + cool_off - self._clock(), 0.0)
+
+    def record_success(self, handler_type: type) -> None:
+        circuit = self._circuits.get(handler_type)
+        if circuit is None:
+            return
+        circuit.failures = 0
+        circuit.trial_in_flight = False
+        if circuit.state is not CircuitState.CLOSED:
+            self._transition(handler_type, circuit, CircuitState.CLOSED)
+
+    def release_trial(self, handler_type: type) -> None:
+        """Lets another trial through after one that ended without an outcome,
+        e.g. cancelled; a no-op once ``record_success`` or ``record_failure``
+        ran. Only the caller that ``allow`` admitted as the trial may call it:
+        it would free another caller's trial too."""
+        circuit = self._circuits.get(handler_type)
+        if circuit is not None:
+            circuit.trial_in_flight = False
+
+    def record_failure(self, handler_type: type) -> None:
+        threshold = self._policies.for_handler(handler_type).breaker_failures
+        if threshold <= 0:
+            return
+        circuit = self._circuits.setdefault(handler_type, _Circuit())
+        circuit.failures += 1
+        circuit.trial_in_flight = False
+        if circuit.state is CircuitState.HALF_OPEN or (
+            circuit.state is CircuitState.CLOSED and circuit.failures >= threshold
+        ):
+            circuit.opened_at = self._clock()
+            self._transition(handler_type, circuit, CircuitState.OPEN)
+
+    def _cool_down(self, handler_type: type, circuit: _Circuit) -> None:
+        if circuit.state is CircuitState.OPEN and not self.retry_after(handler_type):
+            self._transition(handler_type, circuit, CircuitState.HALF_OPEN)
+
+    def _transition(
+        self,
+        handler_type: type,
+        circuit: _Circuit,
+        state: CircuitState,
+    ) -> None:
+        circuit.state = state
+        if state is CircuitState.OPEN:
+            log.warning(
+                "Circuit for handler %s opened after %d consecutive failures; "
+                "pausing its deliveries for %.1fs.",
+                handler_type.__name__,
+                circuit.failures,
+                self.retry_after(handler_type),
+            )
+        else:
+            log.info("Circuit for handler %s is %s.", handler_type.__name__, state)
+        if self._on_transition is not None:
+            self._on_transition(handler_type, state)
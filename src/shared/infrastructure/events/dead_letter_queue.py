@@ -0,0 +1,94 @@
+import logging
+
+from sqlalchemy import delete, false, func, insert, literal, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from shared.application.dead_letter_queue import DeadLetterQueue
+from shared.infrastructure.events.notifications import OUTBOX_NOTIFY_CHANNEL
+from shared.infrastructure.persistence.constants import (
+    DB_COMMIT_DONE,
+    DB_QUERY_FAILED,
+)
+from shared.infrastructure.persistence.errors import DataMapperError
+from shared.infrastructure.persistence.mappers.outbox import (
+    outbox_dead_letter_table,
+    outbox_table,
+)
+from shared.infrastructure.persistence.types_ import MainAsyncSession
+
+log = logging.getLogger(__name__)
+
+
+class SqlaDeadLetterQueue(DeadLetterQueue):
+    def __init__(self, session: MainAsyncSession) -> None:
+        self._session = session
+
+    async def replay(self, event_type: str | None, limit: int) -> int:
+        """Moves dead letters back into the outbox in a single statement.
+
+        Replayed entries start over with a fresh retry budget and are due
+        immediately.
+
+        :raises DataMapperError:
+        """
+        dead_letter = outbox_dead_letter_table
+        selected = (
+            select(dead_letter.c.id)
+            .order_by(dead_letter.c.dead_lettered_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        if event_type is not None:
+            selected = selected.where(dead_letter.c.event_type == event_type)
+
+        removed = (
+            delete(dead_letter)
+            .where(dead_letter.c.id.in_(selected.scalar_subquery()))
+            .returning(
+                dead_letter.c.id,
+                dead_letter.c.event_type,
+                dead_letter.c.payload,
+                dead_letter.c.occurred_at,
+                dead_letter.c.aggregate_id,
+            )
+            .cte("removed")
+        )
+        stmt = (
+            insert(outbox_table)
+            .from_select(
+                [
+                    "id",
+                    "event_type",
+                    "payload",
+                    "occurred_at",
+                    "aggregate_id",
+                    "delivered",
+                    "retry_count",
+                    "next_attempt_at",
+                ],
+                select(
+                    removed.c.id,
+                    removed.c.event_type,
+                    removed.c.payload,
+                    removed.c.occurred_at,
+                    removed.c.aggregate_id,
+                    false(),
+                    literal(0),
+                    func.now(),
+                ),
+            )
+            .returning(outbox_table.c.id)
+        )
+
+        try:
+            replayed = len((await self._session.execute(stmt)).fetchall())
+            if replayed:
+                await self._session.execute(
+                    select(func.pg_notify(OUTBOX_NOTIFY_CHANNEL, ""))
+                )
+            await self._session.commit()
+            log.debug("%s Dead letter replay.", DB_COMMIT_DONE)
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+
+        return replayed
@@ -1,28 +1,61 @@
 import logging
+from uuid import uuid4
+
+from sqlalchemy import func, insert, select
 
 from shared.domain.domain_event import DomainEvent
+from shared.infrastructure.events.fast_path import PostCommitDelivery
+from shared.infrastructure.events.notifications import OUTBOX_NOTIFY_CHANNEL
 from shared.infrastructure.events.serialization import serialize_event
-from shared.infrastructure.persistence.mappers.outbox import OutboxRecord
+from shared.infrastructure.persistence.mappers.outbox import outbox_table
 from shared.infrastructure.persistence.types_ import MainAsyncSession
 
 log = logging.getLogger(__name__)
 
 
 class OutboxEventDispatcher:
-    def __init__(self, session: MainAsyncSession) -> None:
+    def __init__(
+        self,
+        session: MainAsyncSession,
+        post_commit: PostCommitDelivery | None = None,
+    ) -> None:
         self._session = session
+        self._post_commit = post_commit
 
     async def dispatch(self, events: list[DomainEvent]) -> None:
+        """Writes the events to the outbox in the caller's transaction.
+
+        All events go out as one Core ``INSERT`` executed as an executemany,
+        which SQLAlchemy sends as multi-row ``VALUES`` batches, bypassing
+        per-object unit-of-work bookkeeping. The written ids are handed to
+        ``post_commit``, if any, for in-process delivery once committed.
+        """
+        if not events:
+            return
+
+        rows = []
+        ids = []
         for event in events:
             log.debug(
                 "Writing event to outbox: %s (id=%s)",
                 event.event_type,
                 event.event_id,
             )
+            ids.append(uuid4())
+            rows.append({
+                "id": ids[-1],
+                "event_type": event.event_type,
+                "payload": serialize_event(event),
+                "occurred_at": event.occurred_at,
+                "delivered": False,
+                "retry_count": 0,
+                "aggregate_id": event.aggregate_id,
+            })
 
-            record = OutboxRecord(
-                event_type=event.event_type,
-                payload=serialize_event(event),
-                occurred_at=event.occurred_at,
-            )
-            self._session.add(record)
+        # Due by the database clock that claims compare it with, not ours.
+        stmt = insert(outbox_table).values(next_attempt_at=func.now())
+        await self._session.execute(stmt, rows)
+        # Delivered by Postgres only when the surrounding transaction commits.
+        await self._session.execute(select(func.pg_notify(OUTBOX_NOTIFY_CHANNEL, "")))
+        if self._post_commit is not None:
+            self._post_commit.track(ids)
@@ -0,0 +1,89 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Sequence
+from uuid import UUID
+
+from shared.infrastructure.events.relay import OutboxRelay, is_delivering
+
+log = logging.getLogger(__name__)
+
+DEFAULT_FAST_PATH_WAIT_SECONDS: float = 2.0
+
+
+class OutboxFastPath:
+    """Delivers freshly committed outbox entries in process, ahead of polling.
+
+    Deliveries run as background tasks through ``OutboxRelay.deliver``, which
+    leases the entries like any claim, so the relay stays the fallback for
+    entries this process never gets to (crash, shutdown, failed handlers).
+    Without an attached relay, scheduling is a no-op.
+
+    Deliveries run in the background unless the caller opts in to waiting,
+    up to ``wait`` seconds, to observe their effects; past that, they
+    continue in the background. Only callers that read those effects right
+    after should wait: every handler of the entries, remote calls included,
+    counts against it. Handlers running under the relay never wait, so they
+    do not hold a handler slot that the delivery itself may need.
+    """
+
+    def __init__(self, wait: float = DEFAULT_FAST_PATH_WAIT_SECONDS) -> None:
+        self._wait = wait
+        self._relay: OutboxRelay | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def attach(self, relay: OutboxRelay) -> None:
+        self._relay = relay
+
+    async def deliver(self, ids: Sequence[UUID], *, wait: bool = False) -> None:
+        if self._relay is None or not ids:
+            return
+        task = asyncio.create_task(self._run(self._relay, ids))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if not wait or self._wait <= 0 or is_delivering():
+            return
+        with contextlib.suppress(TimeoutError):
+            # Shielded: timing out only stops waiting, not the delivery.
+            await asyncio.wait_for(asyncio.shield(task), self._wait)
+
+    async def close(self) -> None:
+        """Cancels in-flight deliveries; their leases expire to the relay."""
+        self._relay = None
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _run(relay: OutboxRelay, ids: Sequence[UUID]) -> None:
+        try:
+            await relay.deliver(ids)
+        except Exception:
+            log.exception(
+                "Outbox fast path failed for %d entries; leaving them to the relay.",
+                len(ids),
+            )
+
+
+class PostCommitDelivery:
+    """Collects the outbox entries written in one request until it commits.
+
+    ``OutboxEventDispatcher`` tracks the ids it inserts; the unit of work
+    hands them to ``OutboxFastPath`` after a successful commit, or drops them
+    on rollback.
+    """
+
+    def __init__(self, fast_path: OutboxFastPath) -> None:
+        self._fast_path = fast_path
+        self._pending: list[UUID] = []
+
+    def track(self, ids: Sequence[UUID]) -> None:
+        self._pending.extend(ids)
+
+    async def committed(self, *, wait: bool = False) -> None:
+        ids, self._pending = self._pending, []
+        await self._fast_path.deliver(ids, wait=wait)
+
+    def discard(self) -> None:
+        self._pending.clear()
@@ -0,0 +1,38 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Final
+
+DEFAULT_HANDLER_TIMEOUT_SECONDS: Final[float] = 30.0
+DEFAULT_BREAKER_FAILURES: Final[int] = 5
+DEFAULT_BREAKER_COOL_OFF_SECONDS: Final[float] = 30.0
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class HandlerPolicy:
+    """How the relay guards calls to one event handler class.
+
+    ``timeout`` bounds each call, ``None`` for no deadline. After
+    ``breaker_failures`` consecutive failures, 0 to never, the handler's
+    circuit opens and it gets no events for ``breaker_cool_off`` seconds.
+    """
+
+    timeout: float | None = DEFAULT_HANDLER_TIMEOUT_SECONDS
+    breaker_failures: int = DEFAULT_BREAKER_FAILURES
+    breaker_cool_off: float = DEFAULT_BREAKER_COOL_OFF_SECONDS
+
+
+class HandlerPolicies:
+    """Per-handler-class policies, by class name, over a default policy."""
+
+    __slots__ = ("_overrides", "default")
+
+    def __init__(
+        self,
+        default: HandlerPolicy | None = None,
+        overrides: Mapping[str, HandlerPolicy] | None = None,
+    ) -> None:
+        self.default = default or HandlerPolicy()
+        self._overrides = dict(overrides or {})
+
+    def for_handler(self, handler_type: type) -> HandlerPolicy:
+        return self._overrides.get(handler_type.__name__, self.default)
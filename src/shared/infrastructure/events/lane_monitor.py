@@ -0,0 +1,47 @@
+from sqlalchemy import false, func, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from shared.application.outbox_lane_monitor import LaneBacklog, OutboxLaneMonitor
+from shared.infrastructure.events.lanes import OutboxLanes
+from shared.infrastructure.persistence.constants import DB_QUERY_FAILED
+from shared.infrastructure.persistence.errors import DataMapperError
+from shared.infrastructure.persistence.mappers.outbox import outbox_table
+from shared.infrastructure.persistence.types_ import MainAsyncSession
+
+
+class SqlaOutboxLaneMonitor(OutboxLaneMonitor):
+    def __init__(self, session: MainAsyncSession, lanes: OutboxLanes) -> None:
+        self._session = session
+        self._lanes = lanes
+
+    async def backlogs(self) -> list[LaneBacklog]:
+        """Aggregates undelivered entries per event type, then per lane.
+
+        Lag is measured against the database clock, like the claim query.
+
+        :raises DataMapperError:
+        """
+        stmt = (
+            select(
+                outbox_table.c.event_type,
+                func.count(),
+                func.extract(
+                    "epoch",
+                    func.now() - func.min(outbox_table.c.occurred_at),
+                ),
+            )
+            .where(outbox_table.c.delivered == false())
+            .group_by(outbox_table.c.event_type)
+        )
+        try:
+            rows = (await self._session.execute(stmt)).all()
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+
+        totals = self._lanes.totals(
+            (event_type, count, max(float(lag), 0.0)) for event_type, count, lag in rows
+        )
+        return [
+            LaneBacklog(lane=name, backlog=backlog, lag_s=lag)
+            for name, (backlog, lag) in totals.items()
+        ]
@@ -0,0 +1,88 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Final
+
+from sqlalchemy import ColumnElement, FromClause
+
+from shared.infrastructure.persistence.mappers.outbox import outbox_table
+
+DEFAULT_LANE: Final[str] = "default"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OutboxLane:
+    """A delivery lane: event types claimed by their own relay workers.
+
+    Each lane has its own claim loops, batch size and handler concurrency
+    budget, so a burst in one lane never occupies another lane's workers or
+    handler slots.
+    """
+
+    name: str
+    event_types: frozenset[str] = frozenset()
+    batch_size: int
+    concurrency: int
+    workers: int
+
+
+class OutboxLanes:
+    """Routes event types to lanes; unlisted types go to the default lane."""
+
+    __slots__ = ("_by_event_type", "default", "lanes")
+
+    def __init__(self, default: OutboxLane, routed: Sequence[OutboxLane] = ()) -> None:
+        """:raises ValueError:"""
+        if default.event_types:
+            msg = f"Default outbox lane '{default.name}' cannot list event types."
+            raise ValueError(msg)
+        self.default = default
+        self.lanes: tuple[OutboxLane, ...] = (default, *routed)
+        self._by_event_type: dict[str, OutboxLane] = {}
+        names = {default.name}
+        for lane in routed:
+            if lane.name in names:
+                msg = f"Duplicate outbox lane '{lane.name}'."
+                raise ValueError(msg)
+            names.add(lane.name)
+            if not lane.event_types:
+                msg = f"Outbox lane '{lane.name}' lists no event types."
+                raise ValueError(msg)
+            for event_type in lane.event_types:
+                other = self._by_event_type.setdefault(event_type, lane)
+                if other is not lane:
+                    msg = (
+                        f"Event type '{event_type}' is routed to both outbox lanes "
+                        f"'{other.name}' and '{lane.name}'."
+                    )
+                    raise ValueError(msg)
+
+    def lane_for(self, event_type: str) -> OutboxLane:
+        return self._by_event_type.get(event_type, self.default)
+
+    def claim_filter(
+        self,
+        lane: OutboxLane,
+        table: FromClause = outbox_table,
+    ) -> ColumnElement[bool] | None:
+        """Restricts an outbox query on ``table``, the outbox or an alias of
+        it, to the entries of ``lane``, if needed."""
+        if lane.event_types:
+            return table.c.event_type.in_(sorted(lane.event_types))
+        if self._by_event_type:
+            return table.c.event_type.not_in(sorted(self._by_event_type))
+        return None
+
+    def totals(
+        self,
+        by_event_type: Iterable[tuple[str, int, float]],
+    ) -> dict[str, tuple[int, float]]:
+        """Folds (event type, backlog, lag) rows into (backlog, lag) per lane.
+
+        A lane's lag is the largest lag among its event types.
+        """
+        totals = {lane.name: (0, 0.0) for lane in self.lanes}
+        for event_type, backlog, lag in by_event_type:
+            name = self.lane_for(event_type).name
+            lane_backlog, lane_lag = totals[name]
+            totals[name] = (lane_backlog + backlog, max(lane_lag, lag))
+        return totals
@@ -0,0 +1,267 @@
+import math
+import time
+from collections import deque
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import Final
+
+from shared.application.outbox_lane_monitor import LaneBacklog, OutboxLaneMonitor
+from shared.application.outbox_metrics_reader import (
+    OutboxMetricsReader,
+    OutboxMetricsReport,
+)
+from shared.infrastructure.events.circuit_breaker import CircuitState
+from shared.infrastructure.observability.metrics import MetricsRegistry
+
+DEFAULT_RATE_WINDOW_SECONDS: float = 60.0
+# Scrapes within this long of a backlog refresh reuse its counts.
+DEFAULT_BACKLOG_MAX_AGE_SECONDS: float = 5.0
+# Only the relay's metrics are exported: the registry is shared with others.
+OUTBOX_METRIC_PREFIX: Final[str] = "outbox_"
+
+LAG_BUCKETS: Final[tuple[float, ...]] = (
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+    900.0,
+    3600.0,
+)
+_CIRCUIT_STATE_VALUES: Final[dict[CircuitState, float]] = {
+    CircuitState.CLOSED: 0.0,
+    CircuitState.HALF_OPEN: 1.0,
+    CircuitState.OPEN: 2.0,
+}
+
+
+class RelayMetrics:
+    """The outbox relay's counters, gauges and histograms.
+
+    Per-process: each web app or worker process counts its own deliveries.
+    Backlog and lag gauges come from the database, so every process reports
+    the same, global values for them.
+    """
+
+    __slots__ = (
+        "_backlog",
+        "_backlog_max_age",
+        "_backlog_refreshed_at",
+        "_batch_duration",
+        "_circuit_state",
+        "_circuit_transitions",
+        "_dead_letters",
+        "_delivered",
+        "_delivery_lag",
+        "_fast_path_duration",
+        "_handler_duration",
+        "_handler_failures",
+        "_handler_timeouts",
+        "_lag",
+        "_lanes",
+        "_poll_duration",
+        "_postponed",
+        "_rate_window",
+        "_recent",
+        "_retries",
+    )
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        rate_window: float = DEFAULT_RATE_WINDOW_SECONDS,
+        backlog_max_age: float = DEFAULT_BACKLOG_MAX_AGE_SECONDS,
+    ) -> None:
+        self._backlog = registry.gauge(
+            "outbox_backlog",
+            "Undelivered outbox entries.",
+            ("lane",),
+        )
+        self._lag = registry.gauge(
+            "outbox_lag_seconds",
+            "Age of the oldest undelivered outbox entry.",
+            ("lane",),
+        )
+        self._delivered = registry.counter(
+            "outbox_events_delivered_total",
+            "Outbox entries delivered to all their handlers.",
+            ("event_type",),
+        )
+        self._delivery_lag = registry.histogram(
+            "outbox_delivery_lag_seconds",
+            "Time from an event's occurrence to its delivery.",
+            ("event_type",),
+            buckets=LAG_BUCKETS,
+        )
+        self._handler_duration = registry.histogram(
+            "outbox_handler_duration_seconds",
+            "Event handler call latency.",
+            ("handler",),
+        )
+        self._handler_failures = registry.counter(
+            "outbox_handler_failures_total",
+            "Event handler calls that raised.",
+            ("handler",),
+        )
+        self._handler_timeouts = registry.counter(
+            "outbox_handler_timeouts_total",
+            "Event handler calls cancelled at their deadline.",
+            ("handler",),
+        )
+        self._circuit_state = registry.gauge(
+            "outbox_circuit_state",
+            "Handler circuit breaker state: 0 closed, 1 half-open, 2 open.",
+            ("handler",),
+        )
+        self._circuit_transitions = registry.counter(
+            "outbox_circuit_transitions_total",
+            "Handler circuit breaker state changes, by the state entered.",
+            ("handler", "state"),
+        )
+        self._postponed = registry.counter(
+            "outbox_postponed_total",
+            "Outbox entries rescheduled, without using a retry, behind an open "
+            "handler circuit.",
+            ("event_type",),
+        )
+        self._retries = registry.counter(
+            "outbox_retries_total",
+            "Outbox entries rescheduled after a failed delivery.",
+            ("event_type",),
+        )
+        self._dead_letters = registry.counter(
+            "outbox_dead_letters_total",
+            "Outbox entries moved to dead letters after exhausting retries.",
+            ("event_type",),
+        )
+        self._poll_duration = registry.histogram(
+            "outbox_poll_duration_seconds",
+            "Duration of the claim query, including empty polls.",
+            ("lane",),
+        )
+        self._batch_duration = registry.histogram(
+            "outbox_batch_duration_seconds",
+            "Duration of delivering and acknowledging a claimed batch.",
+            ("lane",),
+        )
+        self._fast_path_duration = registry.histogram(
+            "outbox_fast_path_duration_seconds",
+            "Duration of in-process deliveries right after a commit.",
+        )
+        self._rate_window = rate_window
+        self._recent: deque[tuple[float, str]] = deque()
+        self._backlog_max_age = backlog_max_age
+        self._backlog_refreshed_at = -math.inf
+        self._lanes: list[LaneBacklog] = []
+
+    def observe_poll(self, lane: str, seconds: float) -> None:
+        self._poll_duration.observe(seconds, lane=lane)
+
+    def observe_batch(self, lane: str, seconds: float) -> None:
+        self._batch_duration.observe(seconds, lane=lane)
+
+    def observe_fast_path(self, seconds: float) -> None:
+        self._fast_path_duration.observe(seconds)
+
+    def observe_handler(self, handler: str, seconds: float, *, failed: bool) -> None:
+        self._handler_duration.observe(seconds, handler=handler)
+        if failed:
+            self._handler_failures.inc(handler=handler)
+
+    def handler_timed_out(self, handler: str) -> None:
+        self._handler_timeouts.inc(handler=handler)
+
+    def circuit_changed(self, handler_type: type, state: CircuitState) -> None:
+        handler = handler_type.__name__
+        self._circuit_state.set(_CIRCUIT_STATE_VALUES[state], handler=handler)
+        self._circuit_transitions.inc(handler=handler, state=state)
+
+    def delivered(self, entries: Iterable[tuple[str, datetime]]) -> None:
+        """Counts (event type, occurred at) pairs that were just acknowledged."""
+        now = datetime.now(UTC)
+        clock = time.monotonic()
+        for event_type, occurred_at in entries:
+            self._delivered.inc(event_type=event_type)
+            self._delivery_lag.observe(
+                max((now - occurred_at).total_seconds(), 0.0),
+                event_type=event_type,
+            )
+            self._recent.append((clock, event_type))
+        self._trim(clock)
+
+    def retried(self, event_type: str) -> None:
+        self._retries.inc(event_type=event_type)
+
+    def dead_lettered(self, event_type: str) -> None:
+        self._dead_letters.inc(event_type=event_type)
+
+    def postponed(self, event_type: str) -> None:
+        self._postponed.inc(event_type=event_type)
+
+    def update_backlog(self, backlogs: Iterable[LaneBacklog]) -> None:
+        self._lanes = list(backlogs)
+        self._backlog_refreshed_at = time.monotonic()
+        for backlog in self._lanes:
+            self._backlog.set(backlog.backlog, lane=backlog.lane)
+            self._lag.set(backlog.lag_s, lane=backlog.lane)
+
+    def recent_backlog(self) -> list[LaneBacklog] | None:
+        """The last backlog counts, unless they are older than the max age."""
+        age = time.monotonic() - self._backlog_refreshed_at
+        return self._lanes if age < self._backlog_max_age else None
+
+    def delivered_per_second(self) -> dict[str, float]:
+        self._trim(time.monotonic())
+        counts: dict[str, int] = {}
+        for _, event_type in self._recent:
+            counts[event_type] = counts.get(event_type, 0) + 1
+        return {
+            event_type: count / self._rate_window
+            for event_type, count in sorted(counts.items())
+        }
+
+    def _trim(self, clock: float) -> None:
+        horizon = clock - self._rate_window
+        while self._recent and self._recent[0][0] < horizon:
+            self._recent.popleft()
+
+
+class OutboxMetricsCollector(OutboxMetricsReader):
+    """Refreshes the backlog gauges from the database, at most once per max
+    age, then reads the relay's metrics from the registry."""
+
+    def __init__(
+        self,
+        lane_monitor: OutboxLaneMonitor,
+        relay_metrics: RelayMetrics,
+        registry: MetricsRegistry,
+    ) -> None:
+        self._lane_monitor = lane_monitor
+        self._relay_metrics = relay_metrics
+        self._registry = registry
+
+    async def read(self) -> OutboxMetricsReport:
+        """:raises DataMapperError:"""
+        lanes = await self._refresh()
+        return OutboxMetricsReport(
+            lanes=lanes,
+            delivered_per_s=self._relay_metrics.delivered_per_second(),
+            metrics=self._registry.snapshot(OUTBOX_METRIC_PREFIX),
+        )
+
+    async def render_text(self) -> str:
+        """:raises DataMapperError:"""
+        await self._refresh()
+        return self._registry.render_text(OUTBOX_METRIC_PREFIX)
+
+    async def _refresh(self) -> list[LaneBacklog]:
+        lanes = self._relay_metrics.recent_backlog()
+        if lanes is None:
+            lanes = await self._lane_monitor.backlogs()
+            self._relay_metrics.update_backlog(lanes)
+        return lanes
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Final
+
+import psycopg
+from psycopg import sql
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+log = logging.getLogger(__name__)
+
+OUTBOX_NOTIFY_CHANNEL: Final[str] = "outbox"
+DEFAULT_RECONNECT_DELAY: float = 5.0
+
+
+def conninfo_from_engine(engine: AsyncEngine) -> str:
+    """Plain libpq conninfo for a connection kept outside the engine pool."""
+    return engine.url.set(drivername="postgresql").render_as_string(
+        hide_password=False,
+    )
+
+
+class NotificationListener:
+    """Holds a dedicated ``LISTEN`` connection and passes each notification's
+    payload to ``on_payload``.
+
+    After the connection is lost it passes ``None`` before reconnecting:
+    notifications may have been missed meanwhile.
+    """
+
+    def __init__(
+        self,
+        conninfo: str,
+        channel: str,
+        reconnect_delay: float = DEFAULT_RECONNECT_DELAY,
+    ) -> None:
+        self._conninfo = conninfo
+        self._channel = channel
+        self._reconnect_delay = reconnect_delay
+
+    async def run(self, on_payload: Callable[[str | None], None]) -> None:
+        while True:
+            try:
+                await self._listen(on_payload)
+            except psycopg.Error as err:
+                log.warning(
+                    "Listener connection to channel '%s' lost (%s). "
+                    "Reconnecting in %.1fs.",
+                    self._channel,
+                    err,
+                    self._reconnect_delay,
+                )
+            on_payload(None)
+            await asyncio.sleep(self._reconnect_delay)
+
+    async def _listen(self, on_payload: Callable[[str | None], None]) -> None:
+        async with await psycopg.AsyncConnection.connect(
+            self._conninfo,
+            autocommit=True,
+        ) as conn:
+            await conn.execute(
+                sql.SQL("LISTEN {}").format(sql.Identifier(self._channel))
+            )
+            log.info("Listener subscribed to channel '%s'.", self._channel)
+            async for notify in conn.notifies():
+                on_payload(notify.payload)
+
+
+class OutboxNotificationListener:
+    """Holds a dedicated ``LISTEN`` connection and reports outbox commits.
+
+    ``OutboxEventDispatcher`` issues ``pg_notify`` inside the writing
+    transaction, so Postgres only delivers the notification once the outbox
+    rows are committed and claimable. A reconnect is reported too, since
+    notifications may have been missed while disconnected.
+    """
+
+    def __init__(
+        self,
+        conninfo: str,
+        channel: str = OUTBOX_NOTIFY_CHANNEL,
+        reconnect_delay: float = DEFAULT_RECONNECT_DELAY,
+    ) -> None:
+        self._listener = NotificationListener(conninfo, channel, reconnect_delay)
+
+    async def run(self, on_notify: Callable[[], None]) -> None:
+        await self._listener.run(lambda _: on_notify())
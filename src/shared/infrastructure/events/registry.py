@@ -14,12 +14,16 @@ from shared.domain.event_registry import (
 log = logging.getLogger(__name__)
 
 _registry: dict[type[DomainEvent], list[type]] = defaultdict(list)
+# Handlers implementing ``BatchEventHandler.handle_batch``.
+_batch_handlers: set[type] = set()
 
 __all__ = ["_event_type_registry", "register_event"]
 
 
 def handles[T](*event_types: type[DomainEvent]) -> Callable[[type[T]], type[T]]:
     def decorator(cls: type[T]) -> type[T]:
+        if callable(getattr(cls, "handle_batch", None)):
+            _batch_handlers.add(cls)
         for event_type in event_types:
             _registry[event_type].append(cls)
             _event_type_registry[event_type.__name__] = event_type
@@ -35,6 +39,10 @@ def get_handlers_for(event_type: type[DomainEvent]) -> list[type]:
     return _registry.get(event_type, [])
 
 
+def supports_batch(handler_type: type) -> bool:
+    return handler_type in _batch_handlers
+
+
 def get_event_class(name: str) -> type[DomainEvent] | None:
     return _event_type_registry.get(name)
 
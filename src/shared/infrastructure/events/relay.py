@@ -1,140 +1,938 @@
 import asyncio
+import contextlib
 import logging
-from datetime import UTC, datetime
+import time
+from collections.abc import AsyncIterator, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from operator import attrgetter
+from uuid import UUID
 
 from dishka import AsyncContainer, Scope
-from sqlalchemy import select, update
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    bindparam,
+    delete,
+    exists,
+    false,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from shared.application.event_handler import EventHandler
+from shared.application.event_handler import BatchEventHandler, EventHandler
 from shared.domain.domain_event import DomainEvent
-from shared.infrastructure.events.registry import get_handlers_for
-from shared.infrastructure.events.serialization import deserialize_event
-from shared.infrastructure.persistence.mappers.outbox import OutboxRecord, outbox_table
+from shared.infrastructure.events.circuit_breaker import (
+    CircuitState,
+    HandlerCircuitBreakers,
+)
+from shared.infrastructure.events.handler_policy import HandlerPolicies
+from shared.infrastructure.events.lanes import DEFAULT_LANE, OutboxLane, OutboxLanes
+from shared.infrastructure.events.metrics import RelayMetrics
+from shared.infrastructure.events.notifications import OutboxNotificationListener
+from shared.infrastructure.events.registry import get_handlers_for, supports_batch
+from shared.infrastructure.events.serialization import (
+    EventPayload,
+    deserialize_event,
+)
+from shared.infrastructure.observability.metrics import MetricsRegistry
+from shared.infrastructure.persistence.mappers.outbox import (
+    outbox_dead_letter_table,
+    outbox_handler_delivery_table,
+    outbox_table,
+)
+from shared.infrastructure.persistence.types_ import MainAsyncSession
 
 log = logging.getLogger(__name__)
 
 DEFAULT_POLL_INTERVAL: float = 30.0
+DEFAULT_MIN_POLL_INTERVAL: float = 0.5
 DEFAULT_MAX_RETRIES: int = 5
+DEFAULT_BATCH_SIZE: int = 100
+DEFAULT_LEASE_SECONDS: float = 60.0
+DEFAULT_WORKERS: int = 1
+DEFAULT_CONCURRENCY: int = 10
+DEFAULT_BACKOFF_BASE_SECONDS: float = 1.0
+DEFAULT_BACKOFF_MAX_SECONDS: float = 300.0
+
+# id, event_type, payload, retry_count, occurred_at, aggregate_id
+type OutboxEntry = Row[tuple[UUID, str, EventPayload, int, datetime, str | None]]
+
+# Set while handlers run under the relay, whose scope is not a client request.
+_delivering: ContextVar[bool] = ContextVar("outbox_delivering", default=False)
+
+_ENTRY_COLUMNS = (
+    outbox_table.c.id,
+    outbox_table.c.event_type,
+    outbox_table.c.payload,
+    outbox_table.c.retry_count,
+    outbox_table.c.occurred_at,
+    outbox_table.c.aggregate_id,
+)
+
+
+@dataclass(slots=True)
+class _BatchOutcome:
+    delivered: list[OutboxEntry] = field(default_factory=list)
+    failed: list[OutboxEntry] = field(default_factory=list)
+    # Not attempted because an earlier event of the same aggregate failed.
+    deferred: list[OutboxEntry] = field(default_factory=list)
+    # Held back by an open handler circuit, with the delay before retrying.
+    postponed: list[tuple[OutboxEntry, float]] = field(default_factory=list)
+    errors: dict[UUID, str] = field(default_factory=dict)
+    # Handlers known to have succeeded, per entry.
+    completed: dict[UUID, set[str]] = field(default_factory=dict)
+    # The subset of ``completed`` already stored in outbox_handler_delivery.
+    recorded: dict[UUID, set[str]] = field(default_factory=dict)
+    # (entry id, handler) pairs that succeeded in this batch for failed entries.
+    progress: list[tuple[UUID, str]] = field(default_factory=list)
+
+    @staticmethod
+    def ids(entries: list[OutboxEntry]) -> list[UUID]:
+        return [entry.id for entry in entries]
+
+
+@dataclass(frozen=True, slots=True)
+class _Postponed:
+    """An entry's remaining handlers are behind an open circuit."""
+
+    delay: float
+
+
+@dataclass(slots=True)
+class _LaneState:
+    lane: OutboxLane
+    handler_slots: asyncio.Semaphore
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+def handler_key(handler_type: type) -> str:
+    """Stable name under which a handler's deliveries are tracked."""
+    return f"{handler_type.__module__}.{handler_type.__qualname__}"
+
+
+def is_delivering() -> bool:
+    """Whether the current task runs event handlers on behalf of the relay."""
+    return _delivering.get()
+
+
+def _partition_by_aggregate(entries: list[OutboxEntry]) -> list[list[OutboxEntry]]:
+    """Groups entries per aggregate, keeping their order within each group.
+
+    Entries without an aggregate have no ordering constraint and get a group
+    of their own.
+    """
+    partitions: dict[object, list[OutboxEntry]] = {}
+    for entry in entries:
+        key = entry.aggregate_id if entry.aggregate_id is not None else entry.id
+        partitions.setdefault(key, []).append(entry)
+    return list(partitions.values())
 
 
 class OutboxRelay:
+    """Delivers outbox entries to their registered event handlers.
+
+    Entries are claimed in bounded batches with ``FOR UPDATE SKIP LOCKED``
+    and leased via ``locked_until``, so any number of relay workers, in one
+    process or across replicas, split the backlog instead of duplicating it.
+
+    With a listener attached, commits wake the workers immediately. Idle
+    polling backs off from ``min_poll_interval`` to ``poll_interval``, which
+    only remains as a safety net for missed notifications.
+
+    Within a batch, entries of different aggregates are delivered
+    concurrently, bounded by ``concurrency`` across all workers, while entries
+    of the same aggregate run one after another in ``occurred_at`` order. A
+    failure holds back the aggregate's later entries until it is retried, and
+    entries are not claimed while an earlier one of their aggregate is leased
+    by another worker.
+
+    Failed entries are rescheduled through ``next_attempt_at`` with
+    exponential backoff and jitter, so they stay out of the claim query until
+    due; after ``max_retries`` attempts they move to ``outbox_dead_letter``.
+    Handlers that succeeded for a failed entry are recorded in
+    ``outbox_handler_delivery`` and skipped when it is retried or replayed.
+
+    Handlers implementing ``handle_batch`` are first called once with all
+    their events in the batch, before per-entry delivery; if that call fails
+    they get the events one by one like any other handler. Their success is
+    recorded for entries held back behind a failure of their aggregate too.
+
+    With ``batch_scope``, a batch is first delivered sequentially through a
+    single DI scope: handlers are resolved once and share one session, whose
+    commits only release savepoints of a batch transaction that also carries
+    the acknowledgement. If any handler fails, that transaction is rolled
+    back and the batch is delivered again with a scope per handler call, as
+    described above.
+
+    With ``lanes``, the event types listed in a lane are claimed by that
+    lane's own workers, with its own batch size and concurrency budget, so a
+    burst of one type does not delay the others; every other type goes to the
+    default lane, sized by ``batch_size``, ``concurrency`` and ``workers``.
+
+    ``deliver`` runs the same delivery for specific entries right after the
+    transaction writing them commits, ahead of the workers; claiming them
+    through the same lease keeps each entry delivered once.
+
+    Each handler call is bounded by its class's ``handler_policies`` timeout.
+    A handler class that keeps failing has its circuit opened for a cool-off
+    period: entries still needing it are postponed until the circuit lets a
+    trial call through, without using up a retry, while other handlers keep
+    receiving their events. Breakers are per process.
+
+    Claim and batch durations, handler latencies, deliveries with their lag,
+    retries and dead letters are recorded in ``metrics``.
+    """
+
     def __init__(
         self,
         container: AsyncContainer,
         session_factory: async_sessionmaker[AsyncSession],
         poll_interval: float = DEFAULT_POLL_INTERVAL,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        lease_duration: float = DEFAULT_LEASE_SECONDS,
+        workers: int = DEFAULT_WORKERS,
+        min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        listener: OutboxNotificationListener | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        backoff_base: float = DEFAULT_BACKOFF_BASE_SECONDS,
+        backoff_max: float = DEFAULT_BACKOFF_MAX_SECONDS,
+        batch_scope: bool = False,
+        lanes: OutboxLanes | None = None,
+        metrics: RelayMetrics | None = None,
+        handler_policies: HandlerPolicies | None = None,
     ) -> None:
         self._container = container
         self._session_factory = session_factory
         self._poll_interval = poll_interval
         self._max_retries = max_retries
+        self._lease = timedelta(seconds=lease_duration)
+        self._min_poll_interval = min(min_poll_interval, poll_interval)
+        self._listener = listener
+        self._lanes = lanes or OutboxLanes(
+            OutboxLane(
+                name=DEFAULT_LANE,
+                batch_size=batch_size,
+                concurrency=concurrency,
+                workers=workers,
+            )
+        )
+        self._lane_states = {
+            lane.name: _LaneState(lane, asyncio.Semaphore(lane.concurrency))
+            for lane in self._lanes.lanes
+        }
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._batch_scope = batch_scope
+        self._metrics = metrics or RelayMetrics(MetricsRegistry())
+        self._policies = handler_policies or HandlerPolicies()
+        self._breakers = HandlerCircuitBreakers(
+            self._policies,
+            on_transition=self._metrics.circuit_changed,
+        )
+
+    def notify(self) -> None:
+        """Wakes idle workers: new entries were committed."""
+        for state in self._lane_states.values():
+            state.wakeup.set()
 
     async def run(self) -> None:
-        log.info("Outbox relay started (poll_interval=%.1fs).", self._poll_interval)
+        log.info(
+            "Outbox relay started (poll_interval=%.1fs, lanes=%s, batch_scope=%s, "
+            "listening=%s).",
+            self._poll_interval,
+            ", ".join(
+                f"{lane.name}(workers={lane.workers}, batch_size={lane.batch_size}, "
+                f"concurrency={lane.concurrency})"
+                for lane in self._lanes.lanes
+            ),
+            self._batch_scope,
+            self._listener is not None,
+        )
+        tasks = [
+            self._work(state)
+            for state in self._lane_states.values()
+            for _ in range(state.lane.workers)
+        ]
+        if self._listener is not None:
+            tasks.append(self._listener.run(self.notify))
         try:
-            while True:
-                await self._poll()
-                await asyncio.sleep(self._poll_interval)
+            await asyncio.gather(*tasks)
         except asyncio.CancelledError:
             log.info("Outbox relay shutting down gracefully.")
 
-    async def _poll(self) -> None:
+    async def _work(self, state: _LaneState | None = None) -> None:
+        state = state or self._default_lane
+        idle_delay = self._min_poll_interval
+        while True:
+            processed = await self._poll(state)
+            if processed >= state.lane.batch_size:
+                # A full batch means more work is likely waiting.
+                continue
+            if processed:
+                idle_delay = self._min_poll_interval
+            await self._wait_for_work(idle_delay, state)
+            if not processed:
+                idle_delay = min(idle_delay * 2, self._poll_interval)
+
+    async def _wait_for_work(self, delay: float, state: _LaneState) -> None:
+        with contextlib.suppress(TimeoutError):
+            async with asyncio.timeout(delay):
+                await state.wakeup.wait()
+                state.wakeup.clear()
+
+    @property
+    def _default_lane(self) -> _LaneState:
+        return self._lane_states[self._lanes.default.name]
+
+    def _handler_slots(self, event_type: str) -> asyncio.Semaphore:
+        """The concurrency budget of the lane ``event_type`` is delivered in."""
+        return self._lane_states[self._lanes.lane_for(event_type).name].handler_slots
+
+    async def deliver(self, ids: Sequence[UUID]) -> int:
+        """Claims and delivers the given entries now, instead of at the next poll.
+
+        Entries already claimed by a worker, delivered, backing off or held
+        back by an earlier entry of their aggregate are skipped and left to
+        the workers. Returns how many entries were delivered or acknowledged.
+        """
+        if not ids:
+            return 0
+        started = time.perf_counter()
         async with self._session_factory() as session:
-            stmt = (
-                select(outbox_table)
-                .where(
-                    outbox_table.c.delivered.is_(False),
-                    outbox_table.c.retry_count < self._max_retries,
-                )
-                .order_by(outbox_table.c.occurred_at)
-            )
-            result = await session.execute(stmt)
-            rows = result.fetchall()
-            entries = [
-                OutboxRecord(
-                    id=row.id,
-                    event_type=row.event_type,
-                    payload=row.payload,
-                    occurred_at=row.occurred_at,
-                    delivered=row.delivered,
-                    delivered_at=row.delivered_at,
-                    retry_count=row.retry_count,
-                )
-                for row in rows
-            ]
+            entries = await self._claim_batch(session, ids)
+            if not entries:
+                return 0
+            log.debug("Outbox relay: fast-path delivery of %d entries.", len(entries))
+            delivered = await self._deliver_claimed(entries, session)
+        self._metrics.observe_fast_path(time.perf_counter() - started)
+        return delivered
+
+    async def _poll(self, state: _LaneState | None = None) -> int:
+        lane = (state or self._default_lane).lane
+        async with self._session_factory() as session:
+            started = time.perf_counter()
+            entries = await self._claim_batch(session, lane=lane)
+            claimed = time.perf_counter()
+            self._metrics.observe_poll(lane.name, claimed - started)
 
             if not entries:
-                return
+                return 0
 
             log.debug("Outbox relay: processing %d entries.", len(entries))
+            delivered = await self._deliver_claimed(entries, session)
+            self._metrics.observe_batch(lane.name, time.perf_counter() - claimed)
+            return delivered
+
+    async def _deliver_claimed(
+        self,
+        entries: list[OutboxEntry],
+        session: AsyncSession,
+    ) -> int:
+        completed = await self._load_completed_handlers(entries, session)
+        outcome = _BatchOutcome(
+            completed=completed,
+            recorded={entry_id: set(keys) for entry_id, keys in completed.items()},
+        )
+        token = _delivering.set(True)
+        try:
+            if self._batch_scope and await self._deliver_in_batch_scope(
+                entries, outcome
+            ):
+                return len(entries)
+
+            await self._deliver_to_batch_handlers(entries, outcome.completed)
+            async with asyncio.TaskGroup() as group:
+                for partition in _partition_by_aggregate(entries):
+                    group.create_task(self._deliver_in_order(partition, outcome))
+        finally:
+            _delivering.reset(token)
+
+        await self._acknowledge(outcome, session)
+        return len(entries)
+
+    async def _deliver_in_order(
+        self,
+        partition: list[OutboxEntry],
+        outcome: _BatchOutcome,
+    ) -> None:
+        for position, entry in enumerate(partition):
+            completed = outcome.completed.setdefault(entry.id, set())
+            async with self._handler_slots(entry.event_type):
+                error = await self._process_entry(entry, completed)
+            if error is None:
+                outcome.delivered.append(entry)
+                continue
+            if isinstance(error, _Postponed):
+                outcome.postponed.append((entry, error.delay))
+            else:
+                outcome.failed.append(entry)
+                outcome.errors[entry.id] = error
+            # Later entries may already have been through batch handlers.
+            for held in partition[position:]:
+                outcome.progress.extend(
+                    (held.id, key)
+                    for key in outcome.completed.get(held.id, set())
+                    - outcome.recorded.get(held.id, set())
+                )
+            outcome.deferred.extend(partition[position + 1 :])
+            return
 
-            for entry in entries:
-                await self._process_entry(entry, session)
+    async def _deliver_in_batch_scope(
+        self,
+        entries: list[OutboxEntry],
+        outcome: _BatchOutcome,
+    ) -> bool:
+        """Delivers and acknowledges the batch in one DI scope and transaction.
 
-    async def _process_entry(self, entry: OutboxRecord, session: AsyncSession) -> None:
+        Returns whether every entry was delivered. Otherwise nothing was
+        committed and ``outcome`` is left untouched.
+        """
+        completed = {
+            entry.id: set(outcome.completed.get(entry.id, ())) for entry in entries
+        }
+        failed = False
         try:
-            event = deserialize_event(entry.event_type, entry.payload)
+            async with self._session_factory() as batch:
+                connection = await batch.connection()
+                async with (
+                    self._session_factory(
+                        bind=connection,
+                        join_transaction_mode="create_savepoint",
+                    ) as session,
+                    self._container(
+                        scope=Scope.REQUEST,
+                        context={MainAsyncSession: session},
+                    ) as scope,
+                ):
+                    failed = not await self._deliver_to_batch_handlers(
+                        entries, completed, scope
+                    )
+                    for entry in entries:
+                        if failed:
+                            break
+                        async with self._handler_slots(entry.event_type):
+                            error = await self._process_entry(
+                                entry, completed[entry.id], scope
+                            )
+                        failed = error is not None
+                if failed:
+                    await batch.rollback()
+                    log.warning(
+                        "Outbox relay: delivery failed in batch scope; redelivering "
+                        "%d entries with per-event isolation.",
+                        len(entries),
+                    )
+                    return False
+                # Handler effects and delivery marks commit together.
+                await self._acknowledge(
+                    _BatchOutcome(delivered=list(entries)),
+                    batch,
+                )
         except Exception:
+            log.exception(
+                "Outbox relay: batch scope failed; redelivering %d entries with "
+                "per-event isolation.",
+                len(entries),
+            )
+            return False
+        return True
+
+    async def _deliver_to_batch_handlers(
+        self,
+        entries: list[OutboxEntry],
+        completed: dict[UUID, set[str]],
+        scope: AsyncContainer | None = None,
+    ) -> bool:
+        """Calls each batch-capable handler once for all its entries in the batch.
+
+        A successful ``handle_batch`` call marks the handler completed for
+        every entry it covered. On failure nothing is marked, so the entries
+        reach the handler one by one through ``handle``. Returns whether every
+        call succeeded.
+        """
+        succeeded = True
+        pending = self._pending_batch_calls(entries, completed)
+        for handler_type, items in pending.items():
+            # A lone event goes through ``handle`` like any other.
+            if len(items) == 1:
+                continue
+            trial = self._breakers.state(handler_type) is CircuitState.HALF_OPEN
+            if not self._breakers.allow(handler_type):
+                # Postponed when the entries are delivered one by one.
+                succeeded = False
+                continue
+            try:
+                async with self._handler_slots(items[0][0].event_type):
+                    await self._execute_batch_handler(
+                        handler_type, [event for _, event in items], scope
+                    )
+            except Exception:
+                self._breakers.record_failure(handler_type)
+                log.exception(
+                    "Batch handler %s failed for %d events; delivering them "
+                    "one by one.",
+                    handler_type.__name__,
+                    len(items),
+                )
+                succeeded = False
+                continue
+            finally:
+                # A cancelled trial reports no outcome.
+                if trial:
+                    self._breakers.release_trial(handler_type)
+            self._breakers.record_success(handler_type)
+            key = handler_key(handler_type)
+            for entry, _ in items:
+                completed.setdefault(entry.id, set()).add(key)
+        return succeeded
+
+    @staticmethod
+    def _pending_batch_calls(
+        entries: list[OutboxEntry],
+        completed: dict[UUID, set[str]],
+    ) -> dict[type, list[tuple[OutboxEntry, DomainEvent]]]:
+        """The entries and events each batch-capable handler has yet to get."""
+        pending: dict[type, list[tuple[OutboxEntry, DomainEvent]]] = {}
+        for entry in entries:
+            try:
+                event = deserialize_event(entry.event_type, entry.payload)
+            except Exception:  # noqa: S112
+                # Reported when the entry itself is delivered.
+                continue
+            done = completed.get(entry.id, set())
+            for handler_type in get_handlers_for(type(event)):
+                if (
+                    supports_batch(handler_type)
+                    and handler_key(handler_type) not in done
+                ):
+                    pending.setdefault(handler_type, []).append((entry, event))
+        return pending
+
+    async def _claim_batch(
+        self,
+        session: AsyncSession,
+        ids: Sequence[UUID] | None = None,
+        lane: OutboxLane | None = None,
+    ) -> list[OutboxEntry]:
+        """Leases up to a lane's ``batch_size`` due entries in one transaction.
+
+        Memory stays bounded by the batch whatever the backlog size, and only
+        the columns delivery needs are returned, as plain rows. With ``ids``,
+        only those entries are considered, whatever their lane; otherwise
+        only entries of ``lane``, the default lane if not given.
+
+        An entry is leased only with every earlier undelivered entry of its
+        aggregate, so entries of one aggregate are never delivered out of
+        order: not when the earlier one lies outside ``ids``, in another lane
+        or past the batch limit, nor when it is being claimed concurrently.
+        """
+        lane = lane or self._lanes.default
+        earlier = outbox_table.alias("earlier")
+        out_of_scope: ColumnElement[bool] | None = None
+        if ids is not None:
+            out_of_scope = earlier.c.id != func.all(list(ids))
+        elif (earlier_in_lane := self._lanes.claim_filter(lane, earlier)) is not None:
+            out_of_scope = ~earlier_in_lane
+        # An earlier entry of the aggregate that is leased elsewhere, that
+        # sorts after this one (backing off) or that this claim cannot take
+        # must be delivered first. Excluded before the limit, so held-back
+        # entries never crowd claimable ones out of the batch.
+        blocked = [
+            earlier.c.locked_until > func.now(),
+            earlier.c.next_attempt_at > outbox_table.c.next_attempt_at,
+        ]
+        if out_of_scope is not None:
+            blocked.append(out_of_scope)
+        blocking_predecessor = exists().where(
+            earlier.c.aggregate_id == outbox_table.c.aggregate_id,
+            earlier.c.delivered == false(),
+            earlier.c.occurred_at < outbox_table.c.occurred_at,
+            or_(*blocked),
+        )
+        candidates = (
+            select(
+                outbox_table.c.id,
+                outbox_table.c.aggregate_id,
+                outbox_table.c.occurred_at,
+            )
+            .where(
+                # Must match the ix_outbox_due predicate verbatim.
+                outbox_table.c.delivered == false(),
+                outbox_table.c.next_attempt_at <= func.now(),
+                or_(
+                    outbox_table.c.locked_until.is_(None),
+                    outbox_table.c.locked_until < func.now(),
+                ),
+                or_(
+                    outbox_table.c.aggregate_id.is_(None),
+                    ~blocking_predecessor,
+                ),
+            )
+            .order_by(outbox_table.c.next_attempt_at, outbox_table.c.occurred_at)
+            .limit(lane.batch_size if ids is None else len(ids))
+            .with_for_update(skip_locked=True)
+        )
+        if ids is not None:
+            candidates = candidates.where(outbox_table.c.id == func.any(list(ids)))
+        elif (in_lane := self._lanes.claim_filter(lane)) is not None:
+            candidates = candidates.where(in_lane)
+        locked = candidates.cte("candidates")
+        # Predecessors sort first, so only one skipped as row-locked by a
+        # concurrent claim can still be missing here; it holds the later
+        # entries back.
+        prior = outbox_table.alias("prior")
+        unclaimed_predecessor = exists().where(
+            prior.c.aggregate_id == locked.c.aggregate_id,
+            prior.c.delivered == false(),
+            prior.c.occurred_at < locked.c.occurred_at,
+            prior.c.id.not_in(select(locked.c.id)),
+        )
+        claimable = select(locked.c.id).where(
+            or_(locked.c.aggregate_id.is_(None), ~unclaimed_predecessor)
+        )
+        stmt = (
+            update(outbox_table)
+            # = ANY(ARRAY(...)) keeps the update on the primary key index;
+            # IN (subquery) is planned as a hash join over the whole table.
+            .where(
+                outbox_table.c.id == func.any(func.array(claimable.scalar_subquery()))
+            )
+            .values(locked_until=func.now() + self._lease)
+            .returning(*_ENTRY_COLUMNS)
+        )
+        result = await session.execute(stmt)
+        rows: list[OutboxEntry] = list(result.fetchall())
+
+        if not rows:
+            return []
+
+        await session.commit()
+
+        # RETURNING does not preserve the subquery ordering.
+        return sorted(rows, key=attrgetter("occurred_at"))
+
+    @staticmethod
+    async def _load_completed_handlers(
+        entries: list[OutboxEntry],
+        session: AsyncSession,
+    ) -> dict[UUID, set[str]]:
+        # Retried, deferred, postponed and replayed entries may all have
+        # progress, whatever their retry count.
+        completed: dict[UUID, set[str]] = {}
+        result = await session.execute(
+            select(
+                outbox_handler_delivery_table.c.outbox_id,
+                outbox_handler_delivery_table.c.handler,
+            ).where(
+                outbox_handler_delivery_table.c.outbox_id
+                == func.any(_BatchOutcome.ids(entries))
+            )
+        )
+        for outbox_id, handler in result.all():
+            completed.setdefault(outbox_id, set()).add(handler)
+        return completed
+
+    async def _process_entry(
+        self,
+        entry: OutboxEntry,
+        completed: set[str],
+        scope: AsyncContainer | None = None,
+    ) -> str | _Postponed | None:
+        """Runs the entry's handlers not yet in ``completed``.
+
+        Handlers are resolved from ``scope`` when given, otherwise each call
+        gets a scope of its own. Handlers that succeed are added to
+        ``completed``. Returns why the entry failed, if it did, or else how
+        long to postpone it if a handler was skipped behind an open circuit.
+        """
+        try:
+            event = deserialize_event(entry.event_type, entry.payload)
+        except Exception as err:
             log.exception(
                 "Failed to deserialize outbox entry %s (type=%s). Incrementing retry.",
                 entry.id,
                 entry.event_type,
             )
-            await self._increment_retry(entry, session)
-            return
+            return f"deserialization: {err!r}"
 
         handler_types = get_handlers_for(type(event))
 
-        any_failed = False
+        errors: list[str] = []
+        postponed: _Postponed | None = None
         for handler_type in handler_types:
+            key = handler_key(handler_type)
+            if key in completed:
+                continue
+            # Only the call admitted by a half-open circuit holds its trial.
+            trial = self._breakers.state(handler_type) is CircuitState.HALF_OPEN
+            if not self._breakers.allow(handler_type):
+                delay = max(
+                    self._breakers.retry_after(handler_type),
+                    self._min_poll_interval,
+                )
+                if postponed is None or delay > postponed.delay:
+                    postponed = _Postponed(delay)
+                continue
             try:
-                await self._execute_handler(handler_type, event)
-            except Exception:
+                await self._execute_handler(handler_type, event, scope)
+            except Exception as err:
+                self._breakers.record_failure(handler_type)
                 log.exception(
                     "Handler %s failed for event %s (id=%s).",
                     handler_type.__name__,
                     entry.event_type,
                     entry.id,
                 )
-                any_failed = True
+                errors.append(f"{handler_type.__name__}: {err!r}")
+            else:
+                self._breakers.record_success(handler_type)
+                completed.add(key)
+            finally:
+                # A cancelled trial reports no outcome.
+                if trial:
+                    self._breakers.release_trial(handler_type)
 
-        if any_failed:
-            await self._increment_retry(entry, session)
-        else:
-            await self._mark_delivered(entry, session)
+        if errors:
+            return "; ".join(errors)
+        return postponed
 
-    async def _execute_handler(self, handler_type: type, event: DomainEvent) -> None:
-        async with self._container(scope=Scope.REQUEST) as child:
-            handler: EventHandler[DomainEvent] = await child.get(handler_type)
-            await handler.handle(event)
+    async def _execute_handler(
+        self,
+        handler_type: type,
+        event: DomainEvent,
+        scope: AsyncContainer | None = None,
+    ) -> None:
+        handler: EventHandler[DomainEvent]
+        async with self._guarded(handler_type):
+            if scope is not None:
+                handler = await scope.get(handler_type)
+                await handler.handle(event)
+                return
+            async with self._container(scope=Scope.REQUEST) as child:
+                handler = await child.get(handler_type)
+                await handler.handle(event)
 
-    async def _mark_delivered(self, entry: OutboxRecord, session: AsyncSession) -> None:
-        stmt = (
-            update(outbox_table)
-            .where(outbox_table.c.id == entry.id)
-            .values(delivered=True, delivered_at=datetime.now(UTC))
-        )
-        await session.execute(stmt)
+    async def _execute_batch_handler(
+        self,
+        handler_type: type,
+        events: list[DomainEvent],
+        scope: AsyncContainer | None = None,
+    ) -> None:
+        handler: BatchEventHandler[DomainEvent]
+        async with self._guarded(handler_type):
+            if scope is not None:
+                handler = await scope.get(handler_type)
+                await handler.handle_batch(events)
+                return
+            async with self._container(scope=Scope.REQUEST) as child:
+                handler = await child.get(handler_type)
+                await handler.handle_batch(events)
+
+    @contextlib.asynccontextmanager
+    async def _guarded(self, handler_type: type) -> AsyncIterator[None]:
+        """Bounds a handler call by its class's timeout; records its latency."""
+        timeout = self._policies.for_handler(handler_type).timeout
+        started = time.perf_counter()
+        failed = True
+        try:
+            async with asyncio.timeout(timeout):
+                yield
+            failed = False
+        except TimeoutError:
+            self._metrics.handler_timed_out(handler_type.__name__)
+            raise
+        finally:
+            self._metrics.observe_handler(
+                handler_type.__name__,
+                time.perf_counter() - started,
+                failed=failed,
+            )
+
+    async def _acknowledge(self, outcome: _BatchOutcome, session: AsyncSession) -> None:
+        """Writes a batch's outcomes back with set-based updates and one commit."""
+        statements = 0
+        if outcome.delivered:
+            await session.execute(
+                update(outbox_table)
+                .where(outbox_table.c.id == func.any(outcome.ids(outcome.delivered)))
+                .values(
+                    delivered=True,
+                    delivered_at=datetime.now(UTC),
+                    locked_until=None,
+                )
+            )
+            statements += 1
+            # Progress recorded for delivered entries is no longer needed.
+            settled = [
+                entry for entry in outcome.delivered if outcome.recorded.get(entry.id)
+            ]
+            if settled:
+                await session.execute(
+                    delete(outbox_handler_delivery_table).where(
+                        outbox_handler_delivery_table.c.outbox_id
+                        == func.any(outcome.ids(settled))
+                    )
+                )
+                statements += 1
+        retrying: list[OutboxEntry] = []
+        exhausted: list[OutboxEntry] = []
+        for entry in outcome.failed:
+            if entry.retry_count + 1 >= self._max_retries:
+                exhausted.append(entry)
+            else:
+                retrying.append(entry)
+        if retrying:
+            await session.execute(
+                update(outbox_table)
+                .where(outbox_table.c.id == func.any(outcome.ids(retrying)))
+                .values(
+                    retry_count=outbox_table.c.retry_count + 1,
+                    next_attempt_at=self._backoff_deadline(),
+                    locked_until=None,
+                )
+            )
+            statements += 1
+        if outcome.progress:
+            await session.execute(
+                pg_insert(outbox_handler_delivery_table)
+                .values([
+                    {"outbox_id": outbox_id, "handler": handler}
+                    for outbox_id, handler in outcome.progress
+                ])
+                .on_conflict_do_nothing()
+            )
+            statements += 1
+        if exhausted:
+            await self._dead_letter(exhausted, outcome.errors, session)
+            statements += 2
+        statements += await self._release(outcome, session)
         await session.commit()
-        log.debug("Outbox entry %s delivered.", entry.id)
+        self._record(outcome, retrying, exhausted)
+
+        acknowledged = (
+            len(outcome.delivered)
+            + len(outcome.failed)
+            + len(outcome.postponed)
+            + len(outcome.deferred)
+        )
+        # One UPDATE and one COMMIT per entry before batching.
+        saved = 2 * acknowledged - (statements + 1)
+        log.debug(
+            "Outbox relay: acknowledged %d delivered, %d failed, %d postponed and "
+            "%d deferred entries in %d round trips (%d saved, %.2f per entry).",
+            len(outcome.delivered),
+            len(outcome.failed),
+            len(outcome.postponed),
+            len(outcome.deferred),
+            statements + 1,
+            saved,
+            saved / acknowledged,
+        )
+
+        for entry in outcome.failed:
+            self._log_retry(entry)
 
-    async def _increment_retry(
-        self, entry: OutboxRecord, session: AsyncSession
+    def _record(
+        self,
+        outcome: _BatchOutcome,
+        retrying: list[OutboxEntry],
+        exhausted: list[OutboxEntry],
     ) -> None:
-        new_count = entry.retry_count + 1
-        stmt = (
-            update(outbox_table)
-            .where(outbox_table.c.id == entry.id)
-            .values(retry_count=new_count)
+        self._metrics.delivered(
+            (entry.event_type, entry.occurred_at) for entry in outcome.delivered
         )
-        await session.execute(stmt)
-        await session.commit()
+        for entry, _ in outcome.postponed:
+            self._metrics.postponed(entry.event_type)
+        for entry in retrying:
+            self._metrics.retried(entry.event_type)
+        for entry in exhausted:
+            self._metrics.dead_lettered(entry.event_type)
 
+    def _backoff_deadline(self) -> ColumnElement[datetime]:
+        """``now() + min(base * 2^retry_count, max)``, scaled by 50-100% jitter.
+
+        Evaluated per row from the pre-increment ``retry_count``, so one
+        statement reschedules a whole batch.
+        """
+        delay = func.least(
+            self._backoff_base * func.power(2, outbox_table.c.retry_count),
+            self._backoff_max,
+        ) * (0.5 + func.random() / 2)
+        return func.now() + delay * literal_column("interval '1 second'")
+
+    @staticmethod
+    async def _dead_letter(
+        entries: list[OutboxEntry],
+        errors: dict[UUID, str],
+        session: AsyncSession,
+    ) -> None:
+        await session.execute(
+            insert(outbox_dead_letter_table),
+            [
+                {
+                    "id": entry.id,
+                    "event_type": entry.event_type,
+                    "payload": entry.payload,
+                    "occurred_at": entry.occurred_at,
+                    "aggregate_id": entry.aggregate_id,
+                    "retry_count": entry.retry_count + 1,
+                    "last_error": errors.get(entry.id),
+                }
+                for entry in entries
+            ],
+        )
+        await session.execute(
+            delete(outbox_table).where(
+                outbox_table.c.id == func.any(_BatchOutcome.ids(entries))
+            )
+        )
+
+    @staticmethod
+    async def _release(outcome: _BatchOutcome, session: AsyncSession) -> int:
+        """Unlocks postponed and deferred entries; returns the statements run.
+
+        Neither uses up a retry: their handlers were not called.
+        """
+        statements = 0
+        if outcome.postponed:
+            await session.execute(
+                update(outbox_table)
+                .where(outbox_table.c.id == bindparam("entry_id"))
+                .values(
+                    next_attempt_at=func.now()
+                    + bindparam("delay") * literal_column("interval '1 second'"),
+                    locked_until=None,
+                ),
+                [
+                    {"entry_id": entry.id, "delay": delay}
+                    for entry, delay in outcome.postponed
+                ],
+            )
+            statements += 1
+        if outcome.deferred:
+            await session.execute(
+                update(outbox_table)
+                .where(outbox_table.c.id == func.any(outcome.ids(outcome.deferred)))
+                .values(locked_until=None)
+            )
+            statements += 1
+        return statements
+
+    def _log_retry(self, entry: OutboxEntry) -> None:
+        new_count = entry.retry_count + 1
         if new_count >= self._max_retries:
             log.critical(
-                "Outbox entry %s (type=%s) reached max retries (%d). Giving up.",
+                "Outbox entry %s (type=%s) reached max retries (%d). "
+                "Moved to dead letters.",
                 entry.id,
                 entry.event_type,
                 self._max_retries,
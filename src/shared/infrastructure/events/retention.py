@@ -0,0 +1,202 @@
+import asyncio
+import logging
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Final
+
+from sqlalchemy import delete, func, insert, select, text, true
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from shared.infrastructure.persistence.mappers.outbox import (
+    outbox_archive_table,
+    outbox_table,
+)
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MIN_AGE_SECONDS: float = 3600.0
+DEFAULT_RETENTION_DAYS: int = 30
+DEFAULT_PRUNE_BATCH_SIZE: int = 1000
+DEFAULT_PRUNE_INTERVAL: float = 60.0
+
+ARCHIVE_PARTITION_PREFIX: Final[str] = "outbox_archive_p"
+
+_ARCHIVED_COLUMNS: Final[tuple[str, ...]] = (
+    "id",
+    "event_type",
+    "payload",
+    "occurred_at",
+    "aggregate_id",
+    "retry_count",
+    "delivered_at",
+)
+
+
+def archive_partition_name(day: date) -> str:
+    return f"{ARCHIVE_PARTITION_PREFIX}{day:%Y%m%d}"
+
+
+def _partition_day(name: str) -> date | None:
+    try:
+        return date.fromisoformat(name.removeprefix(ARCHIVE_PARTITION_PREFIX))
+    except ValueError:
+        return None
+
+
+class OutboxPruner:
+    """Keeps the hot ``outbox`` table down to pending and recently delivered rows.
+
+    Delivered rows older than ``min_age`` are moved to ``outbox_archive``, one
+    range partition per UTC day, or deleted when archiving is off. Each batch
+    is its own short transaction over at most ``batch_size`` rows claimed with
+    ``SKIP LOCKED``, so pruning never holds long locks or blocks the relay.
+    Archive partitions older than ``retention_days`` are dropped whole instead
+    of being deleted row by row.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        archive: bool = True,
+        min_age: float = DEFAULT_MIN_AGE_SECONDS,
+        retention_days: int = DEFAULT_RETENTION_DAYS,
+        batch_size: int = DEFAULT_PRUNE_BATCH_SIZE,
+        interval: float = DEFAULT_PRUNE_INTERVAL,
+    ) -> None:
+        self._session_factory = session_factory
+        self._archive = archive
+        self._min_age = timedelta(seconds=min_age)
+        self._retention = timedelta(days=retention_days)
+        self._batch_size = batch_size
+        self._interval = interval
+        self._partitions: set[date] = set()
+
+    async def run(self) -> None:
+        log.info(
+            "Outbox pruner started (archive=%s, min_age=%s, retention=%s, "
+            "batch_size=%d).",
+            self._archive,
+            self._min_age,
+            self._retention,
+            self._batch_size,
+        )
+        try:
+            while True:
+                try:
+                    await self.prune()
+                except Exception:
+                    log.exception("Outbox pruning round failed.")
+                await asyncio.sleep(self._interval)
+        except asyncio.CancelledError:
+            log.info("Outbox pruner shutting down gracefully.")
+
+    async def prune(self) -> int:
+        """Runs one pruning round; returns how many rows left the outbox."""
+        pruned = 0
+        while True:
+            batch = await self._prune_batch()
+            pruned += batch
+            if batch < self._batch_size:
+                break
+        dropped = await self._drop_expired_partitions() if self._archive else 0
+        if pruned or dropped:
+            log.info(
+                "Outbox pruner: removed %d delivered rows, dropped %d archive "
+                "partitions.",
+                pruned,
+                dropped,
+            )
+        return pruned
+
+    def _archive_horizon(self) -> date:
+        """Oldest UTC day still kept in the archive."""
+        return (datetime.now(UTC) - self._retention).date()
+
+    async def _prune_batch(self) -> int:
+        async with self._session_factory() as session:
+            claimed = await session.execute(
+                select(outbox_table.c.id, outbox_table.c.delivered_at)
+                .where(
+                    # Must match the ix_outbox_delivered predicate verbatim.
+                    outbox_table.c.delivered == true(),
+                    outbox_table.c.delivered_at < func.now() - self._min_age,
+                )
+                .order_by(outbox_table.c.delivered_at)
+                .limit(self._batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            rows = claimed.fetchall()
+            if not rows:
+                return 0
+
+            ids = [row.id for row in rows]
+            removed = delete(outbox_table).where(outbox_table.c.id == func.any(ids))
+            created: set[date] = set()
+            if self._archive:
+                horizon = self._archive_horizon()
+                days = {row.delivered_at.astimezone(UTC).date() for row in rows}
+                created = await self._ensure_partitions(
+                    session, {day for day in days if day >= horizon}
+                )
+                moved = removed.returning(
+                    *(outbox_table.c[name] for name in _ARCHIVED_COLUMNS)
+                ).cte("moved")
+                await session.execute(
+                    insert(outbox_archive_table).from_select(
+                        _ARCHIVED_COLUMNS,
+                        select(*(moved.c[name] for name in _ARCHIVED_COLUMNS)).where(
+                            # Past the retention window: dropped, not archived.
+                            moved.c.delivered_at
+                            >= datetime.combine(horizon, time(), tzinfo=UTC)
+                        ),
+                    )
+                )
+            else:
+                await session.execute(removed)
+            await session.commit()
+            # The DDL is undone with the batch if it rolls back.
+            self._partitions |= created
+            return len(rows)
+
+    async def _ensure_partitions(
+        self, session: AsyncSession, days: set[date]
+    ) -> set[date]:
+        """Creates the archive partitions of ``days`` not known to exist yet,
+        in the batch transaction; returns the days created."""
+        created = days - self._partitions
+        for day in sorted(created):
+            lower = datetime.combine(day, time(), tzinfo=UTC)
+            upper = lower + timedelta(days=1)
+            # Names and bounds are derived from dates, never from input.
+            await session.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {archive_partition_name(day)} "
+                    f"PARTITION OF {outbox_archive_table.name} "
+                    f"FOR VALUES FROM ('{lower.isoformat()}') "
+                    f"TO ('{upper.isoformat()}')"
+                )
+            )
+        return created
+
+    async def _drop_expired_partitions(self) -> int:
+        horizon = self._archive_horizon()
+        async with self._session_factory() as session:
+            result = await session.execute(
+                text(
+                    "SELECT c.relname FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent = CAST(:parent AS regclass)"
+                ),
+                {"parent": outbox_archive_table.name},
+            )
+            expired = [
+                day
+                for (name,) in result.fetchall()
+                if (day := _partition_day(name)) is not None and day < horizon
+            ]
+            for day in expired:
+                await session.execute(
+                    text(f"DROP TABLE IF EXISTS {archive_partition_name(day)}")
+                )
+                self._partitions.discard(day)
+            await session.commit()
+        return len(expired)
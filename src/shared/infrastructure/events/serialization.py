@@ -1,58 +1,182 @@
 import dataclasses
-import json
+import itertools
 import types
 import typing
-from datetime import datetime
+from collections.abc import Callable
+from datetime import date, datetime
 from enum import Enum
-from typing import get_type_hints
+from operator import attrgetter
+from typing import Any, get_args, get_origin, get_type_hints
 from uuid import UUID
 
+import orjson
+
 from shared.domain.domain_event import DomainEvent
-from shared.infrastructure.events.registry import get_event_class
+from shared.infrastructure.events.registry import (
+    _event_type_registry,
+    get_event_class,
+)
 
 _UNION_ORIGINS = {typing.Union, types.UnionType}
 
+# JSON-native mapping stored as a JSONB object in ``outbox.payload``.
+type EventPayload = dict[str, Any]
+type _Converter = Callable[[Any], object]
+
+
+class EventCodec:
+    """Encoder and decoder specialized for one ``DomainEvent`` subclass.
+
+    Field type hints are resolved once, into a converter per field that needs
+    one; encoding and decoding then only walk those converters.
+    """
+
+    __slots__ = ("_decoders", "_encoders", "event_cls")
+
+    def __init__(self, event_cls: type[DomainEvent]) -> None:
+        self.event_cls = event_cls
+        hints = get_type_hints(event_cls)
+        self._encoders: tuple[tuple[str, _Converter | None], ...] = tuple(
+            (f.name, _encoder_for(hints.get(f.name)))
+            for f in dataclasses.fields(event_cls)
+        )
+        self._decoders: dict[str, _Converter] = {
+            name: decoder
+            for name in hints
+            if (decoder := _decoder_for(hints[name])) is not None
+        }
+
+    def encode(self, event: DomainEvent) -> EventPayload:
+        payload: EventPayload = {}
+        for name, encoder in self._encoders:
+            value = getattr(event, name)
+            payload[name] = (
+                value if encoder is None or value is None else encoder(value)
+            )
+        return payload
+
+    def decode(self, payload: EventPayload) -> DomainEvent:
+        decoders = self._decoders
+        kwargs: EventPayload = {}
+        for name, value in payload.items():
+            decoder = decoders.get(name)
+            kwargs[name] = value if decoder is None or value is None else decoder(value)
+        return self.event_cls(**kwargs)
+
 
-def serialize_event(event: DomainEvent) -> str:
-    return json.dumps(dataclasses.asdict(event), default=str)
+_codecs: dict[type[DomainEvent], EventCodec] = {}
 
 
-def deserialize_event(event_type: str, payload: str) -> DomainEvent:
+def get_codec(event_cls: type[DomainEvent]) -> EventCodec:
+    codec = _codecs.get(event_cls)
+    if codec is None:
+        codec = _codecs[event_cls] = EventCodec(event_cls)
+    return codec
+
+
+def compile_event_codecs() -> None:
+    """Builds the codec of every registered event type up front."""
+    for event_cls in _event_type_registry.values():
+        get_codec(event_cls)
+
+
+def serialize_event(event: DomainEvent) -> EventPayload:
+    return get_codec(type(event)).encode(event)
+
+
+def deserialize_event(
+    event_type: str,
+    payload: EventPayload | str | bytes,
+) -> DomainEvent:
     event_cls = get_event_class(event_type)
     if event_cls is None:
         msg = f"Unknown event type: {event_type}"
         raise ValueError(msg)
 
-    raw = json.loads(payload)
-    hints = get_type_hints(event_cls)
+    if isinstance(payload, str | bytes):
+        # Rows written before payloads were stored as JSONB objects.
+        payload = orjson.loads(payload)
+    return get_codec(event_cls).decode(payload)  # type: ignore[arg-type]
 
-    coerced: dict[str, object] = {}
-    for field_name, value in raw.items():
-        expected = hints.get(field_name)
-        coerced[field_name] = _coerce(value, expected)
-
-    return event_cls(**coerced)  # type: ignore[arg-type]
 
+def _unwrap_optional(expected: object) -> object:
+    if get_origin(expected) in _UNION_ORIGINS:
+        non_none = [a for a in get_args(expected) if a is not type(None)]
+        if non_none:
+            return non_none[0]
+    return expected
 
-def _coerce(value: object, expected: type | None) -> object:
-    if value is None or expected is None:
-        return value
 
-    origin = getattr(expected, "__origin__", None)
+def _encoder_for(expected: object) -> _Converter | None:
+    expected = _unwrap_optional(expected)
+    if expected is UUID:
+        return str
+    if expected is datetime:
+        return datetime.isoformat
+    if expected is date:
+        return date.isoformat
+    if isinstance(expected, type) and issubclass(expected, Enum):
+        return attrgetter("value")
+    if get_origin(expected) is tuple:
+        args, variadic = _tuple_items(expected)
+        items = [_encoder_for(arg) for arg in args]
+        if any(items):
+            return _tuple_converter(items, variadic, list)
+    return None
 
-    if origin in _UNION_ORIGINS:
-        args = expected.__args__  # type: ignore[attr-defined]
-        non_none = [a for a in args if a is not type(None)]
-        if non_none:
-            return _coerce(value, non_none[0])
 
+def _decoder_for(expected: object) -> _Converter | None:
+    expected = _unwrap_optional(expected)
     if expected is UUID:
-        return UUID(str(value))
-
+        return _to_uuid
     if expected is datetime:
-        return datetime.fromisoformat(value) if isinstance(value, str) else value
-
+        return _to_datetime
+    if expected is date:
+        return _to_date
     if isinstance(expected, type) and issubclass(expected, Enum):
-        return expected(value)
+        return expected
+    if get_origin(expected) is tuple:
+        args, variadic = _tuple_items(expected)
+        # JSON arrays come back as lists even when nothing needs converting.
+        return _tuple_converter([_decoder_for(arg) for arg in args], variadic)
+    return None
+
+
+def _tuple_items(expected: object) -> tuple[tuple[object, ...], bool]:
+    """The item types of a ``tuple[...]`` hint, and whether it is ``tuple[X, ...]``,
+    whose single item type applies to every element."""
+    args = get_args(expected)
+    if args and args[-1] is Ellipsis:
+        return args[:-1], True
+    return args, False
+
+
+def _tuple_converter(
+    items: list[_Converter | None],
+    variadic: bool = False,
+    into: Callable[[Any], object] = tuple,
+) -> _Converter:
+    def convert(value: Any) -> object:
+        pairs = (
+            zip(itertools.repeat(items[0]), value)
+            if variadic
+            else zip(items, value, strict=True)
+        )
+        return into(
+            element if item is None or element is None else item(element)
+            for item, element in pairs
+        )
+
+    return convert
+
+
+def _to_uuid(value: object) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def _to_datetime(value: object) -> object:
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
 
-    return value
+def _to_date(value: object) -> object:
+    return date.fromisoformat(value) if isinstance(value, str) else value
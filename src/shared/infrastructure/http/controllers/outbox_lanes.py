@@ -0,0 +1,56 @@
+from inspect import getdoc
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Security, status
+from fastapi_error_map import ErrorAwareRouter, rule
+from pydantic import BaseModel
+
+from shared.application.get_outbox_lanes.port import GetOutboxLanesUseCase
+from shared.domain.errors import AuthenticationError, AuthorizationError
+from shared.infrastructure.http.errors.callbacks import log_error, log_info
+from shared.infrastructure.http.errors.translators import ServiceUnavailableTranslator
+from shared.infrastructure.http.middleware.openapi_marker import bearer_scheme
+from shared.infrastructure.persistence.errors import DataMapperError
+
+
+class OutboxLaneResponse(BaseModel):
+    lane: str
+    backlog: int
+    lag_s: float
+
+
+def create_outbox_lanes_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.get(
+        "/lanes",
+        description=getdoc(GetOutboxLanesUseCase),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(bearer_scheme)],
+    )
+    @inject
+    async def get_outbox_lanes(
+        use_case: FromDishka[GetOutboxLanesUseCase],
+    ) -> list[OutboxLaneResponse]:
+        backlogs = await use_case.execute()
+        return [
+            OutboxLaneResponse(
+                lane=backlog.lane,
+                backlog=backlog.backlog,
+                lag_s=backlog.lag_s,
+            )
+            for backlog in backlogs
+        ]
+
+    return router
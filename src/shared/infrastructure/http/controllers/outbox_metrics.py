@@ -0,0 +1,92 @@
+from inspect import getdoc
+from typing import Any
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Security, status
+from fastapi.responses import PlainTextResponse
+from fastapi_error_map import ErrorAwareRouter, rule
+from pydantic import BaseModel
+
+from shared.application.export_outbox_metrics.port import ExportOutboxMetricsUseCase
+from shared.application.get_outbox_metrics.port import GetOutboxMetricsUseCase
+from shared.domain.errors import AuthenticationError, AuthorizationError
+from shared.infrastructure.http.controllers.outbox_lanes import OutboxLaneResponse
+from shared.infrastructure.http.errors.callbacks import log_error, log_info
+from shared.infrastructure.http.errors.translators import ServiceUnavailableTranslator
+from shared.infrastructure.http.middleware.openapi_marker import bearer_scheme
+from shared.infrastructure.persistence.errors import DataMapperError
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class OutboxMetricsResponse(BaseModel):
+    lanes: list[OutboxLaneResponse]
+    delivered_per_s: dict[str, float]
+    metrics: dict[str, Any]
+
+
+def create_outbox_metrics_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.get(
+        "/metrics",
+        description=getdoc(ExportOutboxMetricsUseCase),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        response_class=PlainTextResponse,
+        dependencies=[Security(bearer_scheme)],
+    )
+    @inject
+    async def scrape_outbox_metrics(
+        use_case: FromDishka[ExportOutboxMetricsUseCase],
+    ) -> PlainTextResponse:
+        return PlainTextResponse(
+            await use_case.execute(),
+            media_type=PROMETHEUS_CONTENT_TYPE,
+        )
+
+    @router.get(
+        "/metrics/summary",
+        description=getdoc(GetOutboxMetricsUseCase),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(bearer_scheme)],
+    )
+    @inject
+    async def get_outbox_metrics(
+        use_case: FromDishka[GetOutboxMetricsUseCase],
+    ) -> OutboxMetricsResponse:
+        report = await use_case.execute()
+        return OutboxMetricsResponse(
+            lanes=[
+                OutboxLaneResponse(
+                    lane=backlog.lane,
+                    backlog=backlog.backlog,
+                    lag_s=backlog.lag_s,
+                )
+                for backlog in report.lanes
+            ],
+            delivered_per_s=report.delivered_per_s,
+            metrics=report.metrics,
+        )
+
+    return router
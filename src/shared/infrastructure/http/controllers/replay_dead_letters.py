@@ -0,0 +1,60 @@
+from inspect import getdoc
+from typing import Annotated
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends, Security, status
+from fastapi_error_map import ErrorAwareRouter, rule
+from pydantic import BaseModel, ConfigDict, Field
+
+from shared.application.replay_dead_letters.command import ReplayDeadLettersCommand
+from shared.application.replay_dead_letters.port import ReplayDeadLettersUseCase
+from shared.domain.errors import AuthenticationError, AuthorizationError
+from shared.infrastructure.http.errors.callbacks import log_error, log_info
+from shared.infrastructure.http.errors.translators import ServiceUnavailableTranslator
+from shared.infrastructure.http.middleware.openapi_marker import bearer_scheme
+from shared.infrastructure.persistence.errors import DataMapperError
+
+
+class ReplayDeadLettersRequestPydantic(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    event_type: Annotated[str | None, Field()] = None
+    limit: Annotated[int, Field(ge=1, le=10_000)] = 1_000
+
+
+class ReplayDeadLettersResponse(BaseModel):
+    replayed: int
+
+
+def create_replay_dead_letters_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.post(
+        "/dead-letters/replay",
+        description=getdoc(ReplayDeadLettersUseCase),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(bearer_scheme)],
+    )
+    @inject
+    async def replay_dead_letters(
+        request_data_pydantic: Annotated[ReplayDeadLettersRequestPydantic, Depends()],
+        use_case: FromDishka[ReplayDeadLettersUseCase],
+    ) -> ReplayDeadLettersResponse:
+        request_data = ReplayDeadLettersCommand(
+            event_type=request_data_pydantic.event_type,
+            limit=request_data_pydantic.limit,
+        )
+        replayed = await use_case.execute(request_data)
+        return ReplayDeadLettersResponse(replayed=replayed)
+
+    return router
@@ -3,6 +3,7 @@ from fastapi import APIRouter
 from account.infrastructure.http.routers.account_router import create_accounts_router
 from core.infrastructure.http.routers.profile_router import create_profiles_router
 from shared.infrastructure.http.controllers.health import create_health_router
+from shared.infrastructure.http.routers.outbox_router import create_outbox_router
 
 
 def create_api_v1_router() -> APIRouter:
@@ -14,6 +15,7 @@ def create_api_v1_router() -> APIRouter:
     sub_routers = (
         create_accounts_router(),
         create_profiles_router(),
+        create_outbox_router(),
         general_router,
     )
     for sub_router in sub_routers:
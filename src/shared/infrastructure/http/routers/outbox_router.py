@@ -0,0 +1,23 @@
+from fastapi import APIRouter
+
+from shared.infrastructure.http.controllers.outbox_lanes import (
+    create_outbox_lanes_router,
+)
+from shared.infrastructure.http.controllers.outbox_metrics import (
+    create_outbox_metrics_router,
+)
+from shared.infrastructure.http.controllers.replay_dead_letters import (
+    create_replay_dead_letters_router,
+)
+
+
+def create_outbox_router() -> APIRouter:
+    router = APIRouter(prefix="/outbox", tags=["Outbox"])
+    sub_routers = (
+        create_replay_dead_letters_router(),
+        create_outbox_lanes_router(),
+        create_outbox_metrics_router(),
+    )
+    for sub_router in sub_routers:
+        router.include_router(sub_router)
+    return router
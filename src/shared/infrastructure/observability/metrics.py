@@ -0,0 +1,298 @@
+import bisect
+import math
+from collections.abc import Mapping, Sequence
+from typing import Any, ClassVar, Final
+
+type LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS: Final[tuple[float, ...]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUANTILES: Final[tuple[float, ...]] = (0.5, 0.95, 0.99)
+
+
+class _Metric:
+    kind: ClassVar[str]
+
+    __slots__ = ("description", "label_names", "name")
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+
+    def _key(self, labels: Mapping[str, str]) -> LabelValues:
+        """:raises ValueError:"""
+        if len(labels) != len(self.label_names):
+            msg = f"Metric '{self.name}' takes labels {self.label_names}."
+            raise ValueError(msg)
+        try:
+            return tuple(str(labels[name]) for name in self.label_names)
+        except KeyError as err:
+            msg = f"Metric '{self.name}' takes labels {self.label_names}."
+            raise ValueError(msg) from err
+
+    def labels_of(self, key: LabelValues) -> dict[str, str]:
+        return dict(zip(self.label_names, key, strict=True))
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    __slots__ = ("_values",)
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+    ) -> None:
+        super().__init__(name, description, label_names)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[tuple[LabelValues, float]]:
+        return sorted(self._values.items())
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    __slots__ = ("_values",)
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+    ) -> None:
+        super().__init__(name, description, label_names)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[tuple[LabelValues, float]]:
+        return sorted(self._values.items())
+
+
+class _HistogramSeries:
+    __slots__ = ("bucket_counts", "count", "sum")
+
+    def __init__(self, buckets: int) -> None:
+        # Per bucket, not cumulative; the last one is +Inf.
+        self.bucket_counts = [0] * (buckets + 1)
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    __slots__ = ("_series", "buckets")
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, description, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[LabelValues, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _HistogramSeries(len(self.buckets))
+        series.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        series.count += 1
+        series.sum += value
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return 0 if series is None else series.count
+
+    def cumulative(self, key: LabelValues) -> list[tuple[float, int]]:
+        """(upper bound, observations at or below it), ending with +Inf."""
+        series = self._series[key]
+        total = 0
+        result = []
+        for bound, count in zip(
+            (*self.buckets, math.inf), series.bucket_counts, strict=True
+        ):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, key: LabelValues, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        series = self._series[key]
+        rank = q * series.count
+        for bound, seen in self.cumulative(key):
+            if seen >= rank:
+                return bound if math.isfinite(bound) else self.buckets[-1]
+        return self.buckets[-1]
+
+    def series(self) -> list[tuple[LabelValues, int, float]]:
+        return sorted(
+            (key, series.count, series.sum) for key, series in self._series.items()
+        )
+
+
+class MetricsRegistry:
+    """In-process metrics, rendered in the Prometheus text format or as JSON.
+
+    Metrics are created once, by name; asking again for the same name returns
+    the existing metric.
+    """
+
+    __slots__ = ("_metrics",)
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def counter(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+    ) -> Counter:
+        return self._register(Counter(name, description, label_names))
+
+    def gauge(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+    ) -> Gauge:
+        return self._register(Gauge(name, description, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, description, label_names, buckets))
+
+    def _register[M: _Metric](self, metric: M) -> M:
+        """:raises ValueError:"""
+        existing = self._metrics.setdefault(metric.name, metric)
+        if type(existing) is not type(metric):
+            msg = f"Metric '{metric.name}' is already registered as a {existing.kind}."
+            raise ValueError(msg)
+        return existing  # type: ignore[return-value]
+
+    def render_text(self, prefix: str = "") -> str:
+        """Prometheus text exposition format, version 0.0.4, of the metrics
+        whose name starts with ``prefix``."""
+        lines: list[str] = []
+        for metric in self._select(prefix):
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.description)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            if isinstance(metric, Histogram):
+                for key, count, total in metric.series():
+                    labels = metric.labels_of(key)
+                    for bound, seen in metric.cumulative(key):
+                        bucket = {**labels, "le": _format_value(bound)}
+                        lines.append(
+                            f"{metric.name}_bucket{_format_labels(bucket)} {seen}"
+                        )
+                    lines.append(
+                        f"{metric.name}_sum{_format_labels(labels)} "
+                        f"{_format_value(total)}"
+                    )
+                    lines.append(f"{metric.name}_count{_format_labels(labels)} {count}")
+            elif isinstance(metric, Counter | Gauge):
+                for key, value in metric.samples():
+                    lines.append(
+                        f"{metric.name}{_format_labels(metric.labels_of(key))} "
+                        f"{_format_value(value)}"
+                    )
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self, prefix: str = "") -> dict[str, Any]:
+        """JSON-ready view of the metrics whose name starts with ``prefix``:
+        counters and gauges with their values, histograms with count, sum, mean
+        and bucket-resolution quantiles."""
+        snapshot: dict[str, Any] = {}
+        for metric in self._select(prefix):
+            samples: list[dict[str, Any]] = []
+            if isinstance(metric, Histogram):
+                for key, count, total in metric.series():
+                    sample: dict[str, Any] = {
+                        "labels": metric.labels_of(key),
+                        "count": count,
+                        "sum": total,
+                        "mean": total / count if count else 0.0,
+                    }
+                    for q in QUANTILES:
+                        sample[f"p{round(q * 100)}"] = metric.quantile(key, q)
+                    samples.append(sample)
+            elif isinstance(metric, Counter | Gauge):
+                samples.extend(
+                    {"labels": metric.labels_of(key), "value": value}
+                    for key, value in metric.samples()
+                )
+            snapshot[metric.name] = {
+                "type": metric.kind,
+                "help": metric.description,
+                "samples": samples,
+            }
+        return snapshot
+
+    def _select(self, prefix: str) -> list[_Metric]:
+        return [
+            metric for name, metric in self._metrics.items() if name.startswith(prefix)
+        ]
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Mapping[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
@@ -0,0 +1,94 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+
+log = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_READ_TIMEOUT_SECONDS = 5.0
+
+
+class MetricsScrapeServer:
+    """Serves ``GET /metrics`` for processes without a web app, such as workers.
+
+    A minimal HTTP/1.0 responder: one request per connection, no keep-alive.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[], Awaitable[str]],
+        host: str,
+        port: int,
+    ) -> None:
+        self._render = render
+        self._host = host
+        self._port = port
+        self._server: asyncio.Server | None = None
+
+    @property
+    def port(self) -> int:
+        """The bound port, once started; resolves port 0 to the chosen one."""
+        if self._server is None:
+            return self._port
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._serve, self._host, self._port)
+        log.info("Metrics available at http://%s:%d/metrics.", self._host, self.port)
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _serve(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            async with asyncio.timeout(_READ_TIMEOUT_SECONDS):
+                request_line = await reader.readline()
+                # Headers are not needed; drain them up to the blank line.
+                while (await reader.readline()).strip():
+                    pass
+            method, _, rest = request_line.decode("latin-1").partition(" ")
+            path = rest.split(" ", 1)[0]
+            if method != "GET":
+                await self._respond(writer, 405, "Method Not Allowed", "")
+            elif path.split("?", 1)[0] != "/metrics":
+                await self._respond(writer, 404, "Not Found", "")
+            else:
+                try:
+                    body = await self._render()
+                except Exception:
+                    log.exception("Failed to render metrics.")
+                    await self._respond(writer, 503, "Service Unavailable", "")
+                else:
+                    await self._respond(writer, 200, "OK", body)
+        except (TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    @staticmethod
+    async def _respond(
+        writer: asyncio.StreamWriter,
+        status: int,
+        reason: str,
+        body: str,
+    ) -> None:
+        payload = body.encode()
+        writer.write(
+            f"HTTP/1.0 {status} {reason}\r\n"
+            f"Content-Type: {CONTENT_TYPE}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "Connection: close\r\n\r\n".encode()
+            + payload
+        )
+        await writer.drain()
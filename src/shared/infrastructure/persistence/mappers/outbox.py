@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any
 from uuid import UUID, uuid4
 
 from sqlalchemy import (
@@ -11,6 +12,7 @@ from sqlalchemy import (
     Integer,
     Table,
     Text,
+    func,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 
@@ -21,11 +23,14 @@ from shared.infrastructure.persistence.registry import mapper_registry
 class OutboxRecord:
     id: UUID = field(default_factory=uuid4)
     event_type: str
-    payload: str
+    payload: dict[str, Any]
     occurred_at: datetime
     delivered: bool = False
     delivered_at: datetime | None = None
     retry_count: int = 0
+    locked_until: datetime | None = None
+    aggregate_id: str | None = None
+    next_attempt_at: datetime | None = None
 
 
 outbox_table = Table(
@@ -38,7 +43,83 @@ outbox_table = Table(
     Column("delivered", Boolean, nullable=False, default=False),
     Column("delivered_at", DateTime(timezone=True), nullable=True),
     Column("retry_count", Integer, nullable=False, default=0),
+    Column("locked_until", DateTime(timezone=True), nullable=True),
+    Column("aggregate_id", Text, nullable=True),
+    Column(
+        "next_attempt_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
     Index("ix_outbox_undelivered", "occurred_at", postgresql_where="delivered = false"),
+    Index(
+        "ix_outbox_due",
+        "next_attempt_at",
+        "occurred_at",
+        postgresql_where="delivered = false",
+    ),
+    Index(
+        "ix_outbox_due_by_type",
+        "event_type",
+        "next_attempt_at",
+        "occurred_at",
+        postgresql_where="delivered = false",
+    ),
+    Index(
+        "ix_outbox_undelivered_aggregate",
+        "aggregate_id",
+        "occurred_at",
+        postgresql_where="delivered = false",
+    ),
+    Index("ix_outbox_delivered", "delivered_at", postgresql_where="delivered = true"),
+)
+
+# Entries that exhausted their retries, kept for inspection and replay.
+outbox_dead_letter_table = Table(
+    "outbox_dead_letter",
+    mapper_registry.metadata,
+    Column("id", SA_UUID(as_uuid=True), primary_key=True),
+    Column("event_type", Text, nullable=False),
+    Column("payload", JSONB, nullable=False),
+    Column("occurred_at", DateTime(timezone=True), nullable=False),
+    Column("aggregate_id", Text, nullable=True),
+    Column("retry_count", Integer, nullable=False),
+    Column("last_error", Text, nullable=True),
+    Column(
+        "dead_lettered_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+)
+
+# Handlers that already succeeded for an entry still being retried. Keyed by
+# outbox id without a foreign key, so progress survives dead-letter replays.
+outbox_handler_delivery_table = Table(
+    "outbox_handler_delivery",
+    mapper_registry.metadata,
+    Column("outbox_id", SA_UUID(as_uuid=True), primary_key=True),
+    Column("handler", Text, primary_key=True),
+    Column(
+        "delivered_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+)
+
+# Delivered entries moved out of the hot table, one partition per UTC day.
+outbox_archive_table = Table(
+    "outbox_archive",
+    mapper_registry.metadata,
+    Column("id", SA_UUID(as_uuid=True), primary_key=True),
+    Column("event_type", Text, nullable=False),
+    Column("payload", JSONB, nullable=False),
+    Column("occurred_at", DateTime(timezone=True), nullable=False),
+    Column("aggregate_id", Text, nullable=True),
+    Column("retry_count", Integer, nullable=False),
+    Column("delivered_at", DateTime(timezone=True), primary_key=True),
+    postgresql_partition_by="RANGE (delivered_at)",
 )
 
 
@@ -1,14 +1,18 @@
 import logging
+from abc import abstractmethod
+from typing import Protocol
 from uuid import UUID
 
 from starlette.requests import Request
 
 from account.infrastructure.security.access_token_processor_jwt import (
+    AccessTokenClaims,
     AccessTokenDecoder,
 )
 from shared.domain.account_id import AccountId
 from shared.domain.errors import AuthenticationError
 from shared.domain.ports.identity_provider import IdentityProvider
+from shared.infrastructure.security.verified_token_cache import VerifiedTokenCache
 
 log = logging.getLogger(__name__)
 
@@ -16,24 +20,53 @@ AUTH_NOT_AUTHENTICATED = "Not authenticated."
 AUTH_INVALID_TOKEN = "Invalid or expired access token."  # noqa: S105
 
 
-class JwtBearerIdentityProvider(IdentityProvider):
+class AccessTokenClaimsProvider(Protocol):
+    @abstractmethod
+    async def get_current_claims(self) -> AccessTokenClaims:
+        """:raises AuthenticationError:"""
+
+
+class JwtBearerIdentityProvider(IdentityProvider, AccessTokenClaimsProvider):
+    """Resolves the bearer token of one request, verifying it at most once.
+
+    The result is memoized for the rest of the request, and verified tokens
+    are shared across requests through ``token_cache``.
+    """
+
     def __init__(
         self,
         request: Request,
         access_token_decoder: AccessTokenDecoder,
+        token_cache: VerifiedTokenCache,
     ) -> None:
         self._request = request
         self._access_token_decoder = access_token_decoder
+        self._token_cache = token_cache
+        self._claims: AccessTokenClaims | None = None
+        self._account_id: AccountId | None = None
 
     async def get_current_account_id(self) -> AccountId:
         """:raises AuthenticationError:"""
+        if self._account_id is None:
+            claims = await self.get_current_claims()
+            self._account_id = AccountId(UUID(claims.account_id))
+        return self._account_id
+
+    async def get_current_claims(self) -> AccessTokenClaims:
+        """:raises AuthenticationError:"""
+        if self._claims is not None:
+            return self._claims
+
         auth_header: str | None = self._request.headers.get("authorization")
         if auth_header is None or not auth_header.startswith("Bearer "):
             raise AuthenticationError(AUTH_NOT_AUTHENTICATED)
 
         token = auth_header[len("Bearer ") :]
-        account_id_str = self._access_token_decoder.decode_account_id(token)
-        if account_id_str is None:
+        claims = self._token_cache.get_or_verify(
+            token, self._access_token_decoder.decode
+        )
+        if claims is None:
             raise AuthenticationError(AUTH_INVALID_TOKEN)
 
-        return AccountId(UUID(account_id_str))
+        self._claims = claims
+        return claims
@@ -0,0 +1,117 @@
+from typing import Final
+
+from shared.infrastructure.observability.metrics import MetricsRegistry
+
+VERIFY_BUCKETS: Final[tuple[float, ...]] = (
+    0.00001,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+)
+
+
+class SecurityMetrics:
+    """Counters and timings of access token verification, authorization
+    lookups, access revocations and token refreshes, per process."""
+
+    __slots__ = (
+        "_access_cache_invalidations",
+        "_access_cache_lookups",
+        "_hit_ratio",
+        "_hits",
+        "_misses",
+        "_revocations",
+        "_token_cache_entries",
+        "_token_cache_evictions",
+        "_token_cache_lookups",
+        "_token_refreshes",
+        "_verify_duration",
+    )
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self._token_cache_lookups = registry.counter(
+            "auth_token_cache_lookups_total",
+            "Verified-token cache lookups, by result: hit or miss.",
+            ("result",),
+        )
+        self._hit_ratio = registry.gauge(
+            "auth_token_cache_hit_ratio",
+            "Share of verified-token cache lookups that hit, since start.",
+        )
+        self._token_cache_entries = registry.gauge(
+            "auth_token_cache_entries",
+            "Verified tokens currently cached.",
+        )
+        self._token_cache_evictions = registry.counter(
+            "auth_token_cache_evictions_total",
+            "Verified tokens dropped from the cache, by reason: expired or capacity.",
+            ("reason",),
+        )
+        self._verify_duration = registry.histogram(
+            "auth_token_verify_duration_seconds",
+            "Access token signature and claims verification latency, on cache misses.",
+            buckets=VERIFY_BUCKETS,
+        )
+        self._access_cache_lookups = registry.counter(
+            "authz_access_cache_lookups_total",
+            "Account role and status cache lookups, by result: hit or miss.",
+            ("result",),
+        )
+        self._access_cache_invalidations = registry.counter(
+            "authz_access_cache_invalidations_total",
+            "Account role and status cache entries invalidated by account events.",
+        )
+        self._revocations = registry.counter(
+            "auth_revocations_total",
+            "Account access revocation requests, by outcome: started, "
+            "coalesced into one in flight, suppressed as recently done, or "
+            "failed.",
+            ("outcome",),
+        )
+        self._token_refreshes = registry.counter(
+            "auth_token_refreshes_total",
+            "Token refresh requests, by outcome: started, coalesced into one "
+            "in flight, reused from one just done, or failed.",
+            ("outcome",),
+        )
+        self._hits = 0
+        self._misses = 0
+
+    def token_cache_hit(self) -> None:
+        self._hits += 1
+        self._token_cache_lookups.inc(result="hit")
+        self._update_hit_ratio()
+
+    def token_cache_miss(self) -> None:
+        self._misses += 1
+        self._token_cache_lookups.inc(result="miss")
+        self._update_hit_ratio()
+
+    def token_cache_evicted(self, reason: str) -> None:
+        self._token_cache_evictions.inc(reason=reason)
+
+    def token_cache_size(self, entries: int) -> None:
+        self._token_cache_entries.set(entries)
+
+    def observe_verify(self, seconds: float) -> None:
+        self._verify_duration.observe(seconds)
+
+    def access_cache_lookup(self, *, hit: bool) -> None:
+        self._access_cache_lookups.inc(result="hit" if hit else "miss")
+
+    def access_cache_invalidated(self) -> None:
+        self._access_cache_invalidations.inc()
+
+    def revocation(self, outcome: str) -> None:
+        self._revocations.inc(outcome=outcome)
+
+    def token_refresh(self, outcome: str) -> None:
+        self._token_refreshes.inc(outcome=outcome)
+
+    def _update_hit_ratio(self) -> None:
+        self._hit_ratio.set(self._hits / (self._hits + self._misses))
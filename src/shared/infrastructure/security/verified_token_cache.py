@@ -0,0 +1,97 @@
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Final
+
+from account.infrastructure.security.access_token_processor_jwt import (
+    AccessTokenClaims,
+)
+from shared.infrastructure.security.metrics import SecurityMetrics
+
+DEFAULT_TOKEN_CACHE_SIZE: Final[int] = 10_000
+DEFAULT_TOKEN_CACHE_MAX_TTL_SECONDS: Final[float] = 300.0
+
+
+class VerifiedTokenCache:
+    """Claims of verified access tokens, shared by all requests of a process.
+
+    Keyed by the SHA-256 digest of the token, so raw bearer tokens are never
+    kept. An entry lives until its token's ``exp``, capped at ``max_ttl``
+    seconds so that keys removed from the JWKS stop being honoured soon
+    after; beyond ``max_size`` entries the least recently used one goes.
+    Only successful verifications are cached. ``max_size`` 0 disables it.
+    """
+
+    __slots__ = ("_clock", "_entries", "_max_size", "_max_ttl", "_metrics")
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_TOKEN_CACHE_SIZE,
+        max_ttl: float = DEFAULT_TOKEN_CACHE_MAX_TTL_SECONDS,
+        metrics: SecurityMetrics | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._max_size = max_size
+        self._max_ttl = max_ttl
+        self._metrics = metrics
+        self._clock = clock
+        self._entries: OrderedDict[bytes, tuple[float, AccessTokenClaims]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_verify(
+        self,
+        token: str,
+        verify: Callable[[str], AccessTokenClaims | None],
+    ) -> AccessTokenClaims | None:
+        """Cached claims of ``token``, else the outcome of ``verify(token)``."""
+        key = hashlib.sha256(token.encode()).digest()
+        claims = self._get(key)
+        if claims is not None:
+            if self._metrics is not None:
+                self._metrics.token_cache_hit()
+            return claims
+
+        started = time.perf_counter()
+        claims = verify(token)
+        if self._metrics is not None:
+            self._metrics.token_cache_miss()
+            self._metrics.observe_verify(time.perf_counter() - started)
+        if claims is not None:
+            self._put(key, claims)
+        return claims
+
+    def _get(self, key: bytes) -> AccessTokenClaims | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, claims = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self._evicted("expired")
+            return None
+        self._entries.move_to_end(key)
+        return claims
+
+    def _put(self, key: bytes, claims: AccessTokenClaims) -> None:
+        if self._max_size <= 0:
+            return
+        expires_at = self._clock() + self._max_ttl
+        if claims.expires_at is not None:
+            expires_at = min(expires_at, claims.expires_at)
+        self._entries[key] = (expires_at, claims)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evicted("capacity")
+        if self._metrics is not None:
+            self._metrics.token_cache_size(len(self._entries))
+
+    def _evicted(self, reason: str) -> None:
+        if self._metrics is not None:
+            self._metrics.token_cache_evicted(reason)
+            self._metrics.token_cache_size(len(self._entries))
@@ -0,0 +1,4 @@
+-- Claim-based relay: a worker leases a batch of entries with
+-- FOR UPDATE SKIP LOCKED and stamps locked_until, so concurrent relay workers
+-- split the backlog. Expired leases become claimable again.
+ALTER TABLE outbox ADD COLUMN locked_until TIMESTAMPTZ;
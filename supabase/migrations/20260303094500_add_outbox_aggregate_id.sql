@@ -0,0 +1,7 @@
+-- Per-aggregate ordering: the relay delivers entries of different aggregates
+-- concurrently but keeps entries sharing an aggregate_id in occurred_at order.
+ALTER TABLE outbox ADD COLUMN aggregate_id TEXT;
+
+CREATE INDEX ix_outbox_undelivered_aggregate
+  ON outbox (aggregate_id, occurred_at)
+  WHERE delivered = false;
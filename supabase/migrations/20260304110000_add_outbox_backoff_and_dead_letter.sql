@@ -0,0 +1,45 @@
+-- Exponential backoff: failed entries are rescheduled through next_attempt_at
+-- and the relay only reads due entries through ix_outbox_due.
+ALTER TABLE outbox ADD COLUMN next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT now();
+UPDATE outbox SET next_attempt_at = occurred_at WHERE delivered = false;
+
+CREATE INDEX ix_outbox_due
+  ON outbox (next_attempt_at, occurred_at)
+  WHERE delivered = false;
+
+-- Entries that exhausted their retries, replayable through the admin API.
+CREATE TABLE outbox_dead_letter (
+    id UUID PRIMARY KEY,
+    event_type TEXT NOT NULL,
+    payload JSONB NOT NULL,
+    occurred_at TIMESTAMPTZ NOT NULL,
+    aggregate_id TEXT,
+    retry_count INTEGER NOT NULL,
+    last_error TEXT,
+    dead_lettered_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Entries abandoned before this migration (default MAX_RETRIES = 5).
+WITH abandoned AS (
+    DELETE FROM outbox
+    WHERE delivered = false AND retry_count >= 5
+    RETURNING id, event_type, payload, occurred_at, aggregate_id, retry_count
+)
+INSERT INTO outbox_dead_letter
+    (id, event_type, payload, occurred_at, aggregate_id, retry_count)
+SELECT id, event_type, payload, occurred_at, aggregate_id, retry_count
+FROM abandoned;
+
+ALTER TABLE public.outbox_dead_letter ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Admins can read outbox dead letters"
+  ON public.outbox_dead_letter
+  FOR SELECT
+  TO authenticated
+  USING (
+    EXISTS (
+      SELECT 1 FROM public.account_metadata
+      WHERE account_metadata.account_id = auth.uid()
+        AND account_metadata.role IN ('ADMIN', 'SUPER_ADMIN')
+    )
+  );
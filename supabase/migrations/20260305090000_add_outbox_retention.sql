@@ -0,0 +1,32 @@
+-- Retention: delivered rows leave the hot outbox table in bounded batches,
+-- located through ix_outbox_delivered, and are archived into daily
+-- partitions of outbox_archive. The pruner creates partitions on demand and
+-- drops those older than the retention window.
+CREATE INDEX ix_outbox_delivered
+  ON outbox (delivered_at)
+  WHERE delivered = true;
+
+CREATE TABLE outbox_archive (
+    id UUID NOT NULL,
+    event_type TEXT NOT NULL,
+    payload JSONB NOT NULL,
+    occurred_at TIMESTAMPTZ NOT NULL,
+    aggregate_id TEXT,
+    retry_count INTEGER NOT NULL,
+    delivered_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (id, delivered_at)
+) PARTITION BY RANGE (delivered_at);
+
+ALTER TABLE public.outbox_archive ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Admins can read outbox archive"
+  ON public.outbox_archive
+  FOR SELECT
+  TO authenticated
+  USING (
+    EXISTS (
+      SELECT 1 FROM public.account_metadata
+      WHERE account_metadata.account_id = auth.uid()
+        AND account_metadata.role IN ('ADMIN', 'SUPER_ADMIN')
+    )
+  );
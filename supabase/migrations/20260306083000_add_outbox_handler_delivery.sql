@@ -0,0 +1,12 @@
+-- Per-handler delivery tracking: when one of an entry's handlers fails, the
+-- ones that succeeded are recorded here and skipped on retry. Keyed by
+-- outbox id without a foreign key so progress survives dead-letter replays;
+-- the relay clears it once the entry is delivered.
+CREATE TABLE outbox_handler_delivery (
+    outbox_id UUID NOT NULL,
+    handler TEXT NOT NULL,
+    delivered_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (outbox_id, handler)
+);
+
+ALTER TABLE public.outbox_handler_delivery ENABLE ROW LEVEL SECURITY;
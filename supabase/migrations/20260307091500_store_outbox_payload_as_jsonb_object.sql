@@ -0,0 +1,13 @@
+-- Event payloads used to be written as a JSON string wrapped in a JSONB
+-- scalar. Unwrap them so every payload is a native JSONB object.
+UPDATE public.outbox
+SET payload = (payload #>> '{}')::jsonb
+WHERE jsonb_typeof(payload) = 'string';
+
+UPDATE public.outbox_dead_letter
+SET payload = (payload #>> '{}')::jsonb
+WHERE jsonb_typeof(payload) = 'string';
+
+UPDATE public.outbox_archive
+SET payload = (payload #>> '{}')::jsonb
+WHERE jsonb_typeof(payload) = 'string';
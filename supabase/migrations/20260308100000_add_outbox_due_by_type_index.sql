@@ -0,0 +1,5 @@
+-- Delivery lanes claim their due entries by event type; this index lets a
+-- lane reach its own entries without scanning past other types' backlog.
+CREATE INDEX ix_outbox_due_by_type
+    ON outbox (event_type, next_attempt_at, occurred_at)
+    WHERE delivered = false;
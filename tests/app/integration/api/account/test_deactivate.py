@@ -18,7 +18,6 @@ class TestDeactivateAccount:
         auth_headers: dict[str, str],
         fake_identity: FakeIdentityProvider,
         mock_account_repo: AsyncMock,
-        mock_access_revoker: AsyncMock,
         account_id: AccountId,
     ) -> None:
         fake_identity.set_current_account(account_id)
@@ -83,3 +83,13 @@ def mock_password_resetter(mocks: MockRegistry) -> AsyncMock:
 @pytest.fixture
 def mock_access_revoker(mocks: MockRegistry) -> AsyncMock:
     return mocks.access_revoker
+
+
+@pytest.fixture
+def mock_dead_letter_queue(mocks: MockRegistry) -> AsyncMock:
+    return mocks.dead_letter_queue
+
+
+@pytest.fixture
+def mock_lane_monitor(mocks: MockRegistry) -> AsyncMock:
+    return mocks.lane_monitor
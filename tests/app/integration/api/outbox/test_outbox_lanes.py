@@ -0,0 +1,53 @@
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from shared.application.outbox_lane_monitor import LaneBacklog
+from shared.domain.account_id import AccountId
+from shared.domain.errors import AuthorizationError
+from tests.app.integration.conftest import FakeIdentityProvider, MockRegistry
+
+
+class TestOutboxLanes:
+    @pytest.mark.asyncio
+    async def test_admin_gets_backlog_and_lag_per_lane(
+        self,
+        client: httpx.AsyncClient,
+        auth_headers: dict[str, str],
+        fake_identity: FakeIdentityProvider,
+        mock_lane_monitor: AsyncMock,
+        account_id: AccountId,
+    ) -> None:
+        fake_identity.set_current_account(account_id)
+        mock_lane_monitor.backlogs.return_value = [
+            LaneBacklog(lane="default", backlog=0, lag_s=0.0),
+            LaneBacklog(lane="bulk", backlog=1200, lag_s=35.5),
+        ]
+
+        response = await client.get("/api/v1/outbox/lanes", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"lane": "default", "backlog": 0, "lag_s": 0.0},
+            {"lane": "bulk", "backlog": 1200, "lag_s": 35.5},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_non_admin_returns_403(
+        self,
+        client: httpx.AsyncClient,
+        auth_headers: dict[str, str],
+        fake_identity: FakeIdentityProvider,
+        mocks: MockRegistry,
+        account_id: AccountId,
+    ) -> None:
+        fake_identity.set_current_account(account_id)
+        mocks.authorization_guard.require_admin.side_effect = AuthorizationError(
+            "Insufficient permissions."
+        )
+
+        response = await client.get("/api/v1/outbox/lanes", headers=auth_headers)
+
+        assert response.status_code == 403
+        mocks.lane_monitor.backlogs.assert_not_awaited()
@@ -0,0 +1,102 @@
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from shared.application.outbox_lane_monitor import LaneBacklog
+from shared.domain.account_id import AccountId
+from shared.domain.errors import AuthorizationError
+from tests.app.integration.conftest import FakeIdentityProvider, MockRegistry
+
+
+class TestOutboxMetrics:
+    @pytest.mark.asyncio
+    async def test_admin_scrapes_prometheus_text(
+        self,
+        client: httpx.AsyncClient,
+        auth_headers: dict[str, str],
+        fake_identity: FakeIdentityProvider,
+        mock_lane_monitor: AsyncMock,
+        account_id: AccountId,
+    ) -> None:
+        fake_identity.set_current_account(account_id)
+        mock_lane_monitor.backlogs.return_value = [
+            LaneBacklog(lane="default", backlog=12, lag_s=3.5),
+        ]
+
+        response = await client.get("/api/v1/outbox/metrics", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE outbox_events_delivered_total counter" in response.text
+        assert 'outbox_backlog{lane="default"} 12.0' in response.text
+        assert 'outbox_lag_seconds{lane="default"} 3.5' in response.text
+
+    @pytest.mark.asyncio
+    async def test_scrape_for_non_admin_returns_403(
+        self,
+        client: httpx.AsyncClient,
+        auth_headers: dict[str, str],
+        fake_identity: FakeIdentityProvider,
+        mocks: MockRegistry,
+        account_id: AccountId,
+    ) -> None:
+        fake_identity.set_current_account(account_id)
+        mocks.authorization_guard.require_admin.side_effect = AuthorizationError(
+            "Insufficient permissions."
+        )
+
+        response = await client.get("/api/v1/outbox/metrics", headers=auth_headers)
+
+        assert response.status_code == 403
+        mocks.lane_monitor.backlogs.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_admin_gets_json_summary(
+        self,
+        client: httpx.AsyncClient,
+        auth_headers: dict[str, str],
+        fake_identity: FakeIdentityProvider,
+        mock_lane_monitor: AsyncMock,
+        account_id: AccountId,
+    ) -> None:
+        fake_identity.set_current_account(account_id)
+        mock_lane_monitor.backlogs.return_value = [
+            LaneBacklog(lane="default", backlog=12, lag_s=3.5),
+        ]
+
+        response = await client.get(
+            "/api/v1/outbox/metrics/summary", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["lanes"] == [{"lane": "default", "backlog": 12, "lag_s": 3.5}]
+        assert body["delivered_per_s"] == {}
+        assert body["metrics"]["outbox_backlog"]["samples"] == [
+            {"labels": {"lane": "default"}, "value": 12.0},
+        ]
+        assert body["metrics"]["outbox_handler_duration_seconds"]["type"] == (
+            "histogram"
+        )
+
+    @pytest.mark.asyncio
+    async def test_summary_for_non_admin_returns_403(
+        self,
+        client: httpx.AsyncClient,
+        auth_headers: dict[str, str],
+        fake_identity: FakeIdentityProvider,
+        mocks: MockRegistry,
+        account_id: AccountId,
+    ) -> None:
+        fake_identity.set_current_account(account_id)
+        mocks.authorization_guard.require_admin.side_effect = AuthorizationError(
+            "Insufficient permissions."
+        )
+
+        response = await client.get(
+            "/api/v1/outbox/metrics/summary", headers=auth_headers
+        )
+
+        assert response.status_code == 403
+        mocks.lane_monitor.backlogs.assert_not_awaited()
@@ -0,0 +1,71 @@
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from shared.domain.account_id import AccountId
+from shared.domain.errors import AuthorizationError
+from tests.app.integration.conftest import FakeIdentityProvider, MockRegistry
+
+
+class TestReplayDeadLetters:
+    @pytest.mark.asyncio
+    async def test_admin_replay_returns_count(
+        self,
+        client: httpx.AsyncClient,
+        auth_headers: dict[str, str],
+        fake_identity: FakeIdentityProvider,
+        mock_dead_letter_queue: AsyncMock,
+        account_id: AccountId,
+    ) -> None:
+        fake_identity.set_current_account(account_id)
+        mock_dead_letter_queue.replay.return_value = 2
+
+        response = await client.post(
+            "/api/v1/outbox/dead-letters/replay",
+            params={"event_type": "AccountCreated", "limit": 50},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"replayed": 2}
+        mock_dead_letter_queue.replay.assert_awaited_once_with(
+            event_type="AccountCreated",
+            limit=50,
+        )
+
+    @pytest.mark.asyncio
+    async def test_non_admin_returns_403(
+        self,
+        client: httpx.AsyncClient,
+        auth_headers: dict[str, str],
+        fake_identity: FakeIdentityProvider,
+        mocks: MockRegistry,
+        account_id: AccountId,
+    ) -> None:
+        fake_identity.set_current_account(account_id)
+        mocks.authorization_guard.require_admin.side_effect = AuthorizationError(
+            "Insufficient permissions."
+        )
+
+        response = await client.post(
+            "/api/v1/outbox/dead-letters/replay",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 403
+        mocks.dead_letter_queue.replay.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_limit_out_of_range_returns_422(
+        self,
+        client: httpx.AsyncClient,
+        auth_headers: dict[str, str],
+    ) -> None:
+        response = await client.post(
+            "/api/v1/outbox/dead-letters/replay",
+            params={"limit": 0},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 422
@@ -13,7 +13,7 @@ Contains:
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import cast
-from unittest.mock import AsyncMock, create_autospec
+from unittest.mock import AsyncMock, Mock, create_autospec
 
 import pytest
 from dishka import Provider, Scope, provide
@@ -21,24 +21,25 @@ from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
 
+from account.application.shared.access_claims_publisher import AccessClaimsPublisher
 from account.application.shared.account_provisioner import AccountProvisioner
 from account.application.shared.account_unit_of_work import AccountUnitOfWork
 from account.application.shared.password_resetter import PasswordResetter
 from account.application.shared.token_pair_issuer import TokenPairIssuer
 from account.application.shared.token_pair_refresher import TokenPairRefresher
-from account.domain.account.ports import AccessRevoker
+from account.domain.account.ports import AccessRevoker, RevokedAccessRegistry
 from account.domain.account.repository import AccountRepository
 from core.application.shared.core_unit_of_work import CoreUnitOfWork
 from core.domain.profile.repository import ProfileRepository
+from shared.application.dead_letter_queue import DeadLetterQueue
 from shared.application.event_dispatcher import EventDispatcher
+from shared.application.outbox_lane_monitor import OutboxLaneMonitor
 from shared.domain.account_id import AccountId
 from shared.domain.errors import AuthenticationError
 from shared.domain.ports.authorization_guard import AuthorizationGuard
 from shared.domain.ports.identity_provider import IdentityProvider
-from shared.infrastructure.config.app_factory import (
-    _map_tables,
-    create_ioc_container,
-)
+from shared.infrastructure.config.app_factory import create_ioc_container
+from shared.infrastructure.config.bootstrap import map_tables
 from shared.infrastructure.config.settings.app_settings import AppSettings
 from shared.infrastructure.config.settings.database import (
     PostgresSettings,
@@ -98,6 +99,13 @@ class MockRegistry:
         self.access_revoker: AsyncMock = cast(
             AsyncMock, create_autospec(AccessRevoker, instance=True)
         )
+        self.access_claims_publisher: AsyncMock = cast(
+            AsyncMock, create_autospec(AccessClaimsPublisher, instance=True)
+        )
+        self.revoked_access: Mock = cast(
+            Mock, create_autospec(RevokedAccessRegistry, instance=True)
+        )
+        self.revoked_access.is_access_revoked.return_value = False
         self.account_repository: AsyncMock = cast(
             AsyncMock, create_autospec(AccountRepository, instance=True)
         )
@@ -113,6 +121,12 @@ class MockRegistry:
         self.event_dispatcher: AsyncMock = cast(
             AsyncMock, create_autospec(EventDispatcher, instance=True)
         )
+        self.dead_letter_queue: AsyncMock = cast(
+            AsyncMock, create_autospec(DeadLetterQueue, instance=True)
+        )
+        self.lane_monitor: AsyncMock = cast(
+            AsyncMock, create_autospec(OutboxLaneMonitor, instance=True)
+        )
         self.authorization_guard: AsyncMock = AsyncMock(spec=AuthorizationGuard)
         self.authorization_guard.require_admin = AsyncMock(return_value=None)
 
@@ -123,16 +137,21 @@ class MockRegistry:
             "token_pair_issuer",
             "token_pair_refresher",
             "access_revoker",
+            "access_claims_publisher",
+            "revoked_access",
             "account_repository",
             "profile_repository",
             "account_uow",
             "core_uow",
             "event_dispatcher",
+            "dead_letter_queue",
+            "lane_monitor",
             "authorization_guard",
         ):
             mock = getattr(self, attr)
             mock.reset_mock(side_effect=True, return_value=True)
         self.token_pair_issuer.access_token_expiry_seconds = 300
+        self.revoked_access.is_access_revoked.return_value = False
         self.authorization_guard.require_admin = AsyncMock(return_value=None)
 
 
@@ -168,12 +187,20 @@ class TestSupabaseProvider(Provider):
     def access_revoker(self) -> AccessRevoker:
         return cast(AccessRevoker, _mocks.access_revoker)
 
+    @provide
+    def access_claims_publisher(self) -> AccessClaimsPublisher:
+        return cast(AccessClaimsPublisher, _mocks.access_claims_publisher)
+
+    @provide
+    def revoked_access(self) -> RevokedAccessRegistry:
+        return cast(RevokedAccessRegistry, _mocks.revoked_access)
+
 
 # ---------------------------------------------------------------------------
 # 2.3  TestRepositoryProvider
 # ---------------------------------------------------------------------------
 class TestRepositoryProvider(Provider):
-    """Overrides repositories, UoWs, and event dispatcher with shared mocks."""
+    """Overrides repositories, UoWs, and outbox ports with shared mocks."""
 
     scope = Scope.REQUEST
 
@@ -197,6 +224,14 @@ class TestRepositoryProvider(Provider):
     def event_dispatcher(self) -> EventDispatcher:
         return cast(EventDispatcher, _mocks.event_dispatcher)
 
+    @provide
+    def dead_letter_queue(self) -> DeadLetterQueue:
+        return cast(DeadLetterQueue, _mocks.dead_letter_queue)
+
+    @provide
+    def lane_monitor(self) -> OutboxLaneMonitor:
+        return cast(OutboxLaneMonitor, _mocks.lane_monitor)
+
 
 # ---------------------------------------------------------------------------
 # 2.4  TestAuthProvider
@@ -225,7 +260,7 @@ _tables_mapped = False
 async def _test_lifespan(app: FastAPI) -> AsyncIterator[None]:  # noqa: RUF029, ARG001
     global _tables_mapped  # noqa: PLW0603
     if not _tables_mapped:
-        _map_tables()
+        map_tables()
         _tables_mapped = True
     auto_discover_handlers()
     yield
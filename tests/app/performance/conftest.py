@@ -0,0 +1,64 @@
+"""Performance test fixtures.
+
+Benchmarks run against the local Supabase Postgres (``make up.db``) in an
+isolated ``outbox_bench`` schema cloned from the public outbox tables, and skip
+when the database is unreachable.
+"""
+
+import contextlib
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.exc import ArgumentError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from shared.infrastructure.config.settings.app_settings import load_settings
+from shared.infrastructure.config.settings.loader import ValidEnvs
+from shared.infrastructure.persistence.mappers.outbox import map_outbox_table
+
+BENCH_SCHEMA = "outbox_bench"
+
+
+@pytest.fixture(scope="session")
+def _outbox_mapped() -> None:
+    with contextlib.suppress(ArgumentError):
+        map_outbox_table()
+
+
+@pytest_asyncio.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    dsn = load_settings(ValidEnvs.LOCAL).postgres.dsn
+    bench_engine = create_async_engine(
+        dsn,
+        pool_size=20,
+        connect_args={"options": f"-c search_path={BENCH_SCHEMA}"},
+    )
+    try:
+        async with bench_engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE"))
+            await conn.execute(text(f"CREATE SCHEMA {BENCH_SCHEMA}"))
+            for table in ("outbox", "outbox_dead_letter", "outbox_handler_delivery"):
+                await conn.execute(
+                    text(
+                        f"CREATE TABLE {BENCH_SCHEMA}.{table} "
+                        f"(LIKE public.{table} INCLUDING ALL)"
+                    )
+                )
+            await conn.execute(
+                text(
+                    f"CREATE TABLE {BENCH_SCHEMA}.outbox_archive "
+                    "(LIKE public.outbox_archive INCLUDING ALL) "
+                    "PARTITION BY RANGE (delivered_at)"
+                )
+            )
+    except (OperationalError, OSError) as err:
+        await bench_engine.dispose()
+        pytest.skip(f"Local Postgres unavailable: {err}")
+
+    yield bench_engine
+
+    async with bench_engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE"))
+    await bench_engine.dispose()
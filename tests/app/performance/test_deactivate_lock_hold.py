@@ -0,0 +1,114 @@
+"""How long deactivating an account holds its row lock, now that signing it
+out happens after commit. Run with ``pytest -m slow``.
+"""
+
+import asyncio
+import time
+from typing import cast
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from account.application.current_account.port import CurrentAccountUseCase
+from account.application.deactivate_account.command import DeactivateAccountCommand
+from account.application.deactivate_account.handler import DeactivateAccountHandler
+from account.application.shared.account_unit_of_work import AccountUnitOfWork
+from account.domain.account.entity import Account
+from account.domain.account.enums import AccountRole
+from account.domain.account.events import AccountDeactivated
+from account.domain.account.ports import AccessRevoker
+from account.domain.account.repository import AccountRepository
+from account.infrastructure.events.handlers.revoke_account_access import (
+    RevokeAccessOnAccountDeactivated,
+)
+from account.infrastructure.security.access_revocation import (
+    AccessRevocationCoordinator,
+)
+from shared.application.event_dispatcher import EventDispatcher
+from shared.domain.account_id import AccountId
+from tests.app.unit.factories.account_entity import create_account
+from tests.app.unit.factories.value_objects import create_account_id
+
+pytestmark = pytest.mark.slow
+
+ROUNDS = 50
+REVOKE_LATENCY_S = 0.02
+
+
+class _LockClock:
+    """Times from the ``for_update`` read to the commit that releases it."""
+
+    def __init__(self) -> None:
+        self.locked_at = 0.0
+        self.held: list[float] = []
+
+    def lock(self) -> None:
+        self.locked_at = time.perf_counter()
+
+    def release(self) -> None:
+        self.held.append(time.perf_counter() - self.locked_at)
+
+
+class _RemoteRevoker(AccessRevoker):
+    async def remove_all_account_access(self, account_id: AccountId) -> None:
+        await asyncio.sleep(REVOKE_LATENCY_S)
+
+
+def _handler(
+    admin: Account, lock_clock: _LockClock
+) -> tuple[DeactivateAccountHandler, AsyncMock]:
+    current_account_handler = create_autospec(CurrentAccountUseCase, instance=True)
+    cast(AsyncMock, current_account_handler.get_current_account).return_value = admin
+    account_repository = create_autospec(AccountRepository, instance=True)
+    account_unit_of_work = create_autospec(AccountUnitOfWork, instance=True)
+    event_dispatcher = create_autospec(EventDispatcher, instance=True)
+
+    def get_by_id(account_id: AccountId, for_update: bool = False) -> Account:
+        if for_update:
+            lock_clock.lock()
+        return create_account(account_id=account_id, is_active=True)
+
+    async def commit() -> None:
+        await asyncio.sleep(0)
+        lock_clock.release()
+
+    cast(AsyncMock, account_repository.get_by_id).side_effect = get_by_id
+    cast(AsyncMock, account_unit_of_work.commit).side_effect = commit
+    handler = DeactivateAccountHandler(
+        current_account_handler=cast(CurrentAccountUseCase, current_account_handler),
+        account_repository=cast(AccountRepository, account_repository),
+        account_unit_of_work=cast(AccountUnitOfWork, account_unit_of_work),
+        event_dispatcher=cast(EventDispatcher, event_dispatcher),
+    )
+    return handler, cast(AsyncMock, event_dispatcher.dispatch)
+
+
+@pytest.mark.asyncio
+async def test_row_lock_is_not_held_across_the_revocation_call() -> None:
+    lock_clock = _LockClock()
+    handler, dispatch = _handler(create_account(role=AccountRole.ADMIN), lock_clock)
+    revoke = RevokeAccessOnAccountDeactivated(
+        AccessRevocationCoordinator(_RemoteRevoker())
+    )
+
+    revoke_s = 0.0
+    for _ in range(ROUNDS):
+        await handler.execute(
+            DeactivateAccountCommand(account_id=create_account_id().value)
+        )
+        (event,) = dispatch.await_args_list[-1].args[0]
+        assert isinstance(event, AccountDeactivated)
+        started = time.perf_counter()
+        # What the relay does with the event once the transaction committed.
+        await revoke.handle(event)
+        revoke_s += time.perf_counter() - started
+
+    held_ms = sum(lock_clock.held) / ROUNDS * 1000
+    revoke_ms = revoke_s / ROUNDS * 1000
+    print(  # noqa: T201
+        f"row lock held {held_ms:.3f} ms per deactivation; revocation after "
+        f"commit {revoke_ms:.1f} ms, previously inside the lock"
+    )
+
+    assert len(lock_clock.held) == ROUNDS
+    assert held_ms * 10 < revoke_ms
@@ -0,0 +1,125 @@
+"""Event codec cost for every registered event type. Run with ``pytest -m slow``.
+
+Both paths are measured down to the bytes sent to and read from Postgres. The
+former codec stored a JSON string inside JSONB, so its text went through
+``json`` twice each way and every decode re-resolved the type hints.
+"""
+
+import dataclasses
+import importlib
+import json
+import time
+import types
+import typing
+from collections.abc import Callable
+from datetime import UTC, date, datetime
+from enum import Enum
+from typing import Any, get_args, get_origin, get_type_hints
+from uuid import UUID, uuid4
+
+import orjson
+import pytest
+
+from shared.domain.domain_event import DomainEvent
+from shared.infrastructure.events.registry import _event_type_registry
+from shared.infrastructure.events.serialization import get_codec
+
+pytestmark = pytest.mark.slow
+
+ROUNDS = 20_000
+EVENT_MODULES = ("account.domain.account.events", "core.domain.profile.events")
+_UNION_ORIGINS = {typing.Union, types.UnionType}
+
+
+def _legacy_coerce(value: object, expected: Any) -> object:  # noqa: PLR0911
+    if value is None or expected is None:
+        return value
+    if get_origin(expected) in _UNION_ORIGINS:
+        non_none = [a for a in get_args(expected) if a is not type(None)]
+        if non_none:
+            return _legacy_coerce(value, non_none[0])
+    if expected is UUID:
+        return UUID(str(value))
+    if expected is datetime:
+        return datetime.fromisoformat(value) if isinstance(value, str) else value
+    if expected is date:
+        return date.fromisoformat(value) if isinstance(value, str) else value
+    if get_origin(expected) is tuple:
+        return tuple(
+            _legacy_coerce(item, arg)
+            for item, arg in zip(value, get_args(expected), strict=True)  # type: ignore[call-overload]
+        )
+    if isinstance(expected, type) and issubclass(expected, Enum):
+        return expected(value)
+    return value
+
+
+def _legacy_round_trip(event: DomainEvent) -> DomainEvent:
+    wire = json.dumps(json.dumps(dataclasses.asdict(event), default=str))
+    raw = json.loads(json.loads(wire))
+    hints = get_type_hints(type(event))
+    kwargs: dict[str, Any] = {
+        name: _legacy_coerce(value, hints.get(name)) for name, value in raw.items()
+    }
+    return type(event)(**kwargs)
+
+
+def _codec_round_trip(event: DomainEvent) -> DomainEvent:
+    codec = get_codec(type(event))
+    return codec.decode(orjson.loads(orjson.dumps(codec.encode(event))))
+
+
+def _sample_value(expected: Any) -> object:
+    if get_origin(expected) in _UNION_ORIGINS:
+        expected = next(a for a in get_args(expected) if a is not type(None))
+    if get_origin(expected) is tuple:
+        return tuple(_sample_value(arg) for arg in get_args(expected))
+    if isinstance(expected, type) and issubclass(expected, Enum):
+        return next(iter(expected))
+    samples: dict[object, object] = {
+        UUID: uuid4(),
+        datetime: datetime.now(UTC),
+        date: date(1990, 5, 17),
+        bool: True,
+        int: 1,
+    }
+    return samples.get(expected, "sample")
+
+
+def _sample_event(event_cls: type[DomainEvent]) -> DomainEvent:
+    hints = get_type_hints(event_cls)
+    base = {f.name for f in dataclasses.fields(DomainEvent)}
+    kwargs: dict[str, Any] = {
+        f.name: _sample_value(hints[f.name])
+        for f in dataclasses.fields(event_cls)
+        if f.name not in base
+    }
+    return event_cls(**kwargs)
+
+
+def _time(
+    round_trip: Callable[[DomainEvent], DomainEvent], event: DomainEvent
+) -> float:
+    """Returns microseconds per encode/decode round trip."""
+    assert round_trip(event) == event
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        round_trip(event)
+    return (time.perf_counter() - started) / ROUNDS * 1_000_000
+
+
+def test_codec_beats_reflection_for_every_event_type() -> None:
+    for module in EVENT_MODULES:
+        importlib.import_module(module)
+    event_types = sorted(_event_type_registry.values(), key=lambda cls: cls.__name__)
+    assert event_types
+
+    for event_cls in event_types:
+        event = _sample_event(event_cls)
+        legacy_us = _time(_legacy_round_trip, event)
+        codec_us = _time(_codec_round_trip, event)
+        print(  # noqa: T201
+            f"{event_cls.__name__}: reflection {legacy_us:.1f}us, "
+            f"codec {codec_us:.1f}us ({legacy_us / codec_us:.1f}x)"
+        )
+        assert codec_us * 2 < legacy_us
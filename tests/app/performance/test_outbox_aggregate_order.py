@@ -0,0 +1,232 @@
+"""Per-aggregate delivery order against a local Postgres.
+
+Run with ``pytest -m slow``.
+"""
+
+import asyncio
+from collections.abc import Generator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import ClassVar
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from shared.domain.domain_event import DomainEvent
+from shared.infrastructure.events.lanes import DEFAULT_LANE, OutboxLane, OutboxLanes
+from shared.infrastructure.events.registry import _event_type_registry, _registry
+from shared.infrastructure.events.relay import OutboxRelay
+from shared.infrastructure.events.serialization import serialize_event
+from shared.infrastructure.persistence.mappers.outbox import outbox_table
+
+pytestmark = pytest.mark.slow
+
+AGGREGATE_ID = "Account:x"
+
+
+@dataclass(frozen=True, kw_only=True)
+class _OrderedEvent(DomainEvent):
+    n: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class _UrgentOrderedEvent(DomainEvent):
+    n: int
+
+
+class _Handler:
+    handled: ClassVar[list[int]] = []
+
+    async def handle(self, event: _OrderedEvent | _UrgentOrderedEvent) -> None:
+        await asyncio.sleep(0)
+        self.handled.append(event.n)
+
+
+class _Container:
+    def __call__(self, **kwargs: object) -> "_Container":
+        return self
+
+    async def __aenter__(self) -> "_Container":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    async def get(self, handler_type: type) -> object:
+        return handler_type()
+
+
+@pytest.fixture(autouse=True)
+def _register_handler() -> Generator[None]:
+    saved_registry = dict(_registry)
+    saved_type_registry = dict(_event_type_registry)
+    _event_type_registry["_OrderedEvent"] = _OrderedEvent
+    _event_type_registry["_UrgentOrderedEvent"] = _UrgentOrderedEvent
+    _registry[_OrderedEvent] = [_Handler]
+    _registry[_UrgentOrderedEvent] = [_Handler]
+    _Handler.handled = []
+    yield
+    _registry.clear()
+    _registry.update(saved_registry)
+    _event_type_registry.clear()
+    _event_type_registry.update(saved_type_registry)
+
+
+async def _seed(
+    session_factory: async_sessionmaker[AsyncSession],
+    *events: DomainEvent,
+    first_locked_until: datetime | None = None,
+) -> list[UUID]:
+    """One entry per event, all of ``AGGREGATE_ID``, in the given order."""
+    base = datetime.now(UTC) - timedelta(minutes=5)
+    ids = [uuid4() for _ in events]
+    rows = [
+        {
+            "id": ids[position],
+            "event_type": event.event_type,
+            "payload": serialize_event(event),
+            "occurred_at": base + timedelta(seconds=position),
+            "next_attempt_at": base + timedelta(seconds=position),
+            "delivered": False,
+            "retry_count": 0,
+            "aggregate_id": AGGREGATE_ID,
+            "locked_until": first_locked_until if position == 0 else None,
+        }
+        for position, event in enumerate(events)
+    ]
+    async with session_factory() as session:
+        await session.execute(text("TRUNCATE outbox"))
+        await session.execute(insert(outbox_table), rows)
+        await session.commit()
+    return ids
+
+
+async def _undelivered(session_factory: async_sessionmaker[AsyncSession]) -> set[UUID]:
+    async with session_factory() as session:
+        result = await session.execute(
+            select(outbox_table.c.id).where(outbox_table.c.delivered.is_(False))
+        )
+        return set(result.scalars())
+
+
+def _relay(
+    session_factory: async_sessionmaker[AsyncSession],
+    lanes: OutboxLanes | None = None,
+) -> OutboxRelay:
+    return OutboxRelay(
+        container=_Container(),  # type: ignore[arg-type]
+        session_factory=session_factory,
+        lanes=lanes,
+    )
+
+
+@pytest.mark.asyncio
+async def test_fast_path_waits_for_a_predecessor_with_an_expired_lease(
+    engine: AsyncEngine,
+) -> None:
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    # The first entry's worker crashed: its lease ran out, undelivered.
+    first, second = await _seed(
+        session_factory,
+        _OrderedEvent(n=1),
+        _OrderedEvent(n=2),
+        first_locked_until=datetime.now(UTC) - timedelta(minutes=1),
+    )
+    relay = _relay(session_factory)
+
+    assert await relay.deliver([second]) == 0
+    assert await _undelivered(session_factory) == {first, second}
+
+    assert await relay._poll() == 2
+    assert _Handler.handled == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_poll_waits_for_a_predecessor_locked_by_a_concurrent_claim(
+    engine: AsyncEngine,
+) -> None:
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    first, second = await _seed(session_factory, _OrderedEvent(n=1), _OrderedEvent(n=2))
+    relay = _relay(session_factory)
+
+    async with session_factory() as claiming:
+        # Another worker's claim of the first entry, not yet committed.
+        await claiming.execute(
+            select(outbox_table.c.id)
+            .where(outbox_table.c.id == first)
+            .with_for_update()
+        )
+        assert await relay._poll() == 0
+        assert await relay.deliver([second]) == 0
+
+    assert await relay._poll() == 2
+    assert _Handler.handled == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_poll_waits_for_a_predecessor_in_another_lane(
+    engine: AsyncEngine,
+) -> None:
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    await _seed(session_factory, _UrgentOrderedEvent(n=1), _OrderedEvent(n=2))
+    default = OutboxLane(name=DEFAULT_LANE, batch_size=10, concurrency=1, workers=1)
+    urgent = OutboxLane(
+        name="urgent",
+        event_types=frozenset({"_UrgentOrderedEvent"}),
+        batch_size=10,
+        concurrency=1,
+        workers=1,
+    )
+    lanes = OutboxLanes(default, [urgent])
+    relay = _relay(session_factory, lanes)
+    states = relay._lane_states
+
+    assert await relay._poll(states[DEFAULT_LANE]) == 0
+    assert await relay._poll(states["urgent"]) == 1
+    assert await relay._poll(states[DEFAULT_LANE]) == 1
+    assert _Handler.handled == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_held_back_entries_do_not_crowd_out_a_claim(
+    engine: AsyncEngine,
+) -> None:
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    held_back = await _seed(
+        session_factory, _UrgentOrderedEvent(n=1), _OrderedEvent(n=2)
+    )
+    unrelated = _OrderedEvent(n=3, aggregate_id="Account:y")
+    async with session_factory() as session:
+        await session.execute(
+            insert(outbox_table),
+            [
+                {
+                    "id": uuid4(),
+                    "event_type": unrelated.event_type,
+                    "payload": serialize_event(unrelated),
+                    "occurred_at": datetime.now(UTC),
+                    "next_attempt_at": datetime.now(UTC),
+                    "delivered": False,
+                    "retry_count": 0,
+                    "aggregate_id": unrelated.aggregate_id,
+                }
+            ],
+        )
+        await session.commit()
+    default = OutboxLane(name=DEFAULT_LANE, batch_size=1, concurrency=1, workers=1)
+    urgent = OutboxLane(
+        name="urgent",
+        event_types=frozenset({"_UrgentOrderedEvent"}),
+        batch_size=1,
+        concurrency=1,
+        workers=1,
+    )
+    relay = _relay(session_factory, OutboxLanes(default, [urgent]))
+
+    # The due entry held back behind the other lane must not take the only
+    # slot of the batch.
+    assert await relay._poll(relay._lane_states[DEFAULT_LANE]) == 1
+    assert _Handler.handled == [3]
+    assert await _undelivered(session_factory) == set(held_back)
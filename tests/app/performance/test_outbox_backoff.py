@@ -0,0 +1,234 @@
+"""Backoff scheduling and dead letters against a local Postgres.
+
+Run with ``pytest -m slow``.
+"""
+
+import asyncio
+from collections.abc import Generator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import ClassVar, cast
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from shared.domain.domain_event import DomainEvent
+from shared.infrastructure.events.dead_letter_queue import SqlaDeadLetterQueue
+from shared.infrastructure.events.registry import _event_type_registry, _registry
+from shared.infrastructure.events.relay import OutboxRelay
+from shared.infrastructure.events.serialization import serialize_event
+from shared.infrastructure.persistence.mappers.outbox import (
+    outbox_dead_letter_table,
+    outbox_handler_delivery_table,
+    outbox_table,
+)
+from shared.infrastructure.persistence.types_ import MainAsyncSession
+
+pytestmark = pytest.mark.slow
+
+_PG_DIALECT = postgresql.dialect()  # type: ignore[no-untyped-call]
+BACKING_OFF = 100_000
+DUE = 50
+
+_SEED_SQL = text(
+    """
+    INSERT INTO outbox (
+        id, event_type, payload, occurred_at, delivered, retry_count,
+        next_attempt_at
+    )
+    SELECT gen_random_uuid(), '_BackoffEvent', '{}'::jsonb, now(), false, 0,
+        now() + CAST(:delay AS interval)
+    FROM generate_series(1, :rows)
+    """
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class _BackoffEvent(DomainEvent):
+    n: int
+
+
+class _FlakyHandler:
+    healthy: ClassVar[bool] = False
+    handled: ClassVar[list[int]] = []
+
+    async def handle(self, event: _BackoffEvent) -> None:
+        await asyncio.sleep(0)
+        if not self.healthy:
+            msg = "downstream unavailable"
+            raise RuntimeError(msg)
+        self.handled.append(event.n)
+
+
+class _SteadyHandler:
+    handled: ClassVar[list[int]] = []
+
+    async def handle(self, event: _BackoffEvent) -> None:
+        await asyncio.sleep(0)
+        self.handled.append(event.n)
+
+
+class _Container:
+    def __call__(self, **kwargs: object) -> "_Container":
+        return self
+
+    async def __aenter__(self) -> "_Container":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    async def get(self, handler_type: type) -> object:
+        return handler_type()
+
+
+@pytest.fixture(autouse=True)
+def _register_handler() -> Generator[None]:
+    saved_registry = dict(_registry)
+    saved_type_registry = dict(_event_type_registry)
+    _event_type_registry["_BackoffEvent"] = _BackoffEvent
+    _registry[_BackoffEvent] = [_FlakyHandler]
+    _FlakyHandler.healthy = False
+    _FlakyHandler.handled = []
+    _SteadyHandler.handled = []
+    yield
+    _registry.clear()
+    _registry.update(saved_registry)
+    _event_type_registry.clear()
+    _event_type_registry.update(saved_type_registry)
+
+
+async def _claim_sql() -> str:
+    session = AsyncMock()
+    result = MagicMock()
+    result.fetchall.return_value = []
+    session.execute = AsyncMock(return_value=result)
+    relay = OutboxRelay(container=_Container(), session_factory=None)  # type: ignore[arg-type]
+    await relay._claim_batch(session)
+    stmt = session.execute.call_args[0][0]
+    return str(
+        stmt.compile(dialect=_PG_DIALECT, compile_kwargs={"literal_binds": True})
+    )
+
+
+@pytest.mark.asyncio
+async def test_claim_reads_only_due_entries(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(_SEED_SQL, {"rows": BACKING_OFF, "delay": "1 hour"})
+        await conn.execute(_SEED_SQL, {"rows": DUE, "delay": "0"})
+        await conn.execute(text("ANALYZE outbox"))
+
+    async with engine.connect() as conn:
+        plan = "\n".join(
+            row[0]
+            for row in await conn.execute(
+                text(f"EXPLAIN (ANALYZE, COSTS OFF) {await _claim_sql()}")
+            )
+        )
+        await conn.rollback()
+
+    print(plan)  # noqa: T201
+    # LIKE ... INCLUDING ALL renames the cloned ix_outbox_due index.
+    assert "Index Cond: (next_attempt_at <= now())" in plan
+    assert f"rows={DUE} loops=1" in plan
+    assert f"rows={BACKING_OFF}" not in plan
+
+
+async def _poll_until(relay: OutboxRelay, expected: int) -> None:
+    async with asyncio.timeout(5):
+        while await relay._poll() != expected:  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_poison_entry_backs_off_then_is_dead_lettered_and_replayed(
+    engine: AsyncEngine,
+) -> None:
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    event = _BackoffEvent(n=1)
+    async with session_factory() as session:
+        await session.execute(
+            insert(outbox_table).values(
+                id=uuid4(),
+                event_type=event.event_type,
+                payload=serialize_event(event),
+                occurred_at=datetime.now(UTC),
+                next_attempt_at=datetime.now(UTC),
+            )
+        )
+        await session.commit()
+
+    relay = OutboxRelay(
+        container=_Container(),  # type: ignore[arg-type]
+        session_factory=session_factory,
+        max_retries=3,
+        backoff_base=0.2,
+    )
+
+    assert await relay._poll() == 1
+    # Rescheduled 100-200ms ahead: invisible to an immediate poll.
+    assert await relay._poll() == 0
+    await _poll_until(relay, 1)
+    await _poll_until(relay, 1)
+
+    async with session_factory() as session:
+        assert (await session.execute(select(outbox_table.c.id))).all() == []
+        dead = (await session.execute(select(outbox_dead_letter_table))).one()
+    assert dead.retry_count == 3
+    assert "_FlakyHandler" in dead.last_error
+
+    _FlakyHandler.healthy = True
+    async with session_factory() as session:
+        queue = SqlaDeadLetterQueue(cast(MainAsyncSession, session))
+        assert await queue.replay(event_type=None, limit=10) == 1
+
+    assert await relay._poll() == 1
+    assert _FlakyHandler.handled == [1]
+    async with session_factory() as session:
+        delivered = await session.execute(select(outbox_table.c.delivered))
+        assert delivered.scalar_one() is True
+        remaining = await session.execute(select(outbox_dead_letter_table.c.id))
+        assert remaining.all() == []
+
+
+@pytest.mark.asyncio
+async def test_retry_reruns_only_the_failed_handler(engine: AsyncEngine) -> None:
+    _registry[_BackoffEvent] = [_SteadyHandler, _FlakyHandler]
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    event = _BackoffEvent(n=7)
+    async with session_factory() as session:
+        await session.execute(
+            insert(outbox_table).values(
+                id=uuid4(),
+                event_type=event.event_type,
+                payload=serialize_event(event),
+                occurred_at=datetime.now(UTC),
+                next_attempt_at=datetime.now(UTC),
+            )
+        )
+        await session.commit()
+    relay = OutboxRelay(
+        container=_Container(),  # type: ignore[arg-type]
+        session_factory=session_factory,
+        backoff_base=0.05,
+    )
+
+    assert await relay._poll() == 1
+    async with session_factory() as session:
+        progress = await session.execute(select(outbox_handler_delivery_table))
+        assert [row.handler for row in progress] == [f"{__name__}._SteadyHandler"]
+
+    _FlakyHandler.healthy = True
+    await _poll_until(relay, 1)
+
+    assert _SteadyHandler.handled == [7]
+    assert _FlakyHandler.handled == [7]
+    async with session_factory() as session:
+        delivered = await session.execute(select(outbox_table.c.delivered))
+        assert delivered.scalar_one() is True
+        progress = await session.execute(select(outbox_handler_delivery_table))
+        assert progress.all() == []
@@ -0,0 +1,193 @@
+"""Batch-scoped handler execution against a local Postgres. Run with ``pytest -m slow``.
+
+The handler writes through ``MainAsyncSession`` and commits, like the use
+cases behind the real event handlers.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterator, Generator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import ClassVar, cast
+from uuid import uuid4
+
+import pytest
+from dishka import AsyncContainer, Provider, Scope, make_async_container, provide
+from sqlalchemy import event, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from shared.domain.domain_event import DomainEvent
+from shared.infrastructure.events.registry import _event_type_registry, _registry
+from shared.infrastructure.events.relay import OutboxRelay
+from shared.infrastructure.events.serialization import serialize_event
+from shared.infrastructure.persistence.mappers.outbox import outbox_table
+from shared.infrastructure.persistence.types_ import MainAsyncSession
+
+pytestmark = pytest.mark.slow
+
+EVENTS = 2_000
+BATCH_SIZE = 100
+POISON = 1_234
+
+
+@dataclass(frozen=True, kw_only=True)
+class _ScopeEvent(DomainEvent):
+    n: int
+
+
+class _WritingHandler:
+    resolved: ClassVar[int] = 0
+
+    def __init__(self, session: MainAsyncSession) -> None:
+        type(self).resolved += 1
+        self._session = session
+
+    async def handle(self, event: _ScopeEvent) -> None:
+        await self._session.execute(
+            text("INSERT INTO batch_scope_handled (n) VALUES (:n)"), {"n": event.n}
+        )
+        if event.n == POISON:
+            msg = "poison event"
+            raise RuntimeError(msg)
+        await self._session.commit()
+
+
+class _HandlerProvider(Provider):
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        super().__init__()
+        self._session_factory = session_factory
+
+    @provide(scope=Scope.REQUEST)
+    async def provide_session(self) -> AsyncIterator[MainAsyncSession]:
+        async with self._session_factory() as session:
+            yield cast(MainAsyncSession, session)
+
+    handler = provide(_WritingHandler, scope=Scope.REQUEST)
+
+
+@pytest.fixture(autouse=True)
+def _register_handler() -> Generator[None]:
+    saved_registry = dict(_registry)
+    saved_type_registry = dict(_event_type_registry)
+    _event_type_registry["_ScopeEvent"] = _ScopeEvent
+    _registry[_ScopeEvent] = [_WritingHandler]
+    yield
+    _registry.clear()
+    _registry.update(saved_registry)
+    _event_type_registry.clear()
+    _event_type_registry.update(saved_type_registry)
+
+
+async def _seed(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    rows = []
+    for n in range(EVENTS):
+        scope_event = _ScopeEvent(n=n)
+        rows.append({
+            "id": uuid4(),
+            "event_type": scope_event.event_type,
+            "payload": serialize_event(scope_event),
+            "occurred_at": datetime.now(UTC),
+        })
+    async with session_factory() as session:
+        await session.execute(text("TRUNCATE outbox"))
+        await session.execute(
+            text("CREATE TABLE IF NOT EXISTS batch_scope_handled (n int PRIMARY KEY)")
+        )
+        await session.execute(text("TRUNCATE batch_scope_handled"))
+        await session.execute(insert(outbox_table), rows)
+        await session.commit()
+
+
+async def _drain(
+    relay: OutboxRelay, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    task = asyncio.create_task(relay.run())
+    while True:
+        async with session_factory() as session:
+            pending = await session.scalar(
+                select(text("count(*)"))
+                .select_from(outbox_table)
+                .where(
+                    outbox_table.c.delivered.is_(False),
+                    outbox_table.c.retry_count == 0,
+                )
+            )
+        if not pending:
+            break
+        await asyncio.sleep(0.05)
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+
+async def _measure(engine: AsyncEngine, *, batch_scope: bool) -> tuple[float, int, int]:
+    """Returns events/s, connection checkouts and handler resolutions."""
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    await _seed(session_factory)
+    container: AsyncContainer = make_async_container(_HandlerProvider(session_factory))
+    checkouts = 0
+
+    def _count_checkout(*_: object) -> None:
+        nonlocal checkouts
+        checkouts += 1
+
+    event.listen(engine.sync_engine.pool, "checkout", _count_checkout)
+    _WritingHandler.resolved = 0
+    relay = OutboxRelay(
+        container=container,
+        session_factory=session_factory,
+        poll_interval=0.01,
+        batch_size=BATCH_SIZE,
+        concurrency=1,
+        # Keeps the poison event's retries out of the measurement.
+        backoff_base=60.0,
+        batch_scope=batch_scope,
+    )
+    started = time.perf_counter()
+    try:
+        await _drain(relay, session_factory)
+    finally:
+        elapsed = time.perf_counter() - started
+        event.remove(engine.sync_engine.pool, "checkout", _count_checkout)
+        await container.close()
+
+    async with session_factory() as session:
+        handled = await session.execute(
+            text("SELECT count(*) FROM batch_scope_handled")
+        )
+        # The poison event's write is rolled back with its savepoint or session;
+        # a batch that fell back left nothing behind to collide with.
+        assert handled.scalar_one() == EVENTS - 1
+        delivered = await session.execute(
+            text("SELECT count(*) FROM outbox WHERE delivered")
+        )
+        assert delivered.scalar_one() == EVENTS - 1
+
+    return EVENTS / elapsed, checkouts, _WritingHandler.resolved
+
+
+@pytest.mark.asyncio
+async def test_batch_scope_cuts_connection_churn_and_resolution(
+    engine: AsyncEngine,
+) -> None:
+    results = {
+        batch_scope: await _measure(engine, batch_scope=batch_scope)
+        for batch_scope in (False, True)
+    }
+
+    for batch_scope, (rate, checkouts, resolved) in results.items():
+        print(  # noqa: T201
+            f"batch_scope={batch_scope}: {rate:,.0f} events/s, "
+            f"{checkouts} connection checkouts, {resolved} handler resolutions"
+        )
+
+    isolated_rate, isolated_checkouts, isolated_resolved = results[False]
+    batched_rate, batched_checkouts, batched_resolved = results[True]
+    batches = EVENTS // BATCH_SIZE
+    # Only the batch holding the poison event falls back to per-event scopes.
+    assert batched_resolved <= batches + BATCH_SIZE
+    assert isolated_resolved >= EVENTS
+    assert batched_checkouts * 3 < isolated_checkouts
+    assert batched_rate > isolated_rate
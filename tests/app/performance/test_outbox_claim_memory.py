@@ -0,0 +1,80 @@
+"""Relay claim path over a large backlog. Run with ``pytest -m slow``."""
+
+import resource
+import time
+from typing import cast
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from shared.infrastructure.events.relay import OutboxRelay
+
+pytestmark = pytest.mark.slow
+
+ROWS = 1_000_000
+BATCH_SIZE = 1_000
+MAX_RSS_GROWTH_MB = 64
+
+_SEED_SQL = text(
+    """
+    INSERT INTO outbox (id, event_type, payload, occurred_at, delivered, retry_count)
+    SELECT
+        gen_random_uuid(),
+        'BenchEvent',
+        to_jsonb(json_build_object('n', n, 'padding', repeat('x', 200))::text),
+        now() + n * interval '1 microsecond',
+        false,
+        0
+    FROM generate_series(1, :rows) AS n
+    """
+)
+
+
+_ACK_SQL = text(
+    "UPDATE outbox SET delivered = true, locked_until = NULL WHERE id = ANY(:ids)"
+)
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+@pytest.mark.asyncio
+async def test_claiming_backlog_keeps_memory_flat(engine: AsyncEngine) -> None:
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        await session.execute(_SEED_SQL, {"rows": ROWS})
+        await session.commit()
+
+    relay = OutboxRelay(
+        container=cast("object", None),  # type: ignore[arg-type]
+        session_factory=session_factory,
+        batch_size=BATCH_SIZE,
+    )
+
+    baseline_rss = _peak_rss_mb()
+    claimed = 0
+    started = time.perf_counter()
+    while True:
+        async with session_factory() as session:
+            batch = await relay._claim_batch(session)
+            if not batch:
+                break
+            # Acknowledge like the relay does, so delivered rows leave the
+            # partial index instead of being rescanned as leased.
+            await session.execute(_ACK_SQL, {"ids": [entry.id for entry in batch]})
+            await session.commit()
+        claimed += len(batch)
+    elapsed = time.perf_counter() - started
+    rss_growth = _peak_rss_mb() - baseline_rss
+
+    print(  # noqa: T201
+        f"claimed {claimed:,} rows in {elapsed:.1f}s "
+        f"({claimed / elapsed:,.0f} rows/s), "
+        f"peak RSS {_peak_rss_mb():.0f} MB (+{rss_growth:.1f} MB)"
+    )
+
+    assert claimed == ROWS
+    assert rss_growth < MAX_RSS_GROWTH_MB
@@ -0,0 +1,103 @@
+"""Outbox write cost per commit. Run with ``pytest -m slow``.
+
+Compares the former per-event ``session.add()`` path with the dispatcher's
+single multi-row insert at 1, 10 and 1,000 events per commit.
+"""
+
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from shared.domain.domain_event import DomainEvent
+from shared.infrastructure.events.dispatcher import OutboxEventDispatcher
+from shared.infrastructure.events.notifications import OUTBOX_NOTIFY_CHANNEL
+from shared.infrastructure.events.serialization import serialize_event
+from shared.infrastructure.persistence.mappers.outbox import OutboxRecord
+
+pytestmark = [pytest.mark.slow, pytest.mark.usefixtures("_outbox_mapped")]
+
+EVENTS_PER_ROUND = 2_000
+BATCH_SIZES = (1, 10, 1_000)
+
+
+@dataclass(frozen=True, kw_only=True)
+class _BenchEvent(DomainEvent):
+    n: int
+
+
+async def _orm_add(session: AsyncSession, events: list[DomainEvent]) -> None:
+    for event in events:
+        session.add(
+            OutboxRecord(
+                event_type=event.event_type,
+                payload=serialize_event(event),
+                occurred_at=event.occurred_at,
+                aggregate_id=event.aggregate_id,
+                next_attempt_at=event.occurred_at,
+            )
+        )
+    await session.execute(select(func.pg_notify(OUTBOX_NOTIFY_CHANNEL, "")))
+
+
+async def _bulk_insert(session: AsyncSession, events: list[DomainEvent]) -> None:
+    await OutboxEventDispatcher(session).dispatch(events)  # type: ignore[arg-type]
+
+
+async def _measure(
+    engine: AsyncEngine,
+    write: Callable[[AsyncSession, list[DomainEvent]], Awaitable[None]],
+    per_commit: int,
+) -> float:
+    """Returns mean milliseconds per commit of ``per_commit`` events."""
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        await session.execute(text("TRUNCATE outbox"))
+        await session.commit()
+
+    commits = EVENTS_PER_ROUND // per_commit
+    batches: list[list[DomainEvent]] = [
+        [_BenchEvent(n=n) for n in range(per_commit)] for _ in range(commits)
+    ]
+    started = time.perf_counter()
+    for events in batches:
+        async with session_factory() as session:
+            await write(session, events)
+            await session.commit()
+    elapsed = time.perf_counter() - started
+
+    async with session_factory() as session:
+        written = await session.execute(text("SELECT count(*) FROM outbox"))
+        assert written.scalar_one() == commits * per_commit
+
+    return elapsed / commits * 1000
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_beats_orm_add_per_commit(engine: AsyncEngine) -> None:
+    # Warm up connections and statement caches for both paths.
+    await _measure(engine, _orm_add, 10)
+    await _measure(engine, _bulk_insert, 10)
+
+    results = {
+        per_commit: (
+            await _measure(engine, _orm_add, per_commit),
+            await _measure(engine, _bulk_insert, per_commit),
+        )
+        for per_commit in BATCH_SIZES
+    }
+
+    for per_commit, (orm_ms, bulk_ms) in results.items():
+        print(  # noqa: T201
+            f"events/commit={per_commit}: session.add {orm_ms:.2f}ms, "
+            f"bulk insert {bulk_ms:.2f}ms"
+        )
+
+    orm_ms, bulk_ms = results[1_000]
+    assert bulk_ms < orm_ms
+    # Single-event commits pay one statement either way; no regression there.
+    orm_ms, bulk_ms = results[1]
+    assert bulk_ms < orm_ms * 1.5
@@ -0,0 +1,172 @@
+"""Handler timeouts and circuit breaking against a local Postgres.
+
+Run with ``pytest -m slow``.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Generator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import ClassVar
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from shared.domain.domain_event import DomainEvent
+from shared.infrastructure.events.circuit_breaker import CircuitState
+from shared.infrastructure.events.handler_policy import HandlerPolicies, HandlerPolicy
+from shared.infrastructure.events.registry import _event_type_registry, _registry
+from shared.infrastructure.events.relay import OutboxRelay
+from shared.infrastructure.events.serialization import serialize_event
+from shared.infrastructure.persistence.mappers.outbox import (
+    outbox_dead_letter_table,
+    outbox_table,
+)
+
+pytestmark = pytest.mark.slow
+
+EVENTS = 200
+
+
+@dataclass(frozen=True, kw_only=True)
+class _GuardedEvent(DomainEvent):
+    n: int
+
+
+class _HungHandler:
+    async def handle(self, event: DomainEvent) -> None:
+        await asyncio.sleep(3600)
+
+
+class _HealthyHandler:
+    handled: ClassVar[int] = 0
+
+    async def handle(self, event: DomainEvent) -> None:
+        await asyncio.sleep(0)
+        type(self).handled += 1
+
+
+class _Container:
+    def __call__(self, **kwargs: object) -> "_Container":
+        return self
+
+    async def __aenter__(self) -> "_Container":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    async def get(self, handler_type: type) -> object:
+        return handler_type()
+
+
+@pytest.fixture(autouse=True)
+def _register_handlers() -> Generator[None]:
+    saved_registry = dict(_registry)
+    saved_type_registry = dict(_event_type_registry)
+    _event_type_registry["_GuardedEvent"] = _GuardedEvent
+    _registry[_GuardedEvent] = [_HealthyHandler, _HungHandler]
+    yield
+    _registry.clear()
+    _registry.update(saved_registry)
+    _event_type_registry.clear()
+    _event_type_registry.update(saved_type_registry)
+
+
+async def _settled(session_factory: async_sessionmaker[AsyncSession]) -> int:
+    """Entries written back by the relay: retried or postponed."""
+    async with session_factory() as session:
+        settled = await session.scalar(
+            select(func.count()).where(
+                outbox_table.c.locked_until.is_(None),
+                outbox_table.c.next_attempt_at > func.now(),
+            )
+        )
+    return settled or 0
+
+
+@pytest.mark.asyncio
+async def test_hung_handler_is_cut_off_while_others_keep_flowing(
+    engine: AsyncEngine,
+) -> None:
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    now = datetime.now(UTC)
+    async with session_factory() as session:
+        await session.execute(text("TRUNCATE outbox, outbox_dead_letter"))
+        await session.execute(
+            insert(outbox_table),
+            [
+                {
+                    "id": uuid4(),
+                    "event_type": "_GuardedEvent",
+                    "payload": serialize_event(_GuardedEvent(n=n)),
+                    "occurred_at": now,
+                    "next_attempt_at": now,
+                    "delivered": False,
+                    "retry_count": 0,
+                }
+                for n in range(EVENTS)
+            ],
+        )
+        await session.commit()
+    _HealthyHandler.handled = 0
+
+    relay = OutboxRelay(
+        container=_Container(),  # type: ignore[arg-type]
+        session_factory=session_factory,
+        poll_interval=0.05,
+        max_retries=2,
+        concurrency=10,
+        handler_policies=HandlerPolicies(
+            HandlerPolicy(),
+            {
+                "_HungHandler": HandlerPolicy(
+                    timeout=0.1, breaker_failures=5, breaker_cool_off=60.0
+                )
+            },
+        ),
+    )
+    started = time.perf_counter()
+    task = asyncio.create_task(relay.run())
+    while _HealthyHandler.handled < EVENTS:  # noqa: ASYNC110
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+    # Let the last batch be acknowledged.
+    async with asyncio.timeout(5):
+        while (await _settled(session_factory)) < EVENTS:  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+    async with session_factory() as session:
+        retried = await session.scalar(
+            select(func.count()).where(outbox_table.c.retry_count > 0)
+        )
+        postponed = await session.scalar(
+            select(func.count()).where(
+                outbox_table.c.retry_count == 0,
+                outbox_table.c.next_attempt_at > func.now() + text("interval '50s'"),
+            )
+        )
+        dead = await session.scalar(
+            select(func.count()).select_from(outbox_dead_letter_table)
+        )
+
+    print(  # noqa: T201
+        f"{EVENTS} events, one handler hung: healthy handler done in "
+        f"{elapsed * 1000:,.0f} ms; {retried} entries retried, {postponed} "
+        f"postponed behind the open circuit, {dead} dead-lettered"
+    )
+
+    assert relay._breakers.state(_HungHandler) is CircuitState.OPEN
+    # Only calls already in flight when the circuit opened used up a retry.
+    assert retried is not None
+    assert retried <= 10
+    assert postponed == EVENTS - retried
+    assert dead == 0
+    assert elapsed < 5
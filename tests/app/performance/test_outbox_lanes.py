@@ -0,0 +1,161 @@
+"""Lane isolation against a local Postgres. Run with ``pytest -m slow``."""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Generator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import ClassVar, cast
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from shared.domain.domain_event import DomainEvent
+from shared.infrastructure.events.lane_monitor import SqlaOutboxLaneMonitor
+from shared.infrastructure.events.lanes import DEFAULT_LANE, OutboxLane, OutboxLanes
+from shared.infrastructure.events.registry import _event_type_registry, _registry
+from shared.infrastructure.events.relay import OutboxRelay
+from shared.infrastructure.events.serialization import serialize_event
+from shared.infrastructure.persistence.mappers.outbox import outbox_table
+from shared.infrastructure.persistence.types_ import MainAsyncSession
+
+pytestmark = pytest.mark.slow
+
+NOISY_EVENTS = 2_000
+URGENT_EVENTS = 20
+HANDLER_LATENCY_S = 0.002
+
+
+@dataclass(frozen=True, kw_only=True)
+class _NoisyEvent(DomainEvent):
+    n: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class _UrgentEvent(DomainEvent):
+    n: int
+
+
+class _Handler:
+    urgent_handled: ClassVar[list[float]] = []
+
+    async def handle(self, event: DomainEvent) -> None:
+        await asyncio.sleep(HANDLER_LATENCY_S)
+        if isinstance(event, _UrgentEvent):
+            self.urgent_handled.append(time.perf_counter())
+
+
+class _Container:
+    def __call__(self, **kwargs: object) -> "_Container":
+        return self
+
+    async def __aenter__(self) -> "_Container":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    async def get(self, handler_type: type) -> object:
+        return handler_type()
+
+
+@pytest.fixture(autouse=True)
+def _register_handler() -> Generator[None]:
+    saved_registry = dict(_registry)
+    saved_type_registry = dict(_event_type_registry)
+    _event_type_registry["_NoisyEvent"] = _NoisyEvent
+    _event_type_registry["_UrgentEvent"] = _UrgentEvent
+    _registry[_NoisyEvent] = [_Handler]
+    _registry[_UrgentEvent] = [_Handler]
+    yield
+    _registry.clear()
+    _registry.update(saved_registry)
+    _event_type_registry.clear()
+    _event_type_registry.update(saved_type_registry)
+
+
+async def _seed(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """A noisy burst, followed by a few urgent events queued behind it."""
+    burst_at = datetime.now(UTC) - timedelta(seconds=5)
+    events: list[DomainEvent] = [_NoisyEvent(n=n) for n in range(NOISY_EVENTS)]
+    events += [_UrgentEvent(n=n) for n in range(URGENT_EVENTS)]
+    rows = [
+        {
+            "id": uuid4(),
+            "event_type": event.event_type,
+            "payload": serialize_event(event),
+            "occurred_at": burst_at + timedelta(microseconds=position),
+            "next_attempt_at": burst_at + timedelta(microseconds=position),
+            "delivered": False,
+            "retry_count": 0,
+        }
+        for position, event in enumerate(events)
+    ]
+    async with session_factory() as session:
+        await session.execute(text("TRUNCATE outbox"))
+        await session.execute(insert(outbox_table), rows)
+        await session.commit()
+
+
+def _lanes(*, urgent_lane: bool) -> OutboxLanes:
+    default = OutboxLane(name=DEFAULT_LANE, batch_size=50, concurrency=10, workers=1)
+    if not urgent_lane:
+        return OutboxLanes(default)
+    urgent = OutboxLane(
+        name="urgent",
+        event_types=frozenset({"_UrgentEvent"}),
+        batch_size=50,
+        concurrency=5,
+        workers=1,
+    )
+    return OutboxLanes(default, [urgent])
+
+
+async def _urgent_latency(engine: AsyncEngine, *, urgent_lane: bool) -> float:
+    """Seconds until every urgent event queued behind the burst is handled."""
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    await _seed(session_factory)
+    _Handler.urgent_handled.clear()
+    lanes = _lanes(urgent_lane=urgent_lane)
+
+    async with session_factory() as session:
+        monitor = SqlaOutboxLaneMonitor(cast(MainAsyncSession, session), lanes)
+        backlogs = {backlog.lane: backlog for backlog in await monitor.backlogs()}
+    assert sum(b.backlog for b in backlogs.values()) == NOISY_EVENTS + URGENT_EVENTS
+    if urgent_lane:
+        assert backlogs["urgent"].backlog == URGENT_EVENTS
+        assert backlogs["urgent"].lag_s > 0
+
+    relay = OutboxRelay(
+        container=_Container(),  # type: ignore[arg-type]
+        session_factory=session_factory,
+        poll_interval=0.01,
+        lanes=lanes,
+    )
+    started = time.perf_counter()
+    task = asyncio.create_task(relay.run())
+    while len(_Handler.urgent_handled) < URGENT_EVENTS:  # noqa: ASYNC110
+        await asyncio.sleep(0.005)
+    elapsed = max(_Handler.urgent_handled) - started
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+    return elapsed
+
+
+@pytest.mark.asyncio
+async def test_urgent_lane_is_not_delayed_by_a_noisy_burst(
+    engine: AsyncEngine,
+) -> None:
+    shared = await _urgent_latency(engine, urgent_lane=False)
+    laned = await _urgent_latency(engine, urgent_lane=True)
+
+    print(  # noqa: T201
+        f"urgent events behind {NOISY_EVENTS:,} noisy ones: "
+        f"shared lane {shared * 1000:,.0f} ms, own lane {laned * 1000:,.0f} ms"
+    )
+
+    assert laned * 10 < shared
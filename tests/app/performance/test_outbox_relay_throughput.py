@@ -0,0 +1,156 @@
+"""Relay throughput against a local Postgres. Run with ``pytest -m slow``."""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Generator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import ClassVar
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from shared.domain.domain_event import DomainEvent
+from shared.infrastructure.events.registry import _event_type_registry, _registry
+from shared.infrastructure.events.relay import OutboxRelay
+from shared.infrastructure.events.serialization import serialize_event
+from shared.infrastructure.persistence.mappers.outbox import outbox_table
+
+pytestmark = pytest.mark.slow
+
+EVENTS = 2_000
+BATCH_SIZE = 50
+HANDLER_LATENCY_S = 0.002
+
+
+@dataclass(frozen=True, kw_only=True)
+class _ThroughputEvent(DomainEvent):
+    n: int
+
+
+class _SlowHandler:
+    handled: ClassVar[list[int]] = []
+
+    async def handle(self, event: _ThroughputEvent) -> None:
+        await asyncio.sleep(HANDLER_LATENCY_S)
+        self.handled.append(event.n)
+
+
+class _Container:
+    def __call__(self, **kwargs: object) -> "_Container":
+        return self
+
+    async def __aenter__(self) -> "_Container":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    async def get(self, handler_type: type) -> object:
+        return handler_type()
+
+
+@pytest.fixture(autouse=True)
+def _register_handler() -> Generator[None]:
+    saved_registry = dict(_registry)
+    saved_type_registry = dict(_event_type_registry)
+    _event_type_registry["_ThroughputEvent"] = _ThroughputEvent
+    _registry[_ThroughputEvent] = [_SlowHandler]
+    yield
+    _registry.clear()
+    _registry.update(saved_registry)
+    _event_type_registry.clear()
+    _event_type_registry.update(saved_type_registry)
+
+
+async def _seed(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    rows = []
+    for n in range(EVENTS):
+        event = _ThroughputEvent(n=n)
+        rows.append({
+            "id": uuid4(),
+            "event_type": event.event_type,
+            "payload": serialize_event(event),
+            "occurred_at": datetime.now(UTC),
+            "delivered": False,
+            "retry_count": 0,
+        })
+    async with session_factory() as session:
+        await session.execute(text("TRUNCATE outbox"))
+        await session.execute(insert(outbox_table), rows)
+        await session.commit()
+
+
+async def _pending(session_factory: async_sessionmaker[AsyncSession]) -> int:
+    async with session_factory() as session:
+        result = await session.execute(
+            select(outbox_table.c.id).where(outbox_table.c.delivered.is_(False))
+        )
+        return len(result.fetchall())
+
+
+async def _measure(engine: AsyncEngine, workers: int, concurrency: int = 1) -> float:
+    """Returns delivered events per second with ``workers`` relays."""
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    await _seed(session_factory)
+    _SlowHandler.handled.clear()
+
+    relays = [
+        OutboxRelay(
+            container=_Container(),  # type: ignore[arg-type]
+            session_factory=session_factory,
+            poll_interval=0.01,
+            batch_size=BATCH_SIZE,
+            concurrency=concurrency,
+        )
+        for _ in range(workers)
+    ]
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(relay.run()) for relay in relays]
+    while await _pending(session_factory):  # noqa: ASYNC110
+        await asyncio.sleep(0.05)
+    elapsed = time.perf_counter() - started
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async with session_factory() as session:
+        delivered = await session.execute(
+            text("SELECT count(*) FROM outbox WHERE delivered")
+        )
+        assert delivered.scalar_one() == EVENTS
+    # Claims never overlap: every event is handled exactly once.
+    assert sorted(_SlowHandler.handled) == list(range(EVENTS))
+
+    return EVENTS / elapsed
+
+
+@pytest.mark.asyncio
+async def test_throughput_grows_with_relay_workers(engine: AsyncEngine) -> None:
+    rates = {workers: await _measure(engine, workers) for workers in (1, 2, 4)}
+
+    for workers, rate in rates.items():
+        print(f"relay workers={workers}: {rate:,.0f} events/s")  # noqa: T201
+
+    assert rates[1] < rates[2] < rates[4]
+    assert rates[4] > rates[1] * 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_delivery_raises_single_relay_throughput(
+    engine: AsyncEngine,
+) -> None:
+    rates = {
+        concurrency: await _measure(engine, workers=1, concurrency=concurrency)
+        for concurrency in (1, 10)
+    }
+
+    for concurrency, rate in rates.items():
+        print(f"relay concurrency={concurrency}: {rate:,.0f} events/s")  # noqa: T201
+
+    assert rates[10] > rates[1] * 3
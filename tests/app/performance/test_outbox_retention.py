@@ -0,0 +1,133 @@
+"""Outbox pruning against a local Postgres. Run with ``pytest -m slow``."""
+
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from shared.infrastructure.events.retention import (
+    OutboxPruner,
+    archive_partition_name,
+)
+
+pytestmark = pytest.mark.slow
+
+DELIVERED = 200_000
+RECENT = 5_000
+PENDING = 1_000
+SPREAD_DAYS = 40
+RETENTION_DAYS = 30
+BATCH_SIZE = 5_000
+
+_SEED_SQL = text(
+    """
+    INSERT INTO outbox (
+        id, event_type, payload, occurred_at, delivered, delivered_at,
+        retry_count, next_attempt_at
+    )
+    SELECT gen_random_uuid(), 'BenchEvent',
+        to_jsonb(repeat('x', 200)), now(), :delivered,
+        CASE WHEN :delivered THEN now() - :newest - :age * (n::float / :rows) END,
+        0, now()
+    FROM generate_series(1, :rows) AS n
+    """
+)
+
+
+async def _count(engine: AsyncEngine, table: str) -> int:
+    async with engine.connect() as conn:
+        result = await conn.execute(text(f"SELECT count(*) FROM {table}"))  # noqa: S608
+        return int(result.scalar_one())
+
+
+@pytest.mark.asyncio
+async def test_pruning_keeps_outbox_small_in_short_batches(
+    engine: AsyncEngine,
+) -> None:
+    expired_day = (datetime.now(UTC) - timedelta(days=RETENTION_DAYS + 15)).date()
+    async with engine.begin() as conn:
+        await conn.execute(
+            _SEED_SQL,
+            {
+                "delivered": True,
+                "rows": DELIVERED,
+                "newest": timedelta(hours=2),
+                "age": timedelta(days=SPREAD_DAYS),
+            },
+        )
+        # Delivered within MIN_AGE_S: stays in the outbox for now.
+        await conn.execute(
+            _SEED_SQL,
+            {
+                "delivered": True,
+                "rows": RECENT,
+                "newest": timedelta(0),
+                "age": timedelta(minutes=30),
+            },
+        )
+        await conn.execute(
+            _SEED_SQL,
+            {
+                "delivered": False,
+                "rows": PENDING,
+                "newest": timedelta(0),
+                "age": timedelta(0),
+            },
+        )
+        await conn.execute(
+            text(
+                f"CREATE TABLE {archive_partition_name(expired_day)} "
+                "PARTITION OF outbox_archive FOR VALUES "
+                f"FROM ('{expired_day}') TO ('{expired_day + timedelta(days=1)}')"
+            )
+        )
+        await conn.execute(text("ANALYZE outbox"))
+
+    pruner = OutboxPruner(
+        session_factory=async_sessionmaker(engine, expire_on_commit=False),
+        min_age=3600,
+        retention_days=RETENTION_DAYS,
+        batch_size=BATCH_SIZE,
+    )
+    batch_durations: list[float] = []
+    prune_batch = pruner._prune_batch
+
+    async def timed_batch() -> int:
+        started = time.perf_counter()
+        try:
+            return await prune_batch()
+        finally:
+            batch_durations.append(time.perf_counter() - started)
+
+    pruner._prune_batch = timed_batch  # type: ignore[method-assign]
+
+    started = time.perf_counter()
+    pruned = await pruner.prune()
+    elapsed = time.perf_counter() - started
+
+    print(  # noqa: T201
+        f"pruned {pruned:,} rows in {elapsed:.1f}s over {len(batch_durations)} "
+        f"batches (longest {max(batch_durations) * 1000:.0f}ms)"
+    )
+
+    assert pruned == DELIVERED
+    assert await _count(engine, "outbox") == RECENT + PENDING
+    archived = await _count(engine, "outbox_archive")
+    expected = DELIVERED * RETENTION_DAYS // SPREAD_DAYS
+    assert abs(archived - expected) <= DELIVERED // SPREAD_DAYS
+    # Each transaction stays short however large the backlog.
+    assert max(batch_durations) < 1.0
+
+    async with engine.connect() as conn:
+        partitions = await conn.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = CAST('outbox_archive' AS regclass)"
+            )
+        )
+        names = {name for (name,) in partitions.fetchall()}
+    assert archive_partition_name(expired_day) not in names
+    assert len(names) in {RETENTION_DAYS, RETENTION_DAYS + 1}
@@ -0,0 +1,105 @@
+"""Event-to-handler latency with LISTEN/NOTIFY. Run with ``pytest -m slow``."""
+
+import asyncio
+import contextlib
+import statistics
+import time
+from collections.abc import Generator
+from dataclasses import dataclass
+from typing import ClassVar, cast
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from shared.domain.domain_event import DomainEvent
+from shared.infrastructure.events.dispatcher import OutboxEventDispatcher
+from shared.infrastructure.events.notifications import (
+    OutboxNotificationListener,
+    conninfo_from_engine,
+)
+from shared.infrastructure.events.registry import _event_type_registry, _registry
+from shared.infrastructure.events.relay import OutboxRelay
+from shared.infrastructure.persistence.types_ import MainAsyncSession
+
+pytestmark = [pytest.mark.slow, pytest.mark.usefixtures("_outbox_mapped")]
+
+EVENTS = 200
+
+
+@dataclass(frozen=True, kw_only=True)
+class _LatencyEvent(DomainEvent):
+    n: int
+
+
+class _RecordingHandler:
+    handled_at: ClassVar[dict[int, float]] = {}
+    received: ClassVar[asyncio.Queue[int]]
+
+    async def handle(self, event: _LatencyEvent) -> None:
+        self.handled_at[event.n] = time.perf_counter()
+        await self.received.put(event.n)
+
+
+class _Container:
+    def __call__(self, **kwargs: object) -> "_Container":
+        return self
+
+    async def __aenter__(self) -> "_Container":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    async def get(self, handler_type: type) -> object:
+        return handler_type()
+
+
+@pytest.fixture(autouse=True)
+def _register_handler() -> Generator[None]:
+    saved_registry = dict(_registry)
+    saved_type_registry = dict(_event_type_registry)
+    _event_type_registry["_LatencyEvent"] = _LatencyEvent
+    _registry[_LatencyEvent] = [_RecordingHandler]
+    yield
+    _registry.clear()
+    _registry.update(saved_registry)
+    _event_type_registry.clear()
+    _event_type_registry.update(saved_type_registry)
+
+
+@pytest.mark.asyncio
+async def test_notify_delivers_within_milliseconds(engine: AsyncEngine) -> None:
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    _RecordingHandler.handled_at.clear()
+    _RecordingHandler.received = asyncio.Queue()
+
+    relay = OutboxRelay(
+        container=_Container(),  # type: ignore[arg-type]
+        session_factory=session_factory,
+        poll_interval=30.0,
+        min_poll_interval=30.0,
+        listener=OutboxNotificationListener(conninfo_from_engine(engine)),
+    )
+    relay_task = asyncio.create_task(relay.run())
+    await asyncio.sleep(0.5)  # let the listener subscribe
+
+    latencies: list[float] = []
+    try:
+        for n in range(EVENTS):
+            async with session_factory() as session:
+                dispatcher = OutboxEventDispatcher(cast(MainAsyncSession, session))
+                await dispatcher.dispatch([_LatencyEvent(n=n)])
+                await session.commit()
+                committed_at = time.perf_counter()
+            assert await asyncio.wait_for(_RecordingHandler.received.get(), 5) == n
+            latencies.append(_RecordingHandler.handled_at[n] - committed_at)
+    finally:
+        relay_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await relay_task
+
+    p50 = statistics.median(latencies)
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    print(f"event-to-handler latency: p50={p50 * 1e3:.1f}ms p99={p99 * 1e3:.1f}ms")  # noqa: T201
+
+    assert p99 < 0.1
@@ -0,0 +1,153 @@
+"""Event loop responsiveness during concurrent logins against a fake Supabase
+Auth server. Run with ``pytest -m slow``.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from account.domain.account.value_objects import Email, RawPassword
+from account.infrastructure.security.supabase_auth_adapter import (
+    SupabaseTokenEndpoint,
+    SupabaseTokenPairIssuer,
+)
+from supabase import create_client
+
+pytestmark = pytest.mark.slow
+
+LOGINS = 20
+AUTH_LATENCY_S = 0.05
+# Not a real key: the sync client only checks that it looks like a JWT.
+SERVICE_ROLE_KEY = "header.payload.signature"
+
+
+class _FakeAuthHandler(BaseHTTPRequestHandler):
+    """Answers every token request with a session, after AUTH_LATENCY_S."""
+
+    protocol_version = "HTTP/1.1"
+    connections: ClassVar[set[tuple[str, int]]] = set()
+
+    def do_POST(self) -> None:
+        self.connections.add(self.client_address)
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(AUTH_LATENCY_S)
+        body = json.dumps({
+            "access_token": f"access-{uuid4()}",
+            "refresh_token": f"refresh-{uuid4()}",
+            "expires_in": 900,
+            "token_type": "bearer",
+            "user": {
+                "id": str(uuid4()),
+                "aud": "authenticated",
+                "app_metadata": {},
+                "user_metadata": {},
+                "created_at": datetime.now(UTC).isoformat(),
+            },
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def auth_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeAuthHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _FakeAuthHandler.connections.clear()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+async def _burst(login: Callable[[], Awaitable[object]]) -> tuple[float, float]:
+    """Runs LOGINS concurrent logins; returns (elapsed, worst event loop stall)."""
+    worst_stall = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        nonlocal worst_stall
+        while not done.is_set():
+            tick = time.perf_counter()
+            await asyncio.sleep(0.001)
+            worst_stall = max(worst_stall, time.perf_counter() - tick - 0.001)
+
+    monitor = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(LOGINS)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await monitor
+    return elapsed, worst_stall
+
+
+def _login_with(issuer: SupabaseTokenPairIssuer) -> Callable[[], Awaitable[object]]:
+    async def login() -> object:
+        return await issuer.issue_token_pair(
+            Email("user@example.com"), RawPassword("password123")
+        )
+
+    return login
+
+
+@pytest.mark.asyncio
+async def test_concurrent_logins_keep_the_event_loop_responsive(
+    auth_url: str,
+) -> None:
+    async with httpx.AsyncClient() as http_client:
+        tokens = SupabaseTokenEndpoint(
+            http_client,
+            url=f"{auth_url}/auth/v1",
+            headers={"apikey": SERVICE_ROLE_KEY},
+        )
+        issuer = SupabaseTokenPairIssuer(tokens, access_token_expiry_s=900)
+        # The first burst opens the pool's connections; the second reuses them.
+        await _burst(_login_with(issuer))
+        pooled = len(_FakeAuthHandler.connections)
+        elapsed, stall = await _burst(_login_with(issuer))
+        reused = len(_FakeAuthHandler.connections) == pooled
+
+    # The synchronous client the adapters used before, called the same way.
+    sync_client = create_client(auth_url, SERVICE_ROLE_KEY)
+    sync_client.auth.sign_in_with_password({
+        "email": "user@example.com",
+        "password": "password123",
+    })
+
+    async def blocking_login() -> object:
+        await asyncio.sleep(0)
+        return sync_client.auth.sign_in_with_password({
+            "email": "user@example.com",
+            "password": "password123",
+        })
+
+    sync_elapsed, sync_stall = await _burst(blocking_login)
+
+    print(  # noqa: T201
+        f"{LOGINS} concurrent logins, {AUTH_LATENCY_S * 1000:.0f} ms each: "
+        f"async {elapsed * 1000:,.0f} ms (worst loop stall {stall * 1000:.1f} ms, "
+        f"{pooled} connections, reused: {reused}); "
+        f"sync {sync_elapsed * 1000:,.0f} ms "
+        f"(worst loop stall {sync_stall * 1000:.1f} ms)"
+    )
+
+    assert stall < AUTH_LATENCY_S / 2
+    assert sync_stall >= AUTH_LATENCY_S
+    assert elapsed * 4 < sync_elapsed
+    assert reused
@@ -0,0 +1,87 @@
+"""ES256 access token verification versus a verified-token cache hit.
+Run with ``pytest -m slow``.
+"""
+
+import json
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+from starlette.requests import Request
+
+from account.infrastructure.security.access_token_processor_jwt import (
+    AccessTokenDecoder,
+)
+from account.infrastructure.security.jwks_key_store import JwksKeyStore
+from shared.infrastructure.observability.metrics import MetricsRegistry
+from shared.infrastructure.security.identity_provider import JwtBearerIdentityProvider
+from shared.infrastructure.security.metrics import SecurityMetrics
+from shared.infrastructure.security.verified_token_cache import VerifiedTokenCache
+
+pytestmark = pytest.mark.slow
+
+ROUNDS = 5_000
+ACCOUNT_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def _decoder_and_token() -> tuple[AccessTokenDecoder, str]:
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    jwk = json.loads(jwt.algorithms.ECAlgorithm.to_jwk(private_key.public_key()))
+    key_store = Mock(spec=JwksKeyStore)
+    key_store.get.return_value = jwt.PyJWK({**jwk, "kid": "k1", "alg": "ES256"})
+    token = jwt.encode(
+        {
+            "sub": ACCOUNT_ID,
+            "aud": "authenticated",
+            "exp": datetime.now(UTC) + timedelta(minutes=15),
+        },
+        private_key,
+        algorithm="ES256",
+        headers={"kid": "k1"},
+    )
+    return AccessTokenDecoder("s" * 32, "ES256", key_store=key_store), token
+
+
+def _per_call_us(call: Callable[[], object]) -> float:
+    call()
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        call()
+    return (time.perf_counter() - started) / ROUNDS * 1_000_000
+
+
+@pytest.mark.asyncio
+async def test_cached_lookup_is_much_cheaper_than_es256_verification() -> None:
+    decoder, token = _decoder_and_token()
+    request = Request({
+        "type": "http",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+    })
+    registry = MetricsRegistry()
+    cache = VerifiedTokenCache(metrics=SecurityMetrics(registry))
+
+    verify_us = _per_call_us(lambda: decoder.decode(token))
+    cached_us = _per_call_us(lambda: cache.get_or_verify(token, decoder.decode))
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        provider = JwtBearerIdentityProvider(request, decoder, cache)
+        # A request resolving its identity twice, e.g. a handler and its guard.
+        await provider.get_current_account_id()
+        await provider.get_current_account_id()
+    request_us = (time.perf_counter() - started) / ROUNDS * 1_000_000
+
+    hit_ratio = registry.snapshot()["auth_token_cache_hit_ratio"]["samples"][0]
+    print(  # noqa: T201
+        f"ES256 verify {verify_us:.1f} us; cache hit {cached_us:.2f} us "
+        f"({verify_us / cached_us:.0f}x); identity per request, resolved twice, "
+        f"{request_us:.2f} us; hit ratio {hit_ratio['value']:.4f}"
+    )
+
+    assert cached_us * 10 < verify_us
+    assert request_us * 5 < verify_us
+    assert hit_ratio["value"] > 0.99
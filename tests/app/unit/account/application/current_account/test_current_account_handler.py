@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, create_autospec
 import pytest
 
 from account.application.current_account.handler import CurrentAccountHandler
-from account.domain.account.ports import AccessRevoker
+from account.domain.account.ports import AccessRevoker, RevokedAccessRegistry
 from account.domain.account.repository import AccountRepository
 from shared.domain.errors import AuthorizationError
 from shared.domain.ports.identity_provider import IdentityProvider
@@ -12,6 +12,12 @@ from tests.app.unit.factories.account_entity import create_account
 from tests.app.unit.factories.value_objects import create_account_id
 
 
+def _not_revoked() -> RevokedAccessRegistry:
+    revoked_access = create_autospec(RevokedAccessRegistry, instance=True)
+    revoked_access.is_access_revoked.return_value = False
+    return cast(RevokedAccessRegistry, revoked_access)
+
+
 @pytest.mark.asyncio
 async def test_returns_active_account() -> None:
     identity_provider = create_autospec(IdentityProvider, instance=True)
@@ -27,6 +33,7 @@ async def test_returns_active_account() -> None:
         identity_provider=cast(IdentityProvider, identity_provider),
         account_repository=cast(AccountRepository, account_repository),
         access_revoker=cast(AccessRevoker, access_revoker),
+        revoked_access=_not_revoked(),
     )
 
     result = await sut.get_current_account()
@@ -49,6 +56,7 @@ async def test_raises_and_revokes_when_account_is_none() -> None:
         identity_provider=cast(IdentityProvider, identity_provider),
         account_repository=cast(AccountRepository, account_repository),
         access_revoker=cast(AccessRevoker, access_revoker),
+        revoked_access=_not_revoked(),
     )
 
     with pytest.raises(AuthorizationError):
@@ -74,6 +82,7 @@ async def test_raises_and_revokes_when_account_is_inactive() -> None:
         identity_provider=cast(IdentityProvider, identity_provider),
         account_repository=cast(AccountRepository, account_repository),
         access_revoker=cast(AccessRevoker, access_revoker),
+        revoked_access=_not_revoked(),
     )
 
     with pytest.raises(AuthorizationError):
@@ -99,6 +108,7 @@ async def test_forwards_for_update_to_repository() -> None:
         identity_provider=cast(IdentityProvider, identity_provider),
         account_repository=cast(AccountRepository, account_repository),
         access_revoker=cast(AccessRevoker, access_revoker),
+        revoked_access=_not_revoked(),
     )
 
     await sut.get_current_account(for_update=True)
@@ -107,3 +117,29 @@ async def test_forwards_for_update_to_repository() -> None:
         account_id,
         for_update=True,
     )
+
+
+@pytest.mark.asyncio
+async def test_rejects_recently_revoked_account_without_lookup() -> None:
+    identity_provider = create_autospec(IdentityProvider, instance=True)
+    account_repository = create_autospec(AccountRepository, instance=True)
+    access_revoker = create_autospec(AccessRevoker, instance=True)
+    revoked_access = create_autospec(RevokedAccessRegistry, instance=True)
+
+    account_id = create_account_id()
+    cast(AsyncMock, identity_provider.get_current_account_id).return_value = account_id
+    revoked_access.is_access_revoked.return_value = True
+
+    sut = CurrentAccountHandler(
+        identity_provider=cast(IdentityProvider, identity_provider),
+        account_repository=cast(AccountRepository, account_repository),
+        access_revoker=cast(AccessRevoker, access_revoker),
+        revoked_access=cast(RevokedAccessRegistry, revoked_access),
+    )
+
+    with pytest.raises(AuthorizationError):
+        await sut.get_current_account()
+
+    revoked_access.is_access_revoked.assert_called_once_with(account_id)
+    cast(AsyncMock, account_repository.get_by_id).assert_not_awaited()
+    cast(AsyncMock, access_revoker.remove_all_account_access).assert_not_awaited()
@@ -9,7 +9,6 @@ from account.application.deactivate_account.handler import DeactivateAccountHand
 from account.application.shared.account_unit_of_work import AccountUnitOfWork
 from account.domain.account.enums import AccountRole
 from account.domain.account.errors import AccountNotFoundByIdError
-from account.domain.account.ports import AccessRevoker
 from account.domain.account.repository import AccountRepository
 from shared.application.event_dispatcher import EventDispatcher
 from shared.domain.errors import AuthorizationError
@@ -22,7 +21,6 @@ async def test_deactivates_active_account() -> None:
     current_account_handler = create_autospec(CurrentAccountUseCase, instance=True)
     account_repository = create_autospec(AccountRepository, instance=True)
     account_unit_of_work = create_autospec(AccountUnitOfWork, instance=True)
-    access_revoker = create_autospec(AccessRevoker, instance=True)
     event_dispatcher = create_autospec(EventDispatcher, instance=True)
 
     admin = create_account(role=AccountRole.ADMIN)
@@ -37,7 +35,6 @@ async def test_deactivates_active_account() -> None:
         current_account_handler=cast(CurrentAccountUseCase, current_account_handler),
         account_repository=cast(AccountRepository, account_repository),
         account_unit_of_work=cast(AccountUnitOfWork, account_unit_of_work),
-        access_revoker=cast(AccessRevoker, access_revoker),
         event_dispatcher=cast(EventDispatcher, event_dispatcher),
     )
 
@@ -45,16 +42,14 @@ async def test_deactivates_active_account() -> None:
 
     assert target.is_active is False
     cast(AsyncMock, account_unit_of_work.commit).assert_awaited_once()
-    cast(AsyncMock, access_revoker.remove_all_account_access).assert_awaited_once()
     cast(AsyncMock, event_dispatcher.dispatch).assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_already_inactive_skips_commit_but_revokes_access() -> None:
+async def test_already_inactive_skips_commit() -> None:
     current_account_handler = create_autospec(CurrentAccountUseCase, instance=True)
     account_repository = create_autospec(AccountRepository, instance=True)
     account_unit_of_work = create_autospec(AccountUnitOfWork, instance=True)
-    access_revoker = create_autospec(AccessRevoker, instance=True)
     event_dispatcher = create_autospec(EventDispatcher, instance=True)
 
     admin = create_account(role=AccountRole.ADMIN)
@@ -69,14 +64,13 @@ async def test_already_inactive_skips_commit_but_revokes_access() -> None:
         current_account_handler=cast(CurrentAccountUseCase, current_account_handler),
         account_repository=cast(AccountRepository, account_repository),
         account_unit_of_work=cast(AccountUnitOfWork, account_unit_of_work),
-        access_revoker=cast(AccessRevoker, access_revoker),
         event_dispatcher=cast(EventDispatcher, event_dispatcher),
     )
 
     await sut.execute(command)
 
     cast(AsyncMock, account_unit_of_work.commit).assert_not_awaited()
-    cast(AsyncMock, access_revoker.remove_all_account_access).assert_not_awaited()
+    cast(AsyncMock, event_dispatcher.dispatch).assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -84,7 +78,6 @@ async def test_user_caller_raises_authorization_error() -> None:
     current_account_handler = create_autospec(CurrentAccountUseCase, instance=True)
     account_repository = create_autospec(AccountRepository, instance=True)
     account_unit_of_work = create_autospec(AccountUnitOfWork, instance=True)
-    access_revoker = create_autospec(AccessRevoker, instance=True)
     event_dispatcher = create_autospec(EventDispatcher, instance=True)
 
     user = create_account(role=AccountRole.USER)
@@ -97,7 +90,6 @@ async def test_user_caller_raises_authorization_error() -> None:
         current_account_handler=cast(CurrentAccountUseCase, current_account_handler),
         account_repository=cast(AccountRepository, account_repository),
         account_unit_of_work=cast(AccountUnitOfWork, account_unit_of_work),
-        access_revoker=cast(AccessRevoker, access_revoker),
         event_dispatcher=cast(EventDispatcher, event_dispatcher),
     )
 
@@ -110,7 +102,6 @@ async def test_target_not_found_raises_error() -> None:
     current_account_handler = create_autospec(CurrentAccountUseCase, instance=True)
     account_repository = create_autospec(AccountRepository, instance=True)
     account_unit_of_work = create_autospec(AccountUnitOfWork, instance=True)
-    access_revoker = create_autospec(AccessRevoker, instance=True)
     event_dispatcher = create_autospec(EventDispatcher, instance=True)
 
     admin = create_account(role=AccountRole.ADMIN)
@@ -124,7 +115,6 @@ async def test_target_not_found_raises_error() -> None:
         current_account_handler=cast(CurrentAccountUseCase, current_account_handler),
         account_repository=cast(AccountRepository, account_repository),
         account_unit_of_work=cast(AccountUnitOfWork, account_unit_of_work),
-        access_revoker=cast(AccessRevoker, access_revoker),
         event_dispatcher=cast(EventDispatcher, event_dispatcher),
     )
 
@@ -137,7 +127,6 @@ async def test_admin_targeting_admin_raises_authorization_error() -> None:
     current_account_handler = create_autospec(CurrentAccountUseCase, instance=True)
     account_repository = create_autospec(AccountRepository, instance=True)
     account_unit_of_work = create_autospec(AccountUnitOfWork, instance=True)
-    access_revoker = create_autospec(AccessRevoker, instance=True)
     event_dispatcher = create_autospec(EventDispatcher, instance=True)
 
     admin = create_account(role=AccountRole.ADMIN)
@@ -154,7 +143,6 @@ async def test_admin_targeting_admin_raises_authorization_error() -> None:
         current_account_handler=cast(CurrentAccountUseCase, current_account_handler),
         account_repository=cast(AccountRepository, account_repository),
         account_unit_of_work=cast(AccountUnitOfWork, account_unit_of_work),
-        access_revoker=cast(AccessRevoker, access_revoker),
         event_dispatcher=cast(EventDispatcher, event_dispatcher),
     )
 
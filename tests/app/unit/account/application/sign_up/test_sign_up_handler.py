@@ -47,7 +47,9 @@ async def test_signs_up_unauthenticated_user() -> None:
 
     assert result["id"] == expected_id.value
     cast(AsyncMock, account_repository.save).assert_awaited_once()
-    cast(AsyncMock, account_unit_of_work.commit).assert_awaited_once()
+    cast(AsyncMock, account_unit_of_work.commit).assert_awaited_once_with(
+        await_handlers=True
+    )
     cast(AsyncMock, event_dispatcher.dispatch).assert_awaited_once()
 
 
@@ -0,0 +1,52 @@
+from typing import cast
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from account.application.shared.access_claims_publisher import AccessClaimsPublisher
+from account.application.sync_access_claims.command import SyncAccessClaimsCommand
+from account.application.sync_access_claims.handler import SyncAccessClaimsHandler
+from account.domain.account.enums import AccountRole
+from account.domain.account.repository import AccountRepository
+from tests.app.unit.factories.account_entity import create_account
+from tests.app.unit.factories.value_objects import create_account_id
+
+
+def _make_sut() -> tuple[SyncAccessClaimsHandler, AsyncMock, AsyncMock]:
+    account_repository = create_autospec(AccountRepository, instance=True)
+    publisher = create_autospec(AccessClaimsPublisher, instance=True)
+    sut = SyncAccessClaimsHandler(
+        account_repository=cast(AccountRepository, account_repository),
+        access_claims_publisher=cast(AccessClaimsPublisher, publisher),
+    )
+    return (
+        sut,
+        cast(AsyncMock, account_repository.get_by_id),
+        cast(AsyncMock, publisher.publish_access_claims),
+    )
+
+
+@pytest.mark.asyncio
+async def test_publishes_the_stored_role_and_status() -> None:
+    sut, get_by_id, publish = _make_sut()
+    account_id = create_account_id()
+    get_by_id.return_value = create_account(
+        account_id, role=AccountRole.ADMIN, is_active=False
+    )
+
+    await sut.execute(SyncAccessClaimsCommand(account_id=account_id.value))
+
+    get_by_id.assert_awaited_once_with(account_id)
+    publish.assert_awaited_once_with(
+        account_id, role=AccountRole.ADMIN, is_active=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_skips_accounts_that_no_longer_exist() -> None:
+    sut, get_by_id, publish = _make_sut()
+    get_by_id.return_value = None
+
+    await sut.execute(SyncAccessClaimsCommand(account_id=create_account_id().value))
+
+    publish.assert_not_awaited()
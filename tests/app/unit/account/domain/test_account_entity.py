@@ -114,3 +114,12 @@ def test_preserves_super_admin_role(
         account.change_role(target_role)
 
     assert account.role == AccountRole.SUPER_ADMIN
+
+
+def test_stamps_emitted_events_with_aggregate_key() -> None:
+    account_id = create_account_id()
+
+    sut = Account.create(id_=account_id, email=create_email())
+
+    [event] = sut.collect_events()
+    assert event.aggregate_id == f"Account:{account_id.value}"
@@ -0,0 +1,45 @@
+from typing import cast
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from account.domain.account.events import AccountDeactivated
+from account.domain.account.ports import AccessRevoker
+from account.infrastructure.events.handlers.revoke_account_access import (
+    RevokeAccessOnAccountDeactivated,
+)
+from account.infrastructure.security.access_revocation import (
+    AccessRevocationCoordinator,
+)
+from shared.infrastructure.events.registry import get_handlers_for
+from tests.app.unit.factories.value_objects import create_account_id
+
+
+@pytest.mark.asyncio
+async def test_deactivation_revokes_access() -> None:
+    revoker = create_autospec(AccessRevoker, instance=True)
+    coordinator = AccessRevocationCoordinator(cast(AccessRevoker, revoker))
+    account_id = create_account_id()
+    sut = RevokeAccessOnAccountDeactivated(coordinator)
+
+    await sut.handle(AccountDeactivated(account_id=account_id.value))
+
+    remove = cast(AsyncMock, revoker.remove_all_account_access)
+    remove.assert_awaited_once_with(account_id)
+    assert coordinator.is_access_revoked(account_id)
+
+
+@pytest.mark.asyncio
+async def test_failed_revocation_propagates_for_the_relay_to_retry() -> None:
+    revoker = create_autospec(AccessRevoker, instance=True)
+    cast(AsyncMock, revoker.remove_all_account_access).side_effect = RuntimeError
+    sut = RevokeAccessOnAccountDeactivated(
+        AccessRevocationCoordinator(cast(AccessRevoker, revoker))
+    )
+
+    with pytest.raises(RuntimeError):
+        await sut.handle(AccountDeactivated(account_id=create_account_id().value))
+
+
+def test_is_registered_for_account_deactivated() -> None:
+    assert RevokeAccessOnAccountDeactivated in get_handlers_for(AccountDeactivated)
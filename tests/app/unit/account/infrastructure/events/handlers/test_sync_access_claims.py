@@ -0,0 +1,49 @@
+from typing import cast
+from unittest.mock import AsyncMock, create_autospec
+from uuid import uuid4
+
+import pytest
+
+from account.application.sync_access_claims.command import SyncAccessClaimsCommand
+from account.application.sync_access_claims.port import SyncAccessClaimsUseCase
+from account.domain.account.enums import AccountRole
+from account.domain.account.events import (
+    AccountActivated,
+    AccountCreated,
+    AccountDeactivated,
+    AccountRoleChanged,
+)
+from account.infrastructure.events.handlers.sync_access_claims import (
+    SyncAccessClaimsOnAccountChanged,
+)
+from shared.domain.domain_event import DomainEvent
+from shared.infrastructure.events.registry import get_handlers_for
+
+
+@pytest.mark.asyncio
+async def test_syncs_the_account_of_the_event() -> None:
+    use_case = create_autospec(SyncAccessClaimsUseCase, instance=True)
+    sut = SyncAccessClaimsOnAccountChanged(cast(SyncAccessClaimsUseCase, use_case))
+    account_id = uuid4()
+
+    await sut.handle(
+        AccountRoleChanged(
+            account_id=account_id,
+            old_role=AccountRole.USER,
+            new_role=AccountRole.ADMIN,
+        )
+    )
+
+    cast(AsyncMock, use_case.execute).assert_awaited_once_with(
+        SyncAccessClaimsCommand(account_id=account_id)
+    )
+
+
+@pytest.mark.parametrize(
+    "event_type",
+    [AccountCreated, AccountActivated, AccountDeactivated, AccountRoleChanged],
+)
+def test_is_registered_for_account_lifecycle_events(
+    event_type: type[DomainEvent],
+) -> None:
+    assert SyncAccessClaimsOnAccountChanged in get_handlers_for(event_type)
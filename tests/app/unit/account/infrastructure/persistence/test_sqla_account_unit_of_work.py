@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, create_autospec
 
 import pytest
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
@@ -6,9 +6,14 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from account.infrastructure.persistence.sqla_account_unit_of_work import (
     SqlaAccountUnitOfWork,
 )
+from shared.infrastructure.events.fast_path import PostCommitDelivery
 from shared.infrastructure.persistence.errors import DataMapperError
 
 
+def _post_commit() -> MagicMock:
+    return create_autospec(PostCommitDelivery, instance=True)  # type: ignore[no-any-return]
+
+
 class TestCommit:
     @pytest.mark.asyncio
     async def test_flush_then_commit_order(self) -> None:
@@ -24,7 +29,7 @@ class TestCommit:
         session.flush.side_effect = track_flush
         session.commit.side_effect = track_commit
 
-        uow = SqlaAccountUnitOfWork(session)
+        uow = SqlaAccountUnitOfWork(session, _post_commit())
         await uow.commit()
 
         assert call_order == ["flush", "commit"]
@@ -36,7 +41,7 @@ class TestCommit:
             "duplicate", params=None, orig=Exception()
         )
 
-        uow = SqlaAccountUnitOfWork(session)
+        uow = SqlaAccountUnitOfWork(session, _post_commit())
 
         with pytest.raises(DataMapperError, match="constraint violation"):
             await uow.commit()
@@ -46,7 +51,7 @@ class TestCommit:
         session = AsyncMock()
         session.flush.side_effect = SQLAlchemyError("flush failed")
 
-        uow = SqlaAccountUnitOfWork(session)
+        uow = SqlaAccountUnitOfWork(session, _post_commit())
 
         with pytest.raises(DataMapperError, match="query failed"):
             await uow.commit()
@@ -56,18 +61,62 @@ class TestCommit:
         session = AsyncMock()
         session.commit.side_effect = SQLAlchemyError("commit failed")
 
-        uow = SqlaAccountUnitOfWork(session)
+        uow = SqlaAccountUnitOfWork(session, _post_commit())
 
         with pytest.raises(DataMapperError, match="query failed"):
             await uow.commit()
 
+    @pytest.mark.asyncio
+    async def test_hands_outbox_entries_over_after_commit(self) -> None:
+        call_order: list[str] = []
+        session = AsyncMock()
+        session.commit.side_effect = lambda: call_order.append("commit")
+        post_commit = _post_commit()
+        post_commit.committed.side_effect = lambda **_: call_order.append("post_commit")
+
+        uow = SqlaAccountUnitOfWork(session, post_commit)
+        await uow.commit()
+
+        assert call_order == ["commit", "post_commit"]
+        post_commit.committed.assert_awaited_once_with(wait=False)
+
+    @pytest.mark.asyncio
+    async def test_waits_for_handlers_only_when_asked(self) -> None:
+        post_commit = _post_commit()
+
+        uow = SqlaAccountUnitOfWork(AsyncMock(), post_commit)
+        await uow.commit(await_handlers=True)
+
+        post_commit.committed.assert_awaited_once_with(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_skips_post_commit_delivery(self) -> None:
+        session = AsyncMock()
+        session.commit.side_effect = SQLAlchemyError("commit failed")
+        post_commit = _post_commit()
+
+        uow = SqlaAccountUnitOfWork(session, post_commit)
+        with pytest.raises(DataMapperError):
+            await uow.commit()
+
+        post_commit.committed.assert_not_awaited()
+
 
 class TestRollback:
     @pytest.mark.asyncio
     async def test_rollback_delegates_to_session(self) -> None:
         session = AsyncMock()
 
-        uow = SqlaAccountUnitOfWork(session)
+        uow = SqlaAccountUnitOfWork(session, _post_commit())
         await uow.rollback()
 
         session.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rollback_discards_tracked_outbox_entries(self) -> None:
+        post_commit = _post_commit()
+
+        uow = SqlaAccountUnitOfWork(AsyncMock(), post_commit)
+        await uow.rollback()
+
+        post_commit.discard.assert_called_once_with()
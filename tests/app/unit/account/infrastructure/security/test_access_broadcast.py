@@ -0,0 +1,132 @@
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from account.domain.account.enums import AccountRole
+from account.domain.account.events import (
+    AccountActivated,
+    AccountCreated,
+    AccountDeactivated,
+    AccountRoleChanged,
+)
+from account.infrastructure.security.access_broadcast import (
+    ACCOUNT_ACCESS_NOTIFY_CHANNEL,
+    AccountAccessBroadcaster,
+    AccountAccessSubscriber,
+)
+from account.infrastructure.security.access_revocation import (
+    AccessRevocationCoordinator,
+)
+from account.infrastructure.security.account_access_cache import (
+    AccountAccess,
+    AccountAccessCache,
+)
+from shared.application.event_dispatcher import EventDispatcher
+from shared.domain.account_id import AccountId
+from shared.infrastructure.persistence.types_ import MainAsyncSession
+
+ACCOUNT_UUID = uuid4()
+USER = AccountAccess(role=AccountRole.USER, is_active=True)
+
+
+def _broadcaster() -> tuple[AccountAccessBroadcaster, MagicMock, MagicMock]:
+    dispatcher = create_autospec(EventDispatcher, instance=True)
+    session = create_autospec(AsyncSession, instance=True)
+    sut = AccountAccessBroadcaster(
+        cast(EventDispatcher, dispatcher),
+        cast(MainAsyncSession, session),
+    )
+    return sut, dispatcher, session
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_notifies_access_changes_after_dispatching() -> None:
+    sut, dispatcher, session = _broadcaster()
+    events = [
+        AccountCreated(account_id=uuid4(), email="a@b.com", role=AccountRole.USER),
+        AccountDeactivated(account_id=ACCOUNT_UUID),
+    ]
+
+    await sut.dispatch(events)
+
+    cast(AsyncMock, dispatcher.dispatch).assert_awaited_once_with(events)
+    [call] = session.execute.await_args_list
+    params = call.args[0].compile().params
+    assert ACCOUNT_ACCESS_NOTIFY_CHANNEL in params.values()
+    assert f"AccountDeactivated:{ACCOUNT_UUID}" in params.values()
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_stays_silent_without_access_changes() -> None:
+    sut, _, session = _broadcaster()
+
+    await sut.dispatch([
+        AccountCreated(account_id=uuid4(), email="a@b.com", role=AccountRole.USER),
+    ])
+
+    session.execute.assert_not_awaited()
+
+
+def _subscriber() -> tuple[AccountAccessSubscriber, AccountAccessCache, MagicMock]:
+    cache = AccountAccessCache()
+    cache.put(AccountId(ACCOUNT_UUID), USER, cache.generation)
+    coordinator = create_autospec(AccessRevocationCoordinator, instance=True)
+    sut = AccountAccessSubscriber(
+        access_cache=cache,
+        coordinator=cast(AccessRevocationCoordinator, coordinator),
+    )
+    return sut, cache, coordinator
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        pytest.param(AccountDeactivated(account_id=ACCOUNT_UUID), id="deactivated"),
+        pytest.param(
+            AccountRoleChanged(
+                account_id=ACCOUNT_UUID,
+                old_role=AccountRole.USER,
+                new_role=AccountRole.ADMIN,
+            ),
+            id="role_changed",
+        ),
+    ],
+)
+def test_subscriber_invalidates_cached_access(
+    event: AccountDeactivated | AccountRoleChanged,
+) -> None:
+    sut, cache, coordinator = _subscriber()
+
+    sut.apply(f"{event.event_type}:{ACCOUNT_UUID}")
+
+    assert cache.get(AccountId(ACCOUNT_UUID)) is None
+    coordinator.forget.assert_not_called()
+
+
+def test_subscriber_forgets_revocation_of_reactivated_account() -> None:
+    sut, cache, coordinator = _subscriber()
+
+    sut.apply(f"{AccountActivated.__name__}:{ACCOUNT_UUID}")
+
+    assert cache.get(AccountId(ACCOUNT_UUID)) is None
+    coordinator.forget.assert_called_once_with(AccountId(ACCOUNT_UUID))
+
+
+def test_subscriber_clears_cache_after_a_reconnect() -> None:
+    sut, cache, _ = _subscriber()
+
+    sut.apply(None)
+
+    assert len(cache) == 0
+
+
+def test_subscriber_ignores_malformed_payload() -> None:
+    sut, cache, coordinator = _subscriber()
+
+    sut.apply("AccountActivated:not-a-uuid")
+
+    assert cache.get(AccountId(ACCOUNT_UUID)) == USER
+    coordinator.forget.assert_not_called()
@@ -0,0 +1,188 @@
+import asyncio
+from typing import cast
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from account.domain.account.ports import AccessRevoker
+from account.infrastructure.security.access_revocation import (
+    AccessRevocationCoordinator,
+)
+from shared.infrastructure.observability.metrics import MetricsRegistry
+from shared.infrastructure.security.metrics import SecurityMetrics
+from tests.app.unit.factories.value_objects import create_account_id
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _SlowRevoker(AccessRevoker):
+    """Takes ``delay`` seconds per call, like the auth provider's admin API."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.calls = 0
+        self.fail = False
+
+    async def remove_all_account_access(self, account_id: object) -> None:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            msg = "auth provider unavailable"
+            raise RuntimeError(msg)
+
+
+def _outcomes(registry: MetricsRegistry) -> dict[str, float]:
+    return {
+        s["labels"]["outcome"]: s["value"]
+        for s in registry.snapshot()["auth_revocations_total"]["samples"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_returns_before_the_revocation_completes() -> None:
+    revoker = _SlowRevoker(delay=10.0)
+    sut = AccessRevocationCoordinator(revoker)
+
+    async with asyncio.timeout(1.0):
+        await sut.remove_all_account_access(create_account_id())
+
+    await asyncio.sleep(0)
+    assert revoker.calls == 1
+    for task in list(sut._in_flight.values()):
+        task.cancel()
+    await sut.close()
+
+
+@pytest.mark.asyncio
+async def test_a_flood_of_stale_tokens_makes_one_call() -> None:
+    registry = MetricsRegistry()
+    revoker = _SlowRevoker()
+    sut = AccessRevocationCoordinator(revoker, metrics=SecurityMetrics(registry))
+    account_id = create_account_id()
+
+    await asyncio.gather(
+        *(sut.remove_all_account_access(account_id) for _ in range(100))
+    )
+    await sut.close()
+    for _ in range(50):
+        await sut.remove_all_account_access(account_id)
+
+    assert revoker.calls == 1
+    assert _outcomes(registry) == {
+        "started": 1.0,
+        "coalesced": 99.0,
+        "suppressed": 50.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_reports_revoked_while_in_flight_and_for_ttl() -> None:
+    clock = _Clock()
+    sut = AccessRevocationCoordinator(_SlowRevoker(), ttl=60.0, clock=clock)
+    account_id = create_account_id()
+    assert not sut.is_access_revoked(account_id)
+
+    await sut.remove_all_account_access(account_id)
+    assert sut.is_access_revoked(account_id)
+    await sut.close()
+    assert sut.is_access_revoked(account_id)
+
+    clock.now = 60.0
+    assert not sut.is_access_revoked(account_id)
+
+
+@pytest.mark.asyncio
+async def test_revokes_again_after_the_ttl() -> None:
+    clock = _Clock()
+    revoker = _SlowRevoker(delay=0)
+    sut = AccessRevocationCoordinator(revoker, ttl=60.0, clock=clock)
+    account_id = create_account_id()
+
+    await sut.remove_all_account_access(account_id)
+    await sut.close()
+    clock.now = 60.0
+    await sut.remove_all_account_access(account_id)
+    await sut.close()
+
+    assert revoker.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_revocations_are_retried_by_the_next_request() -> None:
+    registry = MetricsRegistry()
+    revoker = _SlowRevoker(delay=0)
+    revoker.fail = True
+    sut = AccessRevocationCoordinator(revoker, metrics=SecurityMetrics(registry))
+    account_id = create_account_id()
+
+    await sut.remove_all_account_access(account_id)
+    await sut.close()
+    assert not sut.is_access_revoked(account_id)
+
+    revoker.fail = False
+    await sut.remove_all_account_access(account_id)
+    await sut.close()
+
+    assert revoker.calls == 2
+    assert sut.is_access_revoked(account_id)
+    assert _outcomes(registry) == {"started": 2.0, "failed": 1.0}
+
+
+@pytest.mark.asyncio
+async def test_accounts_are_revoked_independently() -> None:
+    revoker = create_autospec(AccessRevoker, instance=True)
+    sut = AccessRevocationCoordinator(cast(AccessRevoker, revoker))
+    first, second = create_account_id(), create_account_id()
+
+    await sut.remove_all_account_access(first)
+    await sut.remove_all_account_access(second)
+    await sut.close()
+
+    remove = cast(AsyncMock, revoker.remove_all_account_access)
+    assert [c.args for c in remove.await_args_list] == [(first,), (second,)]
+
+
+@pytest.mark.asyncio
+async def test_forget_lets_the_account_in_again() -> None:
+    sut = AccessRevocationCoordinator(_SlowRevoker(delay=0))
+    account_id = create_account_id()
+    await sut.remove_all_account_access(account_id)
+    await sut.close()
+
+    sut.forget(account_id)
+
+    assert not sut.is_access_revoked(account_id)
+
+
+@pytest.mark.asyncio
+async def test_revoke_waits_for_the_call_and_remembers_it() -> None:
+    revoker = _SlowRevoker(delay=0)
+    sut = AccessRevocationCoordinator(revoker)
+    account_id = create_account_id()
+
+    await sut.revoke(account_id)
+    await sut.remove_all_account_access(account_id)
+
+    assert revoker.calls == 1
+    assert sut.is_access_revoked(account_id)
+
+
+@pytest.mark.asyncio
+async def test_revoke_raises_failures_without_remembering_them() -> None:
+    registry = MetricsRegistry()
+    revoker = _SlowRevoker(delay=0)
+    revoker.fail = True
+    sut = AccessRevocationCoordinator(revoker, metrics=SecurityMetrics(registry))
+    account_id = create_account_id()
+
+    with pytest.raises(RuntimeError):
+        await sut.revoke(account_id)
+
+    assert not sut.is_access_revoked(account_id)
+    assert _outcomes(registry) == {"started": 1.0, "failed": 1.0}
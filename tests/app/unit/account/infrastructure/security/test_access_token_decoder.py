@@ -0,0 +1,62 @@
+from datetime import UTC, datetime, timedelta
+
+import jwt
+import pytest
+
+from account.domain.account.enums import AccountRole
+from account.infrastructure.security.access_token_processor_jwt import (
+    AccessTokenClaims,
+    AccessTokenDecoder,
+)
+
+SECRET = "s" * 32
+ACCOUNT_ID = "00000000-0000-0000-0000-000000000001"
+EXPIRES_AT = datetime.now(UTC).replace(microsecond=0) + timedelta(minutes=5)
+
+
+def _token(**claims: object) -> str:
+    return jwt.encode(
+        {"sub": ACCOUNT_ID, "aud": "authenticated", "exp": EXPIRES_AT, **claims},
+        SECRET,
+        algorithm="HS256",
+    )
+
+
+def test_decodes_role_and_status_from_app_metadata() -> None:
+    sut = AccessTokenDecoder(SECRET, "HS256")
+
+    claims = sut.decode(_token(app_metadata={"role": "admin", "is_active": True}))
+
+    assert claims == AccessTokenClaims(
+        account_id=ACCOUNT_ID,
+        expires_at=EXPIRES_AT.timestamp(),
+        role=AccountRole.ADMIN,
+        is_active=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "app_metadata",
+    [
+        pytest.param(None, id="missing"),
+        pytest.param({"provider": "email"}, id="not_synced"),
+        pytest.param({"role": "root", "is_active": "yes"}, id="malformed"),
+        pytest.param(["admin"], id="not_an_object"),
+    ],
+)
+def test_unusable_access_claims_are_none(app_metadata: object) -> None:
+    sut = AccessTokenDecoder(SECRET, "HS256")
+    token = _token() if app_metadata is None else _token(app_metadata=app_metadata)
+
+    claims = sut.decode(token)
+
+    assert claims is not None
+    assert claims.account_id == ACCOUNT_ID
+    assert claims.role is None
+    assert claims.is_active is None
+
+
+def test_rejects_tokens_with_a_bad_signature() -> None:
+    sut = AccessTokenDecoder("x" * 32, "HS256")
+
+    assert sut.decode(_token()) is None
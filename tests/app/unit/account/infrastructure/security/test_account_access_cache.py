@@ -0,0 +1,96 @@
+from account.domain.account.enums import AccountRole
+from account.infrastructure.security.account_access_cache import (
+    AccountAccess,
+    AccountAccessCache,
+)
+from tests.app.unit.factories.value_objects import create_account_id
+
+ADMIN = AccountAccess(role=AccountRole.ADMIN, is_active=True)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_what_was_put() -> None:
+    sut = AccountAccessCache()
+    account_id = create_account_id()
+
+    sut.put(account_id, ADMIN, sut.generation)
+
+    assert sut.get(account_id) == ADMIN
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = _Clock()
+    sut = AccountAccessCache(ttl=30.0, clock=clock)
+    account_id = create_account_id()
+    sut.put(account_id, ADMIN, sut.generation)
+
+    clock.now = 29.9
+    assert sut.get(account_id) == ADMIN
+    clock.now = 30.0
+    assert sut.get(account_id) is None
+
+
+def test_invalidate_drops_the_entry() -> None:
+    sut = AccountAccessCache()
+    account_id = create_account_id()
+    other_id = create_account_id()
+    sut.put(account_id, ADMIN, sut.generation)
+    sut.put(other_id, ADMIN, sut.generation)
+
+    sut.invalidate(account_id)
+
+    assert sut.get(account_id) is None
+    assert sut.get(other_id) == ADMIN
+
+
+def test_clear_drops_every_entry_and_pending_put() -> None:
+    sut = AccountAccessCache()
+    account_id = create_account_id()
+    sut.put(account_id, ADMIN, sut.generation)
+    generation = sut.generation
+
+    sut.clear()
+    sut.put(create_account_id(), ADMIN, generation)
+
+    assert len(sut) == 0
+    assert sut.get(account_id) is None
+
+
+def test_put_after_a_concurrent_invalidation_is_ignored() -> None:
+    sut = AccountAccessCache()
+    account_id = create_account_id()
+    generation = sut.generation
+
+    sut.invalidate(account_id)
+    sut.put(account_id, ADMIN, generation)
+
+    assert sut.get(account_id) is None
+
+
+def test_evicts_least_recently_used_beyond_max_size() -> None:
+    sut = AccountAccessCache(max_size=2)
+    a, b, c = create_account_id(), create_account_id(), create_account_id()
+    sut.put(a, ADMIN, sut.generation)
+    sut.put(b, ADMIN, sut.generation)
+    sut.get(a)
+
+    sut.put(c, ADMIN, sut.generation)
+
+    assert sut.get(b) is None
+    assert sut.get(a) == sut.get(c) == ADMIN
+
+
+def test_zero_size_disables_caching() -> None:
+    sut = AccountAccessCache(max_size=0)
+    account_id = create_account_id()
+
+    sut.put(account_id, ADMIN, sut.generation)
+
+    assert sut.get(account_id) is None
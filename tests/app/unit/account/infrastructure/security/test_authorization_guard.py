@@ -0,0 +1,209 @@
+from typing import cast
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from account.domain.account.enums import AccountRole
+from account.domain.account.repository import AccountRepository
+from account.infrastructure.security.access_token_processor_jwt import (
+    AccessTokenClaims,
+)
+from account.infrastructure.security.account_access_cache import (
+    AccountAccess,
+    AccountAccessCache,
+)
+from account.infrastructure.security.authorization_guard import (
+    AccountAuthorizationGuard,
+    AuthorizationPolicy,
+)
+from shared.domain.account_id import AccountId
+from shared.domain.errors import AuthorizationError
+from shared.domain.ports.identity_provider import IdentityProvider
+from shared.infrastructure.observability.metrics import MetricsRegistry
+from shared.infrastructure.security.identity_provider import (
+    AccessTokenClaimsProvider,
+)
+from shared.infrastructure.security.metrics import SecurityMetrics
+from tests.app.unit.factories.account_entity import create_account
+from tests.app.unit.factories.value_objects import create_account_id
+
+
+def _make_sut(
+    account_id: AccountId,
+    cache: AccountAccessCache | None = None,
+    policy: AuthorizationPolicy | None = None,
+    claims: AccessTokenClaims | None = None,
+) -> tuple[AccountAuthorizationGuard, AsyncMock]:
+    identity_provider = create_autospec(IdentityProvider, instance=True)
+    cast(AsyncMock, identity_provider.get_current_account_id).return_value = account_id
+    claims_provider = create_autospec(AccessTokenClaimsProvider, instance=True)
+    cast(AsyncMock, claims_provider.get_current_claims).return_value = (
+        claims or AccessTokenClaims(str(account_id.value))
+    )
+    account_repository = create_autospec(AccountRepository, instance=True)
+    sut = AccountAuthorizationGuard(
+        identity_provider=cast(IdentityProvider, identity_provider),
+        claims_provider=cast(AccessTokenClaimsProvider, claims_provider),
+        account_repository=cast(AccountRepository, account_repository),
+        access_cache=AccountAccessCache() if cache is None else cache,
+        policy=policy or AuthorizationPolicy(),
+    )
+    return sut, cast(AsyncMock, account_repository.get_by_id)
+
+
+@pytest.mark.asyncio
+async def test_queries_the_account_only_on_a_cache_miss() -> None:
+    registry = MetricsRegistry()
+    cache = AccountAccessCache(metrics=SecurityMetrics(registry))
+    account_id = create_account_id()
+    sut, get_by_id = _make_sut(account_id, cache)
+    get_by_id.return_value = create_account(account_id, role=AccountRole.ADMIN)
+
+    for _ in range(3):
+        await sut.require_admin()
+
+    get_by_id.assert_awaited_once_with(account_id)
+    lookups = {
+        s["labels"]["result"]: s["value"]
+        for s in registry.snapshot()["authz_access_cache_lookups_total"]["samples"]
+    }
+    assert lookups == {"hit": 2.0, "miss": 1.0}
+
+
+@pytest.mark.asyncio
+async def test_sees_a_role_change_after_invalidation() -> None:
+    cache = AccountAccessCache()
+    account_id = create_account_id()
+    sut, get_by_id = _make_sut(account_id, cache)
+    get_by_id.return_value = create_account(account_id, role=AccountRole.ADMIN)
+    await sut.require_admin()
+
+    get_by_id.return_value = create_account(account_id, role=AccountRole.USER)
+    cache.invalidate(account_id)
+
+    with pytest.raises(AuthorizationError):
+        await sut.require_admin()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("role", "is_active"),
+    [
+        pytest.param(AccountRole.USER, True, id="user"),
+        pytest.param(AccountRole.ADMIN, False, id="inactive_admin"),
+    ],
+)
+async def test_rejects_cached_non_admins(role: AccountRole, is_active: bool) -> None:
+    cache = AccountAccessCache()
+    account_id = create_account_id()
+    cache.put(account_id, AccountAccess(role=role, is_active=is_active), 0)
+    sut, get_by_id = _make_sut(account_id, cache)
+
+    with pytest.raises(AuthorizationError):
+        await sut.require_admin()
+
+    get_by_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_does_not_cache_missing_accounts() -> None:
+    cache = AccountAccessCache()
+    account_id = create_account_id()
+    sut, get_by_id = _make_sut(account_id, cache)
+    get_by_id.return_value = None
+
+    for _ in range(2):
+        with pytest.raises(AuthorizationError):
+            await sut.require_admin()
+
+    assert get_by_id.await_count == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_strict_mutation_checks_read_the_account_despite_the_cache() -> None:
+    cache = AccountAccessCache()
+    account_id = create_account_id()
+    cache.put(account_id, AccountAccess(role=AccountRole.ADMIN, is_active=True), 0)
+    sut, get_by_id = _make_sut(account_id, cache)
+    get_by_id.return_value = create_account(account_id, is_active=False)
+
+    with pytest.raises(AuthorizationError):
+        await sut.require_admin(for_update=True)
+
+    get_by_id.assert_awaited_once_with(account_id)
+
+
+@pytest.mark.asyncio
+async def test_trusted_token_claims_decide_without_the_database() -> None:
+    account_id = create_account_id()
+    claims = AccessTokenClaims(
+        str(account_id.value), role=AccountRole.ADMIN, is_active=True
+    )
+    sut, get_by_id = _make_sut(
+        account_id,
+        policy=AuthorizationPolicy(trust_token_claims=True),
+        claims=claims,
+    )
+
+    await sut.require_admin()
+
+    get_by_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_trusted_token_claims_can_reject() -> None:
+    account_id = create_account_id()
+    claims = AccessTokenClaims(
+        str(account_id.value), role=AccountRole.ADMIN, is_active=False
+    )
+    sut, get_by_id = _make_sut(
+        account_id,
+        policy=AuthorizationPolicy(trust_token_claims=True),
+        claims=claims,
+    )
+    get_by_id.return_value = create_account(account_id, role=AccountRole.ADMIN)
+
+    with pytest.raises(AuthorizationError):
+        await sut.require_admin()
+
+    get_by_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_tokens_without_access_claims_fall_back_to_the_account() -> None:
+    account_id = create_account_id()
+    sut, get_by_id = _make_sut(
+        account_id,
+        policy=AuthorizationPolicy(trust_token_claims=True),
+    )
+    get_by_id.return_value = create_account(account_id, role=AccountRole.ADMIN)
+
+    await sut.require_admin()
+
+    get_by_id.assert_awaited_once_with(account_id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("strict", "queries"),
+    [pytest.param(True, 1, id="strict"), pytest.param(False, 0, id="lenient")],
+)
+async def test_strict_mode_rechecks_mutations_against_the_database(
+    strict: bool,
+    queries: int,
+) -> None:
+    account_id = create_account_id()
+    claims = AccessTokenClaims(
+        str(account_id.value), role=AccountRole.ADMIN, is_active=True
+    )
+    sut, get_by_id = _make_sut(
+        account_id,
+        policy=AuthorizationPolicy(trust_token_claims=True, strict=strict),
+        claims=claims,
+    )
+    get_by_id.return_value = create_account(account_id, role=AccountRole.ADMIN)
+
+    await sut.require_admin(for_update=True)
+
+    assert get_by_id.await_count == queries
@@ -0,0 +1,193 @@
+import asyncio
+import json
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from account.infrastructure.security.access_token_processor_jwt import (
+    AccessTokenDecoder,
+)
+from account.infrastructure.security.jwks_key_store import JwksKeyStore
+
+JWKS_URL = "http://auth.test/auth/v1/.well-known/jwks.json"
+ACCOUNT_ID = "00000000-0000-0000-0000-000000000001"
+
+
+class _Jwks:
+    """A JWKS endpoint whose keys and availability the test controls."""
+
+    def __init__(self, *kids: str) -> None:
+        self.private_keys = {
+            kid: ec.generate_private_key(ec.SECP256R1()) for kid in kids
+        }
+        self.requests = 0
+        self.failing = False
+
+    def rotate(self, kid: str) -> None:
+        self.private_keys[kid] = ec.generate_private_key(ec.SECP256R1())
+
+    def sign(self, kid: str) -> str:
+        return jwt.encode(
+            {
+                "sub": ACCOUNT_ID,
+                "aud": "authenticated",
+                "exp": datetime.now(UTC) + timedelta(minutes=5),
+            },
+            self.private_keys[kid],
+            algorithm="ES256",
+            headers={"kid": kid},
+        )
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        assert str(request.url) == JWKS_URL
+        self.requests += 1
+        if self.failing:
+            return httpx.Response(503)
+        keys = [
+            {
+                **json.loads(jwt.algorithms.ECAlgorithm.to_jwk(key.public_key())),
+                "kid": kid,
+                "alg": "ES256",
+                "use": "sig",
+            }
+            for kid, key in self.private_keys.items()
+        ]
+        return httpx.Response(200, json={"keys": keys})
+
+
+def _store(
+    jwks: _Jwks,
+    refresh_interval: float = 300.0,
+    min_refresh_interval: float = 10.0,
+) -> JwksKeyStore:
+    return JwksKeyStore(
+        JWKS_URL,
+        httpx.AsyncClient(transport=httpx.MockTransport(jwks.handle)),
+        refresh_interval=refresh_interval,
+        min_refresh_interval=min_refresh_interval,
+    )
+
+
+async def _until(condition: Callable[[], bool]) -> None:
+    async with asyncio.timeout(1.0):
+        while not condition():  # noqa: ASYNC110
+            await asyncio.sleep(0.001)
+
+
+@pytest.mark.asyncio
+async def test_start_prefetches_the_keys() -> None:
+    jwks = _Jwks("k1", "k2")
+    sut = _store(jwks)
+
+    await sut.start()
+    try:
+        assert sut.kids == {"k1", "k2"}
+        assert jwks.requests == 1
+    finally:
+        await sut.close()
+
+
+@pytest.mark.asyncio
+async def test_decoding_does_no_io() -> None:
+    jwks = _Jwks("k1")
+    sut = _store(jwks)
+    await sut.start()
+    decoder = AccessTokenDecoder("s" * 32, "ES256", key_store=sut)
+    try:
+        for _ in range(50):
+            assert decoder.decode_account_id(jwks.sign("k1")) == ACCOUNT_ID
+        assert jwks.requests == 1
+    finally:
+        await sut.close()
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_is_rejected_and_triggers_a_background_refresh() -> None:
+    jwks = _Jwks("k1")
+    sut = _store(jwks, min_refresh_interval=0.01)
+    await sut.start()
+    decoder = AccessTokenDecoder("s" * 32, "ES256", key_store=sut)
+    try:
+        jwks.rotate("k2")
+        token = jwks.sign("k2")
+
+        assert decoder.decode_account_id(token) is None
+        await _until(lambda: "k2" in sut.kids)
+
+        assert decoder.decode_account_id(token) == ACCOUNT_ID
+        assert jwks.requests == 2
+    finally:
+        await sut.close()
+
+
+@pytest.mark.asyncio
+async def test_unknown_kids_refresh_at_most_once_per_min_interval() -> None:
+    jwks = _Jwks("k1")
+    sut = _store(jwks, min_refresh_interval=0.5)
+    await sut.start()
+    try:
+        for i in range(100):
+            assert sut.get(f"forged-{i}") is None
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.05)
+
+        assert jwks.requests == 1
+        await _until(lambda: jwks.requests == 2)
+    finally:
+        await sut.close()
+
+
+@pytest.mark.asyncio
+async def test_refreshes_on_the_interval() -> None:
+    jwks = _Jwks("k1")
+    sut = _store(jwks, refresh_interval=0.01)
+    await sut.start()
+    try:
+        await _until(lambda: jwks.requests >= 3)
+    finally:
+        await sut.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_the_current_keys() -> None:
+    jwks = _Jwks("k1")
+    sut = _store(jwks)
+    await sut.start()
+    try:
+        jwks.failing = True
+
+        assert await sut.refresh() is False
+        assert sut.kids == {"k1"}
+    finally:
+        await sut.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_prefetch_does_not_fail_startup_and_is_retried() -> None:
+    jwks = _Jwks("k1")
+    jwks.failing = True
+    sut = _store(jwks, min_refresh_interval=0.01)
+
+    await sut.start()
+    try:
+        assert sut.kids == frozenset()
+        jwks.failing = False
+        await _until(lambda: sut.kids == {"k1"})
+    finally:
+        await sut.close()
+
+
+def test_token_without_kid_is_rejected() -> None:
+    jwks = _Jwks("k1")
+    token = jwt.encode(
+        {"sub": ACCOUNT_ID, "aud": "authenticated"},
+        jwks.private_keys["k1"],
+        algorithm="ES256",
+    )
+    decoder = AccessTokenDecoder("s" * 32, "ES256", key_store=_store(jwks))
+
+    assert decoder.decode_account_id(token) is None
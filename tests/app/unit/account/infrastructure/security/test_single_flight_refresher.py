@@ -0,0 +1,187 @@
+import asyncio
+import contextlib
+import gc
+
+import pytest
+
+from account.application.shared.token_pair_refresher import TokenPairRefresher
+from account.infrastructure.security.errors import RefreshTokenNotFoundError
+from account.infrastructure.security.single_flight_refresher import (
+    SingleFlightTokenPairRefresher,
+)
+from shared.infrastructure.observability.metrics import MetricsRegistry
+from shared.infrastructure.security.metrics import SecurityMetrics
+
+CONCURRENCY = 100
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _RotatingRefresher(TokenPairRefresher):
+    """Like the auth provider: a refresh token is good for one refresh."""
+
+    def __init__(self, delay: float = 0.01) -> None:
+        self.delay = delay
+        self.calls = 0
+        self._used: set[str] = set()
+
+    @property
+    def access_token_expiry_seconds(self) -> int:
+        return 300
+
+    async def refresh(self, refresh_token_id: str) -> tuple[str, str]:
+        self.calls += 1
+        call = self.calls
+        await asyncio.sleep(self.delay)
+        if refresh_token_id in self._used:
+            msg = "Refresh token already used."
+            raise RefreshTokenNotFoundError(msg)
+        self._used.add(refresh_token_id)
+        return f"access-{call}", f"refresh-{call}"
+
+
+def _outcomes(registry: MetricsRegistry) -> dict[str, float]:
+    return {
+        s["labels"]["outcome"]: s["value"]
+        for s in registry.snapshot()["auth_token_refreshes_total"]["samples"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_of_one_token_share_one_call() -> None:
+    registry = MetricsRegistry()
+    refresher = _RotatingRefresher()
+    sut = SingleFlightTokenPairRefresher(refresher, metrics=SecurityMetrics(registry))
+
+    pairs = await asyncio.gather(*(sut.refresh("rt") for _ in range(CONCURRENCY)))
+
+    assert refresher.calls == 1
+    assert set(pairs) == {("access-1", "refresh-1")}
+    assert _outcomes(registry) == {"started": 1.0, "coalesced": CONCURRENCY - 1.0}
+
+
+@pytest.mark.asyncio
+async def test_without_single_flight_all_but_one_concurrent_refresh_fail() -> None:
+    refresher = _RotatingRefresher()
+
+    results = await asyncio.gather(
+        *(refresher.refresh("rt") for _ in range(CONCURRENCY)),
+        return_exceptions=True,
+    )
+
+    failures = [r for r in results if isinstance(r, RefreshTokenNotFoundError)]
+    assert refresher.calls == CONCURRENCY
+    assert len(failures) == CONCURRENCY - 1
+
+
+@pytest.mark.asyncio
+async def test_reuses_the_pair_within_the_grace_window() -> None:
+    clock = _Clock()
+    refresher = _RotatingRefresher(delay=0)
+    sut = SingleFlightTokenPairRefresher(refresher, grace=10.0, clock=clock)
+    first = await sut.refresh("rt")
+
+    clock.now = 9.9
+    assert await sut.refresh("rt") == first
+    assert refresher.calls == 1
+
+    clock.now = 10.0
+    with pytest.raises(RefreshTokenNotFoundError):
+        await sut.refresh("rt")
+    assert refresher.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_zero_grace_disables_reuse() -> None:
+    refresher = _RotatingRefresher(delay=0)
+    sut = SingleFlightTokenPairRefresher(refresher, grace=0)
+    await sut.refresh("rt")
+
+    with pytest.raises(RefreshTokenNotFoundError):
+        await sut.refresh("rt")
+
+
+@pytest.mark.asyncio
+async def test_failure_reaches_every_waiter_and_is_not_kept() -> None:
+    registry = MetricsRegistry()
+    refresher = _RotatingRefresher()
+    await refresher.refresh("used")
+    sut = SingleFlightTokenPairRefresher(refresher, metrics=SecurityMetrics(registry))
+
+    results = await asyncio.gather(
+        *(sut.refresh("used") for _ in range(CONCURRENCY)),
+        return_exceptions=True,
+    )
+    with pytest.raises(RefreshTokenNotFoundError):
+        await sut.refresh("used")
+
+    assert all(isinstance(r, RefreshTokenNotFoundError) for r in results)
+    assert refresher.calls == 3
+    assert _outcomes(registry) == {
+        "started": 2.0,
+        "coalesced": CONCURRENCY - 1.0,
+        "failed": 2.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_distinct_tokens_refresh_independently() -> None:
+    refresher = _RotatingRefresher()
+    sut = SingleFlightTokenPairRefresher(refresher)
+
+    first, second = await asyncio.gather(sut.refresh("a"), sut.refresh("b"))
+
+    assert refresher.calls == 2
+    assert first != second
+
+
+@pytest.mark.asyncio
+async def test_a_cancelled_caller_does_not_cancel_the_shared_refresh() -> None:
+    refresher = _RotatingRefresher(delay=0.05)
+    sut = SingleFlightTokenPairRefresher(refresher)
+    abandoned = asyncio.create_task(sut.refresh("rt"))
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(sut.refresh("rt"))
+    await asyncio.sleep(0)
+
+    abandoned.cancel()
+
+    assert await waiting == ("access-1", "refresh-1")
+    assert abandoned.cancelled()
+    assert refresher.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_a_failure_nobody_waits_for_is_not_reported_as_unretrieved() -> None:
+    loop = asyncio.get_running_loop()
+    reported: list[dict[str, object]] = []
+    loop.set_exception_handler(lambda _, context: reported.append(context))
+    refresher = _RotatingRefresher(delay=0.01)
+    await refresher.refresh("used")
+    sut = SingleFlightTokenPairRefresher(refresher)
+    caller = asyncio.create_task(sut.refresh("used"))
+    await asyncio.sleep(0)
+
+    caller.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await caller
+    await asyncio.sleep(0.05)
+    del caller
+    gc.collect()
+
+    loop.set_exception_handler(None)
+    assert refresher.calls == 2
+    assert not sut._in_flight
+    assert reported == []
+
+
+def test_keeps_the_wrapped_expiry() -> None:
+    sut = SingleFlightTokenPairRefresher(_RotatingRefresher())
+
+    assert sut.access_token_expiry_seconds == 300
@@ -1,10 +1,14 @@
-from unittest.mock import MagicMock, Mock
+import json
+from collections.abc import Callable
+from unittest.mock import AsyncMock, Mock
 from uuid import UUID
 
+import httpx
 import pytest
 from gotrue.errors import AuthApiError
 
 from account.application.log_in.handler import AuthenticationError
+from account.domain.account.enums import AccountRole
 from account.domain.account.errors import EmailAlreadyExistsError
 from account.domain.account.value_objects import Email, RawPassword
 from account.infrastructure.security.errors import (
@@ -12,9 +16,11 @@ from account.infrastructure.security.errors import (
     RefreshTokenNotFoundError,
 )
 from account.infrastructure.security.supabase_auth_adapter import (
+    SupabaseAccessClaimsPublisher,
     SupabaseAccessRevoker,
     SupabaseAccountProvisioner,
     SupabasePasswordResetter,
+    SupabaseTokenEndpoint,
     SupabaseTokenPairIssuer,
     SupabaseTokenPairRefresher,
 )
@@ -24,13 +30,13 @@ from shared.domain.account_id import AccountId
 class TestSupabaseAccountProvisioner:
     @pytest.mark.asyncio
     async def test_register_creates_user_and_returns_account_id(self) -> None:
-        client = MagicMock()
+        client = AsyncMock()
         user_id = "00000000-0000-0000-0000-000000000001"
         mock_user = Mock()
         mock_user.id = user_id
         mock_response = Mock()
         mock_response.user = mock_user
-        client.auth.admin.create_user.return_value = mock_response
+        client.admin.create_user.return_value = mock_response
 
         sut = SupabaseAccountProvisioner(client)
         result = await sut.register(
@@ -38,12 +44,12 @@ class TestSupabaseAccountProvisioner:
         )
 
         assert result == AccountId(UUID(user_id))
-        client.auth.admin.create_user.assert_called_once()
+        client.admin.create_user.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_register_raises_email_already_exists_error(self) -> None:
-        client = MagicMock()
-        client.auth.admin.create_user.side_effect = AuthApiError(
+        client = AsyncMock()
+        client.admin.create_user.side_effect = AuthApiError(
             "User already been registered", 422, "user_already_exists"
         )
 
@@ -55,16 +61,75 @@ class TestSupabaseAccountProvisioner:
             )
 
 
+def _token_endpoint(
+    handler: Callable[[httpx.Request], httpx.Response],
+) -> SupabaseTokenEndpoint:
+    return SupabaseTokenEndpoint(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        url="http://auth.test/auth/v1",
+        headers={"apikey": "service-key"},
+    )
+
+
+class TestSupabaseTokenEndpoint:
+    @pytest.mark.asyncio
+    async def test_grant_posts_to_token_endpoint_and_parses_session(self) -> None:
+        requests: list[httpx.Request] = []
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "access_token": "access-token",
+                    "refresh_token": "refresh-token",
+                    "expires_in": 3600,
+                    "token_type": "bearer",
+                    "user": {
+                        "id": "00000000-0000-0000-0000-000000000001",
+                        "app_metadata": {},
+                        "user_metadata": {},
+                        "aud": "authenticated",
+                        "created_at": "2026-01-01T00:00:00Z",
+                    },
+                },
+            )
+
+        sut = _token_endpoint(handle)
+        session = await sut.grant("refresh_token", {"refresh_token": "old"})
+
+        assert session is not None
+        assert session.access_token == "access-token"  # noqa: S105
+        [request] = requests
+        assert str(request.url) == (
+            "http://auth.test/auth/v1/token?grant_type=refresh_token"
+        )
+        assert request.headers["apikey"] == "service-key"
+        assert request.headers["X-Supabase-Api-Version"] == "2024-01-01"
+        assert json.loads(request.content) == {"refresh_token": "old"}
+
+    @pytest.mark.asyncio
+    async def test_grant_raises_auth_api_error_on_rejection(self) -> None:
+        def handle(_: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                400,
+                json={"code": 400, "error_code": "invalid_grant", "msg": "bad"},
+            )
+
+        sut = _token_endpoint(handle)
+
+        with pytest.raises(AuthApiError):
+            await sut.grant("password", {"email": "a@b.c", "password": "x"})
+
+
 class TestSupabaseTokenPairIssuer:
     @pytest.mark.asyncio
     async def test_issue_token_pair_returns_tokens(self) -> None:
-        client = MagicMock()
+        client = AsyncMock()
         mock_session = Mock()
         mock_session.access_token = "access-token"  # noqa: S105
         mock_session.refresh_token = "refresh-token"  # noqa: S105
-        mock_response = Mock()
-        mock_response.session = mock_session
-        client.auth.sign_in_with_password.return_value = mock_response
+        client.grant.return_value = mock_session
 
         sut = SupabaseTokenPairIssuer(client, access_token_expiry_s=3600)
         access, refresh = await sut.issue_token_pair(
@@ -74,11 +139,14 @@ class TestSupabaseTokenPairIssuer:
         assert access == "access-token"
         assert refresh == "refresh-token"
         assert sut.access_token_expiry_seconds == 3600
+        client.grant.assert_awaited_once_with(
+            "password", {"email": "test@example.com", "password": "password123"}
+        )
 
     @pytest.mark.asyncio
     async def test_issue_token_pair_raises_authentication_error(self) -> None:
-        client = MagicMock()
-        client.auth.sign_in_with_password.side_effect = AuthApiError(
+        client = AsyncMock()
+        client.grant.side_effect = AuthApiError(
             "Invalid login credentials", 400, "invalid_credentials"
         )
 
@@ -93,24 +161,25 @@ class TestSupabaseTokenPairIssuer:
 class TestSupabaseTokenPairRefresher:
     @pytest.mark.asyncio
     async def test_refresh_returns_new_token_pair(self) -> None:
-        client = MagicMock()
+        client = AsyncMock()
         mock_session = Mock()
         mock_session.access_token = "new-access"  # noqa: S105
         mock_session.refresh_token = "new-refresh"  # noqa: S105
-        mock_response = Mock()
-        mock_response.session = mock_session
-        client.auth.refresh_session.return_value = mock_response
+        client.grant.return_value = mock_session
 
         sut = SupabaseTokenPairRefresher(client, access_token_expiry_s=3600)
         access, refresh = await sut.refresh("old-refresh")
 
         assert access == "new-access"
         assert refresh == "new-refresh"
+        client.grant.assert_awaited_once_with(
+            "refresh_token", {"refresh_token": "old-refresh"}
+        )
 
     @pytest.mark.asyncio
     async def test_refresh_raises_expired_error(self) -> None:
-        client = MagicMock()
-        client.auth.refresh_session.side_effect = AuthApiError(
+        client = AsyncMock()
+        client.grant.side_effect = AuthApiError(
             "Token expired", 401, "flow_state_expired"
         )
 
@@ -121,10 +190,8 @@ class TestSupabaseTokenPairRefresher:
 
     @pytest.mark.asyncio
     async def test_refresh_raises_not_found_error(self) -> None:
-        client = MagicMock()
-        client.auth.refresh_session.side_effect = AuthApiError(
-            "Invalid token", 401, "bad_jwt"
-        )
+        client = AsyncMock()
+        client.grant.side_effect = AuthApiError("Invalid token", 401, "bad_jwt")
 
         sut = SupabaseTokenPairRefresher(client, access_token_expiry_s=3600)
 
@@ -135,38 +202,56 @@ class TestSupabaseTokenPairRefresher:
 class TestSupabaseAccessRevoker:
     @pytest.mark.asyncio
     async def test_revoke_calls_admin_sign_out(self) -> None:
-        client = MagicMock()
+        client = AsyncMock()
         account_id = AccountId(UUID("00000000-0000-0000-0000-000000000001"))
 
         sut = SupabaseAccessRevoker(client)
         await sut.remove_all_account_access(account_id)
 
-        client.auth.admin.sign_out.assert_called_once_with(
+        client.admin.sign_out.assert_awaited_once_with(
             str(account_id.value), scope="global"
         )
 
     @pytest.mark.asyncio
-    async def test_revoke_swallows_auth_api_error(self) -> None:
-        client = MagicMock()
-        client.auth.admin.sign_out.side_effect = AuthApiError(
+    async def test_revoke_raises_auth_api_error(self) -> None:
+        client = AsyncMock()
+        client.admin.sign_out.side_effect = AuthApiError(
             "error", 500, "unexpected_failure"
         )
         account_id = AccountId(UUID("00000000-0000-0000-0000-000000000001"))
 
         sut = SupabaseAccessRevoker(client)
-        await sut.remove_all_account_access(account_id)
+        with pytest.raises(AuthApiError):
+            await sut.remove_all_account_access(account_id)
 
 
 class TestSupabasePasswordResetter:
     @pytest.mark.asyncio
     async def test_reset_password_calls_admin_update(self) -> None:
-        client = MagicMock()
+        client = AsyncMock()
         account_id = AccountId(UUID("00000000-0000-0000-0000-000000000001"))
 
         sut = SupabasePasswordResetter(client)
         await sut.reset_password(account_id, RawPassword("new-password"))
 
-        client.auth.admin.update_user_by_id.assert_called_once_with(
+        client.admin.update_user_by_id.assert_awaited_once_with(
             str(account_id.value),
             {"password": "new-password"},
         )
+
+
+class TestSupabaseAccessClaimsPublisher:
+    @pytest.mark.asyncio
+    async def test_writes_role_and_status_to_app_metadata(self) -> None:
+        client = AsyncMock()
+        account_id = AccountId(UUID("00000000-0000-0000-0000-000000000001"))
+
+        sut = SupabaseAccessClaimsPublisher(client)
+        await sut.publish_access_claims(
+            account_id, role=AccountRole.ADMIN, is_active=False
+        )
+
+        client.admin.update_user_by_id.assert_awaited_once_with(
+            str(account_id.value),
+            {"app_metadata": {"role": "admin", "is_active": False}},
+        )
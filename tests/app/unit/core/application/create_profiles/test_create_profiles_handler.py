@@ -0,0 +1,41 @@
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+
+from core.application.create_profiles.command import CreateProfilesCommand
+from core.application.create_profiles.handler import CreateProfilesHandler
+from core.application.shared.core_unit_of_work import CoreUnitOfWork
+from core.domain.profile.entity import Profile
+from core.domain.profile.ports import ProfileIdGenerator
+from core.domain.profile.repository import ProfileRepository
+from tests.app.unit.factories.value_objects import create_account_id, create_profile_id
+
+
+@pytest.mark.asyncio
+async def test_creates_all_profiles_with_one_save_and_commit() -> None:
+    profile_id_generator = create_autospec(ProfileIdGenerator, instance=True)
+    profile_repository = create_autospec(ProfileRepository, instance=True)
+    core_unit_of_work = create_autospec(CoreUnitOfWork, instance=True)
+
+    profile_ids = [create_profile_id() for _ in range(3)]
+    account_ids = [create_account_id() for _ in range(3)]
+    command = CreateProfilesCommand(account_ids=tuple(a.value for a in account_ids))
+
+    cast(MagicMock, profile_id_generator.generate).side_effect = profile_ids
+
+    sut = CreateProfilesHandler(
+        profile_id_generator=cast(ProfileIdGenerator, profile_id_generator),
+        profile_repository=cast(ProfileRepository, profile_repository),
+        core_unit_of_work=cast(CoreUnitOfWork, core_unit_of_work),
+    )
+
+    await sut.execute(command)
+
+    cast(AsyncMock, profile_repository.save_many).assert_awaited_once()
+    saved: list[Profile] = cast(AsyncMock, profile_repository.save_many).call_args[0][0]
+    assert [p.id_ for p in saved] == profile_ids
+    assert [p.account_id for p in saved] == account_ids
+    assert all(p.username is None for p in saved)
+    cast(AsyncMock, profile_repository.save).assert_not_awaited()
+    cast(AsyncMock, core_unit_of_work.commit).assert_awaited_once()
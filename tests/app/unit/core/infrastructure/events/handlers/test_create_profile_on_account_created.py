@@ -8,28 +8,56 @@ from account.domain.account.enums import AccountRole
 from account.domain.account.events import AccountCreated
 from core.application.create_profile.command import CreateProfileCommand
 from core.application.create_profile.port import CreateProfileUseCase
+from core.application.create_profiles.command import CreateProfilesCommand
+from core.application.create_profiles.port import CreateProfilesUseCase
 from core.infrastructure.events.handlers.create_profile_on_account_created import (
     CreateProfileOnAccountCreated,
 )
+from shared.infrastructure.events.registry import supports_batch
 
 
-@pytest.mark.asyncio
-async def test_delegates_to_create_profile_use_case() -> None:
+def _make_sut() -> tuple[CreateProfileOnAccountCreated, AsyncMock, AsyncMock]:
     create_profile = create_autospec(CreateProfileUseCase, instance=True)
-    account_id = uuid4()
+    create_profiles = create_autospec(CreateProfilesUseCase, instance=True)
+    sut = CreateProfileOnAccountCreated(
+        create_profile=cast(CreateProfileUseCase, create_profile),
+        create_profiles=cast(CreateProfilesUseCase, create_profiles),
+    )
+    return sut, create_profile, create_profiles
 
-    event = AccountCreated(
-        account_id=account_id,
+
+def _account_created() -> AccountCreated:
+    return AccountCreated(
+        account_id=uuid4(),
         email="alice@example.com",
         role=AccountRole.USER,
     )
 
-    sut = CreateProfileOnAccountCreated(
-        create_profile=cast(CreateProfileUseCase, create_profile),
-    )
+
+@pytest.mark.asyncio
+async def test_delegates_to_create_profile_use_case() -> None:
+    sut, create_profile, _ = _make_sut()
+    event = _account_created()
 
     await sut.handle(event)
 
     cast(AsyncMock, create_profile.execute).assert_awaited_once_with(
-        CreateProfileCommand(account_id=account_id),
+        CreateProfileCommand(account_id=event.account_id),
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_delegates_to_create_profiles_use_case() -> None:
+    sut, create_profile, create_profiles = _make_sut()
+    events = [_account_created() for _ in range(3)]
+
+    await sut.handle_batch(events)
+
+    cast(AsyncMock, create_profiles.execute).assert_awaited_once_with(
+        CreateProfilesCommand(account_ids=tuple(e.account_id for e in events)),
     )
+    cast(AsyncMock, create_profile.execute).assert_not_awaited()
+
+
+def test_is_registered_as_batch_handler() -> None:
+    assert supports_batch(CreateProfileOnAccountCreated)
@@ -2,11 +2,14 @@ from typing import cast
 from unittest.mock import AsyncMock, create_autospec
 
 import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.infrastructure.persistence.sqla_profile_repository import (
     SqlaProfileRepository,
 )
+from shared.infrastructure.persistence.errors import DataMapperError
 from shared.infrastructure.persistence.types_ import MainAsyncSession
 from tests.app.unit.factories.profile_entity import create_profile
 
@@ -48,3 +51,41 @@ class TestSqlaProfileRepositorySave:
         await repo.save(profile)
 
         assert session.merge.await_count == 2
+
+
+class TestSqlaProfileRepositorySaveMany:
+    @pytest.mark.asyncio
+    async def test_inserts_all_profiles_in_one_statement(self) -> None:
+        session = _make_session()
+        repo = SqlaProfileRepository(session=cast(MainAsyncSession, session))
+        profiles = [create_profile(), create_profile()]
+
+        await repo.save_many(profiles)
+
+        session.execute.assert_awaited_once()
+        compiled = session.execute.call_args[0][0].compile(
+            dialect=postgresql.dialect()  # type: ignore[no-untyped-call]
+        )
+        assert str(compiled).startswith("INSERT INTO profiles")
+        assert "ON CONFLICT (account_id) DO NOTHING" in str(compiled)
+        assert compiled.params["account_id_m0"] == profiles[0].account_id.value
+        assert compiled.params["account_id_m1"] == profiles[1].account_id.value
+        session.merge.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_empty_list_skips_the_database(self) -> None:
+        session = _make_session()
+        repo = SqlaProfileRepository(session=cast(MainAsyncSession, session))
+
+        await repo.save_many([])
+
+        session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_wraps_database_errors(self) -> None:
+        session = _make_session()
+        session.execute.side_effect = SQLAlchemyError("boom")
+        repo = SqlaProfileRepository(session=cast(MainAsyncSession, session))
+
+        with pytest.raises(DataMapperError):
+            await repo.save_many([create_profile()])
@@ -0,0 +1,45 @@
+from typing import cast
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from shared.application.export_outbox_metrics.handler import (
+    ExportOutboxMetricsHandler,
+)
+from shared.application.outbox_metrics_reader import OutboxMetricsReader
+from shared.domain.errors import AuthorizationError
+from shared.domain.ports.authorization_guard import AuthorizationGuard
+
+
+@pytest.mark.asyncio
+async def test_admin_gets_metrics_text() -> None:
+    authorization_guard = create_autospec(AuthorizationGuard, instance=True)
+    metrics_reader = create_autospec(OutboxMetricsReader, instance=True)
+    cast(AsyncMock, metrics_reader.render_text).return_value = "outbox_backlog 1.0\n"
+
+    sut = ExportOutboxMetricsHandler(
+        authorization_guard=cast(AuthorizationGuard, authorization_guard),
+        metrics_reader=cast(OutboxMetricsReader, metrics_reader),
+    )
+
+    assert await sut.execute() == "outbox_backlog 1.0\n"
+    cast(AsyncMock, authorization_guard.require_admin).assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_non_admin_raises_authorization_error() -> None:
+    authorization_guard = create_autospec(AuthorizationGuard, instance=True)
+    metrics_reader = create_autospec(OutboxMetricsReader, instance=True)
+    cast(AsyncMock, authorization_guard.require_admin).side_effect = AuthorizationError(
+        "Insufficient permissions."
+    )
+
+    sut = ExportOutboxMetricsHandler(
+        authorization_guard=cast(AuthorizationGuard, authorization_guard),
+        metrics_reader=cast(OutboxMetricsReader, metrics_reader),
+    )
+
+    with pytest.raises(AuthorizationError):
+        await sut.execute()
+
+    cast(AsyncMock, metrics_reader.render_text).assert_not_awaited()
@@ -0,0 +1,44 @@
+from typing import cast
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from shared.application.get_outbox_lanes.handler import GetOutboxLanesHandler
+from shared.application.outbox_lane_monitor import LaneBacklog, OutboxLaneMonitor
+from shared.domain.errors import AuthorizationError
+from shared.domain.ports.authorization_guard import AuthorizationGuard
+
+
+@pytest.mark.asyncio
+async def test_admin_gets_lane_backlogs() -> None:
+    authorization_guard = create_autospec(AuthorizationGuard, instance=True)
+    lane_monitor = create_autospec(OutboxLaneMonitor, instance=True)
+    backlogs = [LaneBacklog(lane="default", backlog=3, lag_s=1.5)]
+    cast(AsyncMock, lane_monitor.backlogs).return_value = backlogs
+
+    sut = GetOutboxLanesHandler(
+        authorization_guard=cast(AuthorizationGuard, authorization_guard),
+        lane_monitor=cast(OutboxLaneMonitor, lane_monitor),
+    )
+
+    assert await sut.execute() == backlogs
+    cast(AsyncMock, authorization_guard.require_admin).assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_non_admin_raises_authorization_error() -> None:
+    authorization_guard = create_autospec(AuthorizationGuard, instance=True)
+    lane_monitor = create_autospec(OutboxLaneMonitor, instance=True)
+    cast(AsyncMock, authorization_guard.require_admin).side_effect = AuthorizationError(
+        "Insufficient permissions."
+    )
+
+    sut = GetOutboxLanesHandler(
+        authorization_guard=cast(AuthorizationGuard, authorization_guard),
+        lane_monitor=cast(OutboxLaneMonitor, lane_monitor),
+    )
+
+    with pytest.raises(AuthorizationError):
+        await sut.execute()
+
+    cast(AsyncMock, lane_monitor.backlogs).assert_not_awaited()
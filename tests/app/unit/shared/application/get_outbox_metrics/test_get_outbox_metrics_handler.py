@@ -0,0 +1,52 @@
+from typing import cast
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from shared.application.get_outbox_metrics.handler import GetOutboxMetricsHandler
+from shared.application.outbox_lane_monitor import LaneBacklog
+from shared.application.outbox_metrics_reader import (
+    OutboxMetricsReader,
+    OutboxMetricsReport,
+)
+from shared.domain.errors import AuthorizationError
+from shared.domain.ports.authorization_guard import AuthorizationGuard
+
+
+@pytest.mark.asyncio
+async def test_admin_gets_metrics_report() -> None:
+    authorization_guard = create_autospec(AuthorizationGuard, instance=True)
+    metrics_reader = create_autospec(OutboxMetricsReader, instance=True)
+    report = OutboxMetricsReport(
+        lanes=[LaneBacklog(lane="default", backlog=3, lag_s=1.5)],
+        delivered_per_s={"AccountCreated": 2.0},
+        metrics={},
+    )
+    cast(AsyncMock, metrics_reader.read).return_value = report
+
+    sut = GetOutboxMetricsHandler(
+        authorization_guard=cast(AuthorizationGuard, authorization_guard),
+        metrics_reader=cast(OutboxMetricsReader, metrics_reader),
+    )
+
+    assert await sut.execute() == report
+    cast(AsyncMock, authorization_guard.require_admin).assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_non_admin_raises_authorization_error() -> None:
+    authorization_guard = create_autospec(AuthorizationGuard, instance=True)
+    metrics_reader = create_autospec(OutboxMetricsReader, instance=True)
+    cast(AsyncMock, authorization_guard.require_admin).side_effect = AuthorizationError(
+        "Insufficient permissions."
+    )
+
+    sut = GetOutboxMetricsHandler(
+        authorization_guard=cast(AuthorizationGuard, authorization_guard),
+        metrics_reader=cast(OutboxMetricsReader, metrics_reader),
+    )
+
+    with pytest.raises(AuthorizationError):
+        await sut.execute()
+
+    cast(AsyncMock, metrics_reader.read).assert_not_awaited()
@@ -0,0 +1,54 @@
+from typing import cast
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from shared.application.dead_letter_queue import DeadLetterQueue
+from shared.application.replay_dead_letters.command import ReplayDeadLettersCommand
+from shared.application.replay_dead_letters.handler import ReplayDeadLettersHandler
+from shared.domain.errors import AuthorizationError
+from shared.domain.ports.authorization_guard import AuthorizationGuard
+
+
+@pytest.mark.asyncio
+async def test_admin_replays_dead_letters() -> None:
+    authorization_guard = create_autospec(AuthorizationGuard, instance=True)
+    dead_letter_queue = create_autospec(DeadLetterQueue, instance=True)
+    cast(AsyncMock, dead_letter_queue.replay).return_value = 3
+
+    sut = ReplayDeadLettersHandler(
+        authorization_guard=cast(AuthorizationGuard, authorization_guard),
+        dead_letter_queue=cast(DeadLetterQueue, dead_letter_queue),
+    )
+
+    result = await sut.execute(
+        ReplayDeadLettersCommand(event_type="AccountCreated", limit=10)
+    )
+
+    assert result == 3
+    cast(AsyncMock, authorization_guard.require_admin).assert_awaited_once_with(
+        for_update=True
+    )
+    cast(AsyncMock, dead_letter_queue.replay).assert_awaited_once_with(
+        event_type="AccountCreated",
+        limit=10,
+    )
+
+
+@pytest.mark.asyncio
+async def test_non_admin_raises_authorization_error() -> None:
+    authorization_guard = create_autospec(AuthorizationGuard, instance=True)
+    dead_letter_queue = create_autospec(DeadLetterQueue, instance=True)
+    cast(AsyncMock, authorization_guard.require_admin).side_effect = AuthorizationError(
+        "Insufficient permissions."
+    )
+
+    sut = ReplayDeadLettersHandler(
+        authorization_guard=cast(AuthorizationGuard, authorization_guard),
+        dead_letter_queue=cast(DeadLetterQueue, dead_letter_queue),
+    )
+
+    with pytest.raises(AuthorizationError):
+        await sut.execute(ReplayDeadLettersCommand(event_type=None, limit=10))
+
+    cast(AsyncMock, dead_letter_queue.replay).assert_not_awaited()
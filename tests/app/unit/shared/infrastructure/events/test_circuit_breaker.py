@@ -0,0 +1,127 @@
+from shared.infrastructure.events.circuit_breaker import (
+    CircuitState,
+    HandlerCircuitBreakers,
+)
+from shared.infrastructure.events.handler_policy import HandlerPolicies, HandlerPolicy
+
+
+class _Flaky:
+    pass
+
+
+class _Healthy:
+    pass
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breakers(
+    clock: _Clock,
+    transitions: list[tuple[type, CircuitState]] | None = None,
+    failures: int = 2,
+) -> HandlerCircuitBreakers:
+    policy = HandlerPolicy(breaker_failures=failures, breaker_cool_off=30.0)
+    return HandlerCircuitBreakers(
+        HandlerPolicies(policy),
+        on_transition=(
+            None if transitions is None else lambda h, s: transitions.append((h, s))
+        ),
+        clock=clock,
+    )
+
+
+def test_opens_after_consecutive_failures_only_for_that_handler() -> None:
+    transitions: list[tuple[type, CircuitState]] = []
+    sut = _breakers(_Clock(), transitions)
+
+    sut.record_failure(_Flaky)
+    assert sut.allow(_Flaky)
+    sut.record_failure(_Flaky)
+
+    assert not sut.allow(_Flaky)
+    assert sut.allow(_Healthy)
+    assert sut.retry_after(_Flaky) == 30.0
+    assert transitions == [(_Flaky, CircuitState.OPEN)]
+
+
+def test_success_resets_the_failure_count() -> None:
+    sut = _breakers(_Clock())
+
+    sut.record_failure(_Flaky)
+    sut.record_success(_Flaky)
+    sut.record_failure(_Flaky)
+
+    assert sut.state(_Flaky) is CircuitState.CLOSED
+
+
+def test_half_open_admits_a_single_trial_that_closes_it() -> None:
+    clock = _Clock()
+    transitions: list[tuple[type, CircuitState]] = []
+    sut = _breakers(clock, transitions)
+    sut.record_failure(_Flaky)
+    sut.record_failure(_Flaky)
+
+    clock.now += 30.0
+
+    assert sut.allow(_Flaky)
+    assert not sut.allow(_Flaky)
+    sut.record_success(_Flaky)
+    assert sut.allow(_Flaky)
+    assert [state for _, state in transitions] == [
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.CLOSED,
+    ]
+
+
+def test_failed_trial_reopens_for_another_cool_off() -> None:
+    clock = _Clock()
+    sut = _breakers(clock)
+    sut.record_failure(_Flaky)
+    sut.record_failure(_Flaky)
+    clock.now += 30.0
+    assert sut.allow(_Flaky)
+
+    sut.record_failure(_Flaky)
+
+    assert sut.state(_Flaky) is CircuitState.OPEN
+    assert sut.retry_after(_Flaky) == 30.0
+
+
+def test_released_trial_lets_another_one_through() -> None:
+    clock = _Clock()
+    sut = _breakers(clock)
+    sut.record_failure(_Flaky)
+    sut.record_failure(_Flaky)
+    clock.now += 30.0
+    assert sut.allow(_Flaky)
+
+    sut.release_trial(_Flaky)
+
+    assert sut.state(_Flaky) is CircuitState.HALF_OPEN
+    assert sut.allow(_Flaky)
+    assert not sut.allow(_Flaky)
+
+
+def test_zero_failures_never_opens() -> None:
+    sut = _breakers(_Clock(), failures=0)
+
+    for _ in range(100):
+        sut.record_failure(_Flaky)
+
+    assert sut.allow(_Flaky)
+
+
+def test_policies_apply_per_handler_class_name() -> None:
+    default = HandlerPolicy()
+    strict = HandlerPolicy(timeout=1.0, breaker_failures=1)
+    policies = HandlerPolicies(default, {"_Flaky": strict})
+
+    assert policies.for_handler(_Flaky) is strict
+    assert policies.for_handler(_Healthy) is default
@@ -1,3 +1,4 @@
+from typing import Any
 from unittest.mock import MagicMock, create_autospec
 from uuid import uuid4
 
@@ -7,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from account.domain.account.enums import AccountRole
 from account.domain.account.events import AccountActivated, AccountCreated
 from shared.infrastructure.events.dispatcher import OutboxEventDispatcher
-from shared.infrastructure.persistence.mappers.outbox import OutboxRecord
+from shared.infrastructure.events.fast_path import PostCommitDelivery
 
 
 @pytest.fixture
@@ -20,9 +21,16 @@ def dispatcher(mock_session: MagicMock) -> OutboxEventDispatcher:
     return OutboxEventDispatcher(session=mock_session)
 
 
+def _inserted_rows(mock_session: MagicMock) -> list[dict[str, Any]]:
+    stmt, rows = mock_session.execute.call_args_list[0][0]
+    assert stmt.is_insert
+    assert stmt.table.name == "outbox"
+    return rows  # type: ignore[no-any-return]
+
+
 class TestOutboxEventDispatcher:
     @pytest.mark.asyncio
-    async def test_single_event_adds_one_record(
+    async def test_single_event_inserts_one_row(
         self, dispatcher: OutboxEventDispatcher, mock_session: MagicMock
     ) -> None:
         event = AccountCreated(
@@ -31,15 +39,14 @@ class TestOutboxEventDispatcher:
 
         await dispatcher.dispatch([event])
 
-        mock_session.add.assert_called_once()
-        record = mock_session.add.call_args[0][0]
-        assert isinstance(record, OutboxRecord)
-        assert record.event_type == "AccountCreated"
-        assert record.delivered is False
-        assert record.retry_count == 0
+        mock_session.add.assert_not_called()
+        [row] = _inserted_rows(mock_session)
+        assert row["event_type"] == "AccountCreated"
+        assert row["delivered"] is False
+        assert row["retry_count"] == 0
 
     @pytest.mark.asyncio
-    async def test_multiple_events_add_multiple_records(
+    async def test_multiple_events_share_one_insert(
         self, dispatcher: OutboxEventDispatcher, mock_session: MagicMock
     ) -> None:
         events = [
@@ -49,7 +56,12 @@ class TestOutboxEventDispatcher:
 
         await dispatcher.dispatch(events)
 
-        assert mock_session.add.call_count == 2
+        rows = _inserted_rows(mock_session)
+        assert [row["event_type"] for row in rows] == [
+            "AccountCreated",
+            "AccountActivated",
+        ]
+        assert len({row["id"] for row in rows}) == 2
 
     @pytest.mark.asyncio
     async def test_does_not_flush_or_commit(
@@ -71,6 +83,7 @@ class TestOutboxEventDispatcher:
         await dispatcher.dispatch([])
 
         mock_session.add.assert_not_called()
+        mock_session.execute.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_record_event_type_matches_class_name(
@@ -80,11 +93,11 @@ class TestOutboxEventDispatcher:
 
         await dispatcher.dispatch([event])
 
-        record = mock_session.add.call_args[0][0]
-        assert record.event_type == "AccountActivated"
+        [row] = _inserted_rows(mock_session)
+        assert row["event_type"] == "AccountActivated"
 
     @pytest.mark.asyncio
-    async def test_record_payload_is_json_string(
+    async def test_record_payload_is_json_object(
         self, dispatcher: OutboxEventDispatcher, mock_session: MagicMock
     ) -> None:
         event = AccountCreated(
@@ -93,9 +106,9 @@ class TestOutboxEventDispatcher:
 
         await dispatcher.dispatch([event])
 
-        record = mock_session.add.call_args[0][0]
-        assert isinstance(record.payload, str)
-        assert "a@b.com" in record.payload
+        [row] = _inserted_rows(mock_session)
+        assert row["payload"]["email"] == "a@b.com"
+        assert row["payload"]["account_id"] == str(event.account_id)
 
     @pytest.mark.asyncio
     async def test_record_occurred_at_from_event(
@@ -107,5 +120,76 @@ class TestOutboxEventDispatcher:
 
         await dispatcher.dispatch([event])
 
-        record = mock_session.add.call_args[0][0]
-        assert record.occurred_at == event.occurred_at
+        [row] = _inserted_rows(mock_session)
+        assert row["occurred_at"] == event.occurred_at
+
+    @pytest.mark.asyncio
+    async def test_entries_are_due_by_the_database_clock(
+        self, dispatcher: OutboxEventDispatcher, mock_session: MagicMock
+    ) -> None:
+        event = AccountCreated(
+            account_id=uuid4(), email="a@b.com", role=AccountRole.USER
+        )
+
+        await dispatcher.dispatch([event])
+
+        [row] = _inserted_rows(mock_session)
+        stmt = mock_session.execute.call_args_list[0][0][0]
+        sql = str(stmt.compile(column_keys=list(row)))
+        assert "next_attempt_at" not in row
+        assert sql.endswith(
+            ", next_attempt_at) VALUES (:id, :event_type, "
+            ":payload, :occurred_at, :delivered, :retry_count, "
+            ":aggregate_id, now())"
+        )
+
+    @pytest.mark.asyncio
+    async def test_record_aggregate_id_from_event(
+        self, dispatcher: OutboxEventDispatcher, mock_session: MagicMock
+    ) -> None:
+        event = AccountActivated(account_id=uuid4(), aggregate_id="Account:1")
+
+        await dispatcher.dispatch([event])
+
+        [row] = _inserted_rows(mock_session)
+        assert row["aggregate_id"] == "Account:1"
+
+    @pytest.mark.asyncio
+    async def test_notifies_relay_once_per_dispatch(
+        self, dispatcher: OutboxEventDispatcher, mock_session: MagicMock
+    ) -> None:
+        events = [
+            AccountCreated(account_id=uuid4(), email="a@b.com", role=AccountRole.USER),
+            AccountActivated(account_id=uuid4()),
+        ]
+
+        await dispatcher.dispatch(events)
+
+        assert mock_session.execute.await_count == 2
+        stmt = mock_session.execute.call_args[0][0]
+        assert "pg_notify" in str(stmt)
+
+    @pytest.mark.asyncio
+    async def test_empty_events_list_does_not_notify(
+        self, dispatcher: OutboxEventDispatcher, mock_session: MagicMock
+    ) -> None:
+        await dispatcher.dispatch([])
+
+        mock_session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_tracks_written_ids_for_post_commit_delivery(
+        self, mock_session: MagicMock
+    ) -> None:
+        post_commit = create_autospec(PostCommitDelivery, instance=True)
+        dispatcher = OutboxEventDispatcher(mock_session, post_commit)
+        events = [
+            AccountCreated(account_id=uuid4(), email="a@b.com", role=AccountRole.USER),
+            AccountActivated(account_id=uuid4()),
+        ]
+
+        await dispatcher.dispatch(events)
+
+        post_commit.track.assert_called_once_with([
+            row["id"] for row in _inserted_rows(mock_session)
+        ])
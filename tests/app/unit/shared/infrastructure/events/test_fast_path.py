@@ -0,0 +1,136 @@
+import asyncio
+from collections.abc import Sequence
+from typing import cast
+from unittest.mock import AsyncMock, create_autospec
+from uuid import UUID, uuid4
+
+import pytest
+
+from shared.infrastructure.events.fast_path import OutboxFastPath, PostCommitDelivery
+from shared.infrastructure.events.relay import OutboxRelay, _delivering
+
+
+class _FakeRelay:
+    def __init__(self, latency: float = 0.0, error: Exception | None = None) -> None:
+        self.latency = latency
+        self.error = error
+        self.delivered: list[list[UUID]] = []
+
+    async def deliver(self, ids: Sequence[UUID]) -> int:
+        await asyncio.sleep(self.latency)
+        if self.error is not None:
+            raise self.error
+        self.delivered.append(list(ids))
+        return len(ids)
+
+
+def _fast_path(relay: _FakeRelay, wait: float = 1.0) -> OutboxFastPath:
+    fast_path = OutboxFastPath(wait=wait)
+    fast_path.attach(cast(OutboxRelay, relay))
+    return fast_path
+
+
+class TestOutboxFastPath:
+    @pytest.mark.asyncio
+    async def test_without_relay_does_nothing(self) -> None:
+        fast_path = OutboxFastPath()
+
+        await fast_path.deliver([uuid4()])
+
+        assert not fast_path._tasks
+
+    @pytest.mark.asyncio
+    async def test_waits_for_delivery_when_asked(self) -> None:
+        relay = _FakeRelay(latency=0.01)
+        ids = [uuid4(), uuid4()]
+
+        await _fast_path(relay).deliver(ids, wait=True)
+
+        assert relay.delivered == [ids]
+
+    @pytest.mark.asyncio
+    async def test_delivers_in_background_by_default(self) -> None:
+        relay = _FakeRelay(latency=0.01)
+        fast_path = _fast_path(relay)
+
+        await fast_path.deliver([uuid4()])
+
+        assert relay.delivered == []
+        await asyncio.gather(*fast_path._tasks)
+        assert len(relay.delivered) == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_delivery_continues_in_background(self) -> None:
+        relay = _FakeRelay(latency=0.1)
+        fast_path = _fast_path(relay, wait=0.01)
+
+        await fast_path.deliver([uuid4()], wait=True)
+
+        assert relay.delivered == []
+        await asyncio.gather(*fast_path._tasks)
+        assert len(relay.delivered) == 1
+
+    @pytest.mark.asyncio
+    async def test_does_not_wait_inside_relay_delivery(self) -> None:
+        relay = _FakeRelay(latency=0.1)
+        fast_path = _fast_path(relay)
+
+        token = _delivering.set(True)
+        try:
+            await fast_path.deliver([uuid4()], wait=True)
+        finally:
+            _delivering.reset(token)
+
+        assert relay.delivered == []
+        await fast_path.close()
+
+    @pytest.mark.asyncio
+    async def test_delivery_failure_is_left_to_the_relay(self) -> None:
+        relay = _FakeRelay(error=RuntimeError("database unavailable"))
+
+        await _fast_path(relay).deliver([uuid4()], wait=True)
+
+        assert relay.delivered == []
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_in_flight_deliveries(self) -> None:
+        relay = _FakeRelay(latency=10.0)
+        fast_path = _fast_path(relay, wait=0)
+        await fast_path.deliver([uuid4()])
+        [task] = fast_path._tasks
+
+        await fast_path.close()
+
+        assert task.cancelled()
+        await fast_path.deliver([uuid4()])
+        assert not fast_path._tasks
+
+
+class TestPostCommitDelivery:
+    @pytest.mark.asyncio
+    async def test_committed_hands_over_tracked_ids_once(self) -> None:
+        fast_path = create_autospec(OutboxFastPath, instance=True)
+        post_commit = PostCommitDelivery(fast_path)
+        first, second = uuid4(), uuid4()
+
+        post_commit.track([first])
+        post_commit.track([second])
+        await post_commit.committed(wait=True)
+        await post_commit.committed()
+
+        deliveries = cast(AsyncMock, fast_path.deliver).await_args_list
+        assert deliveries[0].args == ([first, second],)
+        assert deliveries[0].kwargs == {"wait": True}
+        assert deliveries[1].args == ([],)
+        assert deliveries[1].kwargs == {"wait": False}
+
+    @pytest.mark.asyncio
+    async def test_discard_drops_tracked_ids(self) -> None:
+        fast_path = create_autospec(OutboxFastPath, instance=True)
+        post_commit = PostCommitDelivery(fast_path)
+
+        post_commit.track([uuid4()])
+        post_commit.discard()
+        await post_commit.committed()
+
+        cast(AsyncMock, fast_path.deliver).assert_awaited_once_with([], wait=False)
@@ -0,0 +1,94 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from shared.infrastructure.events.lanes import DEFAULT_LANE, OutboxLane, OutboxLanes
+
+_PG_DIALECT = postgresql.dialect()  # type: ignore[no-untyped-call]
+
+
+def _lane(name: str, *event_types: str) -> OutboxLane:
+    return OutboxLane(
+        name=name,
+        event_types=frozenset(event_types),
+        batch_size=10,
+        concurrency=2,
+        workers=1,
+    )
+
+
+@pytest.fixture
+def lanes() -> OutboxLanes:
+    return OutboxLanes(
+        _lane(DEFAULT_LANE),
+        [
+            _lane("accounts", "AccountCreated"),
+            _lane("bulk", "ProfilePatchApplied", "ProfileUpdated"),
+        ],
+    )
+
+
+def test_routes_listed_event_types_to_their_lane(lanes: OutboxLanes) -> None:
+    assert lanes.lane_for("AccountCreated").name == "accounts"
+    assert lanes.lane_for("ProfileUpdated").name == "bulk"
+
+
+def test_unlisted_event_types_go_to_the_default_lane(lanes: OutboxLanes) -> None:
+    assert lanes.lane_for("AccountActivated") is lanes.default
+
+
+def test_default_lane_filter_excludes_every_routed_type(lanes: OutboxLanes) -> None:
+    in_lane = lanes.claim_filter(lanes.default)
+
+    assert in_lane is not None
+    compiled = in_lane.compile(dialect=_PG_DIALECT)
+    assert "NOT IN" in str(compiled)
+    assert compiled.params["event_type_1"] == [
+        "AccountCreated",
+        "ProfilePatchApplied",
+        "ProfileUpdated",
+    ]
+
+
+def test_without_routed_lanes_the_default_lane_is_unfiltered() -> None:
+    lanes = OutboxLanes(_lane(DEFAULT_LANE))
+
+    assert lanes.claim_filter(lanes.default) is None
+
+
+def test_totals_fold_event_types_into_lanes(lanes: OutboxLanes) -> None:
+    totals = lanes.totals([
+        ("ProfilePatchApplied", 900, 42.0),
+        ("ProfileUpdated", 100, 3.0),
+        ("AccountActivated", 2, 1.5),
+    ])
+
+    assert totals == {
+        DEFAULT_LANE: (2, 1.5),
+        "accounts": (0, 0.0),
+        "bulk": (1000, 42.0),
+    }
+
+
+@pytest.mark.parametrize(
+    ("default", "routed"),
+    [
+        pytest.param(_lane(DEFAULT_LANE, "AccountCreated"), [], id="typed_default"),
+        pytest.param(_lane(DEFAULT_LANE), [_lane("empty")], id="untyped_lane"),
+        pytest.param(
+            _lane(DEFAULT_LANE),
+            [_lane("a", "AccountCreated"), _lane("b", "AccountCreated")],
+            id="type_in_two_lanes",
+        ),
+        pytest.param(
+            _lane(DEFAULT_LANE),
+            [_lane(DEFAULT_LANE, "AccountCreated")],
+            id="duplicate_name",
+        ),
+    ],
+)
+def test_rejects_ambiguous_lanes(
+    default: OutboxLane,
+    routed: list[OutboxLane],
+) -> None:
+    with pytest.raises(ValueError, match="lane"):
+        OutboxLanes(default, routed)
@@ -0,0 +1,98 @@
+from datetime import UTC, datetime, timedelta
+from typing import cast
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from shared.application.outbox_lane_monitor import LaneBacklog, OutboxLaneMonitor
+from shared.infrastructure.events.metrics import OutboxMetricsCollector, RelayMetrics
+from shared.infrastructure.observability.metrics import MetricsRegistry
+
+
+def test_delivered_per_second_counts_only_the_recent_window() -> None:
+    metrics = RelayMetrics(MetricsRegistry(), rate_window=10.0)
+    now = datetime.now(UTC)
+
+    metrics.delivered([("A", now), ("A", now), ("B", now)])
+    assert metrics.delivered_per_second() == {"A": 0.2, "B": 0.1}
+
+    metrics._recent[0] = (metrics._recent[0][0] - 60.0, "A")
+    assert metrics.delivered_per_second() == {"A": 0.1, "B": 0.1}
+
+
+def test_delivery_lag_is_measured_from_occurrence() -> None:
+    registry = MetricsRegistry()
+    metrics = RelayMetrics(registry)
+
+    metrics.delivered([("A", datetime.now(UTC) - timedelta(seconds=20))])
+
+    [sample] = registry.snapshot()["outbox_delivery_lag_seconds"]["samples"]
+    assert sample["sum"] == pytest.approx(20.0, abs=1.0)
+    assert sample["p50"] == 30.0
+
+
+@pytest.mark.asyncio
+async def test_collector_refreshes_backlog_gauges_before_reading() -> None:
+    registry = MetricsRegistry()
+    lane_monitor = create_autospec(OutboxLaneMonitor, instance=True)
+    lanes = [
+        LaneBacklog(lane="default", backlog=4, lag_s=2.5),
+        LaneBacklog(lane="bulk", backlog=0, lag_s=0.0),
+    ]
+    cast(AsyncMock, lane_monitor.backlogs).return_value = lanes
+    collector = OutboxMetricsCollector(
+        lane_monitor=cast(OutboxLaneMonitor, lane_monitor),
+        relay_metrics=RelayMetrics(registry),
+        registry=registry,
+    )
+
+    report = await collector.read()
+
+    assert report.lanes == lanes
+    assert report.delivered_per_s == {}
+    assert report.metrics["outbox_lag_seconds"]["samples"] == [
+        {"labels": {"lane": "bulk"}, "value": 0.0},
+        {"labels": {"lane": "default"}, "value": 2.5},
+    ]
+    assert 'outbox_backlog{lane="default"} 4.0' in await collector.render_text()
+
+
+@pytest.mark.asyncio
+async def test_collector_reuses_a_recent_backlog_refresh() -> None:
+    registry = MetricsRegistry()
+    lane_monitor = create_autospec(OutboxLaneMonitor, instance=True)
+    cast(AsyncMock, lane_monitor.backlogs).return_value = [
+        LaneBacklog(lane="default", backlog=1, lag_s=0.5),
+    ]
+    relay_metrics = RelayMetrics(registry, backlog_max_age=60.0)
+
+    def collector() -> OutboxMetricsCollector:
+        return OutboxMetricsCollector(
+            lane_monitor=cast(OutboxLaneMonitor, lane_monitor),
+            relay_metrics=relay_metrics,
+            registry=registry,
+        )
+
+    await collector().render_text()
+    await collector().read()
+    assert cast(AsyncMock, lane_monitor.backlogs).await_count == 1
+
+    relay_metrics._backlog_refreshed_at -= 60.0
+    await collector().render_text()
+    assert cast(AsyncMock, lane_monitor.backlogs).await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_collector_exports_only_relay_metrics() -> None:
+    registry = MetricsRegistry()
+    registry.counter("auth_revocations_total", "Revocations.").inc()
+    lane_monitor = create_autospec(OutboxLaneMonitor, instance=True)
+    cast(AsyncMock, lane_monitor.backlogs).return_value = []
+    collector = OutboxMetricsCollector(
+        lane_monitor=cast(OutboxLaneMonitor, lane_monitor),
+        relay_metrics=RelayMetrics(registry),
+        registry=registry,
+    )
+
+    assert "auth_" not in await collector.render_text()
+    assert "auth_revocations_total" not in (await collector.read()).metrics
@@ -11,6 +11,7 @@ from shared.infrastructure.events.registry import (
     get_handlers_for,
     handles,
     register_event,
+    supports_batch,
 )
 
 
@@ -54,6 +55,20 @@ class TestHandlesDecorator:
 
         assert get_event_class("_TestEvent") is _TestEvent
 
+    def test_recognizes_batch_handlers(self) -> None:
+        @handles(_TestEvent)
+        class SingleHandler:
+            async def handle(self, event: _TestEvent) -> None: ...
+
+        @handles(_TestEvent)
+        class BulkHandler:
+            async def handle(self, event: _TestEvent) -> None: ...
+
+            async def handle_batch(self, events: list[_TestEvent]) -> None: ...
+
+        assert not supports_batch(SingleHandler)
+        assert supports_batch(BulkHandler)
+
     def test_multiple_event_types_registered(self) -> None:
         @handles(_TestEvent, _AnotherTestEvent)
         class MultiHandler:
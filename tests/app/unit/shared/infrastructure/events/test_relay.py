@@ -2,19 +2,30 @@ import asyncio
 import contextlib
 from collections.abc import Generator
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from typing import Any, ClassVar
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from shared.domain.domain_event import DomainEvent
+from shared.infrastructure.events.circuit_breaker import CircuitState
+from shared.infrastructure.events.handler_policy import HandlerPolicies, HandlerPolicy
+from shared.infrastructure.events.lanes import DEFAULT_LANE, OutboxLane, OutboxLanes
+from shared.infrastructure.events.metrics import RelayMetrics
 from shared.infrastructure.events.registry import (
+    _batch_handlers,
     _event_type_registry,
     _registry,
 )
-from shared.infrastructure.events.relay import OutboxRelay
+from shared.infrastructure.events.relay import OutboxRelay, handler_key
+from shared.infrastructure.observability.metrics import MetricsRegistry
 from shared.infrastructure.persistence.mappers.outbox import OutboxRecord
+from shared.infrastructure.persistence.types_ import MainAsyncSession
+
+_PG_DIALECT = postgresql.dialect()  # type: ignore[no-untyped-call]
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -22,6 +33,11 @@ class _RelayTestEvent(DomainEvent):
     value: str
 
 
+@dataclass(frozen=True, kw_only=True)
+class _UrgentEvent(DomainEvent):
+    value: str
+
+
 class _RelayTestHandler:
     def __init__(self) -> None:
         self.handled_events: list[DomainEvent] = []
@@ -40,6 +56,7 @@ class _FailingHandler:
 def _register_test_event() -> Generator[None]:
     saved_registry = dict(_registry)
     saved_type_registry = dict(_event_type_registry)
+    saved_batch_handlers = set(_batch_handlers)
 
     _event_type_registry["_RelayTestEvent"] = _RelayTestEvent
     _registry[_RelayTestEvent] = [_RelayTestHandler]
@@ -50,26 +67,33 @@ def _register_test_event() -> Generator[None]:
     _registry.update(saved_registry)
     _event_type_registry.clear()
     _event_type_registry.update(saved_type_registry)
+    _batch_handlers.clear()
+    _batch_handlers.update(saved_batch_handlers)
 
 
 def _make_outbox_record(
     event_type: str = "_RelayTestEvent",
-    payload: str = (
-        '{"value": "test", "event_id": "abc",'
-        ' "occurred_at": "2026-01-01T00:00:00+00:00"}'
-    ),
+    payload: dict[str, Any] | None = None,
     retry_count: int = 0,
+    aggregate_id: str | None = None,
 ) -> OutboxRecord:
     return OutboxRecord(
         id=uuid4(),
         event_type=event_type,
-        payload=payload,
+        payload=_payload("test") if payload is None else payload,
         occurred_at=datetime.now(UTC),
         delivered=False,
         retry_count=retry_count,
+        aggregate_id=aggregate_id,
     )
 
 
+def _payload(
+    value: str, occurred_at: str = "2026-01-01T00:00:00+00:00"
+) -> dict[str, Any]:
+    return {"value": value, "event_id": value, "occurred_at": occurred_at}
+
+
 def _make_mock_session(entries: list[OutboxRecord]) -> AsyncMock:
     session = AsyncMock()
     result_mock = MagicMock()
@@ -139,8 +163,8 @@ async def test_processes_undelivered_entry() -> None:
     await relay._poll()
 
     assert len(handler_instance.handled_events) == 1
-    # Select + update
-    assert session.execute.call_count == 2
+    # Select + progress lookup + update
+    assert session.execute.call_count == 3
     session.commit.assert_awaited()
 
 
@@ -174,8 +198,8 @@ async def test_handler_failure_increments_retry() -> None:
     relay = _make_relay(container, session_factory)
     await relay._poll()
 
-    # Select + retry update
-    assert session.execute.call_count == 2
+    # Select + progress lookup + retry update
+    assert session.execute.call_count == 3
     session.commit.assert_awaited()
 
 
@@ -209,6 +233,1019 @@ async def test_no_handlers_marks_delivered() -> None:
     relay = _make_relay(container, session_factory)
     await relay._poll()
 
-    # Select + update (mark delivered)
-    assert session.execute.call_count == 2
+    # Select + progress lookup + update (mark delivered)
+    assert session.execute.call_count == 3
     session.commit.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_claim_uses_skip_locked_and_batch_limit() -> None:
+    session = _make_mock_session([])
+    session_factory = _FakeSessionFactory(session)
+    container = _FakeContainer(AsyncMock())
+
+    relay = OutboxRelay(
+        container=container,  # type: ignore[arg-type]
+        session_factory=session_factory,  # type: ignore[arg-type]
+        batch_size=7,
+    )
+    await relay._poll()
+
+    compiled = session.execute.call_args[0][0].compile(dialect=_PG_DIALECT)
+    assert "FOR UPDATE SKIP LOCKED" in str(compiled)
+    assert "locked_until" in str(compiled)
+    assert compiled.params["param_1"] == 7
+
+
+@pytest.mark.asyncio
+async def test_claim_returns_only_delivery_columns() -> None:
+    session = _make_mock_session([])
+    relay = _make_relay(_FakeContainer(AsyncMock()), _FakeSessionFactory(session))
+
+    await relay._poll()
+
+    compiled = session.execute.call_args[0][0].compile(dialect=_PG_DIALECT)
+    returning = str(compiled).split("RETURNING", 1)[1]
+    assert "outbox.payload" in returning
+    assert "outbox.delivered_at" not in returning
+
+
+@pytest.mark.asyncio
+async def test_claimed_entries_processed_in_occurred_at_order() -> None:
+    later = _make_outbox_record(
+        payload=_payload("later", occurred_at="2026-01-01T00:00:01+00:00"),
+    )
+    earlier = _make_outbox_record(
+        payload=_payload("earlier"),
+    )
+    earlier.occurred_at = later.occurred_at - timedelta(seconds=1)
+    session = _make_mock_session([later, earlier])
+    session_factory = _FakeSessionFactory(session)
+
+    handler_instance = _RelayTestHandler()
+    child_scope = AsyncMock()
+    child_scope.get = AsyncMock(return_value=handler_instance)
+    container = _FakeContainer(child_scope)
+
+    relay = _make_relay(container, session_factory)
+    processed = await relay._poll()
+
+    assert processed == 2
+    assert [e.value for e in handler_instance.handled_events] == [  # type: ignore[attr-defined]
+        "earlier",
+        "later",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_starts_configured_number_of_workers() -> None:
+    relay = OutboxRelay(
+        container=_FakeContainer(AsyncMock()),  # type: ignore[arg-type]
+        session_factory=_FakeSessionFactory(AsyncMock()),  # type: ignore[arg-type]
+        workers=3,
+    )
+    started = 0
+
+    async def fake_work(*_: object) -> None:
+        nonlocal started
+        started += 1
+        await asyncio.sleep(0)
+
+    relay._work = fake_work  # type: ignore[method-assign, assignment]
+    await relay.run()
+
+    assert started == 3
+
+
+@pytest.mark.asyncio
+async def test_notify_wakes_idle_worker_before_poll_interval() -> None:
+    session = _make_mock_session([])
+    relay = OutboxRelay(
+        container=_FakeContainer(AsyncMock()),  # type: ignore[arg-type]
+        session_factory=_FakeSessionFactory(session),  # type: ignore[arg-type]
+        poll_interval=60.0,
+        min_poll_interval=60.0,
+    )
+
+    task = asyncio.create_task(relay._work())
+    await asyncio.sleep(0.01)
+    assert session.execute.call_count == 1
+
+    relay.notify()
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+    assert session.execute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_idle_polling_backs_off_up_to_poll_interval() -> None:
+    relay = _make_relay(_FakeContainer(AsyncMock()), _FakeSessionFactory(AsyncMock()))
+    relay._min_poll_interval = 1.0
+    relay._poll_interval = 4.0
+    relay._poll = AsyncMock(side_effect=[0, 0, 0, 0, asyncio.CancelledError])  # type: ignore[method-assign]
+    delays: list[float] = []
+
+    async def fake_wait(delay: float, *_: object) -> None:
+        delays.append(delay)
+        await asyncio.sleep(0)
+
+    relay._wait_for_work = fake_wait  # type: ignore[method-assign, assignment]
+    with contextlib.suppress(asyncio.CancelledError):
+        await relay._work()
+
+    assert delays == [1.0, 2.0, 4.0, 4.0]
+
+
+@pytest.mark.asyncio
+async def test_backlog_resets_idle_delay() -> None:
+    relay = _make_relay(_FakeContainer(AsyncMock()), _FakeSessionFactory(AsyncMock()))
+    relay._min_poll_interval = 1.0
+    relay._poll_interval = 8.0
+    relay._poll = AsyncMock(side_effect=[0, 0, 1, asyncio.CancelledError])  # type: ignore[method-assign]
+    delays: list[float] = []
+
+    async def fake_wait(delay: float, *_: object) -> None:
+        delays.append(delay)
+        await asyncio.sleep(0)
+
+    relay._wait_for_work = fake_wait  # type: ignore[method-assign, assignment]
+    with contextlib.suppress(asyncio.CancelledError):
+        await relay._work()
+
+    assert delays == [1.0, 2.0, 1.0]
+
+
+class _SelectiveHandler:
+    async def handle(self, event: _RelayTestEvent) -> None:
+        if event.value == "bad":
+            msg = "Handler failure"
+            raise RuntimeError(msg)
+
+
+@pytest.mark.asyncio
+async def test_batch_acknowledged_with_set_based_updates_and_one_commit() -> None:
+    good = [_make_outbox_record(), _make_outbox_record()]
+    bad = _make_outbox_record(
+        payload=_payload("bad"),
+    )
+    session = _make_mock_session([*good, bad])
+
+    _registry[_RelayTestEvent] = [_SelectiveHandler]
+    child_scope = AsyncMock()
+    child_scope.get = AsyncMock(return_value=_SelectiveHandler())
+
+    relay = _make_relay(_FakeContainer(child_scope), _FakeSessionFactory(session))
+    await relay._poll()
+
+    # Claim + progress lookup + one delivered update + one retry update
+    assert session.execute.call_count == 4
+    # Claim commit + acknowledgement commit
+    assert session.commit.await_count == 2
+
+    delivered_stmt = session.execute.call_args_list[2][0][0]
+    delivered_params = delivered_stmt.compile(dialect=_PG_DIALECT).params
+    assert set(delivered_params["any_1"]) == {entry.id for entry in good}
+    assert delivered_params["delivered"] is True
+
+    retry_stmt = session.execute.call_args_list[3][0][0]
+    retry_sql = str(retry_stmt.compile(dialect=_PG_DIALECT))
+    assert "retry_count=(outbox.retry_count +" in retry_sql
+    assert retry_stmt.compile(dialect=_PG_DIALECT).params["any_1"] == [bad.id]
+
+
+@pytest.mark.asyncio
+async def test_undeserializable_entry_counts_as_failed() -> None:
+    entry = _make_outbox_record(event_type="UnknownEvent")
+    session = _make_mock_session([entry])
+    relay = _make_relay(_FakeContainer(AsyncMock()), _FakeSessionFactory(session))
+
+    await relay._poll()
+
+    retry_stmt = session.execute.call_args_list[2][0][0]
+    assert "retry_count" in str(retry_stmt)
+
+
+class _BlockingHandler:
+    """Records start/finish per event and waits on a shared release gate."""
+
+    active = 0
+    peak = 0
+    log: ClassVar[list[str]] = []
+    gate: ClassVar[asyncio.Event]
+
+    async def handle(self, event: _RelayTestEvent) -> None:
+        cls = type(self)
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        cls.log.append(f"start:{event.value}")
+        await cls.gate.wait()
+        cls.log.append(f"end:{event.value}")
+        cls.active -= 1
+
+
+@pytest.fixture
+def blocking_handler() -> type[_BlockingHandler]:
+    _BlockingHandler.active = 0
+    _BlockingHandler.peak = 0
+    _BlockingHandler.log = []
+    _BlockingHandler.gate = asyncio.Event()
+    _registry[_RelayTestEvent] = [_BlockingHandler]
+    return _BlockingHandler
+
+
+def _relay_for(
+    entries: list[OutboxRecord],
+    handler: object,
+    concurrency: int = 10,
+) -> tuple[OutboxRelay, AsyncMock]:
+    session = _make_mock_session(entries)
+    child_scope = AsyncMock()
+    child_scope.get = AsyncMock(return_value=handler)
+    relay = OutboxRelay(
+        container=_FakeContainer(child_scope),  # type: ignore[arg-type]
+        session_factory=_FakeSessionFactory(session),  # type: ignore[arg-type]
+        concurrency=concurrency,
+    )
+    return relay, session
+
+
+@pytest.mark.asyncio
+async def test_different_aggregates_are_delivered_concurrently(
+    blocking_handler: type[_BlockingHandler],
+) -> None:
+    entries = [
+        _make_outbox_record(payload=_payload(f"e{n}"), aggregate_id=f"A:{n}")
+        for n in range(4)
+    ]
+    relay, _ = _relay_for(entries, blocking_handler())
+
+    task = asyncio.create_task(relay._poll())
+    await asyncio.sleep(0.01)
+    blocking_handler.gate.set()
+
+    assert await task == 4
+    assert blocking_handler.peak == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrency_bounds_in_flight_handlers(
+    blocking_handler: type[_BlockingHandler],
+) -> None:
+    entries = [
+        _make_outbox_record(payload=_payload(f"e{n}"), aggregate_id=f"A:{n}")
+        for n in range(5)
+    ]
+    relay, _ = _relay_for(entries, blocking_handler(), concurrency=2)
+
+    task = asyncio.create_task(relay._poll())
+    await asyncio.sleep(0.01)
+    blocking_handler.gate.set()
+    await task
+
+    assert blocking_handler.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_same_aggregate_entries_are_delivered_in_order(
+    blocking_handler: type[_BlockingHandler],
+) -> None:
+    first = _make_outbox_record(payload=_payload("first"), aggregate_id="A:1")
+    second = _make_outbox_record(payload=_payload("second"), aggregate_id="A:1")
+    second.occurred_at = first.occurred_at + timedelta(seconds=1)
+    relay, _ = _relay_for([second, first], blocking_handler())
+
+    task = asyncio.create_task(relay._poll())
+    await asyncio.sleep(0.01)
+    assert blocking_handler.log == ["start:first"]
+    blocking_handler.gate.set()
+    await task
+
+    assert blocking_handler.log == [
+        "start:first",
+        "end:first",
+        "start:second",
+        "end:second",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failure_defers_later_entries_of_the_same_aggregate() -> None:
+    bad = _make_outbox_record(payload=_payload("bad"), aggregate_id="A:1")
+    held_back = _make_outbox_record(payload=_payload("next"), aggregate_id="A:1")
+    held_back.occurred_at = bad.occurred_at + timedelta(seconds=1)
+    other = _make_outbox_record(payload=_payload("other"), aggregate_id="A:2")
+    _registry[_RelayTestEvent] = [_SelectiveHandler]
+    relay, session = _relay_for([bad, held_back, other], _SelectiveHandler())
+
+    await relay._poll()
+
+    # Claim + progress lookup + delivered + retry + release of the deferred entry
+    assert session.execute.call_count == 5
+    delivered_stmt, retry_stmt, release_stmt = (
+        call[0][0] for call in session.execute.call_args_list[2:]
+    )
+    assert delivered_stmt.compile(dialect=_PG_DIALECT).params["any_1"] == [other.id]
+    assert retry_stmt.compile(dialect=_PG_DIALECT).params["any_1"] == [bad.id]
+    release = release_stmt.compile(dialect=_PG_DIALECT)
+    assert release.params["any_1"] == [held_back.id]
+    assert "retry_count" not in str(release)
+
+
+@pytest.mark.asyncio
+async def test_claim_skips_entries_behind_an_in_flight_predecessor() -> None:
+    session = _make_mock_session([])
+    relay = _make_relay(_FakeContainer(AsyncMock()), _FakeSessionFactory(session))
+
+    await relay._poll()
+
+    claim_sql = str(session.execute.call_args[0][0].compile(dialect=_PG_DIALECT))
+    assert "NOT (EXISTS" in claim_sql
+    assert "earlier.aggregate_id = outbox.aggregate_id" in claim_sql
+    assert "prior.id NOT IN (SELECT candidates.id" in claim_sql
+
+
+@pytest.mark.asyncio
+async def test_claim_reads_only_due_entries_in_due_order() -> None:
+    session = _make_mock_session([])
+    relay = _make_relay(_FakeContainer(AsyncMock()), _FakeSessionFactory(session))
+
+    await relay._poll()
+
+    claim_sql = str(session.execute.call_args[0][0].compile(dialect=_PG_DIALECT))
+    assert "outbox.next_attempt_at <= now()" in claim_sql
+    assert "ORDER BY outbox.next_attempt_at, outbox.occurred_at" in claim_sql
+    assert "retry_count <" not in claim_sql
+
+
+@pytest.mark.asyncio
+async def test_deliver_claims_only_the_given_entries() -> None:
+    entry = _make_outbox_record()
+    session = _make_mock_session([entry])
+    handler_instance = _RelayTestHandler()
+    child_scope = AsyncMock()
+    child_scope.get = AsyncMock(return_value=handler_instance)
+    relay = _make_relay(_FakeContainer(child_scope), _FakeSessionFactory(session))
+
+    delivered = await relay.deliver([entry.id])
+
+    claim = session.execute.call_args_list[0][0][0].compile(dialect=_PG_DIALECT)
+    claim_sql = str(claim)
+    assert "FOR UPDATE SKIP LOCKED" in claim_sql
+    assert "AND outbox.id = any(%(any_1)s) ORDER BY" in claim_sql
+    assert claim.params["any_1"] == [entry.id]
+    # Entries held back behind one outside the given ids are not candidates.
+    assert "earlier.id != all(%(all_1)s)" in claim_sql
+    assert claim.params["all_1"] == [entry.id]
+    assert delivered == 1
+    assert len(handler_instance.handled_events) == 1
+
+
+@pytest.mark.asyncio
+async def test_deliver_without_ids_does_not_touch_the_database() -> None:
+    session = _make_mock_session([])
+    relay = _make_relay(_FakeContainer(AsyncMock()), _FakeSessionFactory(session))
+
+    assert await relay.deliver([]) == 0
+
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failure_reschedules_with_exponential_backoff() -> None:
+    entry = _make_outbox_record(retry_count=1)
+    _registry[_RelayTestEvent] = [_FailingHandler]
+    relay, session = _relay_for([entry], _FailingHandler())
+
+    await relay._poll()
+
+    # Claim + completed handlers lookup + retry update
+    retry = session.execute.call_args_list[2][0][0].compile(dialect=_PG_DIALECT)
+    assert "next_attempt_at=(now() + least(" in str(retry)
+    assert "power(" in str(retry)
+    assert "random()" in str(retry)
+
+
+@pytest.mark.asyncio
+async def test_exhausted_entry_moves_to_dead_letters() -> None:
+    entry = _make_outbox_record(retry_count=2, aggregate_id="A:1")
+    _registry[_RelayTestEvent] = [_FailingHandler]
+    relay, session = _relay_for([entry], _FailingHandler())
+    relay._max_retries = 3
+
+    await relay._poll()
+
+    # Claim + completed handlers lookup + dead-letter insert + outbox delete
+    assert session.execute.call_count == 4
+    insert_call, delete_call = session.execute.call_args_list[2:]
+    assert insert_call[0][0].table.name == "outbox_dead_letter"
+    [row] = insert_call[0][1]
+    assert row["id"] == entry.id
+    assert row["retry_count"] == 3
+    assert "_FailingHandler" in row["last_error"]
+    assert row["aggregate_id"] == "A:1"
+    deleted = delete_call[0][0].compile(dialect=_PG_DIALECT)
+    assert str(deleted).startswith("DELETE FROM outbox ")
+    assert deleted.params["any_1"] == [entry.id]
+
+
+class _SecondHandler:
+    calls: ClassVar[int] = 0
+
+    async def handle(self, event: _RelayTestEvent) -> None:
+        type(self).calls += 1
+        await asyncio.sleep(0)
+
+
+class _ByTypeContainer:
+    """Resolves each handler type to a fresh instance."""
+
+    def __call__(self, **kwargs: object) -> "_ByTypeContainer":
+        return self
+
+    async def __aenter__(self) -> "_ByTypeContainer":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    async def get(self, handler_type: type) -> object:
+        return handler_type()
+
+
+@pytest.mark.asyncio
+async def test_partial_failure_records_handlers_that_succeeded() -> None:
+    entry = _make_outbox_record()
+    session = _make_mock_session([entry])
+    _registry[_RelayTestEvent] = [_SecondHandler, _FailingHandler]
+    relay = OutboxRelay(
+        container=_ByTypeContainer(),  # type: ignore[arg-type]
+        session_factory=_FakeSessionFactory(session),  # type: ignore[arg-type]
+    )
+
+    await relay._poll()
+
+    # Claim + progress lookup + retry update + handler progress
+    assert session.execute.call_count == 4
+    progress = session.execute.call_args_list[3][0][0].compile(dialect=_PG_DIALECT)
+    assert "INSERT INTO outbox_handler_delivery" in str(progress)
+    assert "ON CONFLICT DO NOTHING" in str(progress)
+    assert progress.params["outbox_id_m0"] == entry.id
+    assert progress.params["handler_m0"] == handler_key(_SecondHandler)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "retry_count",
+    [
+        pytest.param(1, id="retried"),
+        # Replayed dead letters come back with a fresh retry count.
+        pytest.param(0, id="replayed"),
+    ],
+)
+async def test_redelivery_runs_only_handlers_that_have_not_succeeded(
+    retry_count: int,
+) -> None:
+    entry = _make_outbox_record(retry_count=retry_count)
+    session = _make_mock_session([entry])
+    completed = MagicMock()
+    completed.all.return_value = [(entry.id, handler_key(_SecondHandler))]
+    claimed = session.execute.return_value
+    session.execute = AsyncMock(
+        side_effect=[claimed, completed, MagicMock(), MagicMock()]
+    )
+    _registry[_RelayTestEvent] = [_SecondHandler, _RelayTestHandler]
+    _SecondHandler.calls = 0
+    relay = OutboxRelay(
+        container=_ByTypeContainer(),  # type: ignore[arg-type]
+        session_factory=_FakeSessionFactory(session),  # type: ignore[arg-type]
+    )
+
+    await relay._poll()
+
+    assert _SecondHandler.calls == 0
+    lookup = session.execute.call_args_list[1][0][0].compile(dialect=_PG_DIALECT)
+    assert "FROM outbox_handler_delivery" in str(lookup)
+    assert lookup.params["any_1"] == [entry.id]
+    delivered = session.execute.call_args_list[2][0][0].compile(dialect=_PG_DIALECT)
+    assert delivered.params["delivered"] is True
+    cleanup = session.execute.call_args_list[3][0][0].compile(dialect=_PG_DIALECT)
+    assert str(cleanup).startswith("DELETE FROM outbox_handler_delivery")
+
+
+class _SessionPerCallFactory:
+    """Hands out the claim session first, then a fresh mock session per call."""
+
+    def __init__(self, claim_session: AsyncMock) -> None:
+        self.sessions = [claim_session]
+        self.calls: list[dict[str, object]] = []
+
+    def __call__(self, **kwargs: object) -> _FakeSessionFactory:
+        self.calls.append(kwargs)
+        if len(self.calls) > 1:
+            self.sessions.append(_make_mock_session([]))
+        return _FakeSessionFactory(self.sessions[-1])
+
+
+class _CachingContainer(_ByTypeContainer):
+    """Records every scope opened; handlers are cached per scope, as in Dishka."""
+
+    def __init__(self) -> None:
+        self.contexts: list[object] = []
+        self._handlers: dict[type, object] = {}
+
+    def __call__(self, **kwargs: object) -> "_CachingContainer":
+        self.contexts.append(kwargs.get("context"))
+        self._handlers = {}
+        return self
+
+    async def get(self, handler_type: type) -> object:
+        return self._handlers.setdefault(handler_type, handler_type())
+
+
+class _RecordingHandler:
+    values: ClassVar[list[str]] = []
+
+    async def handle(self, event: _RelayTestEvent) -> None:
+        if event.value == "bad":
+            msg = "Handler failure"
+            raise RuntimeError(msg)
+        self.values.append(event.value)
+
+
+def _batch_scoped_relay(
+    entries: list[OutboxRecord],
+) -> tuple[OutboxRelay, _SessionPerCallFactory, _CachingContainer]:
+    _registry[_RelayTestEvent] = [_RecordingHandler]
+    _RecordingHandler.values = []
+    session_factory = _SessionPerCallFactory(_make_mock_session(entries))
+    container = _CachingContainer()
+    relay = OutboxRelay(
+        container=container,  # type: ignore[arg-type]
+        session_factory=session_factory,  # type: ignore[arg-type]
+        batch_scope=True,
+    )
+    return relay, session_factory, container
+
+
+@pytest.mark.asyncio
+async def test_batch_scope_shares_one_scope_and_transaction() -> None:
+    entries = [_make_outbox_record(payload=_payload(f"e{n}")) for n in range(3)]
+    relay, session_factory, container = _batch_scoped_relay(entries)
+
+    await relay._poll()
+
+    claim, batch, handlers = session_factory.sessions
+    assert _RecordingHandler.values == ["e0", "e1", "e2"]
+    # One scope for the batch, with its session bound to the batch transaction.
+    assert container.contexts == [{MainAsyncSession: handlers}]
+    assert session_factory.calls[2] == {
+        "bind": batch.connection.return_value,
+        "join_transaction_mode": "create_savepoint",
+    }
+    # Acknowledged in the batch transaction; the claim session only claims
+    # and looks up progress.
+    delivered = batch.execute.call_args[0][0].compile(dialect=_PG_DIALECT)
+    assert delivered.params["delivered"] is True
+    batch.commit.assert_awaited_once()
+    assert claim.execute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_scope_falls_back_to_isolation_when_a_handler_fails() -> None:
+    entries = [
+        _make_outbox_record(payload=_payload(value)) for value in ("a", "bad", "c")
+    ]
+    relay, session_factory, container = _batch_scoped_relay(entries)
+
+    await relay._poll()
+
+    claim, batch, _ = session_factory.sessions
+    batch.rollback.assert_awaited_once()
+    batch.commit.assert_not_awaited()
+    # "a" ran in the discarded batch, then again once per isolated scope.
+    assert _RecordingHandler.values == ["a", "a", "c"]
+    assert container.contexts[1:] == [None, None, None]
+    # Claim + progress lookup + delivered update + retry update, committed by
+    # the claim session.
+    assert claim.execute.call_count == 4
+
+
+class _BulkHandler:
+    batches: ClassVar[list[list[str]]] = []
+    singles: ClassVar[list[str]] = []
+    healthy: ClassVar[bool] = True
+
+    async def handle(self, event: _RelayTestEvent) -> None:
+        self.singles.append(event.value)
+
+    async def handle_batch(self, events: list[_RelayTestEvent]) -> None:
+        if not self.healthy:
+            msg = "Bulk failure"
+            raise RuntimeError(msg)
+        self.batches.append([event.value for event in events])
+
+
+@pytest.fixture
+def bulk_handler() -> type[_BulkHandler]:
+    _BulkHandler.batches = []
+    _BulkHandler.singles = []
+    _BulkHandler.healthy = True
+    _registry[_RelayTestEvent] = [_BulkHandler]
+    _batch_handlers.add(_BulkHandler)
+    return _BulkHandler
+
+
+def _bulk_entries() -> list[OutboxRecord]:
+    entries = [_make_outbox_record(payload=_payload(f"e{n}")) for n in range(3)]
+    for n, entry in enumerate(entries):
+        entry.occurred_at += timedelta(seconds=n)
+    return entries
+
+
+@pytest.mark.asyncio
+async def test_batch_handler_gets_all_events_in_one_call(
+    bulk_handler: type[_BulkHandler],
+) -> None:
+    session = _make_mock_session(_bulk_entries())
+    relay = OutboxRelay(
+        container=_ByTypeContainer(),  # type: ignore[arg-type]
+        session_factory=_FakeSessionFactory(session),  # type: ignore[arg-type]
+    )
+
+    await relay._poll()
+
+    assert bulk_handler.batches == [["e0", "e1", "e2"]]
+    assert bulk_handler.singles == []
+    # Claim + progress lookup + one delivered update
+    assert session.execute.call_count == 3
+    delivered = session.execute.call_args[0][0].compile(dialect=_PG_DIALECT)
+    assert delivered.params["delivered"] is True
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_call_falls_back_to_single_events(
+    bulk_handler: type[_BulkHandler],
+) -> None:
+    bulk_handler.healthy = False
+    session = _make_mock_session(_bulk_entries())
+    relay = OutboxRelay(
+        container=_ByTypeContainer(),  # type: ignore[arg-type]
+        session_factory=_FakeSessionFactory(session),  # type: ignore[arg-type]
+    )
+
+    await relay._poll()
+
+    assert sorted(bulk_handler.singles) == ["e0", "e1", "e2"]
+    assert session.execute.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_handler_success_is_recorded_when_another_handler_fails(
+    bulk_handler: type[_BulkHandler],
+) -> None:
+    entries = _bulk_entries()
+    _registry[_RelayTestEvent] = [_BulkHandler, _FailingHandler]
+    session = _make_mock_session(entries)
+    relay = OutboxRelay(
+        container=_ByTypeContainer(),  # type: ignore[arg-type]
+        session_factory=_FakeSessionFactory(session),  # type: ignore[arg-type]
+    )
+
+    await relay._poll()
+
+    assert bulk_handler.batches == [["e0", "e1", "e2"]]
+    # Claim + progress lookup + retry update + handler progress
+    progress = session.execute.call_args_list[3][0][0].compile(dialect=_PG_DIALECT)
+    assert "INSERT INTO outbox_handler_delivery" in str(progress)
+    recorded = {
+        (progress.params[f"outbox_id_m{n}"], progress.params[f"handler_m{n}"])
+        for n in range(3)
+    }
+    assert recorded == {(entry.id, handler_key(_BulkHandler)) for entry in entries}
+
+
+@pytest.mark.asyncio
+async def test_batch_success_is_recorded_for_entries_deferred_behind_a_failure(
+    bulk_handler: type[_BulkHandler],
+) -> None:
+    bad = _make_outbox_record(payload=_payload("bad"), aggregate_id="A:1")
+    held_back = _make_outbox_record(payload=_payload("next"), aggregate_id="A:1")
+    held_back.occurred_at = bad.occurred_at + timedelta(seconds=1)
+    _registry[_RelayTestEvent] = [_BulkHandler, _SelectiveHandler]
+    session = _make_mock_session([bad, held_back])
+    relay = OutboxRelay(
+        container=_ByTypeContainer(),  # type: ignore[arg-type]
+        session_factory=_FakeSessionFactory(session),  # type: ignore[arg-type]
+    )
+
+    await relay._poll()
+
+    assert bulk_handler.batches == [["bad", "next"]]
+    # Claim + progress lookup + retry update + handler progress + release
+    progress = session.execute.call_args_list[3][0][0].compile(dialect=_PG_DIALECT)
+    assert "INSERT INTO outbox_handler_delivery" in str(progress)
+    recorded = {
+        (progress.params[f"outbox_id_m{n}"], progress.params[f"handler_m{n}"])
+        for n in range(2)
+    }
+    assert recorded == {
+        (bad.id, handler_key(_BulkHandler)),
+        (held_back.id, handler_key(_BulkHandler)),
+    }
+    release = session.execute.call_args_list[4][0][0].compile(dialect=_PG_DIALECT)
+    assert release.params["any_1"] == [held_back.id]
+
+
+def _laned_relay(
+    session: AsyncMock, child_scope: AsyncMock | None = None
+) -> OutboxRelay:
+    lanes = OutboxLanes(
+        OutboxLane(name=DEFAULT_LANE, batch_size=100, concurrency=1, workers=2),
+        [
+            OutboxLane(
+                name="urgent",
+                event_types=frozenset({"_UrgentEvent"}),
+                batch_size=5,
+                concurrency=3,
+                workers=1,
+            )
+        ],
+    )
+    return OutboxRelay(
+        container=_FakeContainer(child_scope or AsyncMock()),  # type: ignore[arg-type]
+        session_factory=_FakeSessionFactory(session),  # type: ignore[arg-type]
+        lanes=lanes,
+    )
+
+
+@pytest.mark.asyncio
+async def test_lane_claims_only_its_event_types_with_its_batch_size() -> None:
+    session = _make_mock_session([])
+    relay = _laned_relay(session)
+
+    await relay._poll(relay._lane_states["urgent"])
+
+    claim = session.execute.call_args[0][0].compile(dialect=_PG_DIALECT)
+    assert "outbox.event_type IN (__[POSTCOMPILE_event_type_2])" in str(claim)
+    assert claim.params["event_type_2"] == ["_UrgentEvent"]
+    assert claim.params["param_1"] == 5
+    # Entries held back behind another lane's entry are not candidates.
+    assert "earlier.event_type NOT IN (__[POSTCOMPILE_event_type_1])" in str(claim)
+    assert claim.params["event_type_1"] == ["_UrgentEvent"]
+
+
+@pytest.mark.asyncio
+async def test_default_lane_skips_event_types_routed_elsewhere() -> None:
+    session = _make_mock_session([])
+    relay = _laned_relay(session)
+
+    await relay._poll()
+
+    claim = session.execute.call_args[0][0].compile(dialect=_PG_DIALECT)
+    assert "(outbox.event_type NOT IN (__[POSTCOMPILE_event_type_2]))" in str(claim)
+    assert "earlier.event_type IN (__[POSTCOMPILE_event_type_1])" in str(claim)
+    assert claim.params["param_1"] == 100
+
+
+@pytest.mark.asyncio
+async def test_run_starts_workers_of_every_lane() -> None:
+    relay = _laned_relay(AsyncMock())
+    started: list[str] = []
+
+    async def fake_work(state: Any) -> None:
+        started.append(state.lane.name)
+        await asyncio.sleep(0)
+
+    relay._work = fake_work  # type: ignore[method-assign, assignment]
+    await relay.run()
+
+    assert sorted(started) == [DEFAULT_LANE, DEFAULT_LANE, "urgent"]
+
+
+@pytest.mark.asyncio
+async def test_busy_lane_does_not_hold_back_other_lanes(
+    blocking_handler: type[_BlockingHandler],
+) -> None:
+    urgent_handler = _RelayTestHandler()
+    _event_type_registry["_UrgentEvent"] = _UrgentEvent
+    _registry[_UrgentEvent] = [_RelayTestHandler]
+    noisy = _make_outbox_record(payload=_payload("noisy"))
+    urgent = _make_outbox_record(event_type="_UrgentEvent")
+    child_scope = AsyncMock()
+    child_scope.get = AsyncMock(
+        side_effect=lambda handler_type: (
+            urgent_handler if handler_type is _RelayTestHandler else blocking_handler()
+        )
+    )
+    relay = _laned_relay(_make_mock_session([noisy]), child_scope)
+
+    # The default lane's only handler slot stays busy with the noisy entry.
+    noisy_task = asyncio.create_task(relay._poll())
+    await asyncio.sleep(0.01)
+    assert blocking_handler.active == 1
+    relay._session_factory = _FakeSessionFactory(_make_mock_session([urgent]))  # type: ignore[assignment]
+
+    assert await relay._poll(relay._lane_states["urgent"]) == 1
+    assert len(urgent_handler.handled_events) == 1
+
+    blocking_handler.gate.set()
+    await noisy_task
+
+
+def _samples(registry: MetricsRegistry, name: str) -> list[dict[str, Any]]:
+    samples: list[dict[str, Any]] = registry.snapshot()[name]["samples"]
+    return samples
+
+
+@pytest.mark.asyncio
+async def test_delivery_is_recorded_in_metrics() -> None:
+    entry = _make_outbox_record()
+    registry = MetricsRegistry()
+    relay, _ = _relay_for([entry], _RelayTestHandler())
+    relay._metrics = RelayMetrics(registry)
+
+    await relay._poll()
+
+    [delivered] = _samples(registry, "outbox_events_delivered_total")
+    assert delivered == {"labels": {"event_type": "_RelayTestEvent"}, "value": 1.0}
+    [lag] = _samples(registry, "outbox_delivery_lag_seconds")
+    assert lag["count"] == 1
+    [latency] = _samples(registry, "outbox_handler_duration_seconds")
+    assert latency["labels"] == {"handler": "_RelayTestHandler"}
+    assert latency["count"] == 1
+    [poll] = _samples(registry, "outbox_poll_duration_seconds")
+    assert poll["labels"] == {"lane": DEFAULT_LANE}
+    [batch] = _samples(registry, "outbox_batch_duration_seconds")
+    assert batch["count"] == 1
+    assert relay._metrics.delivered_per_second() == {"_RelayTestEvent": 1 / 60}
+
+
+@pytest.mark.asyncio
+async def test_empty_poll_is_timed_without_a_batch() -> None:
+    registry = MetricsRegistry()
+    relay, _ = _relay_for([], _RelayTestHandler())
+    relay._metrics = RelayMetrics(registry)
+
+    await relay._poll()
+
+    [poll] = _samples(registry, "outbox_poll_duration_seconds")
+    assert poll["count"] == 1
+    assert _samples(registry, "outbox_batch_duration_seconds") == []
+
+
+@pytest.mark.asyncio
+async def test_retries_dead_letters_and_handler_failures_are_counted() -> None:
+    retried = _make_outbox_record(retry_count=0)
+    exhausted = _make_outbox_record(retry_count=2)
+    _registry[_RelayTestEvent] = [_FailingHandler]
+    registry = MetricsRegistry()
+    relay, _ = _relay_for([retried, exhausted], _FailingHandler())
+    relay._max_retries = 3
+    relay._metrics = RelayMetrics(registry)
+
+    await relay._poll()
+
+    labels = {"event_type": "_RelayTestEvent"}
+    assert _samples(registry, "outbox_retries_total") == [
+        {"labels": labels, "value": 1.0}
+    ]
+    assert _samples(registry, "outbox_dead_letters_total") == [
+        {"labels": labels, "value": 1.0}
+    ]
+    assert _samples(registry, "outbox_handler_failures_total") == [
+        {"labels": {"handler": "_FailingHandler"}, "value": 2.0}
+    ]
+    assert _samples(registry, "outbox_events_delivered_total") == []
+
+
+class _HungHandler:
+    async def handle(self, event: _RelayTestEvent) -> None:
+        await asyncio.sleep(60)
+
+
+def _guarded_relay(
+    entries: list[OutboxRecord],
+    policies: dict[str, HandlerPolicy],
+) -> tuple[OutboxRelay, AsyncMock, MetricsRegistry]:
+    session = _make_mock_session(entries)
+    registry = MetricsRegistry()
+    relay = OutboxRelay(
+        container=_ByTypeContainer(),  # type: ignore[arg-type]
+        session_factory=_FakeSessionFactory(session),  # type: ignore[arg-type]
+        metrics=RelayMetrics(registry),
+        handler_policies=HandlerPolicies(HandlerPolicy(), policies),
+    )
+    return relay, session, registry
+
+
+@pytest.mark.asyncio
+async def test_hung_handler_times_out_as_a_failure() -> None:
+    entry = _make_outbox_record()
+    _registry[_RelayTestEvent] = [_HungHandler]
+    relay, session, registry = _guarded_relay(
+        [entry], {"_HungHandler": HandlerPolicy(timeout=0.01)}
+    )
+
+    await asyncio.wait_for(relay._poll(), timeout=1)
+
+    # Claim + progress lookup + retry update
+    retry = session.execute.call_args_list[2][0][0].compile(dialect=_PG_DIALECT)
+    assert "retry_count=(outbox.retry_count + " in str(retry)
+    assert _samples(registry, "outbox_handler_timeouts_total") == [
+        {"labels": {"handler": "_HungHandler"}, "value": 1.0}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_does_not_keep_the_circuit_closed_to_calls() -> None:
+    entry = _make_outbox_record()
+    _registry[_RelayTestEvent] = [_HungHandler]
+    relay, _, _ = _guarded_relay(
+        [entry],
+        {"_HungHandler": HandlerPolicy(breaker_failures=1, breaker_cool_off=0.0)},
+    )
+    relay._breakers.record_failure(_HungHandler)
+    assert relay._breakers.state(_HungHandler) is CircuitState.HALF_OPEN
+
+    poll = asyncio.create_task(relay._poll())
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert not relay._breakers.allow(_HungHandler)
+    poll.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await poll
+
+    assert relay._breakers.allow(_HungHandler)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_does_not_release_another_calls_trial() -> None:
+    entry = _make_outbox_record()
+    _registry[_RelayTestEvent] = [_HungHandler]
+    relay, _, _ = _guarded_relay(
+        [entry],
+        {"_HungHandler": HandlerPolicy(breaker_failures=1, breaker_cool_off=0.0)},
+    )
+    # Admitted while the circuit was closed.
+    poll = asyncio.create_task(relay._poll())
+    for _ in range(10):
+        await asyncio.sleep(0)
+    relay._breakers.record_failure(_HungHandler)
+    assert relay._breakers.allow(_HungHandler)
+
+    poll.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await poll
+
+    assert not relay._breakers.allow(_HungHandler)
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_postpones_entries_without_using_a_retry() -> None:
+    entries = [_make_outbox_record(aggregate_id=f"A:{n}") for n in range(3)]
+    _registry[_RelayTestEvent] = [_SecondHandler, _FailingHandler]
+    _SecondHandler.calls = 0
+    relay, session, registry = _guarded_relay(
+        entries,
+        {"_FailingHandler": HandlerPolicy(breaker_failures=1, breaker_cool_off=30.0)},
+    )
+    relay._breakers.record_failure(_FailingHandler)
+
+    await relay._poll()
+
+    # Other handlers keep receiving their events.
+    assert _SecondHandler.calls == 3
+    # Claim + progress lookup + handler progress + postpone
+    assert session.execute.call_count == 4
+    postpone_call = session.execute.call_args_list[3][0]
+    postpone = postpone_call[0].compile(dialect=_PG_DIALECT)
+    assert "next_attempt_at=(now() + " in str(postpone)
+    assert "retry_count" not in str(postpone)
+    assert [row["entry_id"] for row in postpone_call[1]] == [e.id for e in entries]
+    assert all(25.0 < row["delay"] <= 30.0 for row in postpone_call[1])
+    assert _samples(registry, "outbox_postponed_total") == [
+        {"labels": {"event_type": "_RelayTestEvent"}, "value": 3.0}
+    ]
+    assert _samples(registry, "outbox_retries_total") == []
+
+
+@pytest.mark.asyncio
+async def test_breaker_transitions_are_recorded_in_metrics() -> None:
+    entries = [_make_outbox_record(aggregate_id=f"A:{n}") for n in range(2)]
+    _registry[_RelayTestEvent] = [_FailingHandler]
+    relay, _, registry = _guarded_relay(
+        entries, {"_FailingHandler": HandlerPolicy(breaker_failures=2)}
+    )
+
+    await relay._poll()
+
+    assert relay._breakers.state(_FailingHandler) is CircuitState.OPEN
+    assert _samples(registry, "outbox_circuit_state") == [
+        {"labels": {"handler": "_FailingHandler"}, "value": 2.0}
+    ]
+    assert _samples(registry, "outbox_circuit_transitions_total") == [
+        {"labels": {"handler": "_FailingHandler", "state": "open"}, "value": 1.0}
+    ]
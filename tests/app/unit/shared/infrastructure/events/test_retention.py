@@ -0,0 +1,177 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from shared.infrastructure.events.retention import (
+    OutboxPruner,
+    archive_partition_name,
+)
+
+_PG_DIALECT = postgresql.dialect()  # type: ignore[no-untyped-call]
+
+
+def _delivered_row(age: timedelta) -> SimpleNamespace:
+    return SimpleNamespace(id=uuid4(), delivered_at=datetime.now(UTC) - age)
+
+
+def _make_mock_session(*results: Sequence[object]) -> AsyncMock:
+    session = AsyncMock()
+    mocked = []
+    for rows in results:
+        result = MagicMock()
+        result.fetchall.return_value = rows
+        mocked.append(result)
+    session.execute = AsyncMock(side_effect=[*mocked, *[MagicMock()] * 10])
+    session.commit = AsyncMock()
+    return session
+
+
+class _FakeSessionFactory:
+    def __init__(self, session: AsyncMock) -> None:
+        self._session = session
+
+    def __call__(self) -> "_FakeSessionFactory":
+        return self
+
+    async def __aenter__(self) -> AsyncMock:
+        return self._session
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+
+def _sql(session: AsyncMock, call: int) -> str:
+    stmt = session.execute.call_args_list[call][0][0]
+    return str(stmt.compile(dialect=_PG_DIALECT))
+
+
+def _make_pruner(session: AsyncMock, *, archive: bool = True) -> OutboxPruner:
+    return OutboxPruner(
+        session_factory=_FakeSessionFactory(session),  # type: ignore[arg-type]
+        archive=archive,
+        retention_days=30,
+        batch_size=10,
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_claims_delivered_rows_with_skip_locked() -> None:
+    session = _make_mock_session([])
+    sut = _make_pruner(session)
+
+    assert await sut._prune_batch() == 0
+
+    claim_sql = _sql(session, 0)
+    assert "outbox.delivered = true" in claim_sql
+    assert "FOR UPDATE SKIP LOCKED" in claim_sql
+    session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_batch_moves_rows_into_daily_archive_partitions() -> None:
+    rows = [_delivered_row(timedelta(days=2)), _delivered_row(timedelta(days=2))]
+    session = _make_mock_session(rows)
+    sut = _make_pruner(session)
+
+    assert await sut._prune_batch() == 2
+
+    day = rows[0].delivered_at.date()
+    partition_sql = str(session.execute.call_args_list[1][0][0])
+    assert partition_sql.startswith(
+        f"CREATE TABLE IF NOT EXISTS {archive_partition_name(day)} "
+        "PARTITION OF outbox_archive"
+    )
+    move_sql = _sql(session, 2)
+    assert move_sql.startswith("WITH moved AS")
+    assert "DELETE FROM outbox WHERE outbox.id = any" in move_sql
+    assert "INSERT INTO outbox_archive" in move_sql
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_known_partitions_are_not_recreated() -> None:
+    row = _delivered_row(timedelta(days=2))
+    session = _make_mock_session([row], [row])
+    sut = _make_pruner(session)
+
+    await sut._prune_batch()
+    await sut._prune_batch()
+
+    # Claim + DDL + move, then claim + move
+    assert session.execute.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_partitions_of_a_rolled_back_batch_are_recreated() -> None:
+    row = _delivered_row(timedelta(days=2))
+    # Claim, DDL and move results of each batch.
+    session = _make_mock_session([row], [], [], [row])
+    session.commit.side_effect = [RuntimeError("archive insert failed"), None]
+    sut = _make_pruner(session)
+
+    with pytest.raises(RuntimeError):
+        await sut._prune_batch()
+    await sut._prune_batch()
+
+    # Claim + DDL + move, rolled back, then claim + DDL + move again
+    assert session.execute.call_count == 6
+    partition = (
+        f"CREATE TABLE IF NOT EXISTS {archive_partition_name(row.delivered_at.date())}"
+    )
+    assert str(session.execute.call_args_list[4][0][0]).startswith(partition)
+
+
+@pytest.mark.asyncio
+async def test_rows_past_retention_get_no_partition() -> None:
+    session = _make_mock_session([_delivered_row(timedelta(days=45))])
+    sut = _make_pruner(session)
+
+    await sut._prune_batch()
+
+    # Claim + move; the move skips rows older than the horizon.
+    assert session.execute.call_count == 2
+    assert "WHERE moved.delivered_at >=" in _sql(session, 1)
+
+
+@pytest.mark.asyncio
+async def test_without_archive_rows_are_deleted() -> None:
+    session = _make_mock_session([_delivered_row(timedelta(days=2))])
+    sut = _make_pruner(session, archive=False)
+
+    await sut._prune_batch()
+
+    assert session.execute.call_count == 2
+    assert _sql(session, 1).startswith("DELETE FROM outbox WHERE")
+
+
+@pytest.mark.asyncio
+async def test_prune_repeats_full_batches_then_drops_expired_partitions() -> None:
+    sut = _make_pruner(AsyncMock())
+    sut._prune_batch = AsyncMock(side_effect=[10, 10, 3])  # type: ignore[method-assign]
+    sut._drop_expired_partitions = AsyncMock(return_value=0)  # type: ignore[method-assign]
+
+    assert await sut.prune() == 23
+
+    assert sut._prune_batch.await_count == 3
+    sut._drop_expired_partitions.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_drops_only_partitions_older_than_retention() -> None:
+    today = datetime.now(UTC).date()
+    expired = archive_partition_name(today - timedelta(days=31))
+    kept = archive_partition_name(today - timedelta(days=29))
+    session = _make_mock_session([(expired,), (kept,), ("unrelated",)])
+    sut = _make_pruner(session)
+
+    assert await sut._drop_expired_partitions() == 1
+
+    assert str(session.execute.call_args_list[1][0][0]) == (
+        f"DROP TABLE IF EXISTS {expired}"
+    )
+    session.commit.assert_awaited_once()
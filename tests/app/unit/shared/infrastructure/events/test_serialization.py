@@ -1,35 +1,47 @@
+import dataclasses
 import json
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from uuid import UUID, uuid4
 
+import orjson
 import pytest
 
 from account.domain.account.enums import AccountRole
 from account.domain.account.events import AccountCreated
+from core.domain.profile.events import ProfilePatchApplied
 from shared.domain.domain_event import DomainEvent
 from shared.infrastructure.events.registry import _event_type_registry
 from shared.infrastructure.events.serialization import (
+    _codecs,
+    compile_event_codecs,
     deserialize_event,
+    get_codec,
     serialize_event,
 )
 
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _TaggedEvent(DomainEvent):
+    account_ids: tuple[UUID, ...]
+    days: tuple[date, ...] = ()
+    labels: tuple[str, ...] = ()
+
+
 @pytest.fixture(autouse=True)
 def _register_event_types() -> None:
     _event_type_registry["AccountCreated"] = AccountCreated
 
 
 class TestSerializeEvent:
-    def test_serializes_event_to_json_string(self) -> None:
+    def test_serializes_event_to_json_object(self) -> None:
         event = AccountCreated(
             account_id=UUID("12345678-1234-5678-1234-567812345678"),
             email="test@example.com",
             role=AccountRole.USER,
         )
 
-        result = serialize_event(event)
+        parsed = serialize_event(event)
 
-        parsed = json.loads(result)
         assert parsed["account_id"] == "12345678-1234-5678-1234-567812345678"
         assert parsed["email"] == "test@example.com"
         assert parsed["role"] == "user"
@@ -44,8 +56,7 @@ class TestSerializeEvent:
             role=AccountRole.ADMIN,
         )
 
-        result = serialize_event(event)
-        parsed = json.loads(result)
+        parsed = serialize_event(event)
 
         assert parsed["account_id"] == str(account_id)
 
@@ -58,8 +69,7 @@ class TestSerializeEvent:
             occurred_at=now,
         )
 
-        result = serialize_event(event)
-        parsed = json.loads(result)
+        parsed = serialize_event(event)
 
         assert isinstance(parsed["occurred_at"], str)
 
@@ -70,11 +80,32 @@ class TestSerializeEvent:
             role=AccountRole.SUPER_ADMIN,
         )
 
-        result = serialize_event(event)
-        parsed = json.loads(result)
+        parsed = serialize_event(event)
 
         assert parsed["role"] == "super_admin"
 
+    def test_payload_survives_a_json_round_trip(self) -> None:
+        event = AccountCreated(
+            account_id=uuid4(),
+            email="a@b.com",
+            role=AccountRole.USER,
+        )
+
+        payload = serialize_event(event)
+
+        assert orjson.loads(orjson.dumps(payload)) == payload
+        assert json.loads(json.dumps(payload)) == payload
+
+
+class TestEventCodec:
+    def test_codec_is_built_once_per_event_type(self) -> None:
+        assert get_codec(AccountCreated) is get_codec(AccountCreated)
+
+    def test_compile_event_codecs_covers_registered_types(self) -> None:
+        compile_event_codecs()
+
+        assert AccountCreated in _codecs
+
 
 class TestDeserializeEvent:
     def test_round_trip_preserves_all_fields(self) -> None:
@@ -135,7 +166,48 @@ class TestDeserializeEvent:
 
     def test_unknown_event_type_raises_value_error(self) -> None:
         with pytest.raises(ValueError, match="Unknown event type"):
-            deserialize_event("UnknownEvent", "{}")
+            deserialize_event("UnknownEvent", {})
+
+    def test_decodes_legacy_string_payload(self) -> None:
+        event = AccountCreated(
+            account_id=uuid4(),
+            email="a@b.com",
+            role=AccountRole.USER,
+        )
+        legacy = json.dumps(dataclasses.asdict(event), default=str)
+
+        restored = deserialize_event("AccountCreated", legacy)
+
+        assert restored == event
+
+    def test_round_trips_dates_inside_tuples(self) -> None:
+        _event_type_registry["ProfilePatchApplied"] = ProfilePatchApplied
+        event = ProfilePatchApplied(
+            profile_id=uuid4(),
+            first_name=("Old", None),
+            birth_date=(None, date(1990, 5, 17)),
+        )
+
+        payload = serialize_event(event)
+        restored = deserialize_event("ProfilePatchApplied", payload)
+
+        assert payload["birth_date"] == [None, "1990-05-17"]
+        assert restored == event
+
+    @pytest.mark.parametrize("size", [0, 1, 2, 3])
+    def test_round_trips_variadic_tuples(self, size: int) -> None:
+        _event_type_registry["_TaggedEvent"] = _TaggedEvent
+        event = _TaggedEvent(
+            account_ids=tuple(uuid4() for _ in range(size)),
+            days=tuple(date(2024, 1, day + 1) for day in range(size)),
+            labels=tuple(f"l{n}" for n in range(size)),
+        )
+
+        payload = serialize_event(event)
+        restored = deserialize_event("_TaggedEvent", payload)
+
+        assert payload["days"] == [day.isoformat() for day in event.days]
+        assert restored == event
 
     def test_deserializes_base_domain_event_fields(self) -> None:
         event = AccountCreated(
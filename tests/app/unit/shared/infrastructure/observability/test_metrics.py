@@ -0,0 +1,87 @@
+import pytest
+
+from shared.infrastructure.observability.metrics import MetricsRegistry
+
+
+def test_counters_and_gauges_render_in_prometheus_text_format() -> None:
+    registry = MetricsRegistry()
+    delivered = registry.counter("delivered_total", "Delivered.", ("event_type",))
+    backlog = registry.gauge("backlog", "Backlog.")
+
+    delivered.inc(event_type="AccountCreated")
+    delivered.inc(2, event_type="AccountCreated")
+    backlog.set(7)
+
+    assert registry.render_text() == (
+        "# HELP delivered_total Delivered.\n"
+        "# TYPE delivered_total counter\n"
+        'delivered_total{event_type="AccountCreated"} 3.0\n'
+        "# HELP backlog Backlog.\n"
+        "# TYPE backlog gauge\n"
+        "backlog 7.0\n"
+    )
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count() -> None:
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency", "Latency.", ("handler",), buckets=(0.1, 1))
+
+    for value in (0.05, 0.5, 5.0):
+        latency.observe(value, handler="H")
+
+    assert registry.render_text().splitlines()[2:] == [
+        'latency_bucket{handler="H",le="0.1"} 1',
+        'latency_bucket{handler="H",le="1.0"} 2',
+        'latency_bucket{handler="H",le="+Inf"} 3',
+        'latency_sum{handler="H"} 5.55',
+        'latency_count{handler="H"} 3',
+    ]
+
+
+def test_label_values_are_escaped() -> None:
+    registry = MetricsRegistry()
+    registry.counter("c", "C.", ("name",)).inc(name='a"b\\c')
+
+    assert 'c{name="a\\"b\\\\c"} 1.0' in registry.render_text()
+
+
+def test_snapshot_reports_histogram_quantiles_at_bucket_resolution() -> None:
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency", "Latency.", buckets=(0.1, 1.0, 10.0))
+    for _ in range(90):
+        latency.observe(0.05)
+    for _ in range(10):
+        latency.observe(5.0)
+
+    [sample] = registry.snapshot()["latency"]["samples"]
+
+    assert sample["count"] == 100
+    assert sample["mean"] == pytest.approx(0.545)
+    assert (sample["p50"], sample["p95"], sample["p99"]) == (0.1, 10.0, 10.0)
+
+
+def test_same_name_returns_the_registered_metric() -> None:
+    registry = MetricsRegistry()
+
+    first = registry.counter("c", "C.")
+    first.inc()
+
+    assert registry.counter("c", "C.") is first
+    assert registry.counter("c", "C.").value() == 1.0
+
+
+def test_same_name_with_another_kind_is_rejected() -> None:
+    registry = MetricsRegistry()
+    registry.counter("c", "C.")
+
+    with pytest.raises(ValueError, match="already registered as a counter"):
+        registry.gauge("c", "C.")
+
+
+def test_wrong_labels_are_rejected() -> None:
+    counter = MetricsRegistry().counter("c", "C.", ("lane",))
+
+    with pytest.raises(ValueError, match="takes labels"):
+        counter.inc(event_type="x")
+    with pytest.raises(ValueError, match="takes labels"):
+        counter.inc()
@@ -0,0 +1,63 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+
+from shared.infrastructure.observability.scrape_server import MetricsScrapeServer
+
+
+async def _get(port: int, request: bytes) -> bytes:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    return response
+
+
+@pytest_asyncio.fixture
+async def server() -> AsyncIterator[MetricsScrapeServer]:
+    async def render() -> str:
+        await asyncio.sleep(0)
+        return "backlog 1.0\n"
+
+    scrape_server = MetricsScrapeServer(render, host="127.0.0.1", port=0)
+    await scrape_server.start()
+    yield scrape_server
+    await scrape_server.close()
+
+
+@pytest.mark.asyncio
+async def test_serves_rendered_metrics(server: MetricsScrapeServer) -> None:
+    response = await _get(server.port, b"GET /metrics HTTP/1.1\r\nHost: x\r\n\r\n")
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.0 200 OK")
+    assert b"Content-Type: text/plain; version=0.0.4" in head
+    assert body == b"backlog 1.0\n"
+
+
+@pytest.mark.asyncio
+async def test_unknown_path_returns_404(server: MetricsScrapeServer) -> None:
+    response = await _get(server.port, b"GET /other HTTP/1.1\r\n\r\n")
+
+    assert response.startswith(b"HTTP/1.0 404 Not Found")
+
+
+@pytest.mark.asyncio
+async def test_render_failure_returns_503() -> None:
+    async def render() -> str:
+        await asyncio.sleep(0)
+        msg = "database unavailable"
+        raise RuntimeError(msg)
+
+    server = MetricsScrapeServer(render, host="127.0.0.1", port=0)
+    await server.start()
+    try:
+        response = await _get(server.port, b"GET /metrics HTTP/1.1\r\n\r\n")
+    finally:
+        await server.close()
+
+    assert response.startswith(b"HTTP/1.0 503 Service Unavailable")
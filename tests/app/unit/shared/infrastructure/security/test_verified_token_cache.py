@@ -0,0 +1,182 @@
+from unittest.mock import Mock
+
+import pytest
+from starlette.requests import Request
+
+from account.infrastructure.security.access_token_processor_jwt import (
+    AccessTokenClaims,
+    AccessTokenDecoder,
+)
+from shared.domain.errors import AuthenticationError
+from shared.infrastructure.observability.metrics import MetricsRegistry
+from shared.infrastructure.security.identity_provider import JwtBearerIdentityProvider
+from shared.infrastructure.security.metrics import SecurityMetrics
+from shared.infrastructure.security.verified_token_cache import VerifiedTokenCache
+
+ACCOUNT_ID = "00000000-0000-0000-0000-000000000001"
+NOW = 1_000_000.0
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = NOW
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _verifier(expires_at: float | None = NOW + 900) -> Mock:
+    return Mock(return_value=AccessTokenClaims(ACCOUNT_ID, expires_at))
+
+
+def test_caches_verified_claims() -> None:
+    verify = _verifier()
+    sut = VerifiedTokenCache(clock=_Clock())
+
+    first = sut.get_or_verify("token", verify)
+    second = sut.get_or_verify("token", verify)
+
+    assert first == second == AccessTokenClaims(ACCOUNT_ID, NOW + 900)
+    verify.assert_called_once_with("token")
+
+
+def test_does_not_cache_rejected_tokens() -> None:
+    verify = Mock(return_value=None)
+    sut = VerifiedTokenCache(clock=_Clock())
+
+    assert sut.get_or_verify("token", verify) is None
+    assert sut.get_or_verify("token", verify) is None
+    assert verify.call_count == 2
+    assert len(sut) == 0
+
+
+def test_entries_expire_with_their_token() -> None:
+    clock = _Clock()
+    verify = _verifier(expires_at=NOW + 60)
+    sut = VerifiedTokenCache(max_ttl=300.0, clock=clock)
+    sut.get_or_verify("token", verify)
+
+    clock.now = NOW + 59
+    sut.get_or_verify("token", verify)
+    assert verify.call_count == 1
+
+    clock.now = NOW + 60
+    sut.get_or_verify("token", verify)
+    assert verify.call_count == 2
+
+
+def test_entries_live_at_most_max_ttl() -> None:
+    clock = _Clock()
+    verify = _verifier(expires_at=None)
+    sut = VerifiedTokenCache(max_ttl=30.0, clock=clock)
+    sut.get_or_verify("token", verify)
+
+    clock.now = NOW + 30
+    sut.get_or_verify("token", verify)
+
+    assert verify.call_count == 2
+
+
+def test_evicts_the_least_recently_used_token_beyond_max_size() -> None:
+    verify = _verifier()
+    sut = VerifiedTokenCache(max_size=2, clock=_Clock())
+    sut.get_or_verify("a", verify)
+    sut.get_or_verify("b", verify)
+    sut.get_or_verify("a", verify)
+
+    sut.get_or_verify("c", verify)
+    verify.reset_mock()
+    sut.get_or_verify("a", verify)
+    sut.get_or_verify("b", verify)
+
+    verify.assert_called_once_with("b")
+    assert len(sut) == 2
+
+
+def test_zero_size_disables_caching() -> None:
+    verify = _verifier()
+    sut = VerifiedTokenCache(max_size=0, clock=_Clock())
+
+    sut.get_or_verify("token", verify)
+    sut.get_or_verify("token", verify)
+
+    assert verify.call_count == 2
+
+
+def test_reports_hit_ratio_and_evictions() -> None:
+    registry = MetricsRegistry()
+    clock = _Clock()
+    verify = _verifier(expires_at=NOW + 10)
+    sut = VerifiedTokenCache(max_size=1, metrics=SecurityMetrics(registry), clock=clock)
+
+    for _ in range(4):
+        sut.get_or_verify("a", verify)
+    sut.get_or_verify("b", verify)
+    clock.now = NOW + 10
+    sut.get_or_verify("b", verify)
+
+    snapshot = registry.snapshot()
+    lookups = {
+        s["labels"]["result"]: s["value"]
+        for s in snapshot["auth_token_cache_lookups_total"]["samples"]
+    }
+    evictions = {
+        s["labels"]["reason"]: s["value"]
+        for s in snapshot["auth_token_cache_evictions_total"]["samples"]
+    }
+    assert lookups == {"hit": 3.0, "miss": 3.0}
+    assert snapshot["auth_token_cache_hit_ratio"]["samples"][0]["value"] == 0.5
+    assert evictions == {"capacity": 1.0, "expired": 1.0}
+    assert snapshot["auth_token_cache_entries"]["samples"][0]["value"] == 1.0
+    assert snapshot["auth_token_verify_duration_seconds"]["samples"][0]["count"] == 3
+
+
+def _request(authorization: str | None) -> Request:
+    headers = (
+        [] if authorization is None else [(b"authorization", authorization.encode())]
+    )
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.mark.asyncio
+async def test_identity_provider_verifies_once_per_request() -> None:
+    decoder = Mock(spec=AccessTokenDecoder)
+    decoder.decode.return_value = AccessTokenClaims(ACCOUNT_ID, NOW + 900)
+    cache = Mock(wraps=VerifiedTokenCache(clock=_Clock()))
+    sut = JwtBearerIdentityProvider(_request("Bearer token"), decoder, cache)
+
+    first = await sut.get_current_account_id()
+    second = await sut.get_current_account_id()
+
+    assert first == second
+    assert str(first.value) == ACCOUNT_ID
+    cache.get_or_verify.assert_called_once()
+    decoder.decode.assert_called_once_with("token")
+
+
+@pytest.mark.asyncio
+async def test_identity_provider_shares_verified_tokens_across_requests() -> None:
+    decoder = Mock(spec=AccessTokenDecoder)
+    decoder.decode.return_value = AccessTokenClaims(ACCOUNT_ID, NOW + 900)
+    cache = VerifiedTokenCache(clock=_Clock())
+
+    for _ in range(3):
+        sut = JwtBearerIdentityProvider(_request("Bearer token"), decoder, cache)
+        await sut.get_current_account_id()
+
+    decoder.decode.assert_called_once_with("token")
+
+
+@pytest.mark.asyncio
+async def test_identity_provider_rejects_invalid_tokens_every_time() -> None:
+    decoder = Mock(spec=AccessTokenDecoder)
+    decoder.decode.return_value = None
+    sut = JwtBearerIdentityProvider(
+        _request("Bearer forged"), decoder, VerifiedTokenCache(clock=_Clock())
+    )
+
+    for _ in range(2):
+        with pytest.raises(AuthenticationError):
+            await sut.get_current_account_id()
+
+    assert decoder.decode.call_count == 2
@@ -0,0 +1,103 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+
+from shared.infrastructure.config import app_factory
+from shared.infrastructure.config.settings.app_settings import AppSettings
+from shared.infrastructure.config.settings.database import (
+    PostgresSettings,
+    SqlaEngineSettings,
+)
+from shared.infrastructure.config.settings.logs import LoggingLevel, LoggingSettings
+from shared.infrastructure.config.settings.outbox import OutboxSettings
+from shared.infrastructure.config.settings.security import (
+    AuthSettings,
+    SecuritySettings,
+    SupabaseSettings,
+)
+from shared.infrastructure.events.fast_path import OutboxFastPath
+
+
+def _settings(**outbox: object) -> AppSettings:
+    return AppSettings(
+        postgres=PostgresSettings(
+            **{
+                "USER": "test",
+                "PASSWORD": "test",
+                "DB": "test",
+                "HOST": "localhost",
+                "PORT": 5432,
+                "DRIVER": "psycopg",
+            },
+        ),
+        sqla=SqlaEngineSettings(
+            **{"ECHO": False, "ECHO_POOL": False, "POOL_SIZE": 1, "MAX_OVERFLOW": 0},
+        ),
+        security=SecuritySettings(
+            auth=AuthSettings(
+                **{
+                    "JWT_SECRET": "a" * 32,
+                    "JWT_ALGORITHM": "HS256",
+                    "ACCESS_TOKEN_EXPIRY_MIN": 5,
+                },
+            ),
+            supabase=SupabaseSettings(
+                **{
+                    "SUPABASE_URL": "http://localhost:54321",
+                    "SERVICE_ROLE_KEY": "b" * 32,
+                },
+            ),
+        ),
+        logs=LoggingSettings(**{"LEVEL": LoggingLevel.WARNING}),
+        outbox=OutboxSettings.model_validate(outbox),
+    )
+
+
+def _app(settings: AppSettings) -> FastAPI:
+    app = FastAPI()
+    app.state.dishka_container = app_factory.create_ioc_container(settings)
+    return app
+
+
+@pytest.fixture
+def start_outbox_tasks(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    monkeypatch.setattr(app_factory, "map_tables", lambda: None)
+    start = AsyncMock(return_value=[])
+    monkeypatch.setattr(app_factory, "start_outbox_tasks", start)
+    return start
+
+
+@pytest.fixture
+def start_access_change_listener(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    start = AsyncMock(side_effect=lambda _: asyncio.create_task(asyncio.sleep(3600)))
+    monkeypatch.setattr(app_factory, "start_access_change_listener", start)
+    return start
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("start_access_change_listener")
+async def test_lifespan_runs_the_embedded_relay_by_default(
+    start_outbox_tasks: AsyncMock,
+) -> None:
+    async with app_factory.lifespan(_app(_settings())):
+        pass
+
+    start_outbox_tasks.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_leaves_delivery_to_workers_when_disabled(
+    start_outbox_tasks: AsyncMock,
+    start_access_change_listener: AsyncMock,
+) -> None:
+    app = _app(_settings(EMBEDDED_RELAY=False))
+
+    async with app_factory.lifespan(app):
+        fast_path = await app.state.dishka_container.get(OutboxFastPath)
+        assert fast_path._relay is not None
+
+    start_outbox_tasks.assert_not_awaited()
+    # Access caches are per process: every web process listens for changes.
+    start_access_change_listener.assert_awaited_once()
@@ -0,0 +1,86 @@
+import pytest
+from pydantic import ValidationError
+
+from shared.infrastructure.config.settings.outbox import OutboxSettings
+
+
+def test_outbox_settings_have_defaults() -> None:
+    sut = OutboxSettings()
+
+    assert sut.batch_size >= 1
+    assert sut.workers == 1
+
+
+def test_outbox_settings_read_aliases() -> None:
+    sut = OutboxSettings.model_validate({"BATCH_SIZE": 250, "WORKERS": 4})
+
+    assert sut.batch_size == 250
+    assert sut.workers == 4
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param({"BATCH_SIZE": 0}, id="empty_batch"),
+        pytest.param({"WORKERS": 0}, id="no_workers"),
+        pytest.param({"LEASE_S": 0}, id="no_lease"),
+        pytest.param({"CONCURRENCY": 0}, id="no_concurrency"),
+        pytest.param({"BACKOFF_BASE_S": 0}, id="no_backoff"),
+    ],
+)
+def test_outbox_settings_reject_non_positive_values(data: dict[str, int]) -> None:
+    with pytest.raises(ValidationError):
+        OutboxSettings.model_validate(data)
+
+
+def test_outbox_retention_settings_read_nested_table() -> None:
+    sut = OutboxSettings.model_validate({
+        "retention": {"ARCHIVE": False, "DAYS": 7, "BATCH_SIZE": 500}
+    })
+
+    assert sut.retention.archive is False
+    assert sut.retention.days == 7
+    assert sut.retention.batch_size == 500
+    assert sut.retention.enabled is True
+
+
+def test_outbox_batch_scope_is_opt_in() -> None:
+    assert OutboxSettings().batch_scope is False
+    assert OutboxSettings.model_validate({"BATCH_SCOPE": True}).batch_scope is True
+
+
+def test_outbox_lanes_read_nested_tables() -> None:
+    sut = OutboxSettings.model_validate({
+        "lanes": {
+            "accounts": {"EVENT_TYPES": ["AccountCreated"], "CONCURRENCY": 4},
+        }
+    })
+
+    assert sut.lanes["accounts"].event_types == ["AccountCreated"]
+    assert sut.lanes["accounts"].concurrency == 4
+    assert sut.lanes["accounts"].workers == 1
+    assert OutboxSettings().lanes == {}
+
+
+def test_outbox_lane_requires_event_types() -> None:
+    with pytest.raises(ValidationError):
+        OutboxSettings.model_validate({"lanes": {"empty": {"EVENT_TYPES": []}}})
+
+
+def test_outbox_worker_metrics_server_is_opt_in() -> None:
+    assert OutboxSettings().worker_metrics_port == 0
+    with pytest.raises(ValidationError):
+        OutboxSettings.model_validate({"WORKER_METRICS_PORT": 70_000})
+
+
+def test_outbox_handler_overrides_read_nested_tables() -> None:
+    sut = OutboxSettings.model_validate({
+        "BREAKER_FAILURES": 3,
+        "handlers": {"CreateProfileOnAccountCreated": {"TIMEOUT_S": 5.0}},
+    })
+
+    assert sut.handler_timeout_s == 30.0
+    assert sut.breaker_failures == 3
+    override = sut.handlers["CreateProfileOnAccountCreated"]
+    assert override.timeout_s == 5.0
+    assert override.breaker_failures is None
@@ -11,6 +11,16 @@ def test_auth_settings_valid() -> None:
     sut = AuthSettings.model_validate(data)
 
     assert sut.access_token_expiry_min == 15
+    assert sut.jwks_refresh_interval_s == 300.0
+    assert sut.jwks_min_refresh_interval_s == 10.0
+    assert sut.token_cache_size == 10_000
+    assert sut.token_cache_max_ttl_s == 300.0
+    assert sut.access_cache_size == 10_000
+    assert sut.access_cache_ttl_s == 30.0
+    assert sut.token_claims_authz is False
+    assert sut.strict_authz is True
+    assert sut.revocation_ttl_s == 60.0
+    assert sut.refresh_grace_s == 10.0
 
 
 def test_auth_settings_custom_expiry() -> None:
@@ -25,6 +35,16 @@ def test_auth_settings_custom_expiry() -> None:
     "field_override",
     [
         pytest.param({"ACCESS_TOKEN_EXPIRY_MIN": 0}, id="expiry_min_too_small"),
+        pytest.param({"JWKS_REFRESH_INTERVAL_S": 0}, id="jwks_refresh_not_positive"),
+        pytest.param(
+            {"JWKS_MIN_REFRESH_INTERVAL_S": 0}, id="jwks_min_refresh_not_positive"
+        ),
+        pytest.param({"TOKEN_CACHE_SIZE": -1}, id="token_cache_size_negative"),
+        pytest.param({"TOKEN_CACHE_MAX_TTL_S": 0}, id="token_cache_ttl_not_positive"),
+        pytest.param({"ACCESS_CACHE_SIZE": -1}, id="access_cache_size_negative"),
+        pytest.param({"ACCESS_CACHE_TTL_S": 0}, id="access_cache_ttl_not_positive"),
+        pytest.param({"REVOCATION_TTL_S": 0}, id="revocation_ttl_not_positive"),
+        pytest.param({"REFRESH_GRACE_S": -1}, id="refresh_grace_negative"),
     ],
 )
 def test_auth_rejects_invalid_expiry(field_override: dict[str, int]) -> None:
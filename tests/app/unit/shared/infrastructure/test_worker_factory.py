@@ -0,0 +1,93 @@
+import asyncio
+import os
+import signal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from shared.infrastructure.config import worker_factory
+
+
+@pytest.fixture
+def container() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture(autouse=True)
+def _no_bootstrap(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(worker_factory, "map_tables", lambda: None)
+    monkeypatch.setattr(worker_factory, "prepare_event_delivery", lambda: None)
+    monkeypatch.setattr(worker_factory, "create_outbox_relay", AsyncMock())
+    monkeypatch.setattr(
+        worker_factory, "create_metrics_server", AsyncMock(return_value=None)
+    )
+
+
+def _start_with(
+    monkeypatch: pytest.MonkeyPatch,
+    *coros: object,
+) -> list[asyncio.Task[None]]:
+    tasks: list[asyncio.Task[None]] = []
+
+    async def start(*_: object) -> list[asyncio.Task[None]]:
+        await asyncio.sleep(0)
+        tasks.extend(asyncio.create_task(coro) for coro in coros)  # type: ignore[arg-type]
+        return tasks
+
+    monkeypatch.setattr(worker_factory, "start_outbox_tasks", start)
+    return tasks
+
+
+@pytest.mark.asyncio
+async def test_sigterm_stops_the_worker_gracefully(
+    monkeypatch: pytest.MonkeyPatch,
+    container: AsyncMock,
+) -> None:
+    tasks = _start_with(monkeypatch, asyncio.sleep(60))
+
+    worker = asyncio.create_task(worker_factory.run_outbox_worker(container))
+    await asyncio.sleep(0.01)
+    os.kill(os.getpid(), signal.SIGTERM)
+    await asyncio.wait_for(worker, timeout=1)
+
+    assert all(task.cancelled() for task in tasks)
+    container.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_crashed_relay_fails_the_worker(
+    monkeypatch: pytest.MonkeyPatch,
+    container: AsyncMock,
+) -> None:
+    async def crash() -> None:
+        await asyncio.sleep(0)
+        msg = "relay crashed"
+        raise RuntimeError(msg)
+
+    tasks = _start_with(monkeypatch, crash(), asyncio.sleep(60))
+
+    with pytest.raises(RuntimeError, match="relay crashed"):
+        await asyncio.wait_for(worker_factory.run_outbox_worker(container), timeout=1)
+
+    assert tasks[1].cancelled()
+    container.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_metrics_server_is_closed_on_stop(
+    monkeypatch: pytest.MonkeyPatch,
+    container: AsyncMock,
+) -> None:
+    server = AsyncMock()
+    monkeypatch.setattr(
+        worker_factory, "create_metrics_server", AsyncMock(return_value=server)
+    )
+    _start_with(monkeypatch, asyncio.sleep(60))
+
+    worker = asyncio.create_task(worker_factory.run_outbox_worker(container))
+    await asyncio.sleep(0.01)
+    os.kill(os.getpid(), signal.SIGTERM)
+    await asyncio.wait_for(worker, timeout=1)
+
+    server.start.assert_awaited_once()
+    server.close.assert_awaited_once()